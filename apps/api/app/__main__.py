@@ -8,10 +8,14 @@ import uvicorn
 
 from app.core.logging import configure_logging, get_logger
 from app.core.settings import get_settings
+from app.core.supabase_http import supabase_http_lifespan
 from app.core.supabase_rest import rpc_acquire_worker_lock, upsert_system_status
 from app.worker.alert_task_processor import ALERT_TASK_BATCH_LIMIT, AlertTaskProcessor
+from app.worker.compute import compute_pool_lifespan
 from app.worker.digest_processor import DigestProcessor
 from app.worker.export_processor import EXPORT_BATCH_LIMIT, ExportProcessor
+from app.worker.fetch_engine import fetch_engine_lifespan
+from app.worker.github_api import configure_github
 from app.worker.notification_sender import NotificationSender
 from app.worker.readiness_processor import ReadinessProcessor
 from app.worker.retry import sanitize_error
@@ -87,31 +91,31 @@ async def run_worker_tick(
             )
         return acquired
 
-    if await _lock_acquired("worker:run_processor"):
-        try:
-            run_metrics = await monitor_processor.run_once(
-                queue_limit=10,
-                process_limit=run_batch_limit,
-            )
-            due_sources = int(run_metrics.get("due_sources") or 0)
-            runs_queued = int(run_metrics.get("runs_queued") or 0)
-            runs_processed = int(run_metrics.get("runs_processed") or 0)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            errors += 1
-            logger.error(
-                "worker.tick_process_runs_error",
-                extra={"component": "worker", "error": sanitize_error(exc, default_message="worker error")},
-            )
+    # Run, export and notification queues are claimed with leases, so every
+    # worker drains them in parallel; only the scheduling passes stay locked.
+    try:
+        run_metrics = await monitor_processor.run_once(
+            queue_limit=10,
+            process_limit=run_batch_limit,
+        )
+        due_sources = int(run_metrics.get("due_sources") or 0)
+        runs_queued = int(run_metrics.get("runs_queued") or 0)
+        runs_processed = int(run_metrics.get("runs_processed") or 0)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        errors += 1
+        logger.error(
+            "worker.tick_process_runs_error",
+            extra={"component": "worker", "error": sanitize_error(exc, default_message="worker error")},
+        )
 
-    if await _lock_acquired("worker:export_processor"):
-        try:
-            exports_processed = await export_processor.run_once(limit=EXPORT_BATCH_LIMIT)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            errors += 1
-            logger.error(
-                "worker.tick_process_exports_error",
-                extra={"component": "worker", "error": sanitize_error(exc, default_message="worker error")},
-            )
+    try:
+        exports_processed = await export_processor.run_once(limit=EXPORT_BATCH_LIMIT)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        errors += 1
+        logger.error(
+            "worker.tick_process_exports_error",
+            extra={"component": "worker", "error": sanitize_error(exc, default_message="worker error")},
+        )
 
     if await _lock_acquired("worker:alert_task_processor"):
         try:
@@ -153,15 +157,14 @@ async def run_worker_tick(
                 extra={"component": "worker", "error": sanitize_error(exc, default_message="worker error")},
             )
 
-    if await _lock_acquired("worker:notification_sender"):
-        try:
-            notification_emails_sent = await notification_sender.run_once()
-        except Exception as exc:  # pragma: no cover - defensive guard
-            errors += 1
-            logger.error(
-                "worker.tick_process_notification_jobs_error",
-                extra={"component": "worker", "error": sanitize_error(exc, default_message="worker error")},
-            )
+    try:
+        notification_emails_sent = await notification_sender.run_once()
+    except Exception as exc:  # pragma: no cover - defensive guard
+        errors += 1
+        logger.error(
+            "worker.tick_process_notification_jobs_error",
+            extra={"component": "worker", "error": sanitize_error(exc, default_message="worker error")},
+        )
 
     tick_finished_at = _now_iso()
     payload: dict[str, object] = {
@@ -206,15 +209,23 @@ async def run_worker_supervisor_loop() -> None:
     worker_holder = _worker_holder()
     lock_ttl_seconds = _worker_lock_ttl_seconds()
 
+    configure_github(settings.worker_github_tokens_list)
     monitor_processor = MonitorRunProcessor(
         access_token=read_access_token,
         write_access_token=write_access_token,
         fetch_timeout_seconds=settings.WORKER_FETCH_TIMEOUT_SECONDS,
         fetch_max_bytes=settings.WORKER_FETCH_MAX_BYTES,
+        max_concurrent_runs=settings.WORKER_RUN_CONCURRENCY,
+        shared_fetch_window_seconds=settings.WORKER_SHARED_FETCH_WINDOW_SECONDS,
+        snapshot_cache_seconds=settings.WORKER_SNAPSHOT_CACHE_SECONDS,
+        worker_id=worker_holder,
+        lease_seconds=settings.WORKER_JOB_LEASE_SECONDS,
     )
     export_processor = ExportProcessor(
         access_token=write_access_token,
         bucket_name=settings.EXPORTS_BUCKET_NAME,
+        worker_id=worker_holder,
+        lease_seconds=settings.WORKER_JOB_LEASE_SECONDS,
     )
     alert_task_processor = AlertTaskProcessor(access_token=write_access_token)
     readiness_processor = ReadinessProcessor(
@@ -235,34 +246,52 @@ async def run_worker_supervisor_loop() -> None:
         access_token=write_access_token,
         batch_limit=settings.NOTIFY_JOB_BATCH_LIMIT,
         max_attempts=settings.NOTIFY_MAX_ATTEMPTS,
+        worker_id=worker_holder,
+        lease_seconds=settings.WORKER_JOB_LEASE_SECONDS,
     )
 
-    while True:
-        payload = await run_worker_tick(
-            monitor_processor,
-            export_processor,
-            alert_task_processor,
-            readiness_processor,
-            digest_processor,
-            sla_processor,
-            notification_sender,
-            run_batch_limit=settings.WORKER_BATCH_LIMIT,
-            heartbeat_enabled=heartbeat_enabled,
-            lock_holder=worker_holder,
-            lock_ttl_seconds=lock_ttl_seconds,
-        )
+    async with (
+        supabase_http_lifespan(),
+        fetch_engine_lifespan(
+            per_host_concurrency=settings.WORKER_HOST_CONCURRENCY,
+            per_host_rate_per_second=settings.WORKER_FETCH_HOST_RATE_PER_SECOND,
+            max_connections_per_host=settings.WORKER_FETCH_HOST_MAX_CONNECTIONS,
+            max_clients=settings.WORKER_FETCH_MAX_HOST_CLIENTS,
+            client_idle_seconds=settings.WORKER_FETCH_CLIENT_IDLE_SECONDS,
+            http2=settings.WORKER_FETCH_HTTP2,
+        ),
+        compute_pool_lifespan(
+            max_workers=settings.WORKER_COMPUTE_PROCESSES,
+            task_timeout_seconds=settings.WORKER_COMPUTE_TASK_TIMEOUT_SECONDS,
+            max_input_bytes=settings.WORKER_COMPUTE_MAX_INPUT_BYTES,
+        ),
+    ):
+        while True:
+            payload = await run_worker_tick(
+                monitor_processor,
+                export_processor,
+                alert_task_processor,
+                readiness_processor,
+                digest_processor,
+                sla_processor,
+                notification_sender,
+                run_batch_limit=settings.WORKER_BATCH_LIMIT,
+                heartbeat_enabled=heartbeat_enabled,
+                lock_holder=worker_holder,
+                lock_ttl_seconds=lock_ttl_seconds,
+            )
 
-        if (
-            int(payload.get("runs_processed") or 0) == 0
-            and int(payload.get("exports_processed") or 0) == 0
-            and int(payload.get("alert_tasks_processed") or 0) == 0
-            and int(payload.get("runs_queued") or 0) == 0
-            and int(payload.get("readiness_computed") or 0) == 0
-            and int(payload.get("digests_sent") or 0) == 0
-            and int(payload.get("sla_escalations_queued") or 0) == 0
-            and int(payload.get("notification_emails_sent") or 0) == 0
-        ):
-            await asyncio.sleep(max(1, settings.WORKER_POLL_INTERVAL_SECONDS))
+            if (
+                int(payload.get("runs_processed") or 0) == 0
+                and int(payload.get("exports_processed") or 0) == 0
+                and int(payload.get("alert_tasks_processed") or 0) == 0
+                and int(payload.get("runs_queued") or 0) == 0
+                and int(payload.get("readiness_computed") or 0) == 0
+                and int(payload.get("digests_sent") or 0) == 0
+                and int(payload.get("sla_escalations_queued") or 0) == 0
+                and int(payload.get("notification_emails_sent") or 0) == 0
+            ):
+                await asyncio.sleep(max(1, settings.WORKER_POLL_INTERVAL_SECONDS))
 
 
 def main() -> None:
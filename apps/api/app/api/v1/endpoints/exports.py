@@ -10,15 +10,13 @@ from app.api.v1.schemas.exports import (
     ExportOut,
 )
 from app.auth.roles import enforce_org_role
-from app.billing.entitlements import get_entitlements
-from app.billing.guard import ensure_feature_enabled, require_feature
+from app.billing.guard import ensure_feature_enabled, get_org_entitlements, require_feature
 from app.core.settings import get_settings
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.core.supabase_rest import (
     rpc_create_audit_export,
     select_audit_export_by_id,
     select_audit_exports,
-    select_org_billing,
 )
 from app.core.supabase_storage_admin import create_signed_download_url
 
@@ -58,9 +56,7 @@ async def create_export(
 ) -> ExportCreateOut:
     await enforce_org_role(auth, str(payload.org_id), "member")
     _ensure_exports_configured()
-    billing_row = await select_org_billing(auth.access_token, str(payload.org_id))
-    raw_plan = billing_row.get("plan") if isinstance(billing_row, dict) else None
-    entitlements = get_entitlements(raw_plan if isinstance(raw_plan, str) else None)
+    entitlements = await get_org_entitlements(auth, str(payload.org_id))
 
     if entitlements.max_exports_per_month is not None:
         existing_rows = await select_audit_exports(auth.access_token, str(payload.org_id))
@@ -126,7 +122,7 @@ async def export_download_url(
         )
     await enforce_org_role(auth, org_id, "member")
     await ensure_feature_enabled(
-        access_token=auth.access_token,
+        auth=auth,
         org_id=org_id,
         feature_name="exports_enabled",
     )
@@ -16,8 +16,8 @@ from app.api.v1.schemas.members import (
     OrgMemberOut,
     OrgMemberRoleUpdateIn,
 )
-from app.auth.roles import OrgRoleContext, enforce_org_role
-from app.billing.entitlements import get_entitlements
+from app.auth.roles import OrgRoleContext, enforce_org_role, invalidate_org_role_cache
+from app.billing.guard import get_org_entitlements
 from app.core.settings import get_settings
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.core.supabase_rest import (
@@ -27,7 +27,6 @@ from app.core.supabase_rest import (
     rpc_accept_org_invite,
     rpc_create_org_invite,
     rpc_record_audit_event,
-    select_org_billing,
     select_org_invite_by_id,
     select_org_invites,
     select_org_member_service,
@@ -111,6 +110,7 @@ async def update_org_member_role(
             )
 
     updated = await update_org_member_role_service(str(org_id), str(user_id), payload.role)
+    invalidate_org_role_cache(str(org_id), str(user_id))
 
     if payload.role != current_role:
         await rpc_record_audit_event(
@@ -157,6 +157,7 @@ async def remove_org_member(
             )
 
     await delete_org_member_service(str(org_id), str(user_id))
+    invalidate_org_role_cache(str(org_id), str(user_id))
 
     await rpc_record_audit_event(
         auth.access_token,
@@ -183,9 +184,7 @@ async def create_org_invite(
     auth: VerifiedSupabaseAuth = supabase_auth_dependency,
 ) -> OrgInviteCreateOut:
     role_ctx: OrgRoleContext = await enforce_org_role(auth, str(org_id), "admin")
-    billing_row = await select_org_billing(auth.access_token, str(org_id))
-    raw_plan = billing_row.get("plan") if isinstance(billing_row, dict) else None
-    entitlements = get_entitlements(raw_plan if isinstance(raw_plan, str) else None)
+    entitlements = await get_org_entitlements(auth, str(org_id))
 
     if entitlements.max_members is not None:
         member_rows = await select_org_members_service(str(org_id))
@@ -328,6 +327,10 @@ async def accept_org_invite(
     org_id = await rpc_accept_org_invite(auth.access_token, {"p_token": token})
 
     actor_user_id = _as_uuid_or_none(auth.claims.get("sub") if isinstance(auth.claims.get("sub"), str) else None)
+    if actor_user_id is not None:
+        invalidate_org_role_cache(org_id, str(actor_user_id))
+    else:
+        invalidate_org_role_cache(org_id)
     await rpc_record_audit_event(
         auth.access_token,
         {
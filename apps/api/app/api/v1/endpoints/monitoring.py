@@ -4,27 +4,37 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.v1.schemas.monitoring import (
     AlertOut,
+    AlertsPageOut,
     AlertUpdateIn,
     AuditOut,
+    AuditPageOut,
     FindingExplanationOut,
     FindingOut,
+    FindingsPageOut,
     MonitorRunCreateIn,
     MonitorRunOut,
     MonitorRunQueuedOut,
+    MonitorRunsPageOut,
+)
+from app.core.pagination import (
+    decode_page_cursor,
+    page_cursor_query,
+    page_limit_query,
+    split_page,
 )
 from app.core.settings import get_settings
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.core.supabase_rest import (
     rpc_append_audit,
     rpc_create_monitor_run,
+    rpc_latest_snapshots_for_runs,
     rpc_set_alert_status,
     select_alerts,
     select_audit_log,
     select_evidence_files_by_task,
-    select_finding_explanations_by_org,
+    select_finding_explanations_for_findings,
     select_findings,
     select_latest_finding_explanation,
-    select_latest_snapshot_for_run,
     select_monitor_runs,
     select_task_evidence,
     select_tasks_for_alert,
@@ -36,26 +46,42 @@ supabase_auth_dependency = Depends(verify_supabase_auth)
 
 @router.get("/findings")
 async def findings(
-    org_id: UUID, auth: VerifiedSupabaseAuth = supabase_auth_dependency
-) -> dict[str, list[FindingOut]]:
-    rows = await select_findings(auth.access_token, str(org_id))
-    explanation_rows = await select_finding_explanations_by_org(auth.access_token, str(org_id))
+    org_id: UUID,
+    limit: int = page_limit_query,
+    cursor: str | None = page_cursor_query,
+    auth: VerifiedSupabaseAuth = supabase_auth_dependency,
+) -> FindingsPageOut:
+    rows, next_cursor = split_page(
+        await select_findings(
+            auth.access_token, str(org_id), limit=limit, cursor=decode_page_cursor(cursor)
+        ),
+        limit=limit,
+        sort_column="detected_at",
+    )
+    explanation_rows = await select_finding_explanations_for_findings(
+        auth.access_token,
+        str(org_id),
+        [str(row["id"]) for row in rows if isinstance(row.get("id"), str)],
+    )
     finding_ids_with_explanations = {
         str(row.get("finding_id")) for row in explanation_rows if isinstance(row.get("finding_id"), str)
     }
 
+    run_ids = [row["run_id"] for row in rows if isinstance(row.get("run_id"), str)]
+    snapshots_by_run = await rpc_latest_snapshots_for_runs(auth.access_token, run_ids)
+
     result: list[FindingOut] = []
     for row in rows:
         enriched = dict(row)
         run_id = row.get("run_id")
         if isinstance(run_id, str):
-            snapshot = await select_latest_snapshot_for_run(auth.access_token, run_id)
+            snapshot = snapshots_by_run.get(run_id)
             if snapshot:
                 enriched["canonical_title"] = snapshot.get("canonical_title")
                 enriched["item_published_at"] = snapshot.get("item_published_at")
         enriched["has_explanation"] = str(row.get("id")) in finding_ids_with_explanations
         result.append(FindingOut.model_validate(enriched))
-    return {"findings": result}
+    return FindingsPageOut(findings=result, next_cursor=next_cursor)
 
 
 @router.get("/findings/{finding_id}/explanation")
@@ -70,10 +96,21 @@ async def finding_explanation(
 
 @router.get("/alerts")
 async def alerts(
-    org_id: UUID, auth: VerifiedSupabaseAuth = supabase_auth_dependency
-) -> dict[str, list[AlertOut]]:
-    rows = await select_alerts(auth.access_token, str(org_id))
-    return {"alerts": [AlertOut.model_validate(row) for row in rows]}
+    org_id: UUID,
+    limit: int = page_limit_query,
+    cursor: str | None = page_cursor_query,
+    auth: VerifiedSupabaseAuth = supabase_auth_dependency,
+) -> AlertsPageOut:
+    rows, next_cursor = split_page(
+        await select_alerts(
+            auth.access_token, str(org_id), limit=limit, cursor=decode_page_cursor(cursor)
+        ),
+        limit=limit,
+        sort_column="created_at",
+    )
+    return AlertsPageOut(
+        alerts=[AlertOut.model_validate(row) for row in rows], next_cursor=next_cursor
+    )
 
 
 @router.patch("/alerts/{alert_id}")
@@ -107,18 +144,38 @@ async def update_alert(
 
 @router.get("/audit")
 async def audit_log(
-    org_id: UUID, auth: VerifiedSupabaseAuth = supabase_auth_dependency
-) -> dict[str, list[AuditOut]]:
-    rows = await select_audit_log(auth.access_token, str(org_id))
-    return {"audit": [AuditOut.model_validate(row) for row in rows]}
+    org_id: UUID,
+    limit: int = page_limit_query,
+    cursor: str | None = page_cursor_query,
+    auth: VerifiedSupabaseAuth = supabase_auth_dependency,
+) -> AuditPageOut:
+    rows, next_cursor = split_page(
+        await select_audit_log(
+            auth.access_token, str(org_id), limit=limit, cursor=decode_page_cursor(cursor)
+        ),
+        limit=limit,
+        sort_column="created_at",
+    )
+    return AuditPageOut(audit=[AuditOut.model_validate(row) for row in rows], next_cursor=next_cursor)
 
 
 @router.get("/monitor/runs")
 async def monitor_runs(
-    org_id: UUID, auth: VerifiedSupabaseAuth = supabase_auth_dependency
-) -> dict[str, list[MonitorRunOut]]:
-    rows = await select_monitor_runs(auth.access_token, str(org_id))
-    return {"runs": [MonitorRunOut.model_validate(row) for row in rows]}
+    org_id: UUID,
+    limit: int = page_limit_query,
+    cursor: str | None = page_cursor_query,
+    auth: VerifiedSupabaseAuth = supabase_auth_dependency,
+) -> MonitorRunsPageOut:
+    rows, next_cursor = split_page(
+        await select_monitor_runs(
+            auth.access_token, str(org_id), limit=limit, cursor=decode_page_cursor(cursor)
+        ),
+        limit=limit,
+        sort_column="created_at",
+    )
+    return MonitorRunsPageOut(
+        runs=[MonitorRunOut.model_validate(row) for row in rows], next_cursor=next_cursor
+    )
 
 
 @router.post("/monitor/run")
@@ -2,9 +2,20 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.api.v1.schemas.sources import SourceCreateIn, SourceOut, SourceScheduleIn, SourceUpdateIn
-from app.billing.entitlements import get_entitlements
-from app.billing.guard import require_feature
+from app.api.v1.schemas.sources import (
+    SourceCreateIn,
+    SourceOut,
+    SourceScheduleIn,
+    SourcesPageOut,
+    SourceUpdateIn,
+)
+from app.billing.guard import get_org_entitlements, require_feature
+from app.core.pagination import (
+    decode_page_cursor,
+    page_cursor_query,
+    page_limit_query,
+    split_page,
+)
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.core.supabase_rest import (
     rpc_create_source,
@@ -12,7 +23,6 @@ from app.core.supabase_rest import (
     rpc_set_source_cadence,
     rpc_update_source,
     select_due_sources,
-    select_org_billing,
     select_sources,
 )
 
@@ -22,10 +32,21 @@ supabase_auth_dependency = Depends(verify_supabase_auth)
 
 @router.get("/sources")
 async def sources(
-    org_id: UUID, auth: VerifiedSupabaseAuth = supabase_auth_dependency
-) -> dict[str, list[SourceOut]]:
-    rows = await select_sources(auth.access_token, str(org_id))
-    return {"sources": [SourceOut.model_validate(row) for row in rows]}
+    org_id: UUID,
+    limit: int = page_limit_query,
+    cursor: str | None = page_cursor_query,
+    auth: VerifiedSupabaseAuth = supabase_auth_dependency,
+) -> SourcesPageOut:
+    rows, next_cursor = split_page(
+        await select_sources(
+            auth.access_token, str(org_id), limit=limit, cursor=decode_page_cursor(cursor)
+        ),
+        limit=limit,
+        sort_column="created_at",
+    )
+    return SourcesPageOut(
+        sources=[SourceOut.model_validate(row) for row in rows], next_cursor=next_cursor
+    )
 
 
 @router.get("/sources/due")
@@ -40,9 +61,7 @@ async def due_sources(
 async def create_source(
     payload: SourceCreateIn, auth: VerifiedSupabaseAuth = supabase_auth_dependency
 ) -> dict[str, UUID]:
-    billing_row = await select_org_billing(auth.access_token, str(payload.org_id))
-    raw_plan = billing_row.get("plan") if isinstance(billing_row, dict) else None
-    entitlements = get_entitlements(raw_plan if isinstance(raw_plan, str) else None)
+    entitlements = await get_org_entitlements(auth, str(payload.org_id))
 
     if entitlements.max_sources is not None:
         source_rows = await select_sources(auth.access_token, str(payload.org_id))
@@ -12,6 +12,7 @@ from app.api.v1.schemas.system import (
     SystemStatusRowOut,
 )
 from app.core.settings import get_settings
+from app.core.supabase_http import supabase_http_client
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.core.supabase_rest import (
     select_failed_audit_exports_service,
@@ -72,7 +73,7 @@ async def _probe_supabase_health(*, supabase_url: str, supabase_anon_key: str) -
     timeout = httpx.Timeout(SYSTEM_HEALTH_TIMEOUT_SECONDS, connect=0.5)
 
     async def _request() -> bool:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with supabase_http_client(timeout=timeout) as client:
             response = await client.get(url, headers=headers)
             # Any non-5xx response indicates Supabase is reachable.
             return response.status_code < 500
@@ -9,8 +9,15 @@ from app.api.v1.schemas.tasks import (
     TaskEvidenceIn,
     TaskEvidenceOut,
     TaskOut,
+    TasksPageOut,
     TaskStatusIn,
 )
+from app.core.pagination import (
+    decode_page_cursor,
+    page_cursor_query,
+    page_limit_query,
+    split_page,
+)
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.core.supabase_rest import (
     rpc_add_task_comment,
@@ -28,10 +35,19 @@ supabase_auth_dependency = Depends(verify_supabase_auth)
 
 @router.get("/tasks")
 async def tasks(
-    org_id: UUID, auth: VerifiedSupabaseAuth = supabase_auth_dependency
-) -> dict[str, list[TaskOut]]:
-    rows = await select_tasks(auth.access_token, str(org_id))
-    return {"tasks": [TaskOut.model_validate(row) for row in rows]}
+    org_id: UUID,
+    limit: int = page_limit_query,
+    cursor: str | None = page_cursor_query,
+    auth: VerifiedSupabaseAuth = supabase_auth_dependency,
+) -> TasksPageOut:
+    rows, next_cursor = split_page(
+        await select_tasks(
+            auth.access_token, str(org_id), limit=limit, cursor=decode_page_cursor(cursor)
+        ),
+        limit=limit,
+        sort_column="created_at",
+    )
+    return TasksPageOut(tasks=[TaskOut.model_validate(row) for row in rows], next_cursor=next_cursor)
 
 
 @router.post("/tasks")
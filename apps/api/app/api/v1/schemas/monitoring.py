@@ -16,6 +16,11 @@ class MonitorRunOut(BaseModel):
     created_at: datetime
 
 
+class MonitorRunsPageOut(BaseModel):
+    runs: list[MonitorRunOut]
+    next_cursor: str | None = None
+
+
 class FindingOut(BaseModel):
     id: UUID
     org_id: UUID
@@ -33,6 +38,11 @@ class FindingOut(BaseModel):
     has_explanation: bool = False
 
 
+class FindingsPageOut(BaseModel):
+    findings: list[FindingOut]
+    next_cursor: str | None = None
+
+
 class FindingExplanationOut(BaseModel):
     id: UUID
     org_id: UUID
@@ -54,6 +64,11 @@ class AlertOut(BaseModel):
     resolved_at: datetime | None = None
 
 
+class AlertsPageOut(BaseModel):
+    alerts: list[AlertOut]
+    next_cursor: str | None = None
+
+
 class AlertUpdateIn(BaseModel):
     status: Literal["acknowledged", "resolved"]
 
@@ -70,6 +85,11 @@ class AuditOut(BaseModel):
     created_at: datetime
 
 
+class AuditPageOut(BaseModel):
+    audit: list[AuditOut]
+    next_cursor: str | None = None
+
+
 class MonitorRunCreateIn(BaseModel):
     org_id: UUID
     source_id: UUID
@@ -4,11 +4,22 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
 
+from app.core.content_masks import MaskRules
+from app.core.html_selectors import RegionRules
+
 SourceKind = Literal["html", "rss", "pdf", "github_releases"]
 LegacySourceType = Literal["rss", "url"]
 
 
 def _validate_kind_config(kind: SourceKind, config: dict[str, Any]) -> None:
+    MaskRules.from_config(config)
+    if kind == "html":
+        RegionRules.from_config(config)
+        return
+    if kind == "pdf":
+        if not isinstance(config.get("full_document", False), bool):
+            raise ValueError("config.full_document must be a boolean")
+        return
     if kind != "github_releases":
         return
 
@@ -33,6 +44,11 @@ class SourceOut(BaseModel):
     created_at: datetime
 
 
+class SourcesPageOut(BaseModel):
+    sources: list[SourceOut]
+    next_cursor: str | None = None
+
+
 class SourceCreateIn(BaseModel):
     org_id: UUID
     name: str = Field(min_length=1, max_length=120)
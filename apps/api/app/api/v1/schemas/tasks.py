@@ -25,6 +25,11 @@ class TaskOut(BaseModel):
     updated_at: datetime
 
 
+class TasksPageOut(BaseModel):
+    tasks: list[TaskOut]
+    next_cursor: str | None = None
+
+
 class TaskCreateIn(BaseModel):
     org_id: UUID
     title: str = Field(min_length=2, max_length=120)
@@ -1,3 +1,15 @@
-from app.auth.roles import OrgRoleContext, enforce_org_role, require_org_role, role_rank
+from app.auth.roles import (
+    OrgRoleContext,
+    enforce_org_role,
+    invalidate_org_role_cache,
+    require_org_role,
+    role_rank,
+)
 
-__all__ = ["OrgRoleContext", "enforce_org_role", "require_org_role", "role_rank"]
+__all__ = [
+    "OrgRoleContext",
+    "enforce_org_role",
+    "invalidate_org_role_cache",
+    "require_org_role",
+    "role_rank",
+]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from fastapi import HTTPException, status
+
+from app.core.supabase_jwt import VerifiedSupabaseAuth
+from app.core.supabase_rest import rpc_get_org_auth_context
+
+
+@dataclass(frozen=True)
+class OrgAuthContext:
+    org_id: str
+    user_id: str | None
+    role: str | None
+    plan: str | None
+    plan_status: str | None
+
+
+def _clean_str(value: object) -> str | None:
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+def _context_from_row(row: dict[str, object], *, org_id: str) -> OrgAuthContext:
+    role = _clean_str(row.get("role"))
+    return OrgAuthContext(
+        org_id=org_id,
+        user_id=_clean_str(row.get("user_id")),
+        role=role.lower() if role else None,
+        plan=_clean_str(row.get("plan")),
+        plan_status=_clean_str(row.get("plan_status")),
+    )
+
+
+def _org_cache_key(org_id: str) -> tuple[str, str]:
+    return ("org_auth_context", org_id.strip().lower())
+
+
+def remember_org_auth_context(auth: VerifiedSupabaseAuth, context: OrgAuthContext) -> None:
+    auth.request_cache[_org_cache_key(context.org_id)] = context
+
+
+async def get_org_auth_context(auth: VerifiedSupabaseAuth, org_id: str) -> OrgAuthContext:
+    cached = auth.request_cache.get(_org_cache_key(org_id))
+    if isinstance(cached, OrgAuthContext):
+        return cached
+
+    normalized_org_id = org_id.strip()
+    row = await rpc_get_org_auth_context(auth.access_token, org_id=normalized_org_id)
+    context = _context_from_row(row, org_id=_clean_str(row.get("org_id")) or normalized_org_id)
+    remember_org_auth_context(auth, context)
+    return context
+
+
+async def get_source_auth_context(auth: VerifiedSupabaseAuth, source_id: str) -> OrgAuthContext:
+    cache_key = ("source_auth_context", source_id.strip().lower())
+    cached = auth.request_cache.get(cache_key)
+    if isinstance(cached, OrgAuthContext):
+        return cached
+
+    row = await rpc_get_org_auth_context(auth.access_token, source_id=source_id.strip())
+    resolved_org_id = _clean_str(row.get("org_id"))
+    if resolved_org_id is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="org_id is required")
+
+    context = _context_from_row(row, org_id=resolved_org_id)
+    auth.request_cache[cache_key] = context
+    remember_org_auth_context(auth, context)
+    return context
@@ -6,8 +6,10 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 
+from app.auth.context import get_org_auth_context
+from app.core.settings import get_settings
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
-from app.core.supabase_rest import select_org_member_role
+from app.core.ttl_cache import TTLCache
 
 OrgRole = Literal["owner", "admin", "member", "viewer"]
 
@@ -19,6 +21,7 @@ role_rank: dict[str, int] = {
 }
 
 supabase_auth_dependency = Depends(verify_supabase_auth)
+_role_cache: TTLCache[tuple[str, str], str] | None = None
 
 
 @dataclass(frozen=True)
@@ -53,6 +56,47 @@ def _normalize_role(value: str) -> OrgRole:
     return normalized  # type: ignore[return-value]
 
 
+def _role_cache_key(org_id: str, user_id: str) -> tuple[str, str]:
+    return (org_id.strip().lower(), user_id.strip().lower())
+
+
+def get_org_role_cache() -> TTLCache[tuple[str, str], str]:
+    global _role_cache
+    if _role_cache is None:
+        settings = get_settings()
+        _role_cache = TTLCache(
+            max_entries=settings.ORG_ROLE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.ORG_ROLE_CACHE_TTL_SECONDS,
+        )
+    return _role_cache
+
+
+def invalidate_org_role_cache(org_id: str, user_id: str | None = None) -> None:
+    cache = get_org_role_cache()
+    if user_id is not None:
+        cache.pop(_role_cache_key(org_id, user_id))
+        return
+    normalized_org_id = org_id.strip().lower()
+    cache.discard_where(lambda key: key[0] == normalized_org_id)
+
+
+async def _lookup_org_member_role(auth: VerifiedSupabaseAuth, org_id: str, user_id: str) -> str | None:
+    cache = get_org_role_cache()
+    cache_key = _role_cache_key(org_id, user_id)
+    cached_role = cache.get(cache_key)
+    if cached_role is not None:
+        return cached_role
+
+    # One upstream call yields role and plan; the plan stays memoized on the
+    # request so feature guards in the same request do not refetch it.
+    context = await get_org_auth_context(auth, org_id)
+    if context.role is not None:
+        # Only memberships are cached; a missing row is re-checked so invite
+        # acceptance on another instance takes effect immediately.
+        cache.set(cache_key, context.role)
+    return context.role
+
+
 async def enforce_org_role(
     auth: VerifiedSupabaseAuth,
     org_id: str,
@@ -61,7 +105,7 @@ async def enforce_org_role(
     normalized_min = _normalize_role(min_role)
     user_id = _claims_user_id(auth)
 
-    member_role = await select_org_member_role(auth.access_token, org_id, user_id)
+    member_role = await _lookup_org_member_role(auth, org_id, user_id)
     if not isinstance(member_role, str):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
@@ -1,20 +1,23 @@
 from fastapi import Depends, HTTPException, Request, status
 
-from app.billing.entitlements import FeatureName, get_entitlements
+from app.auth.context import OrgAuthContext, get_org_auth_context, get_source_auth_context
+from app.billing.entitlements import FeatureName, PlanEntitlements, get_entitlements
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
-from app.core.supabase_rest import select_org_billing, select_source_by_id
 
 supabase_auth_dependency = Depends(verify_supabase_auth)
 
 
-async def _resolve_org_id_from_request(request: Request, access_token: str) -> str:
+async def _resolve_auth_context_from_request(
+    request: Request,
+    auth: VerifiedSupabaseAuth,
+) -> OrgAuthContext:
     path_org_id = request.path_params.get("org_id")
     if isinstance(path_org_id, str) and path_org_id.strip():
-        return path_org_id.strip()
+        return await get_org_auth_context(auth, path_org_id.strip())
 
     query_org_id = request.query_params.get("org_id")
     if query_org_id and query_org_id.strip():
-        return query_org_id.strip()
+        return await get_org_auth_context(auth, query_org_id.strip())
 
     body_org_id: str | None = None
     try:
@@ -27,27 +30,17 @@ async def _resolve_org_id_from_request(request: Request, access_token: str) -> s
         body_org_id = None
 
     if body_org_id:
-        return body_org_id
+        return await get_org_auth_context(auth, body_org_id)
 
     source_id = request.path_params.get("source_id")
     if isinstance(source_id, str) and source_id.strip():
-        source = await select_source_by_id(access_token, source_id.strip())
-        source_org_id = source.get("org_id") if isinstance(source, dict) else None
-        if isinstance(source_org_id, str) and source_org_id.strip():
-            return source_org_id.strip()
+        # The RPC resolves the owning org itself, so no separate source lookup.
+        return await get_source_auth_context(auth, source_id.strip())
 
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="org_id is required")
 
 
-async def ensure_feature_enabled(
-    *,
-    access_token: str,
-    org_id: str,
-    feature_name: FeatureName,
-) -> None:
-    row = await select_org_billing(access_token, org_id)
-    plan = row.get("plan") if isinstance(row, dict) else None
-    entitlements = get_entitlements(plan if isinstance(plan, str) else None)
+def _require_entitlement(entitlements: PlanEntitlements, feature_name: FeatureName) -> None:
     if bool(getattr(entitlements, feature_name)):
         return
 
@@ -57,16 +50,26 @@ async def ensure_feature_enabled(
     )
 
 
+async def get_org_entitlements(auth: VerifiedSupabaseAuth, org_id: str) -> PlanEntitlements:
+    context = await get_org_auth_context(auth, org_id)
+    return get_entitlements(context.plan)
+
+
+async def ensure_feature_enabled(
+    *,
+    auth: VerifiedSupabaseAuth,
+    org_id: str,
+    feature_name: FeatureName,
+) -> None:
+    _require_entitlement(await get_org_entitlements(auth, org_id), feature_name)
+
+
 def require_feature(feature_name: FeatureName):
     async def dependency(
         request: Request,
         auth: VerifiedSupabaseAuth = supabase_auth_dependency,
     ) -> None:
-        org_id = await _resolve_org_id_from_request(request, auth.access_token)
-        await ensure_feature_enabled(
-            access_token=auth.access_token,
-            org_id=org_id,
-            feature_name=feature_name,
-        )
+        context = await _resolve_auth_context_from_request(request, auth)
+        _require_entitlement(get_entitlements(context.plan), feature_name)
 
     return Depends(dependency)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from re import _constants as sre_constants
+from re import _parser as sre_parser
+from typing import Any
+
+MAX_MASK_PATTERNS = 20
+MAX_MASK_PATTERN_LENGTH = 300
+
+_MONTHS = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+
+# Built-in detectors for content that changes on every request without the
+# page changing in substance. They are opt-in per source: on a regulation
+# page a date can be the substance.
+BUILTIN_MASKS: dict[str, tuple[re.Pattern[str], str]] = {
+    "timestamps": (
+        re.compile(
+            r"\b\d{4}-\d{2}-\d{2}[T ]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+            r"|\b\d{1,2}:\d{2}(?::\d{2})?(?:\s?[AaPp]\.?[Mm]\.?)?(?:\s?(?:UTC|GMT|[A-Z]{2,4}T))?\b"
+        ),
+        "<time>",
+    ),
+    "dates": (
+        re.compile(
+            rf"\b\d{{4}}-\d{{2}}-\d{{2}}\b|\b\d{{1,2}}[/.]\d{{1,2}}[/.]\d{{2,4}}\b"
+            rf"|\b(?:\d{{1,2}}\s+{_MONTHS}\.?,?\s+\d{{4}}|{_MONTHS}\.?\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}})\b",
+            re.IGNORECASE,
+        ),
+        "<date>",
+    ),
+    "nonces": (
+        re.compile(
+            r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+            r"|\b(?=[A-Za-z0-9_-]*\d)(?=[A-Za-z0-9_-]*[A-Za-z])[A-Za-z0-9_-]{20,}\b"
+        ),
+        "<nonce>",
+    ),
+    "counters": (
+        re.compile(
+            r"\b\d[\d,.]*\s+(?:views?|visits?|visitors?|hits?|reads?|readers?|downloads?)\b"
+            r"|\b(?:views?|visits?|visitors?|hits?|page views?)\s*:\s*\d[\d,.]*",
+            re.IGNORECASE,
+        ),
+        "<count>",
+    ),
+}
+
+
+class MaskRuleError(ValueError):
+    pass
+
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, sre_constants.POSSESSIVE_REPEAT)
+
+
+def _has_nested_quantifier(items: Any, repeated: bool = False) -> bool:
+    """Whether a variable-length quantifier sits inside another repeat, as in
+    ``(a+)+`` or ``(\\w+\\s?)*``, the shape that backtracks exponentially."""
+    for op, value in items:
+        if op in _REPEATS:
+            low, high, body = value
+            if repeated and low != high:
+                return True
+            if _has_nested_quantifier(body, repeated or high > 1):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _has_nested_quantifier(value[-1], repeated):
+                return True
+        elif op is sre_constants.ATOMIC_GROUP:
+            if _has_nested_quantifier(value, repeated):
+                return True
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if _has_nested_quantifier(value[1], repeated):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_has_nested_quantifier(branch, repeated) for branch in value[1]):
+                return True
+        elif op is sre_constants.GROUPREF_EXISTS:
+            if any(branch is not None and _has_nested_quantifier(branch, repeated) for branch in value[1:]):
+                return True
+    return False
+
+
+def _string_list(value: Any, key: str) -> list[str]:
+    if value is None:
+        return []
+    items = [value] if isinstance(value, str) else value
+    if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+        raise MaskRuleError(f"config.{key} must be a string or a list of strings")
+    return items
+
+
+@dataclass(frozen=True)
+class MaskRules:
+    masks: tuple[tuple[re.Pattern[str], str], ...]
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> MaskRules | None:
+        masks: list[tuple[re.Pattern[str], str]] = []
+        for name in _string_list(config.get("mask_builtins"), "mask_builtins"):
+            if name not in BUILTIN_MASKS:
+                supported = ", ".join(sorted(BUILTIN_MASKS))
+                raise MaskRuleError(f"unknown mask in config.mask_builtins: {name!r} (supported: {supported})")
+            masks.append(BUILTIN_MASKS[name])
+
+        patterns = _string_list(config.get("mask_patterns"), "mask_patterns")
+        if len(patterns) > MAX_MASK_PATTERNS:
+            raise MaskRuleError(f"config.mask_patterns accepts at most {MAX_MASK_PATTERNS} patterns")
+        for pattern in patterns:
+            if not pattern or len(pattern) > MAX_MASK_PATTERN_LENGTH:
+                raise MaskRuleError("config.mask_patterns entries must be 1-300 characters")
+            try:
+                compiled = re.compile(pattern)
+            except re.error as exc:
+                raise MaskRuleError(f"invalid pattern in config.mask_patterns: {exc}") from exc
+            if _has_nested_quantifier(sre_parser.parse(pattern)):
+                raise MaskRuleError(
+                    f"config.mask_patterns entry nests quantifiers and could backtrack: {pattern!r}"
+                )
+            masks.append((compiled, "<masked>"))
+
+        if not masks:
+            return None
+        return cls(masks=tuple(masks))
+
+    def apply(self, text: str) -> str:
+        for pattern, placeholder in self.masks:
+            text = pattern.sub(placeholder, text)
+        return text
+
+
+def masked_text_fingerprint(config: Mapping[str, Any], text: str) -> str | None:
+    """Fingerprint of ``text`` after the source's volatile-content masks.
+
+    Without masks this is the plain SHA-256 of the stripped text, so existing
+    snapshot fingerprints stay comparable."""
+    cleaned = (text or "").strip()
+    if not cleaned:
+        return None
+    rules = MaskRules.from_config(config)
+    if rules is not None:
+        cleaned = rules.apply(cleaned)
+    return hashlib.sha256(cleaned.encode("utf-8")).hexdigest()
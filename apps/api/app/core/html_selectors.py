@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+MAX_SELECTORS_PER_RULE = 20
+MAX_SELECTOR_LENGTH = 300
+MAX_SELECTOR_STEPS = 16
+
+_CSS_TOKEN_RE = re.compile(
+    r"""
+    (?P<tag>[A-Za-z][A-Za-z0-9-]*|\*)
+    |\#(?P<id>[A-Za-z0-9_-]+)
+    |\.(?P<cls>[A-Za-z0-9_-]+)
+    |\[\s*(?P<attr>[A-Za-z_:][A-Za-z0-9_:.-]*)\s*
+        (?:=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+    """,
+    re.VERBOSE,
+)
+_XPATH_STEP_RE = re.compile(r"(?P<tag>[A-Za-z][A-Za-z0-9-]*|\*)(?P<predicates>(?:\[[^\]]*\])*)$")
+_XPATH_PREDICATE_RE = re.compile(
+    r"""\[\s*(?:
+        @(?P<attr>[A-Za-z_:][A-Za-z0-9_:.-]*)\s*(?:=\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'))?
+        |contains\(\s*@class\s*,\s*(?:"(?P<cdq>[^"]*)"|'(?P<csq>[^']*)')\s*\)
+    )\s*\]""",
+    re.VERBOSE,
+)
+
+
+class SelectorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SelectorStep:
+    tag: str | None = None
+    element_id: str | None = None
+    classes: tuple[str, ...] = ()
+    attrs: tuple[tuple[str, str | None], ...] = ()
+    # How this step relates to the one before it: "descendant" or "child".
+    combinator: str = "descendant"
+
+    def matches(self, tag: str, attrs: Mapping[str, str]) -> bool:
+        if self.tag is not None and self.tag != tag:
+            return False
+        if self.element_id is not None and attrs.get("id") != self.element_id:
+            return False
+        if self.classes:
+            element_classes = set(attrs.get("class", "").split())
+            if not element_classes.issuperset(self.classes):
+                return False
+        for name, value in self.attrs:
+            if name not in attrs or (value is not None and attrs[name] != value):
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class Selector:
+    source: str
+    steps: tuple[SelectorStep, ...]
+
+    def matches(self, path: Sequence[tuple[str, Mapping[str, str]]]) -> bool:
+        """Whether the last element of ``path`` (root first) matches."""
+        if not path or not self.steps[-1].matches(*path[-1]):
+            return False
+        # One pass per step over the path: ``matched[at]`` says whether the
+        # steps so far match with the current step at ``path[at]``. This is
+        # linear in the path depth per step, where backtracking through
+        # descendant combinators would be exponential.
+        matched: list[bool] | None = None
+        for step in self.steps:
+            current: list[bool] = []
+            ancestor_matched = False
+            for at, (tag, attrs) in enumerate(path):
+                if matched is None:
+                    linked = True
+                elif step.combinator == "child":
+                    linked = at > 0 and matched[at - 1]
+                else:
+                    linked = ancestor_matched
+                current.append(linked and step.matches(tag, attrs))
+                if matched is not None and matched[at]:
+                    ancestor_matched = True
+            matched = current
+        return bool(matched and matched[-1])
+
+
+def _parse_css_compound(text: str, combinator: str) -> SelectorStep:
+    tag: str | None = None
+    element_id: str | None = None
+    classes: list[str] = []
+    attrs: list[tuple[str, str | None]] = []
+    position = 0
+    while position < len(text):
+        matched = _CSS_TOKEN_RE.match(text, position)
+        if matched is None or (matched.group("tag") and position > 0):
+            raise SelectorError(f"unsupported selector syntax: {text!r}")
+        if matched.group("tag") and matched.group("tag") != "*":
+            tag = matched.group("tag").lower()
+        elif matched.group("id"):
+            element_id = matched.group("id")
+        elif matched.group("cls"):
+            classes.append(matched.group("cls"))
+        elif matched.group("attr"):
+            value = next(
+                (group for group in matched.group("dq", "sq", "bare") if group is not None), None
+            )
+            attrs.append((matched.group("attr").lower(), value))
+        position = matched.end()
+    return SelectorStep(
+        tag=tag,
+        element_id=element_id,
+        classes=tuple(classes),
+        attrs=tuple(attrs),
+        combinator=combinator,
+    )
+
+
+def _parse_css(text: str) -> tuple[SelectorStep, ...]:
+    steps: list[SelectorStep] = []
+    combinator = "descendant"
+    for token in text.replace(">", " > ").split():
+        if token == ">":
+            if not steps or combinator == "child":
+                raise SelectorError(f"unsupported selector syntax: {text!r}")
+            combinator = "child"
+            continue
+        steps.append(_parse_css_compound(token, combinator))
+        combinator = "descendant"
+    if not steps or combinator == "child":
+        raise SelectorError(f"unsupported selector syntax: {text!r}")
+    return tuple(steps)
+
+
+def _parse_xpath(text: str) -> tuple[SelectorStep, ...]:
+    raw_steps = re.findall(r"(//|/)([^/]+)", text)
+    if not raw_steps or "".join(separator + step for separator, step in raw_steps) != text:
+        raise SelectorError(f"unsupported XPath syntax: {text!r}")
+    steps: list[SelectorStep] = []
+    for separator, step_text in raw_steps:
+        matched = _XPATH_STEP_RE.match(step_text.strip())
+        if matched is None:
+            raise SelectorError(f"unsupported XPath syntax: {text!r}")
+        element_id: str | None = None
+        classes: list[str] = []
+        attrs: list[tuple[str, str | None]] = []
+        predicates = matched.group("predicates")
+        position = 0
+        while position < len(predicates):
+            predicate = _XPATH_PREDICATE_RE.match(predicates, position)
+            if predicate is None:
+                raise SelectorError(f"unsupported XPath syntax: {text!r}")
+            position = predicate.end()
+            contains = predicate.group("cdq") or predicate.group("csq")
+            if contains:
+                classes.extend(contains.split())
+                continue
+            name = predicate.group("attr").lower()
+            value = next((group for group in predicate.group("dq", "sq") if group is not None), None)
+            if name == "id" and value is not None:
+                element_id = value
+            else:
+                attrs.append((name, value))
+        tag = matched.group("tag").lower()
+        # A leading single "/" anchors at the document root; the root element
+        # has no parent here, so it behaves like a descendant match.
+        combinator = "child" if separator == "/" and steps else "descendant"
+        steps.append(
+            SelectorStep(
+                tag=None if tag == "*" else tag,
+                element_id=element_id,
+                classes=tuple(classes),
+                attrs=tuple(attrs),
+                combinator=combinator,
+            )
+        )
+    return tuple(steps)
+
+
+def parse_selector(text: str) -> Selector:
+    """Parses a CSS selector (tags, #id, .class, [attr], [attr=value],
+    descendant and ``>`` combinators) or an XPath location path made of
+    ``/`` and ``//`` steps with ``[@attr]``, ``[@attr='v']`` and
+    ``[contains(@class, 'v')]`` predicates."""
+    cleaned = text.strip()
+    if not cleaned:
+        raise SelectorError("selector must not be empty")
+    if len(cleaned) > MAX_SELECTOR_LENGTH:
+        raise SelectorError("selector is too long")
+    steps = _parse_xpath(cleaned) if cleaned.startswith("/") else _parse_css(cleaned)
+    if len(steps) > MAX_SELECTOR_STEPS:
+        raise SelectorError(f"selector accepts at most {MAX_SELECTOR_STEPS} steps")
+    return Selector(source=cleaned, steps=steps)
+
+
+def _parse_selector_list(value: Any, key: str) -> tuple[Selector, ...]:
+    if value is None:
+        return ()
+    items = [value] if isinstance(value, str) else value
+    if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+        raise SelectorError(f"config.{key} must be a selector string or a list of selector strings")
+    if len(items) > MAX_SELECTORS_PER_RULE:
+        raise SelectorError(f"config.{key} accepts at most {MAX_SELECTORS_PER_RULE} selectors")
+    selectors: list[Selector] = []
+    for item in items:
+        # Selector lists ("main, article") are accepted as in CSS.
+        parts = [item] if item.strip().startswith("/") else item.split(",")
+        selectors.extend(parse_selector(part) for part in parts)
+    return tuple(selectors)
+
+
+@dataclass(frozen=True)
+class RegionRules:
+    include: tuple[Selector, ...] = field(default_factory=tuple)
+    exclude: tuple[Selector, ...] = field(default_factory=tuple)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> RegionRules | None:
+        include = _parse_selector_list(config.get("include_selectors"), "include_selectors")
+        exclude = _parse_selector_list(config.get("exclude_selectors"), "exclude_selectors")
+        if not include and not exclude:
+            return None
+        return cls(include=include, exclude=exclude)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Query, status
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+page_limit_query = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+page_cursor_query = Query(default=None, max_length=256)
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    sort_value: str
+    id: str
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def encode_page_cursor(sort_value: str, row_id: str) -> str:
+    raw = json.dumps([sort_value, row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_page_cursor(cursor: str | None) -> PageCursor | None:
+    if cursor is None or not cursor.strip():
+        return None
+
+    token = cursor.strip()
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        sort_value, row_id = json.loads(raw)
+        # Both parts end up inside a PostgREST filter, so only accept the shapes we emit.
+        datetime.fromisoformat(sort_value)
+        UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise _invalid_cursor() from None
+
+    return PageCursor(sort_value=sort_value, id=row_id)
+
+
+def keyset_page_params(sort_column: str, *, limit: int, cursor: PageCursor | None) -> dict[str, str]:
+    # One extra row tells us whether another page exists without a count query.
+    params = {
+        "order": f"{sort_column}.desc,id.desc",
+        "limit": str(limit + 1),
+    }
+    if cursor is not None:
+        params["or"] = (
+            f'({sort_column}.lt."{cursor.sort_value}",'
+            f'and({sort_column}.eq."{cursor.sort_value}",id.lt.{cursor.id}))'
+        )
+    return params
+
+
+def split_page(
+    rows: list[dict[str, Any]], *, limit: int, sort_column: str
+) -> tuple[list[dict[str, Any]], str | None]:
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    last = page[-1]
+    sort_value = last.get(sort_column)
+    row_id = last.get("id")
+    if not isinstance(sort_value, str) or not isinstance(row_id, str):
+        return page, None
+    return page, encode_page_cursor(sort_value, row_id)
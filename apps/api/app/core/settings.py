@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     REQUIRE_ALERT_EVIDENCE_FOR_RESOLVE: bool = True
     ALERT_RESOLVE_MIN_EVIDENCE: int = 1
     SLACK_ALERT_NOTIFICATIONS_ENABLED: bool = True
+    ORG_ROLE_CACHE_TTL_SECONDS: float = 60.0
+    ORG_ROLE_CACHE_MAX_ENTRIES: int = 10_000
     VERIRULE_SECRETS_KEY: str | None = None
     INTEGRATIONS_ENCRYPTION_KEY: str | None = None
     NEXT_PUBLIC_SITE_URL: str = "https://www.verirule.com"
@@ -40,12 +42,35 @@ class Settings(BaseSettings):
     SUPABASE_SERVICE_ROLE_KEY: str | None = None
     SUPABASE_ISSUER: str | None = None
     SUPABASE_JWKS_URL: str | None = None
+    SUPABASE_JWKS_REFRESH_SECONDS: int = 600
+    SUPABASE_JWKS_MIN_REFETCH_SECONDS: int = 30
+    SUPABASE_JWT_CACHE_MAX_ENTRIES: int = 2048
+    SUPABASE_HTTP_TIMEOUT_SECONDS: float = 10.0
+    SUPABASE_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    SUPABASE_HTTP_POOL_TIMEOUT_SECONDS: float = 5.0
+    SUPABASE_HTTP_MAX_CONNECTIONS: int = 50
+    SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    SUPABASE_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
     WORKER_SUPABASE_ACCESS_TOKEN: str | None = None
     WORKER_POLL_INTERVAL_SECONDS: int = 5
-    WORKER_BATCH_LIMIT: int = 5
+    WORKER_BATCH_LIMIT: int = 25
+    WORKER_RUN_CONCURRENCY: int = 10
+    WORKER_HOST_CONCURRENCY: int = 2
+    WORKER_JOB_LEASE_SECONDS: int = 300
     READINESS_COMPUTE_INTERVAL_SECONDS: int = 900
     WORKER_FETCH_TIMEOUT_SECONDS: float = 10.0
     WORKER_FETCH_MAX_BYTES: int = 1_000_000
+    WORKER_FETCH_HOST_RATE_PER_SECOND: float = 2.0
+    WORKER_FETCH_HOST_MAX_CONNECTIONS: int = 4
+    WORKER_FETCH_MAX_HOST_CLIENTS: int = 256
+    WORKER_FETCH_CLIENT_IDLE_SECONDS: float = 300.0
+    WORKER_FETCH_HTTP2: bool = True
+    WORKER_SHARED_FETCH_WINDOW_SECONDS: float = 600.0
+    WORKER_SNAPSHOT_CACHE_SECONDS: float = 86_400.0
+    WORKER_GITHUB_TOKENS: str | None = None
+    WORKER_COMPUTE_PROCESSES: int = 2
+    WORKER_COMPUTE_TASK_TIMEOUT_SECONDS: float = 30.0
+    WORKER_COMPUTE_MAX_INPUT_BYTES: int = 20_000_000
     EXPORTS_BUCKET_NAME: str = "exports"
     EXPORT_SIGNED_URL_SECONDS: int = 300
     EVIDENCE_BUCKET_NAME: str = "evidence"
@@ -78,6 +103,10 @@ class Settings(BaseSettings):
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.API_CORS_ORIGINS.split(",") if origin.strip()]
 
+    @property
+    def worker_github_tokens_list(self) -> list[str]:
+        return [token.strip() for token in (self.WORKER_GITHUB_TOKENS or "").split(",") if token.strip()]
+
 
 @lru_cache
 def get_settings() -> Settings:
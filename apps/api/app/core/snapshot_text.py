@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import zlib
+
+TEXT_ENCODING_ZLIB = "zlib"
+TEXT_ENCODING_PLAIN = "plain"
+
+
+def snapshot_text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compress_snapshot_text(text: str) -> dict[str, str]:
+    """Body fields for snapshot_texts; base64 because they travel as JSON."""
+    compressed = zlib.compress(text.encode("utf-8"), 6)
+    return {
+        "text_encoding": TEXT_ENCODING_ZLIB,
+        "text_body": base64.b64encode(compressed).decode("ascii"),
+    }
+
+
+def _bytea_bytes(value: str) -> bytes:
+    # PostgREST renders bytea as "\x" followed by hex digits.
+    if value.startswith("\\x"):
+        return bytes.fromhex(value[2:])
+    return base64.b64decode(value)
+
+
+def decode_snapshot_text(encoding: str | None, body: str) -> str:
+    raw = _bytea_bytes(body)
+    if encoding == TEXT_ENCODING_ZLIB:
+        raw = zlib.decompress(raw)
+    elif encoding not in {None, TEXT_ENCODING_PLAIN}:
+        raise ValueError(f"unsupported snapshot text encoding: {encoding}")
+    return raw.decode("utf-8")
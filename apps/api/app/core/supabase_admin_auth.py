@@ -6,6 +6,7 @@ import httpx
 from fastapi import HTTPException, status
 
 from app.core.settings import get_settings
+from app.core.supabase_http import supabase_http_client
 
 
 def _service_role_key() -> str:
@@ -59,7 +60,7 @@ async def fetch_user_email_by_id(
     url = f"{settings.SUPABASE_URL.rstrip('/')}/auth/v1/admin/users/{user_id_value}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, headers=_admin_headers())
             if response.status_code == status.HTTP_404_NOT_FOUND:
                 if cache is not None:
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from app.core.settings import get_settings
+
+TimeoutValue = float | httpx.Timeout
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+class PooledSupabaseClient:
+    """Per-call view over the shared pool that applies the caller's timeout."""
+
+    def __init__(self, client: httpx.AsyncClient, timeout: TimeoutValue | None) -> None:
+        self._client = client
+        self._timeout = timeout
+
+    def _with_timeout(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        if self._timeout is not None and "timeout" not in kwargs:
+            kwargs["timeout"] = self._timeout
+        return kwargs
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._client.get(url, **self._with_timeout(kwargs))
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._client.post(url, **self._with_timeout(kwargs))
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._client.patch(url, **self._with_timeout(kwargs))
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._client.put(url, **self._with_timeout(kwargs))
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._client.delete(url, **self._with_timeout(kwargs))
+
+    def stream(self, method: str, url: str, **kwargs: Any) -> Any:
+        return self._client.stream(method, url, **self._with_timeout(kwargs))
+
+
+def default_supabase_timeout() -> httpx.Timeout:
+    settings = get_settings()
+    return httpx.Timeout(
+        settings.SUPABASE_HTTP_TIMEOUT_SECONDS,
+        connect=settings.SUPABASE_HTTP_CONNECT_TIMEOUT_SECONDS,
+        pool=settings.SUPABASE_HTTP_POOL_TIMEOUT_SECONDS,
+    )
+
+
+def build_supabase_http_client() -> httpx.AsyncClient:
+    settings = get_settings()
+    return httpx.AsyncClient(
+        timeout=default_supabase_timeout(),
+        limits=httpx.Limits(
+            max_connections=max(1, settings.SUPABASE_HTTP_MAX_CONNECTIONS),
+            max_keepalive_connections=max(0, settings.SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS),
+            keepalive_expiry=max(0.0, settings.SUPABASE_HTTP_KEEPALIVE_EXPIRY_SECONDS),
+        ),
+    )
+
+
+async def open_supabase_http_client() -> httpx.AsyncClient:
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = build_supabase_http_client()
+    return _shared_client
+
+
+async def close_supabase_http_client() -> None:
+    global _shared_client
+    client = _shared_client
+    _shared_client = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def get_shared_supabase_http_client() -> httpx.AsyncClient | None:
+    client = _shared_client
+    if client is None or client.is_closed:
+        return None
+    return client
+
+
+@asynccontextmanager
+async def supabase_http_client(timeout: TimeoutValue | None = None) -> AsyncIterator[Any]:
+    # Outside the API lifespan / worker loop (scripts, tests) fall back to a
+    # short-lived client so callers never need to care which mode is active.
+    shared = get_shared_supabase_http_client()
+    if shared is not None:
+        yield PooledSupabaseClient(shared, timeout)
+        return
+
+    async with httpx.AsyncClient(timeout=timeout or default_supabase_timeout()) as client:
+        yield client
+
+
+@asynccontextmanager
+async def supabase_http_lifespan() -> AsyncIterator[httpx.AsyncClient]:
+    client = await open_supabase_http_client()
+    try:
+        yield client
+    finally:
+        await close_supabase_http_client()
@@ -1,18 +1,28 @@
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
 import jwt
 from fastapi import Header, HTTPException, status
-from jwt import PyJWKClient
-from jwt.exceptions import InvalidTokenError, PyJWKClientError
+from jwt import PyJWK, PyJWKClient, PyJWKSet
+from jwt.exceptions import InvalidTokenError, PyJWKClientError, PyJWKSetError
 
 from app.core.settings import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class VerifiedSupabaseAuth:
     access_token: str
     claims: dict[str, Any]
+    # Lives exactly as long as the request; guards memoize org lookups here.
+    request_cache: dict[Any, Any] = field(default_factory=dict, compare=False, repr=False)
 
 
 def _unauthorized() -> HTTPException:
@@ -34,24 +44,225 @@ def _extract_bearer_token(authorization: str | None) -> str:
     return token.strip()
 
 
-def _decode_supabase_token(token: str) -> dict[str, Any]:
+class SigningKeyCache:
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        refresh_seconds: float,
+        min_refetch_seconds: float,
+    ) -> None:
+        self.jwks_url = jwks_url
+        self._client = PyJWKClient(jwks_url, cache_jwk_set=False)
+        self._refresh_seconds = max(1.0, refresh_seconds)
+        self._min_refetch_seconds = max(0.0, min_refetch_seconds)
+        self._keys: dict[str | None, PyJWK] = {}
+        self._fetched_at: float | None = None
+        self._last_attempt_at: float | None = None
+        self._state_lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._background_refresh: threading.Thread | None = None
+
+    def _load_keys(self) -> dict[str | None, PyJWK]:
+        jwk_set = PyJWKSet.from_dict(self._client.fetch_data())
+        keys: dict[str | None, PyJWK] = {key.key_id: key for key in jwk_set.keys}
+        if len(jwk_set.keys) == 1:
+            keys.setdefault(None, jwk_set.keys[0])
+        return keys
+
+    def refresh(self, *, force: bool = False) -> None:
+        with self._fetch_lock:
+            now = time.monotonic()
+            with self._state_lock:
+                last_attempt_at = self._last_attempt_at
+                have_keys = bool(self._keys)
+            if (
+                not force
+                and have_keys
+                and last_attempt_at is not None
+                and now - last_attempt_at < self._min_refetch_seconds
+            ):
+                return
+
+            with self._state_lock:
+                self._last_attempt_at = now
+            keys = self._load_keys()
+            with self._state_lock:
+                self._keys = keys
+                self._fetched_at = time.monotonic()
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh(force=True)
+        except (PyJWKClientError, PyJWKSetError, ValueError) as exc:
+            # Keep serving the previous key set; the next stale read retries.
+            logger.warning("auth.jwks_refresh_failed", extra={"component": "auth", "error": str(exc)[:200]})
+
+    def _schedule_background_refresh(self) -> None:
+        with self._state_lock:
+            running = self._background_refresh
+            if running is not None and running.is_alive():
+                return
+            thread = threading.Thread(target=self._refresh_quietly, name="jwks-refresh", daemon=True)
+            self._background_refresh = thread
+        thread.start()
+
+    def cached_signing_key(self, kid: str | None) -> PyJWK | None:
+        with self._state_lock:
+            key = self._keys.get(kid)
+            fetched_at = self._fetched_at
+        if key is not None and fetched_at is not None and time.monotonic() - fetched_at >= self._refresh_seconds:
+            self._schedule_background_refresh()
+        return key
+
+    def _known_signing_key(self, kid: str | None) -> PyJWK:
+        with self._state_lock:
+            key = self._keys.get(kid)
+        if key is None:
+            raise PyJWKClientError(f'Unable to find a signing key that matches: "{kid}"')
+        return key
+
+    def get_signing_key(self, kid: str | None) -> PyJWK:
+        key = self.cached_signing_key(kid)
+        if key is not None:
+            return key
+        # Unknown kid: the issuer may have rotated keys, so refetch (rate limited).
+        self.refresh()
+        return self._known_signing_key(kid)
+
+    async def aget_signing_key(self, kid: str | None) -> PyJWK:
+        key = self.cached_signing_key(kid)
+        if key is not None:
+            return key
+        # The JWKS download is blocking I/O; keep it off the event loop.
+        await asyncio.to_thread(self.refresh)
+        return self._known_signing_key(kid)
+
+    def get_signing_key_from_jwt(self, token: str) -> PyJWK:
+        return self.get_signing_key(_token_kid(token))
+
+    async def aget_signing_key_from_jwt(self, token: str) -> PyJWK:
+        return await self.aget_signing_key(_token_kid(token))
+
+
+def _token_kid(token: str) -> str | None:
+    kid = jwt.get_unverified_header(token).get("kid")
+    return kid if isinstance(kid, str) else None
+
+
+class VerifiedTokenCache:
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        if self._max_entries == 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return dict(claims)
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        if self._max_entries == 0:
+            return
+        exp = claims.get("exp")
+        if isinstance(exp, bool) or not isinstance(exp, int | float):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(exp), dict(claims))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_cache_lock = threading.Lock()
+_signing_key_cache: SigningKeyCache | None = None
+_verified_token_cache: VerifiedTokenCache | None = None
+
+
+def get_signing_key_cache() -> SigningKeyCache:
+    global _signing_key_cache
     settings = get_settings()
+    jwks_url = settings.SUPABASE_JWKS_URL or ""
+    with _cache_lock:
+        if _signing_key_cache is None or _signing_key_cache.jwks_url != jwks_url:
+            _signing_key_cache = SigningKeyCache(
+                jwks_url,
+                refresh_seconds=settings.SUPABASE_JWKS_REFRESH_SECONDS,
+                min_refetch_seconds=settings.SUPABASE_JWKS_MIN_REFETCH_SECONDS,
+            )
+        return _signing_key_cache
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    global _verified_token_cache
+    with _cache_lock:
+        if _verified_token_cache is None:
+            _verified_token_cache = VerifiedTokenCache(get_settings().SUPABASE_JWT_CACHE_MAX_ENTRIES)
+        return _verified_token_cache
+
+
+def _decode_with_key(token: str, signing_key: Any) -> dict[str, Any]:
+    decoded = jwt.decode(
+        token,
+        signing_key,
+        algorithms=["RS256", "ES256"],
+        issuer=get_settings().SUPABASE_ISSUER,
+        options={"verify_aud": False},
+    )
+    if not isinstance(decoded, dict):
+        raise _unauthorized()
+    get_verified_token_cache().put(token, decoded)
+    return decoded
+
+
+def _decode_supabase_token(token: str) -> dict[str, Any]:
+    cached_claims = get_verified_token_cache().get(token)
+    if cached_claims is not None:
+        return cached_claims
+
+    try:
+        signing_key = get_signing_key_cache().get_signing_key_from_jwt(token).key
+        return _decode_with_key(token, signing_key)
+    except HTTPException:
+        raise
+    except (InvalidTokenError, PyJWKClientError, PyJWKSetError, ValueError):
+        raise _unauthorized() from None
+
+
+async def _adecode_supabase_token(token: str) -> dict[str, Any]:
+    cached_claims = get_verified_token_cache().get(token)
+    if cached_claims is not None:
+        return cached_claims
 
     try:
-        signing_key = PyJWKClient(settings.SUPABASE_JWKS_URL).get_signing_key_from_jwt(token).key
-        decoded = jwt.decode(
-            token,
-            signing_key,
-            algorithms=["RS256", "ES256"],
-            issuer=settings.SUPABASE_ISSUER,
-            options={"verify_aud": False},
-        )
-        if not isinstance(decoded, dict):
-            raise _unauthorized()
-        return decoded
+        signing_key = (await get_signing_key_cache().aget_signing_key_from_jwt(token)).key
+        return _decode_with_key(token, signing_key)
     except HTTPException:
         raise
-    except (InvalidTokenError, PyJWKClientError, ValueError):
+    except (InvalidTokenError, PyJWKClientError, PyJWKSetError, ValueError):
         raise _unauthorized() from None
 
 
@@ -60,10 +271,10 @@ def verify_bearer_token(auth_header: str) -> dict[str, Any]:
     return _decode_supabase_token(token)
 
 
-def verify_supabase_jwt(authorization: str | None = Header(default=None)) -> dict[str, Any]:
-    return verify_bearer_token(authorization or "")
+async def verify_supabase_jwt(authorization: str | None = Header(default=None)) -> dict[str, Any]:
+    return await _adecode_supabase_token(_extract_bearer_token(authorization))
 
 
-def verify_supabase_auth(authorization: str | None = Header(default=None)) -> VerifiedSupabaseAuth:
+async def verify_supabase_auth(authorization: str | None = Header(default=None)) -> VerifiedSupabaseAuth:
     token = _extract_bearer_token(authorization)
-    return VerifiedSupabaseAuth(access_token=token, claims=_decode_supabase_token(token))
+    return VerifiedSupabaseAuth(access_token=token, claims=await _adecode_supabase_token(token))
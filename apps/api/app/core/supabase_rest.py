@@ -1,14 +1,20 @@
+import zlib
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Literal
 
 import httpx
 from fastapi import HTTPException, status
 
 from app.core.logging import get_request_id
+from app.core.pagination import PageCursor, keyset_page_params
 from app.core.settings import get_settings
+from app.core.snapshot_text import decode_snapshot_text
+from app.core.supabase_http import supabase_http_client
 
 AUDIT_PACKET_MAX_ROWS = 2_000
-SUPABASE_HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+FINDING_ID_FILTER_BATCH = 100
+
+JobQueue = Literal["monitor_runs", "audit_exports", "notification_jobs"]
 
 
 def supabase_rest_headers(access_token: str) -> dict[str, str]:
@@ -86,12 +92,43 @@ async def _service_role_patch(
     headers["Prefer"] = "return=minimal"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
+            response = await client.patch(url, params=params, json=payload, headers=headers)
+            response.raise_for_status()
+    except httpx.HTTPError as exc:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=error_detail) from exc
+
+
+async def _service_role_claimed_patch(
+    table: str,
+    row_id: str,
+    holder: str,
+    payload: dict[str, Any],
+    *,
+    error_detail: str,
+) -> bool:
+    """Patch a claimed job row only while ``holder`` still owns its lease.
+    Returns False when no row matched, i.e. the lease was lost."""
+    settings = get_settings()
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/{table}"
+    params = {
+        "id": f"eq.{row_id}",
+        "status": "eq.running",
+        "claimed_by": f"eq.{holder}",
+        "select": "id",
+    }
+    headers = supabase_service_role_headers()
+    headers["Prefer"] = "return=representation"
+
+    try:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json=payload, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=error_detail) from exc
 
+    return bool(_validated_list_payload(response.json(), error_detail))
+
 
 async def _service_role_upsert(
     table: str,
@@ -106,7 +143,7 @@ async def _service_role_upsert(
     headers["Prefer"] = "resolution=merge-duplicates,return=minimal"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 params={"on_conflict": conflict_column},
@@ -124,7 +161,7 @@ async def supabase_select_orgs(access_token: str) -> list[dict[str, Any]]:
     params = {"select": "id,name,created_at"}
 
     try:
-        async with httpx.AsyncClient(timeout=SUPABASE_HTTP_TIMEOUT) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except (httpx.TimeoutException, httpx.HTTPError) as exc:
@@ -152,7 +189,7 @@ async def select_org_member_role(access_token: str, org_id: str, user_id: str) -
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -166,6 +203,38 @@ async def select_org_member_role(access_token: str, org_id: str, user_id: str) -
     return role if isinstance(role, str) else None
 
 
+async def rpc_get_org_auth_context(
+    access_token: str,
+    *,
+    org_id: str | None = None,
+    source_id: str | None = None,
+) -> dict[str, Any]:
+    settings = get_settings()
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/get_org_auth_context"
+    payload = {"p_org_id": org_id, "p_source_id": source_id}
+
+    try:
+        async with supabase_http_client() as client:
+            response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
+            response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        error_detail = _supabase_error_detail(exc.response) or ""
+        if "not authenticated" in error_detail.lower():
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Unauthorized",
+                headers={"WWW-Authenticate": "Bearer"},
+            ) from exc
+        raise _supabase_gateway_error("Failed to fetch authorization context from Supabase.") from exc
+    except httpx.HTTPError as exc:
+        raise _supabase_gateway_error("Failed to fetch authorization context from Supabase.") from exc
+
+    body = response.json()
+    if not isinstance(body, dict):
+        raise _supabase_gateway_error("Invalid authorization context response from Supabase.")
+    return body
+
+
 async def select_org_ids_for_roles(
     access_token: str,
     user_id: str,
@@ -187,7 +256,7 @@ async def select_org_ids_for_roles(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=SUPABASE_HTTP_TIMEOUT) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except (httpx.TimeoutException, httpx.HTTPError) as exc:
@@ -212,7 +281,7 @@ async def select_org_members_service(org_id: str) -> list[dict[str, Any]]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -235,7 +304,7 @@ async def select_org_member_service(org_id: str, user_id: str) -> dict[str, Any]
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -260,7 +329,7 @@ async def update_org_member_role_service(org_id: str, user_id: str, role: str) -
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json={"role": role}, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -284,7 +353,7 @@ async def delete_org_member_service(org_id: str, user_id: str) -> None:
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.delete(url, params=params, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -308,7 +377,7 @@ async def count_org_members_by_role_service(org_id: str, role: str) -> int:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -338,7 +407,7 @@ async def select_org_invites(
         params["accepted_at"] = "is.null"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -365,7 +434,7 @@ async def select_org_invite_by_id(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -386,7 +455,7 @@ async def delete_org_invite(access_token: str, org_id: str, invite_id: str) -> N
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.delete(url, params=params, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -405,7 +474,7 @@ async def rpc_require_org_role(access_token: str, payload: dict[str, Any]) -> No
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/require_org_role"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -432,7 +501,7 @@ async def rpc_create_org_invite(access_token: str, payload: dict[str, Any]) -> d
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/create_org_invite"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -468,7 +537,7 @@ async def rpc_accept_org_invite(access_token: str, payload: dict[str, Any]) -> s
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/accept_org_invite"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -503,7 +572,7 @@ async def supabase_rpc_create_org(access_token: str, name: str) -> str:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/create_org"
 
     try:
-        async with httpx.AsyncClient(timeout=SUPABASE_HTTP_TIMEOUT) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 json={"p_name": name},
@@ -553,7 +622,7 @@ async def rpc_compute_org_readiness(access_token: str, org_id: str) -> str:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/compute_org_readiness"
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with supabase_http_client(timeout=15.0) as client:
             response = await client.post(
                 url,
                 json={"p_org_id": org_id},
@@ -587,7 +656,7 @@ async def list_org_readiness(access_token: str, org_id: str, limit: int = 30) ->
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -604,16 +673,24 @@ async def get_latest_org_readiness(access_token: str, org_id: str) -> dict[str,
     return rows[0] if rows else None
 
 
-async def select_sources(access_token: str, org_id: str) -> list[dict[str, Any]]:
+async def select_sources(
+    access_token: str,
+    org_id: str,
+    *,
+    limit: int | None = None,
+    cursor: PageCursor | None = None,
+) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/sources"
     params = {
         "select": "id,org_id,name,type,kind,config,title,url,is_enabled,cadence,next_run_at,last_run_at,created_at",
         "org_id": f"eq.{org_id}",
     }
+    if limit is not None:
+        params.update(keyset_page_params("created_at", limit=limit, cursor=cursor))
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -644,7 +721,7 @@ async def rpc_create_source(access_token: str, payload: dict[str, Any]) -> str:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/create_source_v2"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -668,7 +745,7 @@ async def rpc_toggle_source(access_token: str, payload: dict[str, Any]) -> None:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/toggle_source"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -683,7 +760,7 @@ async def rpc_update_source(access_token: str, payload: dict[str, Any]) -> None:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/update_source"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -698,7 +775,7 @@ async def rpc_set_source_cadence(access_token: str, payload: dict[str, Any]) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/set_source_cadence"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -713,7 +790,7 @@ async def rpc_schedule_next_run(access_token: str, payload: dict[str, Any]) -> N
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/schedule_next_run"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -765,7 +842,13 @@ def _consume_audit_packet_rows(rows: list[dict[str, Any]], remaining: int) -> in
     return remaining - row_count
 
 
-async def select_monitor_runs(access_token: str, org_id: str) -> list[dict[str, Any]]:
+async def select_monitor_runs(
+    access_token: str,
+    org_id: str,
+    *,
+    limit: int | None = None,
+    cursor: PageCursor | None = None,
+) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/monitor_runs"
     params = {
@@ -773,9 +856,11 @@ async def select_monitor_runs(access_token: str, org_id: str) -> list[dict[str,
         "org_id": f"eq.{org_id}",
         "order": "created_at.desc",
     }
+    if limit is not None:
+        params.update(keyset_page_params("created_at", limit=limit, cursor=cursor))
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -787,30 +872,6 @@ async def select_monitor_runs(access_token: str, org_id: str) -> list[dict[str,
     return _validated_list_payload(response.json(), "Invalid monitor runs response from Supabase.")
 
 
-async def select_queued_monitor_runs(access_token: str, limit: int = 5) -> list[dict[str, Any]]:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/monitor_runs"
-    params = {
-        "select": "id,org_id,source_id,status,attempts,next_attempt_at,last_error",
-        "status": "eq.queued",
-        "or": "(next_attempt_at.is.null,next_attempt_at.lte.now())",
-        "order": "created_at.asc",
-        "limit": str(limit),
-    }
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to fetch queued monitor runs from Supabase.",
-        ) from exc
-
-    return _validated_list_payload(response.json(), "Invalid queued monitor runs response from Supabase.")
-
-
 async def select_source_by_id(access_token: str, source_id: str) -> dict[str, Any] | None:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/sources"
@@ -821,7 +882,7 @@ async def select_source_by_id(access_token: str, source_id: str) -> dict[str, An
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -848,7 +909,7 @@ async def select_due_sources(access_token: str, org_id: str | None = None) -> li
         params["org_id"] = f"eq.{org_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -860,88 +921,99 @@ async def select_due_sources(access_token: str, org_id: str | None = None) -> li
     return _validated_list_payload(response.json(), "Invalid due sources response from Supabase.")
 
 
-async def select_recent_active_monitor_runs_for_source(
-    access_token: str,
-    source_id: str,
-    created_after_iso: str,
-) -> list[dict[str, Any]]:
+async def select_latest_snapshot(access_token: str, source_id: str) -> dict[str, Any] | None:
+    # Metadata only; the text lives in snapshot_texts (select_snapshot_text).
     settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/monitor_runs"
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/snapshots"
     params = {
-        "select": "id,source_id,status,created_at",
+        "select": "id,org_id,source_id,run_id,content_hash,http_status,etag,last_modified,text_fingerprint,text_hash,item_id,item_published_at,created_at",
         "source_id": f"eq.{source_id}",
-        "status": "in.(queued,running)",
-        "created_at": f"gte.{created_after_iso}",
         "order": "created_at.desc",
         "limit": "1",
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to fetch recent active monitor runs from Supabase.",
+            detail="Failed to fetch latest snapshot from Supabase.",
         ) from exc
 
-    return _validated_list_payload(
-        response.json(), "Invalid recent active monitor runs response from Supabase."
-    )
+    rows = _validated_list_payload(response.json(), "Invalid latest snapshot response from Supabase.")
+    return rows[0] if rows else None
 
 
-async def select_latest_snapshot(access_token: str, source_id: str) -> dict[str, Any] | None:
+async def select_snapshot_text(access_token: str, snapshot_id: str) -> str | None:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/snapshots"
     params = {
-        "select": "id,org_id,source_id,run_id,fetched_url,content_hash,content_type,content_len,http_status,etag,last_modified,text_preview,text_fingerprint,canonical_title,canonical_text,item_id,item_published_at,fetched_at,created_at",
-        "source_id": f"eq.{source_id}",
-        "order": "created_at.desc",
+        "select": "canonical_text,text_preview,snapshot_texts(encoding,body)",
+        "id": f"eq.{snapshot_id}",
         "limit": "1",
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to fetch latest snapshot from Supabase.",
+            detail="Failed to fetch snapshot text from Supabase.",
         ) from exc
 
-    rows = _validated_list_payload(response.json(), "Invalid latest snapshot response from Supabase.")
-    return rows[0] if rows else None
+    rows = _validated_list_payload(response.json(), "Invalid snapshot text response from Supabase.")
+    if not rows:
+        return None
+    row = rows[0]
+    stored = row.get("snapshot_texts")
+    if isinstance(stored, dict) and stored.get("body") is not None:
+        try:
+            return decode_snapshot_text(stored.get("encoding"), str(stored["body"]))
+        except (ValueError, zlib.error) as exc:
+            raise _supabase_gateway_error("Invalid snapshot text response from Supabase.") from exc
+    # Rows written before the text store carry their text inline.
+    return row.get("canonical_text") or row.get("text_preview")
+
 
+async def rpc_latest_snapshots_for_runs(access_token: str, run_ids: list[str]) -> dict[str, dict[str, Any]]:
+    normalized_ids = sorted({run_id.strip() for run_id in run_ids if run_id.strip()})
+    if not normalized_ids:
+        return {}
 
-async def select_latest_snapshot_for_run(access_token: str, run_id: str) -> dict[str, Any] | None:
     settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/snapshots"
-    params = {
-        "select": "id,run_id,canonical_title,item_published_at,created_at",
-        "run_id": f"eq.{run_id}",
-        "order": "created_at.desc",
-        "limit": "1",
-    }
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/latest_snapshots_for_runs"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
+        async with supabase_http_client() as client:
+            response = await client.post(
+                url,
+                json={"p_run_ids": normalized_ids},
+                headers=supabase_rest_headers(access_token),
+            )
             response.raise_for_status()
     except httpx.HTTPError as exc:
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to fetch latest snapshot for run from Supabase.",
+            detail="Failed to fetch latest snapshots for runs from Supabase.",
         ) from exc
 
     rows = _validated_list_payload(
-        response.json(), "Invalid latest snapshot for run response from Supabase."
+        response.json(), "Invalid latest snapshots for runs response from Supabase."
     )
-    return rows[0] if rows else None
+    return {str(row["run_id"]): row for row in rows if isinstance(row.get("run_id"), str)}
 
 
-async def select_findings(access_token: str, org_id: str) -> list[dict[str, Any]]:
+async def select_findings(
+    access_token: str,
+    org_id: str,
+    *,
+    limit: int | None = None,
+    cursor: PageCursor | None = None,
+) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/findings"
     params = {
@@ -949,9 +1021,11 @@ async def select_findings(access_token: str, org_id: str) -> list[dict[str, Any]
         "org_id": f"eq.{org_id}",
         "order": "detected_at.desc",
     }
+    if limit is not None:
+        params.update(keyset_page_params("detected_at", limit=limit, cursor=cursor))
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -963,27 +1037,35 @@ async def select_findings(access_token: str, org_id: str) -> list[dict[str, Any]
     return _validated_list_payload(response.json(), "Invalid findings response from Supabase.")
 
 
-async def select_finding_explanations_by_org(access_token: str, org_id: str) -> list[dict[str, Any]]:
+async def select_finding_explanations_for_findings(
+    access_token: str, org_id: str, finding_ids: list[str]
+) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/finding_explanations"
-    params = {
-        "select": "finding_id",
-        "org_id": f"eq.{org_id}",
-    }
+    ids = list(dict.fromkeys(finding_id for finding_id in finding_ids if finding_id.strip()))
+    rows: list[dict[str, Any]] = []
+    # Batched so a full findings page does not produce an oversized URL.
+    for start in range(0, len(ids), FINDING_ID_FILTER_BATCH):
+        params = {
+            "select": "finding_id",
+            "org_id": f"eq.{org_id}",
+            "finding_id": _in_filter(ids[start : start + FINDING_ID_FILTER_BATCH]),
+        }
 
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to fetch finding explanations from Supabase.",
-        ) from exc
+        try:
+            async with supabase_http_client() as client:
+                response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
+                response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Failed to fetch finding explanations from Supabase.",
+            ) from exc
 
-    return _validated_list_payload(
-        response.json(), "Invalid finding explanations response from Supabase."
-    )
+        rows.extend(
+            _validated_list_payload(response.json(), "Invalid finding explanations response from Supabase.")
+        )
+    return rows
 
 
 async def select_latest_finding_explanation(
@@ -999,7 +1081,7 @@ async def select_latest_finding_explanation(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1014,7 +1096,13 @@ async def select_latest_finding_explanation(
     return rows[0] if rows else None
 
 
-async def select_alerts(access_token: str, org_id: str) -> list[dict[str, Any]]:
+async def select_alerts(
+    access_token: str,
+    org_id: str,
+    *,
+    limit: int | None = None,
+    cursor: PageCursor | None = None,
+) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/alerts"
     params = {
@@ -1022,9 +1110,11 @@ async def select_alerts(access_token: str, org_id: str) -> list[dict[str, Any]]:
         "org_id": f"eq.{org_id}",
         "order": "created_at.desc",
     }
+    if limit is not None:
+        params.update(keyset_page_params("created_at", limit=limit, cursor=cursor))
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1046,7 +1136,7 @@ async def select_alert_by_id(access_token: str, alert_id: str) -> dict[str, Any]
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1072,7 +1162,7 @@ async def select_alert_by_id_for_org(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1097,7 +1187,7 @@ async def select_alerts_needing_tasks_service(limit: int = 50) -> list[dict[str,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1122,7 +1212,7 @@ async def list_active_org_ids_service(limit_per_table: int = 2000) -> list[str]:
     headers = supabase_service_role_headers()
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with supabase_http_client(timeout=15.0) as client:
             sources_response = await client.get(source_url, params=params, headers=headers)
             sources_response.raise_for_status()
             tasks_response = await client.get(task_url, params=params, headers=headers)
@@ -1159,7 +1249,7 @@ async def select_finding_by_id(access_token: str, finding_id: str) -> dict[str,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1172,7 +1262,13 @@ async def select_finding_by_id(access_token: str, finding_id: str) -> dict[str,
     return rows[0] if rows else None
 
 
-async def select_audit_log(access_token: str, org_id: str) -> list[dict[str, Any]]:
+async def select_audit_log(
+    access_token: str,
+    org_id: str,
+    *,
+    limit: int | None = None,
+    cursor: PageCursor | None = None,
+) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/audit_events"
     params = {
@@ -1180,9 +1276,11 @@ async def select_audit_log(access_token: str, org_id: str) -> list[dict[str, Any
         "org_id": f"eq.{org_id}",
         "order": "created_at.desc",
     }
+    if limit is not None:
+        params.update(keyset_page_params("created_at", limit=limit, cursor=cursor))
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1199,7 +1297,7 @@ async def rpc_create_audit_export(access_token: str, payload: dict[str, Any]) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/create_audit_export"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -1245,7 +1343,7 @@ async def select_audit_exports(access_token: str, org_id: str) -> list[dict[str,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1267,7 +1365,7 @@ async def select_audit_export_by_id(access_token: str, export_id: str) -> dict[s
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1280,32 +1378,6 @@ async def select_audit_export_by_id(access_token: str, export_id: str) -> dict[s
     return rows[0] if rows else None
 
 
-async def select_queued_audit_exports_service(limit: int = 3) -> list[dict[str, Any]]:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/audit_exports"
-    params = {
-        "select": "id,org_id,requested_by_user_id,format,scope,status,created_at,attempts,next_attempt_at,last_error",
-        "status": "eq.queued",
-        "or": "(next_attempt_at.is.null,next_attempt_at.lte.now())",
-        "order": "created_at.asc",
-        "limit": str(limit),
-    }
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=supabase_service_role_headers())
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to fetch queued audit exports from Supabase.",
-        ) from exc
-
-    return _validated_list_payload(
-        response.json(), "Invalid queued audit exports response from Supabase."
-    )
-
-
 async def select_audit_packet_data(
     access_token: str,
     org_id: str,
@@ -1334,7 +1406,7 @@ async def select_audit_packet_data(
         params = _with_time_range(params, column=date_column, from_ts=from_ts, to_ts=to_ts)
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with supabase_http_client(timeout=15.0) as client:
                 response = await client.get(f"{base_url}/{table}", params=params, headers=headers)
                 response.raise_for_status()
         except httpx.HTTPError as exc:
@@ -1415,7 +1487,7 @@ async def select_audit_packet_data(
         "limit": "1",
     }
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with supabase_http_client(timeout=15.0) as client:
             readiness_response = await client.get(
                 f"{base_url}/org_readiness_snapshots",
                 params=readiness_params,
@@ -1459,35 +1531,31 @@ async def update_audit_export_status(
     file_sha256: str | None,
     error_text: str | None,
     completed_at: str | None,
-) -> None:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/audit_exports"
-    params = {"id": f"eq.{export_id}"}
-    payload = {
-        "status": status_value,
-        "file_path": file_path,
-        "file_sha256": file_sha256,
-        "error_text": error_text,
-        "completed_at": completed_at,
-    }
-    headers = supabase_service_role_headers()
-    headers["Prefer"] = "return=minimal"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.patch(url, params=params, json=payload, headers=headers)
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to update audit export status in Supabase.",
-        ) from exc
+    *,
+    holder: str,
+) -> bool:
+    return await _service_role_claimed_patch(
+        "audit_exports",
+        export_id,
+        holder,
+        {
+            "status": status_value,
+            "file_path": file_path,
+            "file_sha256": file_sha256,
+            "error_text": error_text,
+            "completed_at": completed_at,
+            "claimed_by": None,
+            "lease_expires_at": None,
+        },
+        error_detail="Failed to update audit export status in Supabase.",
+    )
 
 
-async def mark_audit_export_attempt_started(export_id: str, attempts: int) -> None:
-    await _service_role_patch(
+async def mark_audit_export_attempt_started(export_id: str, attempts: int, *, holder: str) -> bool:
+    return await _service_role_claimed_patch(
         "audit_exports",
         export_id,
+        holder,
         {
             "status": "running",
             "attempts": attempts,
@@ -1505,10 +1573,13 @@ async def mark_audit_export_for_retry(
     attempts: int,
     next_attempt_at: str,
     last_error: str,
-) -> None:
-    await _service_role_patch(
+    *,
+    holder: str,
+) -> bool:
+    return await _service_role_claimed_patch(
         "audit_exports",
         export_id,
+        holder,
         {
             "status": "queued",
             "attempts": attempts,
@@ -1516,6 +1587,8 @@ async def mark_audit_export_for_retry(
             "last_error": last_error,
             "error_text": last_error,
             "completed_at": None,
+            "claimed_by": None,
+            "lease_expires_at": None,
         },
         error_detail="Failed to schedule audit export retry.",
     )
@@ -1526,10 +1599,13 @@ async def mark_audit_export_dead_letter(
     attempts: int,
     last_error: str,
     completed_at: str,
-) -> None:
-    await _service_role_patch(
+    *,
+    holder: str,
+) -> bool:
+    return await _service_role_claimed_patch(
         "audit_exports",
         export_id,
+        holder,
         {
             "status": "failed",
             "attempts": attempts,
@@ -1537,15 +1613,18 @@ async def mark_audit_export_dead_letter(
             "last_error": last_error,
             "error_text": last_error,
             "completed_at": completed_at,
+            "claimed_by": None,
+            "lease_expires_at": None,
         },
         error_detail="Failed to mark audit export as failed.",
     )
 
 
-async def mark_monitor_run_attempt_started(run_id: str, attempts: int) -> None:
-    await _service_role_patch(
+async def mark_monitor_run_attempt_started(run_id: str, attempts: int, *, holder: str) -> bool:
+    return await _service_role_claimed_patch(
         "monitor_runs",
         run_id,
+        holder,
         {
             "attempts": attempts,
             "next_attempt_at": None,
@@ -1556,28 +1635,18 @@ async def mark_monitor_run_attempt_started(run_id: str, attempts: int) -> None:
     )
 
 
-async def clear_monitor_run_error_state(run_id: str) -> None:
-    await _service_role_patch(
-        "monitor_runs",
-        run_id,
-        {
-            "next_attempt_at": None,
-            "last_error": None,
-            "error": None,
-        },
-        error_detail="Failed to clear monitor run retry fields.",
-    )
-
-
 async def mark_monitor_run_for_retry(
     run_id: str,
     attempts: int,
     next_attempt_at: str,
     last_error: str,
-) -> None:
-    await _service_role_patch(
+    *,
+    holder: str,
+) -> bool:
+    return await _service_role_claimed_patch(
         "monitor_runs",
         run_id,
+        holder,
         {
             "status": "queued",
             "attempts": attempts,
@@ -1585,6 +1654,8 @@ async def mark_monitor_run_for_retry(
             "last_error": last_error,
             "error": None,
             "finished_at": None,
+            "claimed_by": None,
+            "lease_expires_at": None,
         },
         error_detail="Failed to schedule monitor run retry.",
     )
@@ -1595,10 +1666,13 @@ async def mark_monitor_run_dead_letter(
     attempts: int,
     last_error: str,
     failed_at: str,
-) -> None:
-    await _service_role_patch(
+    *,
+    holder: str,
+) -> bool:
+    return await _service_role_claimed_patch(
         "monitor_runs",
         run_id,
+        holder,
         {
             "status": "failed",
             "attempts": attempts,
@@ -1606,6 +1680,8 @@ async def mark_monitor_run_dead_letter(
             "last_error": last_error,
             "error": last_error,
             "finished_at": failed_at,
+            "claimed_by": None,
+            "lease_expires_at": None,
         },
         error_detail="Failed to mark monitor run as failed.",
     )
@@ -1633,7 +1709,7 @@ async def select_system_status(access_token: str) -> list[dict[str, Any]]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1660,7 +1736,7 @@ async def rpc_acquire_worker_lock(key: str, holder: str, ttl_seconds: int) -> bo
     }
 
     try:
-        async with httpx.AsyncClient(timeout=SUPABASE_HTTP_TIMEOUT) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_service_role_headers())
             response.raise_for_status()
     except (ValueError, httpx.TimeoutException, httpx.HTTPError) as exc:
@@ -1672,6 +1748,119 @@ async def rpc_acquire_worker_lock(key: str, holder: str, ttl_seconds: int) -> bo
     raise _supabase_gateway_error("Invalid worker lock response from Supabase.")
 
 
+async def rpc_claim_jobs(
+    queue: JobQueue,
+    holder: str,
+    *,
+    limit: int,
+    lease_seconds: int,
+) -> list[dict[str, Any]]:
+    normalized_holder = holder.strip()
+    if not normalized_holder:
+        return []
+
+    settings = get_settings()
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/claim_jobs"
+    payload = {
+        "p_queue": queue,
+        "p_holder": normalized_holder,
+        "p_limit": max(1, int(limit)),
+        "p_lease_seconds": max(5, int(lease_seconds)),
+    }
+
+    try:
+        async with supabase_http_client() as client:
+            response = await client.post(url, json=payload, headers=supabase_service_role_headers())
+            response.raise_for_status()
+    except (ValueError, httpx.TimeoutException, httpx.HTTPError) as exc:
+        raise _supabase_gateway_error(f"Failed to claim {queue} jobs.") from exc
+
+    return _validated_list_payload(response.json(), f"Invalid claim {queue} response from Supabase.")
+
+
+async def rpc_renew_job_lease(queue: JobQueue, job_id: str, holder: str, lease_seconds: int) -> bool:
+    settings = get_settings()
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/renew_job_lease"
+    payload = {
+        "p_queue": queue,
+        "p_id": job_id,
+        "p_holder": holder.strip(),
+        "p_lease_seconds": max(5, int(lease_seconds)),
+    }
+
+    try:
+        async with supabase_http_client() as client:
+            response = await client.post(url, json=payload, headers=supabase_service_role_headers())
+            response.raise_for_status()
+    except (ValueError, httpx.TimeoutException, httpx.HTTPError) as exc:
+        raise _supabase_gateway_error(f"Failed to renew {queue} lease.") from exc
+
+    body = response.json()
+    if isinstance(body, bool):
+        return body
+    raise _supabase_gateway_error(f"Invalid renew {queue} lease response from Supabase.")
+
+
+async def rpc_enqueue_due_runs(*, limit: int) -> dict[str, int]:
+    settings = get_settings()
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/enqueue_due_runs"
+
+    try:
+        async with supabase_http_client() as client:
+            response = await client.post(
+                url,
+                json={"p_limit": max(1, int(limit))},
+                headers=supabase_service_role_headers(),
+            )
+            response.raise_for_status()
+    except (ValueError, httpx.TimeoutException, httpx.HTTPError) as exc:
+        raise _supabase_gateway_error("Failed to enqueue due monitor runs.") from exc
+
+    body = response.json()
+    if not isinstance(body, dict):
+        raise _supabase_gateway_error("Invalid enqueue due runs response from Supabase.")
+    try:
+        return {
+            "due_sources": int(body.get("due_sources") or 0),
+            "runs_queued": int(body.get("runs_queued") or 0),
+        }
+    except (TypeError, ValueError) as exc:
+        raise _supabase_gateway_error("Invalid enqueue due runs response from Supabase.") from exc
+
+
+async def rpc_complete_monitor_run(
+    run_id: str,
+    *,
+    holder: str,
+    fetch: dict[str, Any],
+    snapshot: dict[str, Any] | None = None,
+    finding: dict[str, Any] | None = None,
+    touch: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    settings = get_settings()
+    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/complete_monitor_run"
+    payload = {
+        "p_run_id": run_id,
+        "p_holder": holder,
+        "p_fetch": fetch,
+        "p_snapshot": snapshot,
+        "p_finding": finding,
+        "p_touch": touch,
+    }
+
+    try:
+        async with supabase_http_client() as client:
+            response = await client.post(url, json=payload, headers=supabase_service_role_headers())
+            response.raise_for_status()
+    except (ValueError, httpx.TimeoutException, httpx.HTTPError) as exc:
+        raise _supabase_gateway_error("Failed to complete monitor run in Supabase.") from exc
+
+    body = response.json()
+    if not isinstance(body, dict):
+        raise _supabase_gateway_error("Invalid complete monitor run response from Supabase.")
+    return body
+
+
 def _org_ids_in_filter(org_ids: list[str]) -> str:
     normalized = [org_id.strip() for org_id in org_ids if org_id.strip()]
     return f"in.({','.join(normalized)})"
@@ -1696,7 +1885,7 @@ async def select_failed_notification_jobs_service(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=SUPABASE_HTTP_TIMEOUT) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except (httpx.TimeoutException, httpx.HTTPError) as exc:
@@ -1724,7 +1913,7 @@ async def select_failed_audit_exports_service(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=SUPABASE_HTTP_TIMEOUT) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except (httpx.TimeoutException, httpx.HTTPError) as exc:
@@ -1752,7 +1941,7 @@ async def select_failed_monitor_runs_service(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=SUPABASE_HTTP_TIMEOUT) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except (httpx.TimeoutException, httpx.HTTPError) as exc:
@@ -1766,7 +1955,7 @@ async def rpc_create_monitor_run(access_token: str, payload: dict[str, Any]) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/create_monitor_run"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1790,7 +1979,7 @@ async def rpc_set_monitor_run_state(access_token: str, payload: dict[str, Any])
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/set_monitor_run_state"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1805,7 +1994,7 @@ async def rpc_insert_snapshot(access_token: str, payload: dict[str, Any]) -> str
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/insert_snapshot"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1829,31 +2018,7 @@ async def rpc_insert_snapshot_v2(access_token: str, payload: dict[str, Any]) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/insert_snapshot_v2"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to insert snapshot in Supabase.",
-        ) from exc
-
-    response_payload = response.json()
-    if not isinstance(response_payload, str):
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Invalid insert snapshot response from Supabase.",
-        )
-
-    return response_payload
-
-
-async def rpc_insert_snapshot_v3(access_token: str, payload: dict[str, Any]) -> str:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/insert_snapshot_v3"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1872,36 +2037,12 @@ async def rpc_insert_snapshot_v3(access_token: str, payload: dict[str, Any]) ->
     return response_payload
 
 
-async def rpc_upsert_finding(access_token: str, payload: dict[str, Any]) -> str:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/upsert_finding"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to upsert finding in Supabase.",
-        ) from exc
-
-    response_payload = response.json()
-    if not isinstance(response_payload, str):
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Invalid upsert finding response from Supabase.",
-        )
-
-    return response_payload
-
-
 async def rpc_set_alert_status(access_token: str, payload: dict[str, Any]) -> None:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/set_alert_status"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1916,7 +2057,7 @@ async def rpc_record_audit_event(access_token: str, payload: dict[str, Any]) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/record_audit_event"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -1930,46 +2071,13 @@ async def rpc_append_audit(access_token: str, payload: dict[str, Any]) -> None:
     await rpc_record_audit_event(access_token, payload)
 
 
-async def rpc_insert_finding_explanation(access_token: str, payload: dict[str, Any]) -> str:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/insert_finding_explanation"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to insert finding explanation in Supabase.",
-        ) from exc
-
-    response_payload = response.json()
-    if not isinstance(response_payload, str):
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Invalid finding explanation response from Supabase.",
-        )
-
-    return response_payload
-
-
-async def rpc_set_source_fetch_metadata(access_token: str, payload: dict[str, Any]) -> None:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/set_source_fetch_metadata"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to update source fetch metadata in Supabase.",
-        ) from exc
-
-
-async def select_tasks(access_token: str, org_id: str) -> list[dict[str, Any]]:
+async def select_tasks(
+    access_token: str,
+    org_id: str,
+    *,
+    limit: int | None = None,
+    cursor: PageCursor | None = None,
+) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/tasks"
     params = {
@@ -1977,9 +2085,11 @@ async def select_tasks(access_token: str, org_id: str) -> list[dict[str, Any]]:
         "org_id": f"eq.{org_id}",
         "order": "created_at.desc",
     }
+    if limit is not None:
+        params.update(keyset_page_params("created_at", limit=limit, cursor=cursor))
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2001,7 +2111,7 @@ async def select_task_by_id(access_token: str, task_id: str) -> dict[str, Any] |
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2024,7 +2134,7 @@ async def select_tasks_for_alert(access_token: str, alert_id: str) -> list[dict[
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2046,7 +2156,7 @@ async def select_task_comments(access_token: str, task_id: str) -> list[dict[str
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2068,7 +2178,7 @@ async def select_task_evidence(access_token: str, task_id: str) -> list[dict[str
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2093,7 +2203,7 @@ async def select_task_evidence_by_id(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2119,7 +2229,7 @@ async def select_evidence_files_by_task(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2144,7 +2254,7 @@ async def select_evidence_file_by_id(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2164,7 +2274,7 @@ async def insert_evidence_file(access_token: str, payload: dict[str, Any]) -> di
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2194,7 +2304,7 @@ async def update_evidence_file_finalize_service(
     payload = {"sha256": sha256, "uploaded_by": uploaded_by}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json=payload, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2218,7 +2328,7 @@ async def delete_evidence_file(access_token: str, evidence_file_id: str, org_id:
     headers["Prefer"] = "return=minimal"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.delete(url, params=params, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2233,7 +2343,7 @@ async def rpc_create_task(access_token: str, payload: dict[str, Any]) -> str:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/create_task"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2281,7 +2391,7 @@ async def insert_task_service(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2329,7 +2439,7 @@ async def bulk_insert_task_controls(
     payload = [{"org_id": org_id, "task_id": task_id, "control_id": control_id} for control_id in normalized_ids]
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 params={"on_conflict": "org_id,task_id,control_id"},
@@ -2362,7 +2472,7 @@ async def bulk_insert_task_controls_service(
     payload = [{"org_id": org_id, "task_id": task_id, "control_id": control_id} for control_id in normalized_ids]
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 params={"on_conflict": "org_id,task_id,control_id"},
@@ -2411,7 +2521,7 @@ async def bulk_insert_task_evidence_service(
     ]
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2433,7 +2543,7 @@ async def rpc_link_alert_task(access_token: str, org_id: str, alert_id: str, tas
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -2469,7 +2579,7 @@ async def rpc_set_task_status(access_token: str, payload: dict[str, Any]) -> Non
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/set_task_status"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2484,7 +2594,7 @@ async def rpc_add_task_comment(access_token: str, payload: dict[str, Any]) -> st
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/add_task_comment"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2508,7 +2618,7 @@ async def rpc_add_task_evidence(access_token: str, payload: dict[str, Any]) -> s
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/add_task_evidence"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2537,7 +2647,7 @@ async def select_integrations(access_token: str, org_id: str) -> list[dict[str,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2560,7 +2670,7 @@ async def select_integration(access_token: str, org_id: str, integration_type: s
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2578,7 +2688,7 @@ async def rpc_upsert_integration(access_token: str, payload: dict[str, Any]) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/upsert_integration"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2602,7 +2712,7 @@ async def rpc_disable_integration(access_token: str, payload: dict[str, Any]) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/disable_integration"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2625,7 +2735,7 @@ async def select_integration_secret(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2648,7 +2758,7 @@ async def select_org_billing(access_token: str, org_id: str) -> dict[str, Any] |
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2667,7 +2777,7 @@ async def ensure_alert_task_rules(access_token: str, org_id: str) -> None:
     payload = {"p_org_id": org_id}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -2702,7 +2812,7 @@ async def get_alert_task_rules(access_token: str, org_id: str) -> dict[str, Any]
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2728,7 +2838,7 @@ async def update_alert_task_rules(
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json=patch, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2747,7 +2857,7 @@ async def ensure_org_sla_rules(access_token: str, org_id: str) -> None:
     payload = {"p_org_id": org_id}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -2782,7 +2892,7 @@ async def get_org_sla_rules(access_token: str, org_id: str) -> dict[str, Any] |
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2808,7 +2918,7 @@ async def update_org_sla_rules(
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json=patch, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2837,7 +2947,7 @@ async def rpc_compute_task_due_at(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2866,7 +2976,7 @@ async def list_enabled_sla_rules_service(limit: int = 500) -> list[dict[str, Any
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2891,7 +3001,7 @@ async def select_open_tasks_for_sla_service(org_id: str, *, limit: int = 1000) -
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -2933,7 +3043,7 @@ async def create_task_escalation_service(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 params={"on_conflict": "task_id,kind,window_start"},
@@ -2973,7 +3083,7 @@ async def ensure_org_notification_rules(access_token: str, org_id: str) -> None:
     payload = {"p_org_id": org_id}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -3004,7 +3114,7 @@ async def upsert_my_email(access_token: str, org_id: str) -> None:
     payload = {"p_org_id": org_id}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -3039,7 +3149,7 @@ async def get_org_notification_rules(access_token: str, org_id: str) -> dict[str
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3065,7 +3175,7 @@ async def update_org_notification_rules(
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json=patch, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3083,7 +3193,7 @@ async def ensure_user_notification_prefs(access_token: str) -> None:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/ensure_user_notification_prefs"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json={}, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -3115,7 +3225,7 @@ async def get_user_notification_prefs(access_token: str) -> dict[str, Any] | Non
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3142,7 +3252,7 @@ async def update_user_notification_prefs(
     headers["Prefer"] = "return=representation"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json=patch, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3169,7 +3279,7 @@ async def list_digest_notification_rules_service(limit: int = 50) -> list[dict[s
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3189,7 +3299,7 @@ async def update_org_notification_last_digest_sent_service(org_id: str, sent_at:
     headers["Prefer"] = "return=minimal"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(
                 url,
                 params=params,
@@ -3214,7 +3324,7 @@ async def select_org_member_user_ids_service(org_id: str) -> list[str]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3242,7 +3352,7 @@ async def list_org_member_emails(org_id: str) -> list[dict[str, Any]]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3270,7 +3380,7 @@ async def select_user_notification_prefs_for_users_service(user_ids: list[str])
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3310,7 +3420,7 @@ async def enqueue_notification_job(
         body["run_after"] = run_after
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=body, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3323,35 +3433,11 @@ async def enqueue_notification_job(
     return rows[0] if rows else None
 
 
-async def fetch_due_notification_jobs(limit: int = 50) -> list[dict[str, Any]]:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/notification_jobs"
-    now_iso = datetime.now(UTC).isoformat().replace("+00:00", "Z")
-    params = {
-        "select": "id,org_id,type,payload,status,attempts,last_error,run_after,created_at,updated_at",
-        "status": "eq.queued",
-        "run_after": f"lte.{now_iso}",
-        "order": "run_after.asc",
-        "limit": str(max(1, limit)),
-    }
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=supabase_service_role_headers())
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to fetch notification jobs from Supabase.",
-        ) from exc
-
-    return _validated_list_payload(response.json(), "Invalid notification jobs response from Supabase.")
-
-
-async def mark_notification_job_running(job_id: str, attempts: int) -> None:
-    await _service_role_patch(
+async def mark_notification_job_running(job_id: str, attempts: int, *, holder: str) -> bool:
+    return await _service_role_claimed_patch(
         "notification_jobs",
         job_id,
+        holder,
         {
             "status": "running",
             "attempts": attempts,
@@ -3361,14 +3447,17 @@ async def mark_notification_job_running(job_id: str, attempts: int) -> None:
     )
 
 
-async def mark_notification_job_sent(job_id: str, attempts: int) -> None:
-    await _service_role_patch(
+async def mark_notification_job_sent(job_id: str, attempts: int, *, holder: str) -> bool:
+    return await _service_role_claimed_patch(
         "notification_jobs",
         job_id,
+        holder,
         {
             "status": "sent",
             "attempts": attempts,
             "last_error": None,
+            "claimed_by": None,
+            "lease_expires_at": None,
         },
         error_detail="Failed to mark notification job as sent in Supabase.",
     )
@@ -3379,19 +3468,23 @@ async def mark_notification_job_failed(
     attempts: int,
     last_error: str | None,
     *,
+    holder: str,
     run_after: str | None = None,
     terminal: bool = False,
-) -> None:
+) -> bool:
     payload: dict[str, Any] = {
         "status": "failed" if terminal else "queued",
         "attempts": attempts,
         "last_error": last_error,
+        "claimed_by": None,
+        "lease_expires_at": None,
     }
     if run_after:
         payload["run_after"] = run_after
-    await _service_role_patch(
+    return await _service_role_claimed_patch(
         "notification_jobs",
         job_id,
+        holder,
         payload,
         error_detail="Failed to update notification job in Supabase.",
     )
@@ -3407,7 +3500,7 @@ async def get_notification_job_service(job_id: str) -> dict[str, Any] | None:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3455,7 +3548,7 @@ async def list_notification_events(
         params["status"] = f"eq.{status_filter}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3496,7 +3589,7 @@ async def get_notification_event(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3531,7 +3624,7 @@ async def mark_notification_read(access_token: str, *, user_id: str, event_id: s
 
     payload = {"user_id": user_id, "event_id": event_id}
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 params={"on_conflict": "user_id,event_id"},
@@ -3554,7 +3647,7 @@ async def mark_notification_unread(access_token: str, *, user_id: str, event_id:
     headers["Prefer"] = "return=minimal"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.delete(url, params=params, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3602,7 +3695,7 @@ async def upsert_notification_event_service(
             "limit": "1",
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with supabase_http_client() as client:
                 lookup_response = await client.get(
                     url,
                     params=lookup_params,
@@ -3633,7 +3726,7 @@ async def upsert_notification_event_service(
     headers = supabase_service_role_headers()
     headers["Prefer"] = "return=representation"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 json=payload,
@@ -3668,7 +3761,7 @@ async def _select_notification_reads(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3693,7 +3786,7 @@ async def select_org_name_service(org_id: str) -> str | None:
     params = {"select": "name", "id": f"eq.{org_id}", "limit": "1"}
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_service_role_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3722,7 +3815,7 @@ async def select_billing_events(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3734,35 +3827,6 @@ async def select_billing_events(
     return _validated_list_payload(response.json(), "Invalid billing events response from Supabase.")
 
 
-async def rpc_upsert_alert_for_finding(access_token: str, payload: dict[str, Any]) -> dict[str, Any]:
-    settings = get_settings()
-    url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/upsert_alert_for_finding"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Failed to upsert alert in Supabase.",
-        ) from exc
-
-    response_payload = response.json()
-    if not isinstance(response_payload, dict):
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Invalid upsert alert response from Supabase.",
-        )
-    if not isinstance(response_payload.get("id"), str) or not isinstance(response_payload.get("created"), bool):
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Invalid upsert alert response from Supabase.",
-        )
-
-    return response_payload
-
-
 async def list_framework_templates(access_token: str) -> list[dict[str, Any]]:
     settings = get_settings()
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/framework_templates"
@@ -3773,7 +3837,7 @@ async def list_framework_templates(access_token: str) -> list[dict[str, Any]]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3800,7 +3864,7 @@ async def get_framework_template_by_slug(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3828,7 +3892,7 @@ async def list_framework_template_sources(
         params["template_id"] = f"eq.{template_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3847,7 +3911,7 @@ async def rpc_create_source_v3(access_token: str, payload: dict[str, Any]) -> st
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/create_source_v3"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -3892,7 +3956,7 @@ async def list_sources_by_org(access_token: str, org_id: str) -> list[dict[str,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3954,7 +4018,7 @@ async def list_controls(access_token: str, framework_slug: str | None = None) ->
         params["framework_slug"] = f"eq.{framework_slug}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -3980,7 +4044,7 @@ async def list_controls_by_ids(access_token: str, control_ids: list[str]) -> lis
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4007,7 +4071,7 @@ async def list_control_evidence(access_token: str, control_id: str) -> list[dict
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4035,7 +4099,7 @@ async def list_control_evidence_for_controls(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4063,7 +4127,7 @@ async def get_control_guidance(access_token: str, control_id: str) -> dict[str,
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4086,7 +4150,7 @@ async def list_org_controls(access_token: str, org_id: str) -> list[dict[str, An
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4123,7 +4187,7 @@ async def patch_org_control_status(
         payload["notes"] = notes
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.patch(url, params=params, json=payload, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4147,7 +4211,7 @@ async def rpc_install_controls_for_template(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -4210,7 +4274,7 @@ async def list_finding_controls(access_token: str, org_id: str, finding_id: str)
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4234,7 +4298,7 @@ async def list_finding_controls_by_org(access_token: str, org_id: str) -> list[d
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4261,7 +4325,7 @@ async def rpc_link_finding_to_control(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
@@ -4299,7 +4363,7 @@ async def select_templates_public() -> list[dict[str, Any]]:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_public_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4321,7 +4385,7 @@ async def select_template_by_slug_public(slug: str) -> dict[str, Any] | None:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_public_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4345,7 +4409,7 @@ async def select_template_sources_public(template_id: str | None = None) -> list
         params["template_id"] = f"eq.{template_id}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.get(url, params=params, headers=supabase_public_headers())
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -4362,7 +4426,7 @@ async def rpc_install_template(access_token: str, payload: dict[str, Any]) -> in
     url = f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1/rpc/install_template"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(url, json=payload, headers=supabase_rest_headers(access_token))
             response.raise_for_status()
     except httpx.HTTPStatusError as exc:
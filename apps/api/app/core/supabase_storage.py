@@ -5,6 +5,7 @@ import httpx
 from fastapi import HTTPException, status
 
 from app.core.settings import get_settings
+from app.core.supabase_http import supabase_http_client
 
 
 def get_storage_admin_headers() -> dict[str, str]:
@@ -55,7 +56,7 @@ async def create_signed_upload_url(bucket: str, path: str, expires_in: int) -> d
     url = f"{settings.SUPABASE_URL.rstrip('/')}/storage/v1/object/sign/{encoded_bucket}/{encoded_path}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 json={"expiresIn": expires_in},
@@ -79,7 +80,7 @@ async def create_signed_download_url(bucket: str, path: str, expires_in: int) ->
     url = f"{settings.SUPABASE_URL.rstrip('/')}/storage/v1/object/sign/{encoded_bucket}/{encoded_path}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 json={"expiresIn": expires_in},
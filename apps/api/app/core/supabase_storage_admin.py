@@ -5,6 +5,7 @@ import httpx
 from fastapi import HTTPException, status
 
 from app.core.settings import get_settings
+from app.core.supabase_http import supabase_http_client
 
 
 def _service_role_key(error_detail: str = "Audit exports are not configured.") -> str:
@@ -86,7 +87,7 @@ async def upload_bytes(bucket: str, path: str, data: bytes, content_type: str) -
     headers["x-upsert"] = "true"
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with supabase_http_client(timeout=30.0) as client:
             response = await client.post(url, content=data, headers=headers)
             response.raise_for_status()
     except httpx.HTTPError as exc:
@@ -108,7 +109,7 @@ async def create_signed_upload_url(
         payload["contentType"] = content_type
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 json=payload,
@@ -135,7 +136,7 @@ async def create_signed_download_url(bucket: str, path: str, expires: int) -> di
     url = f"{settings.SUPABASE_URL.rstrip('/')}/storage/v1/object/sign/{encoded_bucket}/{encoded_path}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.post(
                 url,
                 json={"expiresIn": expires},
@@ -162,7 +163,7 @@ async def delete_object(bucket: str, path: str) -> None:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/storage/v1/object/{encoded_bucket}/{encoded_path}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with supabase_http_client() as client:
             response = await client.delete(
                 url,
                 headers=_admin_headers(error_detail="File evidence uploads are not configured."),
@@ -189,7 +190,7 @@ async def download_bytes(bucket: str, path: str) -> bytes:
     url = f"{settings.SUPABASE_URL.rstrip('/')}/storage/v1/object/{encoded_bucket}/{encoded_path}"
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with supabase_http_client(timeout=30.0) as client:
             async with client.stream("GET", url, headers=_admin_headers()) as response:
                 if response.status_code == status.HTTP_404_NOT_FOUND:
                     detail = _error_message_from_response(response, "Evidence file was not found.")
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries expire after a monotonic TTL. With
+    ``weigh``, entries are also evicted while their total weight exceeds
+    ``max_weight``."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        max_weight: int | None = None,
+        weigh: Callable[[V], int] | None = None,
+    ) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_weight = None if max_weight is None else max(0, int(max_weight))
+        self._weigh = weigh
+        self._weight = 0
+        self._entries: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: K) -> V | None:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= now:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, *, ttl_seconds: float | None = None) -> None:
+        if not self.enabled:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else max(0.0, float(ttl_seconds))
+        if ttl <= 0:
+            return
+        weight = max(0, int(self._weigh(value))) if self._weigh is not None else 0
+        with self._lock:
+            self._remove(key)
+            if self.max_weight is not None and weight > self.max_weight:
+                # Would evict everything else and still not fit.
+                return
+            self._entries[key] = (time.monotonic() + ttl, value, weight)
+            self._weight += weight
+            while len(self._entries) > self.max_entries or (
+                self.max_weight is not None and self._weight > self.max_weight
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._remove(key)
+        return entry[1] if entry is not None else None
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        with self._lock:
+            doomed = [key for key in self._entries if predicate(key)]
+            for key in doomed:
+                self._remove(key)
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    @property
+    def weight(self) -> int:
+        return self._weight
+
+    def _remove(self, key: K) -> tuple[float, V, int] | None:
+        # Callers hold the lock.
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._weight -= entry[2]
+        return entry
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -1,16 +1,27 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import router as v1_router
 from app.core.logging import configure_logging
 from app.core.settings import get_settings
+from app.core.supabase_http import supabase_http_lifespan
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 
 configure_logging()
 settings = get_settings()
 
-app = FastAPI(title="Verirule API")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    async with supabase_http_lifespan():
+        yield
+
+
+app = FastAPI(title="Verirule API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
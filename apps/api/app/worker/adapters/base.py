@@ -5,6 +5,9 @@ from typing import Any, Literal, Protocol
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.core.content_masks import masked_text_fingerprint
+from app.worker.compute import run_cpu_bound
+
 SourceKind = Literal["html", "rss", "pdf", "github_releases"]
 
 
@@ -59,6 +62,16 @@ class AdapterResult(BaseModel):
     fetched_url: str | None = None
     content_len: int = 0
     raw_bytes_hash: str | None = None
+    # Fingerprint of canonical_text after the source's volatile-content masks.
+    text_fingerprint: str | None = None
+
+
+async def masked_fingerprint(source: Source, text: str) -> str | None:
+    """Fingerprint of ``text`` after the source's masks. Tenant patterns run
+    in the compute pool, whose timeout bounds a pattern that backtracks."""
+    if not source.config.get("mask_patterns"):
+        return masked_text_fingerprint(source.config, text)
+    return await run_cpu_bound(masked_text_fingerprint, source.config, text)
 
 
 class Adapter(Protocol):
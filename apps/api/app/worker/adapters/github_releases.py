@@ -5,8 +5,16 @@ import re
 from datetime import UTC, datetime
 from typing import Any
 
-from app.worker.adapters.base import AdapterResult, Snapshot, Source
+from app.worker.adapters.base import AdapterResult, Snapshot, Source, masked_fingerprint
 from app.worker.fetcher import fetch_url
+from app.worker.github_api import (
+    GITHUB_API_HOST,
+    GITHUB_API_URL,
+    RELEASES_PAGE_SIZE,
+    budgeted_request,
+    get_github_batcher,
+    get_github_budget,
+)
 
 _REPO_RE = re.compile(r"^[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+$")
 
@@ -49,44 +57,84 @@ def _release_item_id(release: dict[str, Any]) -> str:
     return ""
 
 
+def _latest_release(releases: list[dict[str, Any]]) -> dict[str, Any] | None:
+    latest_release: dict[str, Any] | None = None
+    latest_published_at: datetime | None = None
+    for release in releases:
+        published_at = _parse_datetime(release.get("published_at")) or _parse_datetime(
+            release.get("created_at")
+        )
+        if latest_release is None:
+            latest_release = release
+            latest_published_at = published_at
+            continue
+
+        if published_at is None:
+            continue
+        if latest_published_at is None or published_at > latest_published_at:
+            latest_release = release
+            latest_published_at = published_at
+    return latest_release
+
+
+async def _post_graphql(
+    body: bytes, headers: dict[str, str], timeout_seconds: float, max_bytes: int
+) -> dict[str, Any]:
+    return await fetch_url(
+        f"{GITHUB_API_URL}/graphql",
+        timeout_seconds=timeout_seconds,
+        max_bytes=max_bytes,
+        allowed_hosts={GITHUB_API_HOST},
+        extra_headers={**headers, "Content-Type": "application/json"},
+        method="POST",
+        body=body,
+    )
+
+
 class GitHubReleasesAdapter:
+    """Reads the newest release of ``config.repo``. Requests are paced by the
+    shared GitHub rate-limit budget; with tokens configured, concurrent
+    lookups are batched into one GraphQL query."""
+
     async def fetch(self, source: Source, prev_snapshot: Snapshot | None) -> AdapterResult:
         repo = str(source.config.get("repo") or "").strip()
         if not _REPO_RE.match(repo):
             raise ValueError("github_releases sources require config.repo in owner/name format")
 
-        fetch_result = await fetch_url(
-            f"https://api.github.com/repos/{repo}/releases",
-            etag=source.etag or (prev_snapshot.etag if prev_snapshot else None),
-            last_modified=source.last_modified or (prev_snapshot.last_modified if prev_snapshot else None),
-            timeout_seconds=source.fetch_timeout_seconds,
-            max_bytes=source.fetch_max_bytes,
-            allowed_hosts={"api.github.com"},
-            extra_headers={
-                "User-Agent": "verirule",
-                "Accept": "application/vnd.github+json",
-            },
-        )
-        status_code = int(fetch_result.get("status") or 0)
-        content_type = str(fetch_result.get("content_type") or "").strip() or None
-        response_etag = str(fetch_result.get("etag") or "").strip() or None
-        response_last_modified = str(fetch_result.get("last_modified") or "").strip() or None
-        fetched_url = str(fetch_result.get("fetched_url") or source.url)
-
-        if status_code == 304:
-            return AdapterResult(
-                canonical_title=None,
-                canonical_text="",
-                item_id=prev_snapshot.item_id if prev_snapshot else None,
-                item_published_at=prev_snapshot.item_published_at if prev_snapshot else None,
-                content_type=content_type,
-                etag=response_etag,
-                last_modified=response_last_modified,
-                http_status=status_code,
-                fetched_url=fetched_url,
+        releases_url = f"{GITHUB_API_URL}/repos/{repo}/releases"
+        batcher = get_github_batcher()
+        if batcher is not None:
+            release = await batcher.latest_release(
+                repo,
+                _post_graphql,
+                timeout_seconds=source.fetch_timeout_seconds,
+                max_bytes=source.fetch_max_bytes,
+            )
+            return await self._result(
+                source,
+                prev_snapshot,
+                release,
+                fetch_result={"status": 200, "content_type": "application/json", "fetched_url": releases_url},
                 content_len=0,
             )
 
+        # Only the newest few releases are needed to pick the latest one.
+        fetch_result = await budgeted_request(
+            get_github_budget(),
+            "core",
+            lambda headers: fetch_url(
+                f"{releases_url}?per_page={RELEASES_PAGE_SIZE}",
+                etag=source.etag or (prev_snapshot.etag if prev_snapshot else None),
+                last_modified=source.last_modified or (prev_snapshot.last_modified if prev_snapshot else None),
+                timeout_seconds=source.fetch_timeout_seconds,
+                max_bytes=source.fetch_max_bytes,
+                allowed_hosts={GITHUB_API_HOST},
+                extra_headers=headers,
+            ),
+        )
+        if int(fetch_result.get("status") or 0) == 304:
+            return await self._result(source, prev_snapshot, None, fetch_result=fetch_result, content_len=0)
+
         response_bytes = fetch_result["bytes"] if isinstance(fetch_result.get("bytes"), bytes) else b""
         try:
             parsed = json.loads(response_bytes.decode("utf-8", errors="replace"))
@@ -94,22 +142,28 @@ class GitHubReleasesAdapter:
             parsed = []
 
         releases = [item for item in parsed if isinstance(item, dict)] if isinstance(parsed, list) else []
-        latest_release: dict[str, Any] | None = None
-        latest_published_at: datetime | None = None
-        for release in releases:
-            published_at = _parse_datetime(release.get("published_at")) or _parse_datetime(
-                release.get("created_at")
-            )
-            if latest_release is None:
-                latest_release = release
-                latest_published_at = published_at
-                continue
+        return await self._result(
+            source,
+            prev_snapshot,
+            _latest_release(releases),
+            fetch_result=fetch_result,
+            content_len=len(response_bytes),
+        )
 
-            if published_at is None:
-                continue
-            if latest_published_at is None or published_at > latest_published_at:
-                latest_release = release
-                latest_published_at = published_at
+    async def _result(
+        self,
+        source: Source,
+        prev_snapshot: Snapshot | None,
+        latest_release: dict[str, Any] | None,
+        *,
+        fetch_result: dict[str, Any],
+        content_len: int,
+    ) -> AdapterResult:
+        status_code = int(fetch_result.get("status") or 0)
+        content_type = str(fetch_result.get("content_type") or "").strip() or None
+        response_etag = str(fetch_result.get("etag") or "").strip() or None
+        response_last_modified = str(fetch_result.get("last_modified") or "").strip() or None
+        fetched_url = str(fetch_result.get("fetched_url") or source.url)
 
         if latest_release is None:
             return AdapterResult(
@@ -122,7 +176,7 @@ class GitHubReleasesAdapter:
                 last_modified=response_last_modified,
                 http_status=status_code,
                 fetched_url=fetched_url,
-                content_len=len(response_bytes),
+                content_len=content_len,
             )
 
         item_id = _release_item_id(latest_release) or (prev_snapshot.item_id if prev_snapshot else None)
@@ -136,9 +190,10 @@ class GitHubReleasesAdapter:
             else None
         )
 
+        canonical_text = _to_text(latest_release.get("body"))
         return AdapterResult(
             canonical_title=canonical_title,
-            canonical_text=_to_text(latest_release.get("body")),
+            canonical_text=canonical_text,
             item_id=item_id,
             item_published_at=_parse_datetime(latest_release.get("published_at"))
             or _parse_datetime(latest_release.get("created_at")),
@@ -147,5 +202,6 @@ class GitHubReleasesAdapter:
             last_modified=response_last_modified,
             http_status=status_code,
             fetched_url=fetched_url,
-            content_len=len(response_bytes),
+            content_len=content_len,
+            text_fingerprint=await masked_fingerprint(source, canonical_text),
         )
@@ -4,9 +4,11 @@ import hashlib
 import re
 from html import unescape
 
-from app.worker.adapters.base import AdapterResult, Snapshot, Source
+from app.core.html_selectors import RegionRules
+from app.worker.adapters.base import AdapterResult, Snapshot, Source, masked_fingerprint
+from app.worker.compute import run_cpu_bound
 from app.worker.fetcher import fetch_url
-from app.worker.normalize import normalize
+from app.worker.normalize import HtmlStreamExtractor, normalize
 
 _TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
 
@@ -20,14 +22,42 @@ def _extract_title(content: bytes) -> str | None:
     return cleaned or None
 
 
+def _parse_html(content_type: str | None, content: bytes) -> tuple[str | None, str]:
+    normalized = normalize(content_type, content)
+    return _extract_title(content), str(normalized.get("normalized_text") or "")
+
+
+class _HtmlBody:
+    # HTML is parsed while it downloads; other content types are buffered
+    # and normalized once the body is complete.
+    def __init__(self, rules: RegionRules | None = None) -> None:
+        self.rules = rules
+        self.extractor: HtmlStreamExtractor | None = None
+        self.buffer = bytearray()
+
+    def begin(self, content_type: str | None) -> None:
+        if "text/html" in (content_type or "").lower():
+            self.extractor = HtmlStreamExtractor(self.rules)
+
+    def write(self, chunk: bytes) -> None:
+        if self.extractor is not None:
+            self.extractor.write(chunk)
+        else:
+            self.buffer.extend(chunk)
+
+
 class HtmlAdapter:
     async def fetch(self, source: Source, prev_snapshot: Snapshot | None) -> AdapterResult:
+        # Include/exclude selectors in the source config narrow the text that
+        # is stored and diffed to the region of the page that matters.
+        body = _HtmlBody(RegionRules.from_config(source.config))
         fetch_result = await fetch_url(
             source.url,
             etag=source.etag or (prev_snapshot.etag if prev_snapshot else None),
             last_modified=source.last_modified or (prev_snapshot.last_modified if prev_snapshot else None),
             timeout_seconds=source.fetch_timeout_seconds,
             max_bytes=source.fetch_max_bytes,
+            sink=body,
         )
         status_code = int(fetch_result.get("status") or 0)
         content_type = str(fetch_result.get("content_type") or "").strip() or None
@@ -50,11 +80,31 @@ class HtmlAdapter:
                 content_len=0,
             )
 
-        response_bytes = fetch_result["bytes"] if isinstance(fetch_result.get("bytes"), bytes) else b""
-        normalized = normalize(content_type, response_bytes)
+        extractor = body.extractor
+        if extractor is not None:
+            canonical_text = extractor.finish()
+            return AdapterResult(
+                canonical_title=extractor.title,
+                canonical_text=canonical_text,
+                content_type=content_type,
+                etag=response_etag,
+                last_modified=response_last_modified,
+                http_status=status_code,
+                fetched_url=fetched_url,
+                content_len=extractor.content_len,
+                raw_bytes_hash=extractor.raw_bytes_hash,
+                text_fingerprint=await masked_fingerprint(source, canonical_text),
+            )
+
+        response_bytes = bytes(body.buffer)
+        if not response_bytes and isinstance(fetch_result.get("bytes"), bytes):
+            response_bytes = fetch_result["bytes"]
+        canonical_title, canonical_text = await run_cpu_bound(
+            _parse_html, content_type, response_bytes
+        )
         return AdapterResult(
-            canonical_title=_extract_title(response_bytes),
-            canonical_text=str(normalized.get("normalized_text") or ""),
+            canonical_title=canonical_title,
+            canonical_text=canonical_text,
             content_type=content_type,
             etag=response_etag,
             last_modified=response_last_modified,
@@ -62,4 +112,5 @@ class HtmlAdapter:
             fetched_url=fetched_url,
             content_len=len(response_bytes),
             raw_bytes_hash=hashlib.sha256(response_bytes).hexdigest(),
+            text_fingerprint=await masked_fingerprint(source, canonical_text),
         )
@@ -1,27 +1,123 @@
 from __future__ import annotations
 
 import hashlib
-from io import BytesIO
+from typing import Any, BinaryIO
 
 from pypdf import PdfReader
-
-from app.worker.adapters.base import AdapterResult, Snapshot, Source
+from pypdf.generic import IndirectObject, StreamObject
+
+from app.core.ttl_cache import TTLCache
+from app.worker.adapters.base import AdapterResult, Snapshot, Source, masked_fingerprint
+from app.worker.body_spool import (
+    DEFAULT_SPOOL_MEMORY_BYTES,
+    SpooledBody,
+    SpooledPayload,
+    open_payload,
+)
+from app.worker.compute import run_cpu_bound
 from app.worker.fetcher import fetch_url
 
 MAX_PDF_PAGES = 20
 MAX_PDF_CHARS = 200_000
+# Form XObjects can draw other forms; deeper nesting is not fingerprinted.
+MAX_FORM_DEPTH = 8
+_MAX_OBJECT_DEPTH = 6
+
+# (page fingerprint, extracted text); the text is None when the caller
+# already holds it for that fingerprint.
+PdfPage = tuple[str, str | None]
 
 
-def _extract_pdf_text(content: bytes) -> tuple[str, str | None]:
-    if not content:
-        return "", None
+def _stream_data(value: Any) -> bytes:
+    try:
+        return value.get_object().get_data()
+    except Exception:  # pragma: no cover - malformed stream
+        return b""
+
+
+def _resolve(value: Any) -> Any:
+    return value.get_object() if isinstance(value, IndirectObject) else value
+
+
+def _hash_object(digest: Any, value: Any, depth: int = 0) -> None:
+    """Feeds a resolved PDF object (dictionaries by sorted key, arrays in
+    order, stream data) into ``digest``."""
+    value = _resolve(value)
+    if depth > _MAX_OBJECT_DEPTH:
+        digest.update(b"|...")
+    elif isinstance(value, dict):
+        for key in sorted(value):
+            digest.update(f"|{key}=".encode())
+            _hash_object(digest, value.get(key), depth + 1)
+        if isinstance(value, StreamObject):
+            digest.update(_stream_data(value))
+    elif isinstance(value, list):
+        digest.update(b"|[")
+        for item in value:
+            _hash_object(digest, item, depth + 1)
+        digest.update(b"|]")
+    else:
+        digest.update(f"|{value}".encode())
+
+
+def _hash_resources(digest: Any, resources: Any, depth: int, seen: set[tuple[int, int]]) -> None:
+    resources = _resolve(resources) or {}
+    fonts = _resolve(resources.get("/Font")) or {}
+    for name in sorted(fonts):
+        font = _resolve(fonts[name])
+        digest.update(f"|font={name}:{font.get('/BaseFont')}".encode())
+        # Usually a reference to a dictionary whose /Differences remap glyphs.
+        _hash_object(digest, font.get("/Encoding"))
+        if "/ToUnicode" in font:
+            digest.update(_stream_data(font["/ToUnicode"]))
+    xobjects = _resolve(resources.get("/XObject")) or {}
+    for name in sorted(xobjects):
+        reference = xobjects.raw_get(name) if hasattr(xobjects, "raw_get") else xobjects[name]
+        xobject = _resolve(reference)
+        if xobject.get("/Subtype") != "/Form":
+            continue
+        digest.update(f"|form={name}@{depth}".encode())
+        key = (reference.idnum, reference.generation) if isinstance(reference, IndirectObject) else None
+        if depth >= MAX_FORM_DEPTH or (key is not None and key in seen):
+            continue
+        if key is not None:
+            seen.add(key)
+        digest.update(_stream_data(xobject))
+        _hash_resources(digest, xobject.get("/Resources"), depth + 1, seen)
+
+
+def _page_fingerprint(page: Any) -> str:
+    """Hash of everything text extraction reads from a page: its content
+    stream, the font encodings and the form XObjects it draws, including
+    forms nested inside forms."""
+    digest = hashlib.sha256()
+    contents = page.get_contents()
+    if contents is not None:
+        digest.update(contents.get_data())
+    digest.update(f"|rotate={page.get('/Rotate', 0)}".encode())
+    _hash_resources(digest, page.get("/Resources"), 0, set())
+    return digest.hexdigest()
+
+
+def _extract_pdf_pages(
+    content: SpooledPayload, known_fingerprints: frozenset[str], max_pages: int | None
+) -> tuple[list[PdfPage], str | None]:
+    with open_payload(content) as stream:
+        return _read_pdf_pages(stream, known_fingerprints, max_pages)
+
+
+def _read_pdf_pages(
+    stream: BinaryIO, known_fingerprints: frozenset[str], max_pages: int | None
+) -> tuple[list[PdfPage], str | None]:
+    if stream.seek(0, 2) == 0:
+        return [], None
+    stream.seek(0)
 
     title: str | None = None
-    chunks: list[str] = []
-    total_chars = 0
+    pages: list[PdfPage] = []
 
     try:
-        reader = PdfReader(BytesIO(content))
+        reader = PdfReader(stream)
         metadata = reader.metadata
         meta_title = metadata.get("/Title") if metadata else None
         if isinstance(meta_title, str):
@@ -29,31 +125,72 @@ def _extract_pdf_text(content: bytes) -> tuple[str, str | None]:
             title = cleaned_title or None
 
         for page_index, page in enumerate(reader.pages):
-            if page_index >= MAX_PDF_PAGES or total_chars >= MAX_PDF_CHARS:
+            if max_pages is not None and page_index >= max_pages:
                 break
-            page_text = page.extract_text() or ""
-            cleaned_page = page_text.strip()
-            if not cleaned_page:
+            fingerprint = _page_fingerprint(page)
+            if fingerprint in known_fingerprints:
+                pages.append((fingerprint, None))
                 continue
-
-            remaining = MAX_PDF_CHARS - total_chars
-            clipped = cleaned_page[:remaining]
-            chunks.append(clipped)
-            total_chars += len(clipped)
+            pages.append((fingerprint, (page.extract_text() or "").strip()))
     except Exception:  # pragma: no cover - defensive parser fallback
-        return "", title
+        return [], title
 
-    return "\n".join(chunks).strip(), title
+    return pages, title
+
+
+def _join_pages(page_texts: list[str], max_chars: int | None) -> str:
+    chunks: list[str] = []
+    total_chars = 0
+    for page_text in page_texts:
+        if not page_text:
+            continue
+        if max_chars is not None:
+            if total_chars >= max_chars:
+                break
+            page_text = page_text[: max_chars - total_chars]
+        chunks.append(page_text)
+        total_chars += len(page_text)
+    return "\n".join(chunks).strip()
 
 
 class PdfAdapter:
+    """Keeps each source's extracted page texts keyed by page fingerprint, so
+    a refetch only re-extracts pages whose content actually changed."""
+
+    def __init__(
+        self,
+        *,
+        page_cache_sources: int = 2000,
+        page_cache_chars: int = 20_000_000,
+        page_cache_seconds: float = 86400.0,
+        spool_memory_bytes: int = DEFAULT_SPOOL_MEMORY_BYTES,
+    ) -> None:
+        # Bounded by the characters held, since full-document sources can
+        # cache far more text than the page-limited ones.
+        self._page_texts: TTLCache[str, dict[str, str]] = TTLCache(
+            max_entries=page_cache_sources,
+            ttl_seconds=page_cache_seconds,
+            max_weight=page_cache_chars,
+            weigh=lambda pages: sum(len(text) for text in pages.values()),
+        )
+        self.spool_memory_bytes = spool_memory_bytes
+
     async def fetch(self, source: Source, prev_snapshot: Snapshot | None) -> AdapterResult:
+        # Large PDFs are spooled to a temp file that the parser maps, rather
+        # than held as several in-memory copies per concurrent run.
+        with SpooledBody(max_memory_bytes=self.spool_memory_bytes) as body:
+            return await self._fetch(source, prev_snapshot, body)
+
+    async def _fetch(
+        self, source: Source, prev_snapshot: Snapshot | None, body: SpooledBody
+    ) -> AdapterResult:
         fetch_result = await fetch_url(
             source.url,
             etag=source.etag or (prev_snapshot.etag if prev_snapshot else None),
             last_modified=source.last_modified or (prev_snapshot.last_modified if prev_snapshot else None),
             timeout_seconds=source.fetch_timeout_seconds,
             max_bytes=max(source.fetch_max_bytes, 5_000_000),
+            sink=body,
         )
         status_code = int(fetch_result.get("status") or 0)
         content_type = str(fetch_result.get("content_type") or "").strip() or None
@@ -74,9 +211,26 @@ class PdfAdapter:
                 content_len=0,
             )
 
-        response_bytes = fetch_result["bytes"] if isinstance(fetch_result.get("bytes"), bytes) else b""
-        raw_bytes_hash = hashlib.sha256(response_bytes).hexdigest()
-        canonical_text, canonical_title = _extract_pdf_text(response_bytes)
+        if body.size == 0 and isinstance(fetch_result.get("bytes"), bytes):
+            body.write(fetch_result["bytes"])
+        full_document = source.config.get("full_document") is True
+        cached_pages = self._page_texts.get(source.id) or {}
+        pages, canonical_title = await run_cpu_bound(
+            _extract_pdf_pages,
+            body.payload(),
+            frozenset(cached_pages),
+            None if full_document else MAX_PDF_PAGES,
+        )
+        page_texts = {
+            fingerprint: cached_pages[fingerprint] if text is None else text
+            for fingerprint, text in pages
+        }
+        if page_texts:
+            self._page_texts.set(source.id, page_texts)
+        canonical_text = _join_pages(
+            [page_texts[fingerprint] for fingerprint, _ in pages],
+            None if full_document else MAX_PDF_CHARS,
+        )
 
         return AdapterResult(
             canonical_title=canonical_title,
@@ -86,6 +240,7 @@ class PdfAdapter:
             last_modified=response_last_modified,
             http_status=status_code,
             fetched_url=fetched_url,
-            content_len=len(response_bytes),
-            raw_bytes_hash=raw_bytes_hash,
+            content_len=body.size,
+            raw_bytes_hash=body.sha256,
+            text_fingerprint=await masked_fingerprint(source, canonical_text),
         )
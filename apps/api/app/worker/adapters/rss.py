@@ -2,15 +2,27 @@ from __future__ import annotations
 
 import hashlib
 import time
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from html.parser import HTMLParser
+from io import BytesIO
 from typing import Any
 
 import feedparser
 
-from app.worker.adapters.base import AdapterResult, Snapshot, Source
+from app.worker.adapters.base import AdapterResult, Snapshot, Source, masked_fingerprint
+from app.worker.compute import run_cpu_bound
 from app.worker.fetcher import fetch_url
 
+MAX_NEW_ENTRIES = 50
+
+_FEED_ROOTS = {"rss", "feed", "rdf"}
+_ENTRY_TAGS = {"item", "entry"}
+_RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+
 
 class _TextStripper(HTMLParser):
     def __init__(self) -> None:
@@ -57,35 +69,190 @@ def _entry_published_at(entry: Any) -> datetime | None:
         return None
 
 
-def _entry_text(entry: Any) -> str:
+def _entry_body(entry: Any) -> str:
     summary = _safe_string(entry.get("summary"))
     if summary:
-        return _strip_to_text(summary)
+        return summary
 
     content = entry.get("content")
     if isinstance(content, list):
-        chunks: list[str] = []
-        for item in content:
-            if isinstance(item, dict):
-                value = _safe_string(item.get("value"))
-                if value:
-                    chunks.append(_strip_to_text(value))
-        joined = "\n".join(chunk for chunk in chunks if chunk)
-        if joined:
-            return joined
+        values = [_safe_string(item.get("value")) for item in content if isinstance(item, dict)]
+        return "\n".join(value for value in values if value)
+    return ""
 
-    title = _safe_string(entry.get("title"))
-    return title
 
-
-def _sorted_entries(entries: list[Any]) -> list[Any]:
+def _sorted_entries(entries: list[FeedEntry]) -> list[FeedEntry]:
     return sorted(
         entries,
-        key=lambda item: _entry_published_at(item) or datetime.min.replace(tzinfo=UTC),
+        key=lambda item: item.published_at or datetime.min.replace(tzinfo=UTC),
         reverse=True,
     )
 
 
+@dataclass(frozen=True)
+class FeedEntry:
+    item_id: str
+    title: str
+    published_at: datetime | None
+    # Raw summary/content markup; only entries that are emitted get stripped.
+    body: str
+
+    def text(self) -> str:
+        return (_strip_to_text(self.body) if self.body else "") or self.title
+
+
+class _MalformedFeed(ValueError):
+    pass
+
+
+def _local_name(tag: Any) -> str:
+    return tag.rsplit("}", 1)[-1].lower() if isinstance(tag, str) else ""
+
+
+def _parse_stream_date(value: str) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _inner_markup(element: ET.Element) -> str:
+    # Unescaped HTML inside a description parses as child elements; keep it
+    # as markup so it is stripped the same way as escaped HTML.
+    parts = [element.text or ""]
+    parts.extend(ET.tostring(child, encoding="unicode") for child in element)
+    return "".join(parts).strip()
+
+
+def _stream_entry(element: ET.Element) -> FeedEntry:
+    fields: dict[str, str] = {}
+    for child in element:
+        name = _local_name(child.tag)
+        if name == "link" and not (child.text or "").strip():
+            if child.get("rel", "alternate") == "alternate":
+                fields.setdefault("link", (child.get("href") or "").strip())
+            continue
+        if name == "encoded":
+            name = "content"
+        elif name == "description":
+            name = "summary"
+        elif name in {"pubdate", "issued", "date"}:
+            name = "published"
+        elif name == "guid":
+            name = "id"
+        fields.setdefault(name, _inner_markup(child))
+
+    entry_id = fields.get("id") or element.get(f"{{{_RDF_NS}}}about", "").strip()
+    published = fields.get("published") or fields.get("updated") or ""
+    item_id = entry_id or fields.get("link") or ""
+    if not item_id:
+        item_id = hashlib.sha256(f"{fields.get('title', '')}|{published}".encode()).hexdigest()
+    return FeedEntry(
+        item_id=item_id,
+        title=fields.get("title", ""),
+        published_at=_parse_stream_date(published),
+        body=fields.get("summary") or fields.get("content", ""),
+    )
+
+
+def _iter_stream_entries(content: bytes) -> Iterator[FeedEntry]:
+    # Entries are handed out as soon as their closing tag is parsed, so the
+    # caller can stop reading once it reaches entries it has already seen.
+    events = ET.iterparse(BytesIO(content), events=("start", "end"))
+    root_seen = False
+    try:
+        for event, element in events:
+            name = _local_name(element.tag)
+            if event == "start":
+                if not root_seen and name not in _FEED_ROOTS:
+                    raise _MalformedFeed(f"not a feed document: {name}")
+                root_seen = True
+                continue
+            if name in _ENTRY_TAGS:
+                yield _stream_entry(element)
+                element.clear()
+    except ET.ParseError as exc:
+        raise _MalformedFeed(str(exc)) from exc
+    if not root_seen:
+        raise _MalformedFeed("empty feed document")
+
+
+def _is_older(entry: FeedEntry, than: FeedEntry) -> bool:
+    return bool(entry.published_at and than.published_at and entry.published_at < than.published_at)
+
+
+def _new_stream_entries(content: bytes, previous_item_id: str | None) -> list[FeedEntry]:
+    entries = _iter_stream_entries(content)
+    seen: list[FeedEntry] = []
+    for entry in entries:
+        if not previous_item_id or entry.item_id != previous_item_id:
+            seen.append(entry)
+            continue
+        # Most feeds list newest entries first, so everything before the
+        # previously seen entry is new and the rest need not be parsed.
+        # Oldest-first feeds are detected by their dates and read to the end.
+        oldest_first = any(_is_older(earlier, entry) for earlier in seen)
+        if not seen:
+            following = next(entries, None)
+            if following is None or not _is_older(entry, following):
+                return []
+            return [following, *entries]
+        if not oldest_first:
+            return seen
+        return list(entries)
+    return seen
+
+
+def _feedparser_entries(content: bytes, previous_item_id: str | None) -> list[FeedEntry]:
+    parsed_feed = feedparser.parse(content)
+    entries = [
+        FeedEntry(
+            item_id=_entry_item_id(entry),
+            title=_safe_string(entry.get("title")),
+            published_at=_entry_published_at(entry),
+            body=_entry_body(entry),
+        )
+        for entry in list(getattr(parsed_feed, "entries", []) or [])
+    ]
+    ordered = _sorted_entries(entries)
+    if not previous_item_id:
+        return ordered
+    for index, entry in enumerate(ordered):
+        if entry.item_id == previous_item_id:
+            return ordered[:index]
+    return ordered
+
+
+def _parse_feed(content: bytes, previous_item_id: str | None) -> dict[str, Any] | None:
+    try:
+        entries = _new_stream_entries(content, previous_item_id)
+    except _MalformedFeed:
+        entries = _feedparser_entries(content, previous_item_id)
+
+    # The first capture of a feed is a baseline of its newest entry; after
+    # that every entry published since the previous capture is reported.
+    new_entries = _sorted_entries(entries)[: MAX_NEW_ENTRIES if previous_item_id else 1]
+    if not new_entries:
+        return None
+    newest = new_entries[0]
+    if len(new_entries) == 1:
+        text = newest.text()
+    else:
+        text = "\n\n".join(f"{entry.title}\n{entry.text()}".strip() for entry in new_entries)
+    return {
+        "title": newest.title or None,
+        "text": text,
+        "item_id": newest.item_id,
+        "published_at": newest.published_at,
+    }
+
+
 class RssAdapter:
     async def fetch(self, source: Source, prev_snapshot: Snapshot | None) -> AdapterResult:
         fetch_result = await fetch_url(
@@ -116,19 +283,8 @@ class RssAdapter:
             )
 
         response_bytes = fetch_result["bytes"] if isinstance(fetch_result.get("bytes"), bytes) else b""
-        parsed_feed = feedparser.parse(response_bytes)
-        entries_raw = list(getattr(parsed_feed, "entries", []) or [])
-        entries = _sorted_entries(entries_raw)
-
         previous_item_id = prev_snapshot.item_id if prev_snapshot else None
-        selected_entry = None
-        if previous_item_id:
-            for entry in entries:
-                if _entry_item_id(entry) != previous_item_id:
-                    selected_entry = entry
-                    break
-        elif entries:
-            selected_entry = entries[0]
+        selected_entry = await run_cpu_bound(_parse_feed, response_bytes, previous_item_id)
 
         if selected_entry is None:
             return AdapterResult(
@@ -146,10 +302,10 @@ class RssAdapter:
             )
 
         return AdapterResult(
-            canonical_title=_safe_string(selected_entry.get("title")) or None,
-            canonical_text=_entry_text(selected_entry),
-            item_id=_entry_item_id(selected_entry),
-            item_published_at=_entry_published_at(selected_entry),
+            canonical_title=selected_entry["title"],
+            canonical_text=selected_entry["text"],
+            item_id=selected_entry["item_id"],
+            item_published_at=selected_entry["published_at"],
             content_type=content_type,
             etag=response_etag,
             last_modified=response_last_modified,
@@ -157,4 +313,5 @@ class RssAdapter:
             fetched_url=fetched_url,
             content_len=len(response_bytes),
             raw_bytes_hash=hashlib.sha256(response_bytes).hexdigest(),
+            text_fingerprint=await masked_fingerprint(source, selected_entry["text"]),
         )
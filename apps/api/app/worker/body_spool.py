@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import BytesIO
+from typing import IO, BinaryIO
+
+DEFAULT_SPOOL_MEMORY_BYTES = 1_000_000
+
+
+@dataclass(frozen=True)
+class SpooledFile:
+    """Picklable handle to a body spooled to disk, so compute-pool processes
+    can map the file instead of receiving a copy of its bytes."""
+
+    path: str
+    size: int
+
+
+SpooledPayload = bytes | SpooledFile
+
+
+class SpooledBody:
+    """Response body sink that stays in memory for small responses and
+    spills to a temporary file once it grows past ``max_memory_bytes``."""
+
+    def __init__(self, *, max_memory_bytes: int = DEFAULT_SPOOL_MEMORY_BYTES) -> None:
+        self.max_memory_bytes = max(0, int(max_memory_bytes))
+        self.content_type: str | None = None
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._buffer = bytearray()
+        self._file: IO[bytes] | None = None
+
+    def __enter__(self) -> SpooledBody:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    @property
+    def spooled(self) -> bool:
+        return self._file is not None
+
+    def begin(self, content_type: str | None) -> None:
+        self.content_type = content_type
+
+    def write(self, chunk: bytes) -> None:
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        if self._file is None and len(self._buffer) + len(chunk) > self.max_memory_bytes:
+            self._file = tempfile.NamedTemporaryFile(prefix="verirule-body-", delete=False)
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._buffer.extend(chunk)
+
+    def payload(self) -> SpooledPayload:
+        if self._file is None:
+            return bytes(self._buffer)
+        self._file.flush()
+        return SpooledFile(path=self._file.name, size=self.size)
+
+    def close(self) -> None:
+        spool = self._file
+        self._file = None
+        self._buffer = bytearray()
+        if spool is None:
+            return
+        spool.close()
+        try:
+            os.unlink(spool.name)
+        except FileNotFoundError:
+            pass
+
+
+@contextmanager
+def open_payload(payload: SpooledPayload) -> Iterator[BinaryIO]:
+    """Seekable read-only stream over a payload; spooled files are mmapped."""
+    if not isinstance(payload, SpooledFile):
+        yield BytesIO(payload)
+        return
+    if payload.size == 0:
+        yield BytesIO(b"")
+        return
+    with open(payload.path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield mapped  # type: ignore[misc]
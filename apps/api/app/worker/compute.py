@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from app.core.logging import get_logger
+from app.worker.body_spool import SpooledFile
+
+T = TypeVar("T")
+
+logger = get_logger("worker.compute")
+# Times a task is run again after its pool was torn down by another task.
+MAX_RESUBMITS = 2
+_shared_pool: ComputePool | None = None
+
+
+class ComputeTaskError(ValueError):
+    pass
+
+
+def _payload_size(args: tuple[Any, ...]) -> int:
+    return sum(
+        arg.size if isinstance(arg, SpooledFile) else len(arg)
+        for arg in args
+        if isinstance(arg, bytes | bytearray | str | SpooledFile)
+    )
+
+
+class ComputePool:
+    """Runs CPU-bound parsing and diffing in worker processes so a large
+    document cannot stall the event loop. A task that times out or kills its
+    process only fails itself; the pool is rebuilt for the next task and
+    tasks that were running beside it are resubmitted."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 2,
+        task_timeout_seconds: float = 30.0,
+        max_input_bytes: int = 20_000_000,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.task_timeout_seconds = max(0.1, float(task_timeout_seconds))
+        self.max_input_bytes = max(1, int(max_input_bytes))
+        self._executor: ProcessPoolExecutor | None = None
+        # At most one task per process is submitted, so a task starts as soon
+        # as it is handed to the executor and its timeout only covers its own
+        # execution, not time spent queued behind other tasks.
+        self._slots = asyncio.Semaphore(self.max_workers)
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        if self._executor is not executor:
+            # Another task already replaced this pool.
+            return
+        self._executor = None
+        # A timed-out task keeps running in its process; terminate the pool's
+        # processes so it cannot keep a core busy after we gave up on it.
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if _payload_size(args) > self.max_input_bytes:
+            raise ComputeTaskError("compute task input exceeds size limit")
+
+        task_name = getattr(func, "__name__", "task")
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            resubmits = 0
+            while True:
+                executor = self._ensure_executor()
+                future = loop.run_in_executor(executor, func, *args)
+                try:
+                    return await asyncio.wait_for(future, timeout=self.task_timeout_seconds)
+                except TimeoutError as exc:
+                    logger.warning(
+                        "compute.task_timeout", extra={"component": "worker", "task": task_name}
+                    )
+                    self._discard_executor(executor)
+                    raise ComputeTaskError("compute task timed out") from exc
+                except (BrokenProcessPool, asyncio.CancelledError) as exc:
+                    # Another task's timeout or crash tore the pool down under
+                    # this one (``cancel_futures`` surfaces as CancelledError).
+                    collateral = executor is not self._executor
+                    if isinstance(exc, asyncio.CancelledError):
+                        current = asyncio.current_task()
+                        if not collateral or (current is not None and current.cancelling()):
+                            raise
+                    if collateral and resubmits < MAX_RESUBMITS:
+                        resubmits += 1
+                        logger.info(
+                            "compute.task_resubmitted",
+                            extra={"component": "worker", "task": task_name},
+                        )
+                        continue
+                    logger.warning(
+                        "compute.pool_broken", extra={"component": "worker", "task": task_name}
+                    )
+                    self._discard_executor(executor)
+                    raise ComputeTaskError("compute task crashed") from exc
+
+    def close(self) -> None:
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any) -> T:
+    # Outside the worker loop (API, scripts, tests) there is no process pool;
+    # a thread still keeps the event loop responsive.
+    pool = _shared_pool
+    if pool is None:
+        return await asyncio.to_thread(func, *args)
+    return await pool.run(func, *args)
+
+
+@asynccontextmanager
+async def compute_pool_lifespan(*, max_workers: int, **options: Any) -> AsyncIterator[ComputePool | None]:
+    global _shared_pool
+    if max_workers <= 0:
+        yield None
+        return
+
+    pool = ComputePool(max_workers=max_workers, **options)
+    _shared_pool = pool
+    try:
+        yield pool
+    finally:
+        _shared_pool = None
+        await asyncio.to_thread(pool.close)
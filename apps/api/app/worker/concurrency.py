@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+
+def host_key(url: str) -> str:
+    parsed = urlparse(url)
+    return (parsed.hostname or "").strip().lower()
+
+
+@dataclass
+class _HostSlot:
+    semaphore: asyncio.Semaphore
+    users: int = 0
+
+
+class HostConcurrencyLimiter:
+    """Caps in-flight work per remote host; idle hosts are forgotten."""
+
+    def __init__(self, per_host: int) -> None:
+        self.per_host = max(1, int(per_host))
+        self._slots: dict[str, _HostSlot] = {}
+
+    @asynccontextmanager
+    async def acquire(self, url: str) -> AsyncIterator[None]:
+        key = host_key(url)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = _HostSlot(semaphore=asyncio.Semaphore(self.per_host))
+            self._slots[key] = slot
+        slot.users += 1
+        try:
+            async with slot.semaphore:
+                yield
+        finally:
+            slot.users -= 1
+            if slot.users <= 0 and self._slots.get(key) is slot:
+                del self._slots[key]
+
+    def in_use(self, url: str) -> int:
+        slot = self._slots.get(host_key(url))
+        return slot.users if slot is not None else 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+class HostRateLimiter:
+    """Spaces request starts to the same host at least 1/rate seconds apart."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        rate = float(rate_per_second)
+        self.interval_seconds = 1.0 / rate if rate > 0 else 0.0
+        self._next_start: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url: str) -> None:
+        if self.interval_seconds <= 0:
+            return
+        key = host_key(url)
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start_at = max(now, self._next_start.get(key, now))
+            self._next_start[key] = start_at + self.interval_seconds
+            if len(self._next_start) > 1024:
+                for stale in [host for host, at in self._next_start.items() if at <= now]:
+                    del self._next_start[stale]
+        delay = start_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-import difflib
 from typing import Any
 
+from app.worker.line_diff import iter_unified_hunks
+
+MAX_PREVIEW_LINES = 200
+MAX_CITATIONS = 3
+DIFF_TIME_BUDGET_SECONDS = 1.0
+
 
 def _truncate(value: str, limit: int = 280) -> str:
     if len(value) <= limit:
@@ -20,47 +25,48 @@ def build_explanation(prev_text: str, new_text: str) -> dict[str, Any]:
             "citations": [],
         }
 
-    diff_lines = list(
-        difflib.unified_diff(
-            previous.splitlines(),
-            current.splitlines(),
-            fromfile="previous",
-            tofile="current",
-            n=2,
-            lineterm="",
-        )
+    hunks = iter_unified_hunks(
+        previous.splitlines(),
+        current.splitlines(),
+        context=2,
+        time_budget_seconds=DIFF_TIME_BUDGET_SECONDS,
     )
 
-    max_lines = 200
-    preview_lines = diff_lines[:max_lines]
-    if len(diff_lines) > max_lines:
-        preview_lines.append("... diff truncated ...")
-    diff_preview = "\n".join(preview_lines)
-
+    # Hunks are produced lazily; stop diffing once the preview and the
+    # citation quota are both filled instead of diffing the whole document.
+    preview_lines: list[str] = []
     citations: list[dict[str, str]] = []
-    current_hunk = ""
-    for line in diff_lines:
-        if line.startswith("@@"):
-            current_hunk = line
-            continue
-        if line.startswith(("+++", "---")):
-            continue
-        if line.startswith(("+", "-")):
+    change_sections = 0
+    truncated = False
+    stopped_early = False
+    for hunk in hunks:
+        if not preview_lines:
+            preview_lines.extend(["--- previous", "+++ current"])
+        change_sections += 1
+        current_hunk = hunk[0]
+        for line in hunk:
+            if len(preview_lines) < MAX_PREVIEW_LINES:
+                preview_lines.append(line)
+            else:
+                truncated = True
+            if len(citations) >= MAX_CITATIONS or not line.startswith(("+", "-")):
+                continue
             quote = _truncate(line[1:].strip())
             if quote:
-                citations.append(
-                    {
-                        "quote": quote,
-                        "context": current_hunk or "content update",
-                    }
-                )
-            if len(citations) >= 3:
-                break
+                citations.append({"quote": quote, "context": current_hunk or "content update"})
+        if len(preview_lines) >= MAX_PREVIEW_LINES and len(citations) >= MAX_CITATIONS:
+            stopped_early = next(hunks, None) is not None
+            truncated = truncated or stopped_early
+            break
+
+    if truncated:
+        preview_lines.append("... diff truncated ...")
+    diff_preview = "\n".join(preview_lines)
 
-    change_sections = sum(1 for line in diff_lines if line.startswith("@@"))
+    sections = f"{change_sections or 1}{'+' if stopped_early else ''}"
     citation_count = len(citations)
     summary = (
-        f"The source updated {change_sections or 1} section(s) since the previous capture. "
+        f"The source updated {sections} section(s) since the previous capture. "
         f"{citation_count} notable line-level change(s) are highlighted for review. "
         "See the diff preview for exact additions and removals."
     )
@@ -12,13 +12,14 @@ from app.core.supabase_rest import (
     mark_audit_export_attempt_started,
     mark_audit_export_dead_letter,
     mark_audit_export_for_retry,
+    rpc_claim_jobs,
     select_audit_packet_data,
-    select_queued_audit_exports_service,
     update_audit_export_status,
 )
 from app.core.supabase_storage_admin import download_bytes, upload_bytes
 from app.exports.generate import build_csv, build_export_bytes, build_pdf
 from app.exports.packet import build_zip
+from app.worker.leases import batch_lease_heartbeat
 from app.worker.retry import backoff_seconds, sanitize_error
 
 EXPORT_BATCH_LIMIT = 3
@@ -123,14 +124,32 @@ def _safe_text(value: object | None) -> str:
 
 
 class ExportProcessor:
-    def __init__(self, *, access_token: str, bucket_name: str) -> None:
+    def __init__(
+        self,
+        *,
+        access_token: str,
+        bucket_name: str,
+        worker_id: str = "worker",
+        lease_seconds: int = 300,
+    ) -> None:
         self.access_token = access_token
         self.bucket_name = bucket_name
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
 
     async def process_queued_exports_once(self, limit: int = EXPORT_BATCH_LIMIT) -> int:
-        export_rows = await select_queued_audit_exports_service(limit=limit)
-        for row in export_rows:
-            await self._process_single_export(row)
+        export_rows = await rpc_claim_jobs(
+            "audit_exports", self.worker_id, limit=limit, lease_seconds=self.lease_seconds
+        )
+        # Exports are built one at a time; the ones still queued behind the
+        # current export keep their leases too.
+        pending = {str(row.get("id") or "") for row in export_rows} - {""}
+        async with batch_lease_heartbeat("audit_exports", pending, self.worker_id, self.lease_seconds):
+            for row in export_rows:
+                try:
+                    await self._process_single_export(row)
+                finally:
+                    pending.discard(str(row.get("id") or ""))
         return len(export_rows)
 
     async def run_once(self, *, limit: int = EXPORT_BATCH_LIMIT) -> int:
@@ -148,7 +167,9 @@ class ExportProcessor:
         if not export_id or not org_id or export_format not in {"csv", "pdf", "zip"}:
             return
 
-        await mark_audit_export_attempt_started(export_id, attempt_number)
+        if not await mark_audit_export_attempt_started(export_id, attempt_number, holder=self.worker_id):
+            self._lease_lost(export_id)
+            return
 
         try:
             from_ts = _normalize_iso8601(scope.get("from"))
@@ -167,24 +188,29 @@ class ExportProcessor:
             file_path = f"org/{org_id}/exports/{export_id}.{extension}"
             await upload_bytes(self.bucket_name, file_path, content, content_type)
 
-            await update_audit_export_status(
+            if not await update_audit_export_status(
                 export_id,
                 status_value="succeeded",
                 file_path=file_path,
                 file_sha256=sha256,
                 error_text=None,
                 completed_at=_now_iso(),
-            )
+                holder=self.worker_id,
+            ):
+                self._lease_lost(export_id)
         except Exception as exc:
             error_text = _sanitize_error_text(exc)
             if attempt_number < MAX_EXPORT_ATTEMPTS:
                 next_attempt_at = _retry_at_iso(attempt_number)
-                await mark_audit_export_for_retry(
+                if not await mark_audit_export_for_retry(
                     export_id,
                     attempts=attempt_number,
                     next_attempt_at=next_attempt_at,
                     last_error=error_text,
-                )
+                    holder=self.worker_id,
+                ):
+                    self._lease_lost(export_id)
+                    return
                 logger.warning(
                     "export.retry_scheduled",
                     extra={
@@ -195,12 +221,15 @@ class ExportProcessor:
                     },
                 )
                 return
-            await mark_audit_export_dead_letter(
+            if not await mark_audit_export_dead_letter(
                 export_id,
                 attempts=attempt_number,
                 last_error=error_text,
                 completed_at=_now_iso(),
-            )
+                holder=self.worker_id,
+            ):
+                self._lease_lost(export_id)
+                return
             logger.error(
                 "export.dead_letter",
                 extra={
@@ -211,6 +240,12 @@ class ExportProcessor:
                 },
             )
 
+    def _lease_lost(self, export_id: str) -> None:
+        logger.warning(
+            "export.lease_lost",
+            extra={"component": "worker", "export_id": export_id, "holder": self.worker_id},
+        )
+
     async def _build_export_content(
         self,
         *,
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import importlib.util
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import httpx
+
+from app.worker.concurrency import HostConcurrencyLimiter, HostRateLimiter, host_key
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_shared_engine: FetchEngine | None = None
+
+
+@dataclass
+class _HostClient:
+    client: httpx.AsyncClient
+    last_used: float
+    users: int = 0
+
+
+class FetchEngine:
+    """Outbound HTTP for source adapters: one keep-alive pool per host plus
+    per-host concurrency and request-rate limits. This is the only per-host
+    concurrency limit in the worker. Pools idle for ``client_idle_seconds``
+    or beyond the ``max_clients`` most recently used hosts are closed."""
+
+    def __init__(
+        self,
+        *,
+        per_host_concurrency: int = 2,
+        per_host_rate_per_second: float = 2.0,
+        max_connections_per_host: int = 4,
+        keepalive_expiry_seconds: float = 30.0,
+        max_clients: int = 256,
+        client_idle_seconds: float = 300.0,
+        http2: bool = True,
+    ) -> None:
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.max_connections_per_host = max(1, int(max_connections_per_host))
+        self.keepalive_expiry_seconds = max(0.0, float(keepalive_expiry_seconds))
+        self.max_clients = max(1, int(max_clients))
+        self.client_idle_seconds = max(0.0, float(client_idle_seconds))
+        self._clients: OrderedDict[str, _HostClient] = OrderedDict()
+        self._concurrency = HostConcurrencyLimiter(per_host_concurrency)
+        self._pacer = HostRateLimiter(per_host_rate_per_second)
+
+    def _checkout(self, url: str) -> _HostClient:
+        # Requests are sent to a pinned IP, so pools are split by hostname to
+        # keep connections (and their TLS SNI) from being shared across names.
+        key = host_key(url)
+        entry = self._clients.get(key)
+        if entry is None or entry.client.is_closed:
+            entry = _HostClient(
+                client=httpx.AsyncClient(
+                    follow_redirects=False,
+                    http2=self.http2,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections_per_host,
+                        max_keepalive_connections=self.max_connections_per_host,
+                        keepalive_expiry=self.keepalive_expiry_seconds,
+                    ),
+                ),
+                last_used=time.monotonic(),
+            )
+            self._clients[key] = entry
+        self._clients.move_to_end(key)
+        entry.users += 1
+        return entry
+
+    def _take_evictable(self) -> list[httpx.AsyncClient]:
+        # Oldest first; pools with a request in flight are never closed.
+        now = time.monotonic()
+        overflow = len(self._clients) - self.max_clients
+        evicted: list[httpx.AsyncClient] = []
+        for key, entry in list(self._clients.items()):
+            if entry.users > 0:
+                continue
+            if overflow > 0 or now - entry.last_used >= self.client_idle_seconds:
+                del self._clients[key]
+                overflow -= 1
+                evicted.append(entry.client)
+        return evicted
+
+    @asynccontextmanager
+    async def request_slot(self, url: str) -> AsyncIterator[httpx.AsyncClient]:
+        async with self._concurrency.acquire(url):
+            await self._pacer.wait(url)
+            entry = self._checkout(url)
+            try:
+                yield entry.client
+            finally:
+                entry.users -= 1
+                entry.last_used = time.monotonic()
+                for client in self._take_evictable():
+                    await client.aclose()
+
+    async def aclose(self) -> None:
+        entries = list(self._clients.values())
+        self._clients.clear()
+        for entry in entries:
+            if not entry.client.is_closed:
+                await entry.client.aclose()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+def get_fetch_engine() -> FetchEngine | None:
+    return _shared_engine
+
+
+async def close_fetch_engine() -> None:
+    global _shared_engine
+    engine = _shared_engine
+    _shared_engine = None
+    if engine is not None:
+        await engine.aclose()
+
+
+@asynccontextmanager
+async def fetch_engine_lifespan(**options: object) -> AsyncIterator[FetchEngine]:
+    global _shared_engine
+    engine = FetchEngine(**options)  # type: ignore[arg-type]
+    _shared_engine = engine
+    try:
+        yield engine
+    finally:
+        await close_fetch_engine()
@@ -1,17 +1,49 @@
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import socket
-from typing import Any
-from urllib.parse import urlparse
+from dataclasses import dataclass
+from typing import Any, Protocol
+from urllib.parse import urlparse, urlunparse
 
 import httpx
 
+from app.core.ttl_cache import TTLCache
+from app.worker.fetch_engine import get_fetch_engine
+
+DNS_CACHE_TTL_SECONDS = 300.0
+DNS_NEGATIVE_CACHE_TTL_SECONDS = 30.0
+DNS_CACHE_MAX_ENTRIES = 4096
+
+_dns_cache: TTLCache[str, tuple[str, ...]] = TTLCache(
+    max_entries=DNS_CACHE_MAX_ENTRIES,
+    ttl_seconds=DNS_CACHE_TTL_SECONDS,
+)
+_dns_failures: TTLCache[str, str] = TTLCache(
+    max_entries=DNS_CACHE_MAX_ENTRIES,
+    ttl_seconds=DNS_NEGATIVE_CACHE_TTL_SECONDS,
+)
+_dns_inflight: dict[str, asyncio.Future[tuple[str, ...]]] = {}
+
 
 class UnsafeUrlError(ValueError):
     pass
 
 
+class BodySink(Protocol):
+    def begin(self, content_type: str | None) -> None: ...
+
+    def write(self, chunk: bytes) -> None: ...
+
+
+@dataclass(frozen=True)
+class FetchTarget:
+    url: str
+    host: str
+    ip: str
+
+
 def _is_blocked_ip(ip: ipaddress._BaseAddress) -> bool:
     return (
         ip.is_private
@@ -23,18 +55,45 @@ def _is_blocked_ip(ip: ipaddress._BaseAddress) -> bool:
     )
 
 
-def resolve_public_ips(host: str) -> list[ipaddress._BaseAddress]:
+def clear_dns_cache() -> None:
+    _dns_cache.clear()
+    _dns_failures.clear()
+
+
+async def _getaddrinfo_uncached(host: str) -> tuple[str, ...]:
+    loop = asyncio.get_running_loop()
     try:
-        results = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+        results = await loop.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
     except socket.gaierror as exc:
+        _dns_failures.set(host, "host resolution failed")
         raise UnsafeUrlError("host resolution failed") from exc
 
+    addresses = tuple(dict.fromkeys(str(result[4][0]) for result in results if result[4]))
+    _dns_cache.set(host, addresses)
+    return addresses
+
+
+async def _lookup_host(host: str) -> tuple[str, ...]:
+    cached = _dns_cache.get(host)
+    if cached is not None:
+        return cached
+    failure = _dns_failures.get(host)
+    if failure is not None:
+        raise UnsafeUrlError(failure)
+
+    # Concurrent fetches of one host share a single resolver call.
+    pending = _dns_inflight.get(host)
+    if pending is None:
+        pending = asyncio.ensure_future(_getaddrinfo_uncached(host))
+        _dns_inflight[host] = pending
+        pending.add_done_callback(lambda _: _dns_inflight.pop(host, None))
+    return await asyncio.shield(pending)
+
+
+async def resolve_public_ips(host: str) -> list[ipaddress._BaseAddress]:
     ips: list[ipaddress._BaseAddress] = []
-    for result in results:
-        sockaddr = result[4]
-        if not sockaddr:
-            continue
-        ip = ipaddress.ip_address(sockaddr[0])
+    for address in await _lookup_host(host):
+        ip = ipaddress.ip_address(address)
         if _is_blocked_ip(ip):
             raise UnsafeUrlError(f"blocked IP address: {ip}")
         ips.append(ip)
@@ -44,7 +103,7 @@ def resolve_public_ips(host: str) -> list[ipaddress._BaseAddress]:
     return ips
 
 
-def validate_fetch_url(url: str, *, allowed_hosts: set[str] | None = None) -> str:
+async def validate_fetch_url(url: str, *, allowed_hosts: set[str] | None = None) -> FetchTarget:
     parsed = urlparse(url)
     if parsed.scheme not in {"http", "https"}:
         raise UnsafeUrlError("only http/https URLs are allowed")
@@ -62,12 +121,19 @@ def validate_fetch_url(url: str, *, allowed_hosts: set[str] | None = None) -> st
     try:
         ip = ipaddress.ip_address(host)
     except ValueError:
-        resolve_public_ips(host)
+        ip = (await resolve_public_ips(host))[0]
     else:
         if _is_blocked_ip(ip):
             raise UnsafeUrlError(f"blocked IP address: {ip}")
 
-    return url
+    return FetchTarget(url=url, host=host, ip=str(ip))
+
+
+def _pinned_url(target: FetchTarget) -> str:
+    parsed = urlparse(target.url)
+    ip_host = f"[{target.ip}]" if ":" in target.ip else target.ip
+    netloc = f"{ip_host}:{parsed.port}" if parsed.port else ip_host
+    return urlunparse(parsed._replace(netloc=netloc))
 
 
 async def fetch_url(
@@ -79,13 +145,22 @@ async def fetch_url(
     max_bytes: int = 1_000_000,
     allowed_hosts: set[str] | None = None,
     extra_headers: dict[str, str] | None = None,
+    sink: BodySink | None = None,
+    method: str = "GET",
+    body: bytes | None = None,
 ) -> dict[str, Any]:
-    safe_url = validate_fetch_url(url, allowed_hosts=allowed_hosts)
+    target = await validate_fetch_url(url, allowed_hosts=allowed_hosts)
+    safe_url = target.url
+    parsed_url = urlparse(safe_url)
     timeout = httpx.Timeout(timeout_seconds)
+    # Connect to the address that passed validation so the name cannot be
+    # rebound between the check and the request; Host and SNI keep the name.
     headers: dict[str, str] = {
+        "Host": parsed_url.netloc,
         "User-Agent": "VeriruleMonitor/1.0",
         "Accept-Encoding": "gzip, deflate",
     }
+    extensions = {"sni_hostname": target.host} if parsed_url.scheme == "https" else {}
     if extra_headers:
         headers.update(extra_headers)
     if etag:
@@ -93,44 +168,99 @@ async def fetch_url(
     if last_modified:
         headers["If-Modified-Since"] = last_modified
 
+    engine = get_fetch_engine()
+    if engine is None:
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=False) as client:
+            return await _read_response(
+                client,
+                target,
+                headers,
+                extensions,
+                etag=etag,
+                last_modified=last_modified,
+                max_bytes=max_bytes,
+                sink=sink,
+                method=method,
+                body=body,
+            )
+
+    async with engine.request_slot(safe_url) as client:
+        return await _read_response(
+            client,
+            target,
+            headers,
+            extensions,
+            etag=etag,
+            last_modified=last_modified,
+            max_bytes=max_bytes,
+            timeout=timeout,
+            sink=sink,
+            method=method,
+            body=body,
+        )
+
+
+async def _read_response(
+    client: httpx.AsyncClient,
+    target: FetchTarget,
+    headers: dict[str, str],
+    extensions: dict[str, str],
+    *,
+    etag: str | None,
+    last_modified: str | None,
+    max_bytes: int,
+    timeout: httpx.Timeout | None = None,
+    sink: BodySink | None = None,
+    method: str = "GET",
+    body: bytes | None = None,
+) -> dict[str, Any]:
     content = bytearray()
-    fetched_url = safe_url
-    response_status = 0
-    response_content_type: str | None = None
-    response_etag: str | None = None
-    response_last_modified: str | None = None
-
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=False) as client:
-        async with client.stream("GET", safe_url, headers=headers) as response:
-            if 300 <= response.status_code < 400 and response.status_code != 304:
-                raise UnsafeUrlError("redirects are not allowed")
-            if response.status_code not in {200, 304}:
-                response.raise_for_status()
-
-            fetched_url = str(response.url)
-            response_status = int(response.status_code)
-            response_content_type = response.headers.get("content-type")
-            response_etag = response.headers.get("etag") or etag
-            response_last_modified = response.headers.get("last-modified") or last_modified
-
-            if response_status == 304:
-                return {
-                    "status": response_status,
-                    "bytes": b"",
-                    "content_type": response_content_type,
-                    "etag": response_etag,
-                    "last_modified": response_last_modified,
-                    "fetched_url": fetched_url,
-                }
-
-            declared_len = response.headers.get("content-length")
-            if declared_len and declared_len.isdigit() and int(declared_len) > max_bytes:
-                raise UnsafeUrlError("response exceeds maximum size")
+    content_len = 0
+    fetched_url = target.url
+    request_options: dict[str, Any] = {"headers": headers, "extensions": extensions}
+    if timeout is not None:
+        request_options["timeout"] = timeout
+    if body is not None:
+        request_options["content"] = body
+
+    async with client.stream(method, _pinned_url(target), **request_options) as response:
+        if 300 <= response.status_code < 400 and response.status_code != 304:
+            raise UnsafeUrlError("redirects are not allowed")
+        if response.status_code not in {200, 304}:
+            response.raise_for_status()
+
+        response_status = int(response.status_code)
+        response_content_type = response.headers.get("content-type")
+        response_etag = response.headers.get("etag") or etag
+        response_last_modified = response.headers.get("last-modified") or last_modified
 
-            async for chunk in response.aiter_bytes():
+        if response_status == 304:
+            return {
+                "status": response_status,
+                "bytes": b"",
+                "content_type": response_content_type,
+                "etag": response_etag,
+                "last_modified": response_last_modified,
+                "fetched_url": fetched_url,
+                "headers": response.headers,
+            }
+
+        declared_len = response.headers.get("content-length")
+        if declared_len and declared_len.isdigit() and int(declared_len) > max_bytes:
+            raise UnsafeUrlError("response exceeds maximum size")
+
+        # With a sink the body is handed over chunk by chunk as it arrives
+        # instead of being buffered here.
+        if sink is not None:
+            sink.begin(response_content_type)
+        async for chunk in response.aiter_bytes():
+            content_len += len(chunk)
+            if content_len > max_bytes:
+                raise UnsafeUrlError("response exceeds maximum size")
+            if sink is not None:
+                sink.write(chunk)
+            else:
                 content.extend(chunk)
-                if len(content) > max_bytes:
-                    raise UnsafeUrlError("response exceeds maximum size")
 
     return {
         "status": response_status,
@@ -139,4 +269,6 @@ async def fetch_url(
         "etag": response_etag,
         "last_modified": response_last_modified,
         "fetched_url": fetched_url,
+        "content_len": content_len,
+        "headers": response.headers,
     }
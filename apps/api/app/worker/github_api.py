@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_URL = f"https://{GITHUB_API_HOST}"
+RELEASES_PAGE_SIZE = 5
+GRAPHQL_BATCH_SIZE = 25
+GRAPHQL_BATCH_WINDOW_SECONDS = 0.05
+# Requests held back per token so other workers sharing it are not starved.
+BUDGET_RESERVE = 5
+_DEFAULT_LIMIT_WAIT_SECONDS = 60.0
+
+_shared_budget: GitHubBudget | None = None
+_shared_batcher: GitHubReleaseBatcher | None = None
+
+
+class GitHubRateLimited(Exception):
+    """No configured credential has request budget left; retry at ``retry_at``."""
+
+    def __init__(self, retry_at: float) -> None:
+        super().__init__("GitHub API rate limit reached")
+        self.retry_at = retry_at
+
+    @property
+    def retry_at_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.retry_at, tz=UTC)
+
+
+@dataclass
+class _Allowance:
+    remaining: int | None = None
+    reset_at: float = 0.0
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class GitHubBudget:
+    """Tracks the rate-limit allowance of each configured token (or of the
+    anonymous client when none are configured) from GitHub's response headers
+    and hands out the token with the most requests left."""
+
+    def __init__(self, tokens: Sequence[str] = (), *, reserve: int = BUDGET_RESERVE) -> None:
+        cleaned = [token.strip() for token in tokens if token.strip()]
+        self.tokens: tuple[str | None, ...] = tuple(dict.fromkeys(cleaned)) or (None,)
+        self.reserve = max(0, int(reserve))
+        self._allowances: dict[tuple[str | None, str], _Allowance] = {}
+
+    @property
+    def authenticated(self) -> bool:
+        return self.tokens != (None,)
+
+    def _allowance(self, token: str | None, resource: str) -> _Allowance:
+        return self._allowances.setdefault((token, resource), _Allowance())
+
+    def acquire(self, resource: str = "core") -> str | None:
+        now = time.time()
+        available: list[tuple[str | None, _Allowance]] = []
+        for token in self.tokens:
+            allowance = self._allowance(token, resource)
+            if allowance.remaining is not None and allowance.reset_at <= now:
+                allowance.remaining = None
+            if allowance.remaining is None or allowance.remaining > self.reserve:
+                available.append((token, allowance))
+        if not available:
+            retry_at = min(self._allowance(token, resource).reset_at for token in self.tokens)
+            raise GitHubRateLimited(max(retry_at, now + 1.0))
+
+        # A token whose allowance is unknown has not been used since its
+        # window reset, so it goes first.
+        token, allowance = max(
+            available,
+            key=lambda item: float("inf") if item[1].remaining is None else item[1].remaining,
+        )
+        # Counted up front so concurrent runs do not all spend the last request.
+        if allowance.remaining is not None:
+            allowance.remaining -= 1
+        return token
+
+    def record(
+        self, token: str | None, resource: str, status_code: int, headers: Mapping[str, str]
+    ) -> None:
+        allowance = self._allowance(token, resource)
+        remaining = _header_number(headers, "x-ratelimit-remaining")
+        reset_at = _header_number(headers, "x-ratelimit-reset")
+        if remaining is not None:
+            allowance.remaining = int(remaining)
+        if reset_at is not None:
+            allowance.reset_at = reset_at
+        if status_code in {403, 429} and (remaining == 0 or "retry-after" in headers):
+            # Secondary limits only send Retry-After.
+            retry_after = _header_number(headers, "retry-after")
+            allowance.remaining = 0
+            if retry_after is not None:
+                allowance.reset_at = max(allowance.reset_at, time.time() + retry_after)
+            elif reset_at is None:
+                allowance.reset_at = time.time() + _DEFAULT_LIMIT_WAIT_SECONDS
+            raise GitHubRateLimited(allowance.reset_at)
+
+
+def auth_headers(token: str | None) -> dict[str, str]:
+    headers = {"User-Agent": "verirule", "Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+async def budgeted_request(
+    budget: GitHubBudget,
+    resource: str,
+    request: Callable[[dict[str, str]], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    token = budget.acquire(resource)
+    try:
+        result = await request(auth_headers(token))
+    except httpx.HTTPStatusError as exc:
+        budget.record(token, resource, exc.response.status_code, exc.response.headers)
+        raise
+    budget.record(token, resource, int(result.get("status") or 0), result.get("headers") or {})
+    return result
+
+
+_RELEASE_FIELDS = "databaseId tagName name description publishedAt createdAt url"
+
+
+def _graphql_query(repos: Sequence[str]) -> str:
+    parts = []
+    for index, repo in enumerate(repos):
+        owner, name = repo.split("/", 1)
+        parts.append(
+            f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ releases(first: 1, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+            f"{{ nodes {{ {_RELEASE_FIELDS} }} }} }}"
+        )
+    return "query { " + " ".join(parts) + " }"
+
+
+def _release_from_node(node: Mapping[str, Any]) -> dict[str, Any]:
+    # Same keys as the REST releases API, so both paths share one parser.
+    return {
+        "id": node.get("databaseId"),
+        "tag_name": node.get("tagName"),
+        "name": node.get("name"),
+        "body": node.get("description"),
+        "published_at": node.get("publishedAt"),
+        "created_at": node.get("createdAt"),
+        "html_url": node.get("url"),
+    }
+
+
+# Called as post(body, headers, timeout_seconds, max_bytes).
+GraphQLPost = Callable[[bytes, dict[str, str], float, int], Awaitable[dict[str, Any]]]
+
+
+class GitHubReleaseBatcher:
+    """Collects latest-release lookups that arrive within a short window and
+    answers them with one GraphQL query, which costs a single rate-limit
+    point for the whole batch. GraphQL requires a token.
+
+    The batch request uses the largest timeout and response size among the
+    lookups it answers, so no caller's limits are narrowed by another's."""
+
+    def __init__(
+        self,
+        budget: GitHubBudget,
+        *,
+        max_batch: int = GRAPHQL_BATCH_SIZE,
+        window_seconds: float = GRAPHQL_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self.budget = budget
+        self.max_batch = max(1, int(max_batch))
+        self.window_seconds = max(0.0, float(window_seconds))
+        self.batches_sent = 0
+        self._pending: dict[str, list[asyncio.Future[dict[str, Any] | None]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._post: GraphQLPost | None = None
+        self._limits: tuple[float, int] | None = None
+        self._flushes: set[asyncio.Future[None]] = set()
+
+    async def latest_release(
+        self, repo: str, post: GraphQLPost, *, timeout_seconds: float, max_bytes: int
+    ) -> dict[str, Any] | None:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any] | None] = loop.create_future()
+        self._pending.setdefault(repo, []).append(future)
+        self._post = post
+        if self._limits is not None:
+            timeout_seconds = max(timeout_seconds, self._limits[0])
+            max_bytes = max(max_bytes, self._limits[1])
+        self._limits = (timeout_seconds, max_bytes)
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        post, self._post = self._post, None
+        limits, self._limits = self._limits, None
+        if pending and post is not None and limits is not None:
+            flush = asyncio.ensure_future(self._flush(pending, post, *limits))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self,
+        pending: dict[str, list[asyncio.Future[dict[str, Any] | None]]],
+        post: GraphQLPost,
+        timeout_seconds: float,
+        max_bytes: int,
+    ) -> None:
+        repos = list(pending)
+        try:
+            self.batches_sent += 1
+            body = json.dumps({"query": _graphql_query(repos)}).encode("utf-8")
+            result = await budgeted_request(
+                self.budget, "graphql", lambda headers: post(body, headers, timeout_seconds, max_bytes)
+            )
+            payload = json.loads(bytes(result.get("bytes") or b"").decode("utf-8", errors="replace"))
+            data = payload.get("data") if isinstance(payload, dict) else None
+            errors = payload.get("errors") if isinstance(payload, dict) else None
+            if any(isinstance(error, dict) and error.get("type") == "RATE_LIMITED" for error in errors or []):
+                raise GitHubRateLimited(time.time() + _DEFAULT_LIMIT_WAIT_SECONDS)
+            if not isinstance(data, dict):
+                raise ValueError("GitHub GraphQL response has no data")
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        for index, repo in enumerate(repos):
+            repository = data.get(f"r{index}")
+            outcome: dict[str, Any] | None | Exception
+            if not isinstance(repository, dict):
+                outcome = ValueError(f"GitHub repository not found: {repo}")
+            else:
+                nodes = (repository.get("releases") or {}).get("nodes") or []
+                outcome = _release_from_node(nodes[0]) if nodes and isinstance(nodes[0], dict) else None
+            for future in pending[repo]:
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+
+def get_github_budget() -> GitHubBudget:
+    global _shared_budget
+    if _shared_budget is None:
+        _shared_budget = GitHubBudget()
+    return _shared_budget
+
+
+def get_github_batcher() -> GitHubReleaseBatcher | None:
+    return _shared_batcher
+
+
+def configure_github(tokens: Sequence[str] = ()) -> GitHubBudget:
+    global _shared_budget, _shared_batcher
+    _shared_budget = GitHubBudget(tokens)
+    _shared_batcher = GitHubReleaseBatcher(_shared_budget) if _shared_budget.authenticated else None
+    return _shared_budget
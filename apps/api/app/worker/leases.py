@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import HTTPException
+
+from app.core.logging import get_logger
+from app.core.supabase_rest import JobQueue, rpc_renew_job_lease
+
+logger = get_logger("worker.leases")
+
+
+@asynccontextmanager
+async def lease_heartbeat(
+    queue: JobQueue, job_id: str, holder: str, lease_seconds: int
+) -> AsyncIterator[None]:
+    """Renews the lease on a claimed job every third of its length until the
+    block exits. A lost lease is only logged here; the fenced completion
+    write is what keeps the stale holder from storing its result."""
+    async with batch_lease_heartbeat(queue, {job_id}, holder, lease_seconds):
+        yield
+
+
+@asynccontextmanager
+async def batch_lease_heartbeat(
+    queue: JobQueue, job_ids: set[str], holder: str, lease_seconds: int
+) -> AsyncIterator[None]:
+    """Like ``lease_heartbeat`` for a claimed batch handled one job at a time,
+    so jobs waiting behind the current one keep their leases too. The caller
+    discards ids from ``job_ids`` as it finishes them; ids whose lease was
+    lost are dropped from the set."""
+    interval = max(0.1, lease_seconds / 3)
+
+    async def _renew_one(job_id: str) -> None:
+        try:
+            renewed = await rpc_renew_job_lease(queue, job_id, holder, lease_seconds)
+        except HTTPException:
+            # Transient; the next beat still lands before the lease ends.
+            logger.warning(
+                "job.lease_renew_failed",
+                extra={"component": "worker", "queue": queue, "job_id": job_id},
+            )
+            return
+        if not renewed and job_id in job_ids:
+            job_ids.discard(job_id)
+            logger.warning(
+                "job.lease_lost",
+                extra={"component": "worker", "queue": queue, "job_id": job_id},
+            )
+
+    async def _renew() -> None:
+        while job_ids:
+            await asyncio.sleep(interval)
+            await asyncio.gather(*(_renew_one(job_id) for job_id in list(job_ids)))
+
+    task = asyncio.create_task(_renew())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator, Sequence
+
+# (tag, i1, i2, j1, j2) with the same meaning as difflib opcodes.
+Opcode = tuple[str, int, int, int, int]
+
+DEFAULT_MAX_EDIT_COST = 1_000
+
+
+def _intern_lines(previous: Sequence[str], current: Sequence[str]) -> tuple[list[int], list[int]]:
+    ids: dict[str, int] = {}
+    a = [ids.setdefault(line, len(ids)) for line in previous]
+    b = [ids.setdefault(line, len(ids)) for line in current]
+    return a, b
+
+
+def _patience_anchors(
+    a: list[int], alo: int, ahi: int, b: list[int], blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    counts: dict[int, list[int]] = {}
+    for i in range(alo, ahi):
+        entry = counts.setdefault(a[i], [0, 0, i])
+        entry[0] += 1
+    for j in range(blo, bhi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[1] += 1
+            if entry[1] == 1:
+                entry.append(j)
+
+    pairs = sorted(
+        (entry[2], entry[3]) for entry in counts.values() if entry[0] == 1 and entry[1] == 1
+    )
+    if not pairs:
+        return []
+
+    # Longest increasing run of b positions (patience sorting).
+    tails: list[int] = []
+    tail_index: list[int] = []
+    back: list[int] = [-1] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        low, high = 0, len(tails)
+        while low < high:
+            mid = (low + high) // 2
+            if tails[mid] < j:
+                low = mid + 1
+            else:
+                high = mid
+        if low == len(tails):
+            tails.append(j)
+            tail_index.append(index)
+        else:
+            tails[low] = j
+            tail_index[low] = index
+        back[index] = tail_index[low - 1] if low > 0 else -1
+
+    anchors: list[tuple[int, int]] = []
+    index = tail_index[-1]
+    while index >= 0:
+        anchors.append(pairs[index])
+        index = back[index]
+    anchors.reverse()
+    return anchors
+
+
+def _myers(
+    a: list[int],
+    alo: int,
+    ahi: int,
+    b: list[int],
+    blo: int,
+    bhi: int,
+    *,
+    max_cost: int,
+    deadline: float | None,
+) -> list[Opcode] | None:
+    n, m = ahi - alo, bhi - blo
+    v: dict[int, int] = {1: 0}
+    trace: list[dict[int, int]] = []
+    for d in range(min(n + m, max_cost) + 1):
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m, alo, blo)
+    return None
+
+
+def _backtrack(trace: list[dict[int, int]], n: int, m: int, alo: int, blo: int) -> list[Opcode]:
+    steps: list[str] = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            steps.append("equal")
+            x -= 1
+            y -= 1
+        if d > 0:
+            steps.append("insert" if x == prev_x else "delete")
+        x, y = prev_x, prev_y
+    steps.reverse()
+
+    opcodes: list[Opcode] = []
+    i, j = alo, blo
+    for step in steps:
+        i2 = i + (step != "insert")
+        j2 = j + (step != "delete")
+        if opcodes and opcodes[-1][0] == step:
+            tag, i1, _, j1, _ = opcodes[-1]
+            opcodes[-1] = (tag, i1, i2, j1, j2)
+        else:
+            opcodes.append((step, i, i2, j, j2))
+        i, j = i2, j2
+    return opcodes
+
+
+def _change(alo: int, ahi: int, blo: int, bhi: int) -> Iterator[Opcode]:
+    if ahi > alo:
+        yield ("delete", alo, ahi, blo, blo)
+    if bhi > blo:
+        yield ("insert", ahi, ahi, blo, bhi)
+
+
+def iter_opcodes(
+    a: list[int],
+    b: list[int],
+    *,
+    max_edit_cost: int = DEFAULT_MAX_EDIT_COST,
+    deadline: float | None = None,
+) -> Iterator[Opcode]:
+    """Yields opcodes left to right so callers can stop early. Unique common
+    lines anchor the alignment (patience diff); the gaps between anchors are
+    solved with Myers up to ``max_edit_cost`` edits, and anything over budget
+    or past ``deadline`` is reported as one delete/insert block."""
+    stack: list[tuple[str, int, int, int, int]] = [("range", 0, len(a), 0, len(b))]
+    while stack:
+        tag, alo, ahi, blo, bhi = stack.pop()
+        if tag != "range":
+            yield (tag, alo, ahi, blo, bhi)
+            continue
+
+        i, j = alo, blo
+        while i < ahi and j < bhi and a[i] == b[j]:
+            i += 1
+            j += 1
+        if i > alo:
+            yield ("equal", alo, i, blo, j)
+
+        a_end, b_end = ahi, bhi
+        while a_end > i and b_end > j and a[a_end - 1] == b[b_end - 1]:
+            a_end -= 1
+            b_end -= 1
+        pending: list[tuple[str, int, int, int, int]] = []
+        if a_end < ahi:
+            pending.append(("equal", a_end, ahi, b_end, bhi))
+
+        if i == a_end or j == b_end:
+            yield from _change(i, a_end, j, b_end)
+            stack.extend(reversed(pending))
+            continue
+
+        anchors = _patience_anchors(a, i, a_end, b, j, b_end)
+        if anchors:
+            items: list[tuple[str, int, int, int, int]] = []
+            ai, bj = i, j
+            for anchor_a, anchor_b in anchors:
+                items.append(("range", ai, anchor_a, bj, anchor_b))
+                items.append(("equal", anchor_a, anchor_a + 1, anchor_b, anchor_b + 1))
+                ai, bj = anchor_a + 1, anchor_b + 1
+            items.append(("range", ai, a_end, bj, b_end))
+            stack.extend(reversed(items + pending))
+            continue
+
+        opcodes = _myers(a, i, a_end, b, j, b_end, max_cost=max_edit_cost, deadline=deadline)
+        if opcodes is None:
+            yield from _change(i, a_end, j, b_end)
+        else:
+            yield from opcodes
+        stack.extend(reversed(pending))
+
+
+def _merge_equal(opcodes: Iterator[Opcode]) -> Iterator[Opcode]:
+    pending: Opcode | None = None
+    for opcode in opcodes:
+        if opcode[0] != "equal":
+            if pending is not None:
+                yield pending
+                pending = None
+            yield opcode
+        elif pending is None:
+            pending = opcode
+        else:
+            pending = ("equal", pending[1], opcode[2], pending[3], opcode[4])
+    if pending is not None:
+        yield pending
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def iter_unified_hunks(
+    previous: Sequence[str],
+    current: Sequence[str],
+    *,
+    context: int = 2,
+    max_edit_cost: int = DEFAULT_MAX_EDIT_COST,
+    time_budget_seconds: float | None = None,
+) -> Iterator[list[str]]:
+    """Lazily yields unified-diff hunks (header line first) of two line lists."""
+    deadline = time.monotonic() + time_budget_seconds if time_budget_seconds is not None else None
+    a, b = _intern_lines(previous, current)
+    hunk: list[Opcode] = []
+
+    def render(group: list[Opcode]) -> list[str]:
+        first, last = group[0], group[-1]
+        lines = [f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"]
+        removed: list[str] = []
+        added: list[str] = []
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                lines.extend(f"-{line}" for line in removed)
+                lines.extend(f"+{line}" for line in added)
+                removed, added = [], []
+                lines.extend(f" {line}" for line in previous[i1:i2])
+                continue
+            removed.extend(previous[i1:i2])
+            added.extend(current[j1:j2])
+        lines.extend(f"-{line}" for line in removed)
+        lines.extend(f"+{line}" for line in added)
+        return lines
+
+    opcodes = iter_opcodes(a, b, max_edit_cost=max_edit_cost, deadline=deadline)
+    for tag, i1, i2, j1, j2 in _merge_equal(opcodes):
+        if tag != "equal":
+            hunk.append((tag, i1, i2, j1, j2))
+            continue
+        if not hunk:
+            # Leading context for the first change.
+            hunk.append(("equal", max(i1, i2 - context), i2, max(j1, j2 - context), j2))
+            continue
+        if i2 - i1 > context * 2:
+            hunk.append(("equal", i1, i1 + context, j1, j1 + context))
+            if any(op[0] != "equal" for op in hunk):
+                yield render(hunk)
+            hunk = [("equal", i2 - context, i2, j2 - context, j2)]
+            continue
+        hunk.append((tag, i1, i2, j1, j2))
+
+    if any(op[0] != "equal" for op in hunk):
+        while hunk and hunk[-1][0] == "equal" and hunk[-1][2] - hunk[-1][1] > context:
+            tag, i1, _, j1, _ = hunk[-1]
+            hunk[-1] = (tag, i1, i1 + context, j1, j1 + context)
+        yield render(hunk)
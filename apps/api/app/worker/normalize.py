@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import codecs
 import hashlib
 import json
 import re
@@ -7,37 +8,138 @@ from html import unescape
 from html.parser import HTMLParser
 from typing import Any
 
+from app.core.html_selectors import RegionRules
+
 
 class _VisibleTextExtractor(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
         self._chunks: list[str] = []
+        self._pending: list[str] = []
         self._skip_depth = 0
 
+    def _flush(self) -> None:
+        # Text between two pieces of markup can arrive in several
+        # handle_data calls when the document is fed incrementally.
+        if not self._pending:
+            return
+        cleaned = " ".join("".join(self._pending).split())
+        self._pending = []
+        if cleaned:
+            self._chunks.append(cleaned)
+
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush()
         if tag in {"script", "style", "noscript"}:
             self._skip_depth += 1
 
     def handle_endtag(self, tag: str) -> None:
+        self._flush()
         if tag in {"script", "style", "noscript"} and self._skip_depth > 0:
             self._skip_depth -= 1
 
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
     def handle_data(self, data: str) -> None:
         if self._skip_depth > 0:
             return
-        cleaned = " ".join(data.split())
-        if cleaned:
-            self._chunks.append(cleaned)
+        self._pending.append(data)
 
     def text(self) -> str:
+        self._flush()
         return "\n".join(self._chunks)
 
 
+_VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+)
+
+
+class HtmlStreamExtractor(_VisibleTextExtractor):
+    """Single pass over an HTML body as it downloads: decodes, extracts the
+    title and visible text, and hashes the raw bytes chunk by chunk. With
+    region rules only text inside an include selector match (or anywhere, if
+    there are none) and outside every exclude match is kept."""
+
+    def __init__(self, rules: RegionRules | None = None) -> None:
+        super().__init__()
+        self._rules = rules
+        self._path: list[tuple[str, dict[str, str]]] = []
+        self._regions: list[tuple[bool, bool]] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._raw_hash = hashlib.sha256()
+        self._title_parts: list[str] | None = None
+        self._title_done = False
+        self.title: str | None = None
+        self.content_len = 0
+
+    def _in_region(self) -> bool:
+        if self._regions:
+            included, excluded = self._regions[-1]
+            return included and not excluded
+        return self._rules is None or not self._rules.include
+
+    def _enter_element(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        rules = self._rules
+        if rules is None or tag in _VOID_ELEMENTS:
+            return
+        self._path.append((tag, {name: value or "" for name, value in attrs}))
+        included, excluded = self._regions[-1] if self._regions else (False, False)
+        included = included or any(selector.matches(self._path) for selector in rules.include)
+        excluded = excluded or any(selector.matches(self._path) for selector in rules.exclude)
+        self._regions.append((included, excluded))
+
+    def _leave_element(self, tag: str) -> None:
+        if self._rules is None or tag in _VOID_ELEMENTS:
+            return
+        # Tolerate unclosed children: closing a tag also closes anything
+        # still open inside it.
+        for index in range(len(self._path) - 1, -1, -1):
+            if self._path[index][0] == tag:
+                del self._path[index:]
+                del self._regions[index:]
+                return
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        super().handle_starttag(tag, attrs)
+        self._enter_element(tag, attrs)
+        if tag == "title" and not self._title_done and self._title_parts is None:
+            self._title_parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        super().handle_endtag(tag)
+        self._leave_element(tag)
+        if tag == "title" and self._title_parts is not None:
+            self.title = " ".join("".join(self._title_parts).split()) or None
+            self._title_parts = None
+            self._title_done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        if self._in_region():
+            super().handle_data(data)
+
+    def write(self, chunk: bytes) -> None:
+        self.content_len += len(chunk)
+        self._raw_hash.update(chunk)
+        self.feed(self._decoder.decode(chunk))
+
+    def finish(self) -> str:
+        self.feed(self._decoder.decode(b"", final=True))
+        self.close()
+        return self.text().strip()
+
+    @property
+    def raw_bytes_hash(self) -> str:
+        return self._raw_hash.hexdigest()
+
+
 def _extract_html_text(content: bytes) -> str:
-    decoded = content.decode("utf-8", errors="replace")
-    parser = _VisibleTextExtractor()
-    parser.feed(decoded)
-    return parser.text()
+    parser = HtmlStreamExtractor()
+    parser.write(content)
+    return parser.finish()
 
 
 def _extract_pdf_text(content: bytes) -> str:
@@ -11,12 +11,12 @@ from app.core.logging import get_logger
 from app.core.settings import get_settings
 from app.core.supabase_rest import (
     ensure_org_notification_rules,
-    fetch_due_notification_jobs,
     get_org_notification_rules,
     list_org_member_emails,
     mark_notification_job_failed,
     mark_notification_job_running,
     mark_notification_job_sent,
+    rpc_claim_jobs,
     rpc_record_audit_event,
     select_alert_by_id_for_org,
     select_finding_by_id,
@@ -33,6 +33,7 @@ from app.notifications.templates import (
     sla_due_soon_email,
     sla_overdue_email,
 )
+from app.worker.leases import batch_lease_heartbeat
 from app.worker.retry import backoff_seconds, sanitize_error
 
 logger = get_logger("worker.notification_sender")
@@ -53,18 +54,37 @@ class NotificationSender:
         access_token: str,
         batch_limit: int = 50,
         max_attempts: int = 5,
+        worker_id: str = "worker",
+        lease_seconds: int = 300,
     ) -> None:
         self.access_token = access_token
         self.batch_limit = max(1, batch_limit)
         self.max_attempts = max(1, max_attempts)
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
 
     async def process_queued_jobs_once(self) -> int:
-        jobs = await fetch_due_notification_jobs(limit=self.batch_limit)
+        jobs = await rpc_claim_jobs(
+            "notification_jobs",
+            self.worker_id,
+            limit=self.batch_limit,
+            lease_seconds=self.lease_seconds,
+        )
         processed = 0
-        for job in jobs:
-            sent = await self._process_job(job)
-            if sent:
-                processed += 1
+        # Jobs are sent one at a time, so the whole claimed batch is kept
+        # leased until each job is finished, not just the one being sent.
+        pending = {str(job.get("id") or "").strip() for job in jobs} - {""}
+        async with batch_lease_heartbeat(
+            "notification_jobs", pending, self.worker_id, self.lease_seconds
+        ):
+            for job in jobs:
+                job_id = str(job.get("id") or "").strip()
+                try:
+                    sent = await self._process_job(job)
+                finally:
+                    pending.discard(job_id)
+                if sent:
+                    processed += 1
         return processed
 
     async def run_once(self) -> int:
@@ -82,7 +102,10 @@ class NotificationSender:
 
         current_attempts = _safe_int(job.get("attempts"))
         next_attempt = current_attempts + 1
-        await mark_notification_job_running(job_id, next_attempt)
+        if not await mark_notification_job_running(job_id, next_attempt, holder=self.worker_id):
+            # Another worker reclaimed the job; it does the sending.
+            self._lease_lost(job_id)
+            return False
 
         try:
             if job_type == "digest":
@@ -110,7 +133,9 @@ class NotificationSender:
                     request_id=f"notify-{job_id}",
                 )
 
-            await mark_notification_job_sent(job_id, next_attempt)
+            if not await mark_notification_job_sent(job_id, next_attempt, holder=self.worker_id):
+                self._lease_lost(job_id)
+                return False
             await rpc_record_audit_event(
                 self.access_token,
                 {
@@ -128,23 +153,28 @@ class NotificationSender:
         except Exception as exc:
             error_text = sanitize_error(exc, default_message="notification job failed")
             if next_attempt >= self.max_attempts:
-                await mark_notification_job_failed(
+                recorded = await mark_notification_job_failed(
                     job_id,
                     next_attempt,
                     error_text,
+                    holder=self.worker_id,
                     terminal=True,
                 )
             else:
                 retry_at = (
                     datetime.now(UTC) + timedelta(seconds=backoff_seconds(next_attempt))
                 ).isoformat().replace("+00:00", "Z")
-                await mark_notification_job_failed(
+                recorded = await mark_notification_job_failed(
                     job_id,
                     next_attempt,
                     error_text,
+                    holder=self.worker_id,
                     run_after=retry_at,
                     terminal=False,
                 )
+            if not recorded:
+                self._lease_lost(job_id)
+                return False
             logger.warning(
                 "notification_sender.job_failed",
                 extra={
@@ -157,6 +187,12 @@ class NotificationSender:
             )
             return False
 
+    def _lease_lost(self, job_id: str) -> None:
+        logger.warning(
+            "notification_sender.lease_lost",
+            extra={"component": "worker", "job_id": job_id, "holder": self.worker_id},
+        )
+
     async def _send_digest_job(
         self,
         org_id: str,
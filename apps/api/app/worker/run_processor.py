@@ -1,44 +1,40 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
-from dataclasses import dataclass
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
 import httpx
 
 from app.core.logging import get_logger
+from app.core.snapshot_text import compress_snapshot_text, snapshot_text_hash
 from app.core.supabase_rest import (
-    clear_monitor_run_error_state,
-    enqueue_notification_job,
-    ensure_org_notification_rules,
-    get_org_notification_rules,
     mark_monitor_run_attempt_started,
     mark_monitor_run_dead_letter,
     mark_monitor_run_for_retry,
-    rpc_append_audit,
-    rpc_create_monitor_run,
-    rpc_insert_finding_explanation,
-    rpc_insert_snapshot_v3,
-    rpc_schedule_next_run,
-    rpc_set_monitor_run_state,
-    rpc_set_source_fetch_metadata,
-    rpc_upsert_alert_for_finding,
-    rpc_upsert_finding,
-    select_due_sources,
+    rpc_claim_jobs,
+    rpc_complete_monitor_run,
+    rpc_enqueue_due_runs,
     select_latest_snapshot,
-    select_queued_monitor_runs,
-    select_recent_active_monitor_runs_for_source,
+    select_snapshot_text,
     select_source_by_id,
 )
-from app.worker.adapters.base import Snapshot, Source
+from app.core.ttl_cache import TTLCache
+from app.worker.adapters.base import AdapterResult, Snapshot, Source
 from app.worker.adapters.registry import get_adapter
+from app.worker.compute import run_cpu_bound
 from app.worker.explain import build_explanation
 from app.worker.fetcher import UnsafeUrlError
+from app.worker.github_api import GitHubRateLimited
+from app.worker.leases import lease_heartbeat
 from app.worker.retry import backoff_seconds, sanitize_error
+from app.worker.shared_fetch import SharedFetchCache
 
 MAX_RUN_ATTEMPTS = 5
 logger = get_logger("worker.runs")
-_SEVERITY_RANK = {"low": 1, "medium": 2, "high": 3}
 
 
 @dataclass
@@ -47,74 +43,312 @@ class MonitorRunProcessor:
     write_access_token: str | None = None
     fetch_timeout_seconds: float = 10.0
     fetch_max_bytes: int = 1_000_000
+    max_concurrent_runs: int = 10
+    worker_id: str = "worker"
+    lease_seconds: int = 300
+    shared_fetch_window_seconds: float = 600.0
+    snapshot_cache_seconds: float = 86_400.0
+    snapshot_cache_size: int = 10_000
+    _shared_fetch: SharedFetchCache = field(init=False, repr=False)
+    _latest_snapshots: TTLCache[str, Snapshot] = field(init=False, repr=False)
+    _stored_texts: TTLCache[str, bool] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._shared_fetch = SharedFetchCache(window_seconds=self.shared_fetch_window_seconds)
+        # Latest snapshot per source without its text: enough to detect
+        # "unchanged" and to send validators. Text is loaded only on change.
+        self._latest_snapshots = TTLCache(
+            max_entries=self.snapshot_cache_size, ttl_seconds=self.snapshot_cache_seconds
+        )
+        # Text hashes this worker has stored, so the same text (many orgs on
+        # one URL) is not compressed and uploaded again.
+        self._stored_texts = TTLCache(
+            max_entries=self.snapshot_cache_size, ttl_seconds=self.snapshot_cache_seconds
+        )
 
     @property
     def write_token(self) -> str:
         return self.write_access_token or self.access_token
 
-    async def count_due_sources_once(self) -> int:
-        due_sources = await select_due_sources(self.access_token)
-        return len(due_sources)
-
-    async def queue_due_sources_once(self, limit: int = 10) -> int:
-        due_sources = await select_due_sources(self.access_token)
-        queued_count = 0
-        created_after = (datetime.now(UTC) - timedelta(minutes=10)).isoformat().replace("+00:00", "Z")
-
-        for source in due_sources:
-            if queued_count >= limit:
-                break
-
-            source_id = str(source.get("id") or "")
-            org_id = str(source.get("org_id") or "")
-            if not source_id or not org_id:
-                continue
+    async def enqueue_due_runs_once(self, limit: int = 10) -> dict[str, int]:
+        return await rpc_enqueue_due_runs(limit=limit)
 
-            active_runs = await select_recent_active_monitor_runs_for_source(
-                self.access_token,
-                source_id,
-                created_after,
-            )
-            if active_runs:
-                continue
+    async def process_queued_runs_once(self, limit: int = 5) -> int:
+        runs = await rpc_claim_jobs(
+            "monitor_runs", self.worker_id, limit=limit, lease_seconds=self.lease_seconds
+        )
+        if not runs:
+            return 0
 
-            await rpc_create_monitor_run(
-                self.write_token,
-                {"p_org_id": org_id, "p_source_id": source_id},
+        batch_started = time.perf_counter()
+        run_slots = asyncio.Semaphore(max(1, self.max_concurrent_runs))
+        outcomes: Counter[str] = Counter()
+
+        async def _run_with_slot(run: dict[str, object]) -> None:
+            queued_at = time.perf_counter()
+            # The lease is held from the claim, so it is renewed while the
+            # run waits for a slot as well as while it runs.
+            async with (
+                lease_heartbeat("monitor_runs", str(run.get("id")), self.worker_id, self.lease_seconds),
+                run_slots,
+            ):
+                started_at = time.perf_counter()
+                try:
+                    outcome = await self._process_single_run(run)
+                except Exception as exc:
+                    outcome = "error"
+                    logger.error(
+                        "run.process_failed",
+                        extra={
+                            "component": "worker",
+                            "run_id": str(run.get("id")),
+                            "error": sanitize_error(exc, default_message="Monitor run failed."),
+                        },
+                    )
+                finished_at = time.perf_counter()
+            outcomes[outcome] += 1
+            logger.info(
+                "run.completed",
+                extra={
+                    "component": "worker",
+                    "run_id": str(run.get("id")),
+                    "org_id": str(run.get("org_id")),
+                    "source_id": str(run.get("source_id")),
+                    "outcome": outcome,
+                    "wait_ms": round((started_at - queued_at) * 1000, 1),
+                    "duration_ms": round((finished_at - started_at) * 1000, 1),
+                },
             )
-            await rpc_schedule_next_run(self.write_token, {"p_source_id": source_id})
-            queued_count += 1
 
-        return queued_count
-
-    async def process_queued_runs_once(self, limit: int = 5) -> int:
-        runs = await select_queued_monitor_runs(self.access_token, limit=limit)
-        for run in runs:
-            await self._process_single_run(run)
+        await asyncio.gather(*(_run_with_slot(run) for run in runs))
+        logger.info(
+            "run.batch_completed",
+            extra={
+                "component": "worker",
+                "runs": len(runs),
+                "concurrency": max(1, self.max_concurrent_runs),
+                "outcomes": dict(outcomes),
+                "shared_fetch": dict(self._shared_fetch.stats),
+                "duration_ms": round((time.perf_counter() - batch_started) * 1000, 1),
+            },
+        )
         return len(runs)
 
     async def run_once(self, *, queue_limit: int = 10, process_limit: int = 5) -> dict[str, int]:
-        due_sources = await self.count_due_sources_once()
-        runs_queued = await self.queue_due_sources_once(limit=queue_limit)
+        scheduled = await self.enqueue_due_runs_once(limit=queue_limit)
         runs_processed = await self.process_queued_runs_once(limit=process_limit)
         return {
-            "due_sources": due_sources,
-            "runs_queued": runs_queued,
+            "due_sources": scheduled["due_sources"],
+            "runs_queued": scheduled["runs_queued"],
             "runs_processed": runs_processed,
         }
 
-    async def _process_single_run(self, run: dict[str, object]) -> None:
+    async def _latest_snapshot(self, source_id: str) -> Snapshot | None:
+        cached = self._latest_snapshots.get(source_id)
+        if cached is not None:
+            return cached
+        row = await select_latest_snapshot(self.access_token, source_id)
+        if not row:
+            return None
+        snapshot = Snapshot.model_validate(row)
+        self._latest_snapshots.set(source_id, snapshot)
+        return snapshot
+
+    async def _previous_text(self, snapshot: Snapshot | None) -> str:
+        if snapshot is None:
+            return ""
+        text = snapshot.canonical_text or snapshot.text_preview
+        if not text and snapshot.id:
+            text = await select_snapshot_text(self.access_token, snapshot.id)
+        return text or ""
+
+    def _lease_lost(self, run_id: str, source_id: str) -> str:
+        # Whoever reclaimed the run owns its result; what this worker cached
+        # about the source may already be stale.
+        self._latest_snapshots.pop(source_id)
+        logger.warning(
+            "run.lease_lost",
+            extra={"component": "worker", "run_id": run_id, "holder": self.worker_id},
+        )
+        return "lease_lost"
+
+    async def _complete_touch(
+        self,
+        run_id: str,
+        source_id: str,
+        fetch_metadata: dict[str, str | None],
+        touch: dict[str, object] | None,
+        outcome: str,
+    ) -> str | None:
+        completed = await rpc_complete_monitor_run(
+            run_id, holder=self.worker_id, fetch=fetch_metadata, touch=touch
+        )
+        if completed.get("lease_lost"):
+            return self._lease_lost(run_id, source_id)
+        if completed.get("stale_snapshot"):
+            # Another worker stored a newer snapshot; nothing was recorded.
+            return None
+        return outcome
+
+    async def _record_result(
+        self,
+        run_id: str,
+        org_id: str,
+        source_model: Source,
+        adapter_result: AdapterResult,
+        previous_snapshot: Snapshot | None,
+    ) -> str | None:
+        """Compares a fetch with ``previous_snapshot`` and completes the run.
+        Returns None when the database rejected the write because
+        ``previous_snapshot`` is no longer the newest snapshot."""
+        source_id = source_model.id
+        source_url = source_model.url
+        text_hash: str | None = None
+        status_code = int(adapter_result.http_status)
+        response_etag = adapter_result.etag
+        response_last_modified = adapter_result.last_modified
+        response_content_type = adapter_result.content_type
+
+        fetch_metadata = {
+            "etag": response_etag,
+            "last_modified": response_last_modified,
+            "content_type": response_content_type,
+        }
+
+        # Nothing new since the latest snapshot: record the check on it
+        # instead of storing another copy of the same text.
+        touch = None
+        if previous_snapshot and previous_snapshot.id:
+            touch = {"snapshot_id": previous_snapshot.id, "http_status": status_code}
+
+        if status_code == 304:
+            return await self._complete_touch(
+                run_id, source_id, fetch_metadata, touch, "not_modified"
+            )
+
+        if source_model.kind in {"rss", "github_releases"} and previous_snapshot:
+            previous_item_id = (previous_snapshot.item_id or "").strip()
+            current_item_id = (adapter_result.item_id or "").strip()
+            if previous_item_id and current_item_id and previous_item_id == current_item_id:
+                return await self._complete_touch(
+                    run_id, source_id, fetch_metadata, touch, "unchanged"
+                )
+
+        canonical_text = (adapter_result.canonical_text or "").strip()
+        if canonical_text:
+            current_fingerprint = (
+                adapter_result.text_fingerprint
+                or hashlib.sha256(canonical_text.encode("utf-8")).hexdigest()
+            )
+        elif adapter_result.raw_bytes_hash:
+            current_fingerprint = adapter_result.raw_bytes_hash
+        else:
+            fallback_bytes = (adapter_result.item_id or "").encode("utf-8")
+            current_fingerprint = hashlib.sha256(fallback_bytes).hexdigest()
+
+        previous_fingerprint = None
+        if previous_snapshot:
+            previous_fingerprint = (
+                previous_snapshot.text_fingerprint or previous_snapshot.content_hash or ""
+            ).strip() or None
+
+        changed = previous_fingerprint != current_fingerprint
+        if not changed and touch is not None:
+            return await self._complete_touch(
+                run_id, source_id, fetch_metadata, touch, "unchanged"
+            )
+
+        snapshot = {
+            "fetched_url": adapter_result.fetched_url or source_url,
+            "content_hash": current_fingerprint,
+            "content_type": response_content_type,
+            "content_len": int(adapter_result.content_len),
+            "http_status": status_code,
+            "etag": response_etag,
+            "last_modified": response_last_modified,
+            "text_preview": canonical_text[:2000],
+            "text_fingerprint": current_fingerprint,
+            "canonical_title": adapter_result.canonical_title,
+            "item_id": adapter_result.item_id,
+            "item_published_at": (
+                adapter_result.item_published_at.isoformat()
+                if adapter_result.item_published_at
+                else None
+            ),
+            # What this run compared against; the insert is dropped if
+            # another worker stored a newer snapshot meanwhile.
+            "previous_snapshot_id": previous_snapshot.id if previous_snapshot else None,
+        }
+
+        if canonical_text:
+            text_hash = snapshot_text_hash(canonical_text)
+            snapshot["text_hash"] = text_hash
+            snapshot["text_len"] = len(canonical_text)
+            if self._stored_texts.get(text_hash) is None:
+                snapshot.update(compress_snapshot_text(canonical_text))
+
+        finding = None
+        if changed:
+            previous_text = await self._previous_text(previous_snapshot)
+            explanation = await run_cpu_bound(build_explanation, previous_text, canonical_text)
+            finding = {
+                "title": "Source content changed",
+                "summary": str(explanation["summary"]),
+                "severity": "medium",
+                "fingerprint": hashlib.sha256(f"{source_id}:{current_fingerprint}".encode()).hexdigest(),
+                "raw_url": adapter_result.fetched_url or source_url,
+                "raw_hash": current_fingerprint,
+                "diff_preview": explanation.get("diff_preview"),
+                "citations": explanation.get("citations") or [],
+            }
+
+        completed = await rpc_complete_monitor_run(
+            run_id,
+            holder=self.worker_id,
+            fetch=fetch_metadata,
+            snapshot=snapshot,
+            finding=finding,
+        )
+        if completed.get("lease_lost"):
+            return self._lease_lost(run_id, source_id)
+        if completed.get("stale_snapshot"):
+            # Compared against an outdated snapshot. When the newest one
+            # already has this content the check was recorded on it.
+            self._latest_snapshots.pop(source_id)
+            return "unchanged" if completed.get("snapshot_id") else None
+        if text_hash:
+            self._stored_texts.set(text_hash, True)
+        snapshot_id = str(completed.get("snapshot_id") or "").strip()
+        if snapshot_id:
+            self._latest_snapshots.set(
+                source_id,
+                Snapshot(
+                    id=snapshot_id,
+                    org_id=org_id,
+                    source_id=source_id,
+                    run_id=run_id,
+                    content_hash=current_fingerprint,
+                    text_fingerprint=current_fingerprint,
+                    item_id=adapter_result.item_id,
+                    item_published_at=adapter_result.item_published_at,
+                    etag=response_etag,
+                    last_modified=response_last_modified,
+                ),
+            )
+        else:
+            self._latest_snapshots.pop(source_id)
+        return "changed" if changed else "unchanged"
+
+    async def _process_single_run(self, run: dict[str, object]) -> str:
         run_id = str(run["id"])
         org_id = str(run["org_id"])
         source_id = str(run["source_id"])
         current_attempts = _safe_int(run.get("attempts"))
         attempt_number = current_attempts + 1
 
-        await mark_monitor_run_attempt_started(run_id, attempt_number)
-        await rpc_set_monitor_run_state(
-            self.write_token,
-            {"p_run_id": run_id, "p_status": "running", "p_error": None},
-        )
+        # claim_jobs already marked the run running.
+        if not await mark_monitor_run_attempt_started(run_id, attempt_number, holder=self.worker_id):
+            return self._lease_lost(run_id, source_id)
 
         try:
             source = await select_source_by_id(self.access_token, source_id)
@@ -131,171 +365,67 @@ class MonitorRunProcessor:
             source_payload["fetch_timeout_seconds"] = self.fetch_timeout_seconds
             source_payload["fetch_max_bytes"] = self.fetch_max_bytes
             source_model = Source.model_validate(source_payload)
-            previous_snapshot_row = await select_latest_snapshot(self.access_token, source_id)
-            previous_snapshot = (
-                Snapshot.model_validate(previous_snapshot_row) if previous_snapshot_row else None
-            )
+            previous_snapshot = await self._latest_snapshot(source_id)
             adapter = get_adapter(source_model.kind)
-            adapter_result = await adapter.fetch(source_model, previous_snapshot)
-
-            status_code = int(adapter_result.http_status)
-            response_etag = adapter_result.etag
-            response_last_modified = adapter_result.last_modified
-            response_content_type = adapter_result.content_type
-
-            await rpc_set_source_fetch_metadata(
-                self.write_token,
-                {
-                    "p_source_id": source_id,
-                    "p_etag": response_etag,
-                    "p_last_modified": response_last_modified,
-                    "p_content_type": response_content_type,
-                },
-            )
+            # Per-host concurrency is enforced per request by the fetch engine.
+            adapter_result = await self._shared_fetch.fetch(adapter, source_model, previous_snapshot)
 
-            if status_code == 304:
-                await rpc_set_monitor_run_state(
-                    self.write_token,
-                    {"p_run_id": run_id, "p_status": "succeeded", "p_error": None},
-                )
-                await clear_monitor_run_error_state(run_id)
-                return
-
-            if source_model.kind in {"rss", "github_releases"} and previous_snapshot:
-                previous_item_id = (previous_snapshot.item_id or "").strip()
-                current_item_id = (adapter_result.item_id or "").strip()
-                if previous_item_id and current_item_id and previous_item_id == current_item_id:
-                    await rpc_set_monitor_run_state(
-                        self.write_token,
-                        {"p_run_id": run_id, "p_status": "succeeded", "p_error": None},
-                    )
-                    await clear_monitor_run_error_state(run_id)
-                    return
-
-            canonical_text = (adapter_result.canonical_text or "").strip()
-            if canonical_text:
-                current_fingerprint = hashlib.sha256(canonical_text.encode("utf-8")).hexdigest()
-            elif adapter_result.raw_bytes_hash:
-                current_fingerprint = adapter_result.raw_bytes_hash
-            else:
-                fallback_bytes = (adapter_result.item_id or "").encode("utf-8")
-                current_fingerprint = hashlib.sha256(fallback_bytes).hexdigest()
-
-            previous_fingerprint = None
-            if previous_snapshot:
-                previous_fingerprint = (
-                    previous_snapshot.text_fingerprint or previous_snapshot.content_hash or ""
-                ).strip() or None
-
-            await rpc_insert_snapshot_v3(
-                self.write_token,
-                {
-                    "p_org_id": org_id,
-                    "p_source_id": source_id,
-                    "p_run_id": run_id,
-                    "p_fetched_url": adapter_result.fetched_url or source_url,
-                    "p_content_hash": current_fingerprint,
-                    "p_content_type": response_content_type,
-                    "p_content_len": int(adapter_result.content_len),
-                    "p_http_status": status_code,
-                    "p_etag": response_etag,
-                    "p_last_modified": response_last_modified,
-                    "p_text_preview": canonical_text[:2000],
-                    "p_text_fingerprint": current_fingerprint,
-                    "p_canonical_title": adapter_result.canonical_title,
-                    "p_canonical_text": canonical_text,
-                    "p_item_id": adapter_result.item_id,
-                    "p_item_published_at": (
-                        adapter_result.item_published_at.isoformat()
-                        if adapter_result.item_published_at
-                        else None
-                    ),
-                },
+            outcome = await self._record_result(
+                run_id, org_id, source_model, adapter_result, previous_snapshot
             )
-
-            if previous_fingerprint != current_fingerprint:
-                finding_fingerprint = hashlib.sha256(
-                    f"{source_id}:{current_fingerprint}".encode()
-                ).hexdigest()
-                finding_severity = "medium"
-                previous_text = ""
-                if previous_snapshot:
-                    previous_text = previous_snapshot.canonical_text or previous_snapshot.text_preview or ""
-                explanation = build_explanation(previous_text, canonical_text)
-                finding_id = await rpc_upsert_finding(
-                    self.write_token,
-                    {
-                        "p_org_id": org_id,
-                        "p_source_id": source_id,
-                        "p_run_id": run_id,
-                        "p_title": "Source content changed",
-                        "p_summary": str(explanation["summary"]),
-                        "p_severity": finding_severity,
-                        "p_fingerprint": finding_fingerprint,
-                        "p_raw_url": adapter_result.fetched_url or source_url,
-                        "p_raw_hash": current_fingerprint,
-                    },
+            if outcome is None:
+                # The cached snapshot was stale: compare against the current
+                # latest snapshot once more instead of losing the change.
+                self._latest_snapshots.pop(source_id)
+                previous_snapshot = await self._latest_snapshot(source_id)
+                outcome = await self._record_result(
+                    run_id, org_id, source_model, adapter_result, previous_snapshot
                 )
-                await rpc_insert_finding_explanation(
-                    self.write_token,
-                    {
-                        "p_org_id": org_id,
-                        "p_finding_id": finding_id,
-                        "p_summary": str(explanation["summary"]),
-                        "p_diff_preview": explanation.get("diff_preview"),
-                        "p_citations": explanation.get("citations") or [],
-                    },
+            if outcome is None:
+                # Raced another worker twice; the run is still claimed, so
+                # requeue it without spending an attempt.
+                self._latest_snapshots.pop(source_id)
+                if not await mark_monitor_run_for_retry(
+                    run_id,
+                    current_attempts,
+                    _now_iso(),
+                    "source snapshot changed during the run",
+                    holder=self.worker_id,
+                ):
+                    return self._lease_lost(run_id, source_id)
+                logger.info(
+                    "run.stale_snapshot",
+                    extra={"component": "worker", "run_id": run_id, "source_id": source_id},
                 )
-                alert_result = await rpc_upsert_alert_for_finding(
-                    self.write_token,
-                    {"p_org_id": org_id, "p_finding_id": finding_id},
-                )
-                alert_id = str(alert_result.get("id") or "").strip()
-                if alert_id:
-                    try:
-                        await self._enqueue_immediate_alert_if_needed(
-                            org_id=org_id,
-                            alert_id=alert_id,
-                            severity=finding_severity,
-                        )
-                    except Exception as exc:
-                        logger.warning(
-                            "run.immediate_alert_queue_failed",
-                            extra={
-                                "component": "worker",
-                                "org_id": org_id,
-                                "alert_id": alert_id,
-                                "error": sanitize_error(
-                                    exc,
-                                    default_message="immediate alert queue failed",
-                                ),
-                            },
-                        )
-                await rpc_append_audit(
-                    self.write_token,
-                    {
-                        "p_org_id": org_id,
-                        "p_action": "worker_finding_detected",
-                        "p_entity_type": "monitor_run",
-                        "p_entity_id": run_id,
-                        "p_metadata": {
-                            "source_id": source_id,
-                            "finding_id": finding_id,
-                            "alert_id": alert_id,
-                        },
-                    },
-                )
-
-            await rpc_set_monitor_run_state(
-                self.write_token,
-                {"p_run_id": run_id, "p_status": "succeeded", "p_error": None},
+                return "stale_snapshot"
+            return outcome
+        except GitHubRateLimited as exc:
+            # Out of API budget is not a failure of the source: requeue the
+            # run for when the budget resets without spending an attempt.
+            next_attempt_at = exc.retry_at_datetime.isoformat().replace("+00:00", "Z")
+            if not await mark_monitor_run_for_retry(
+                run_id, current_attempts, next_attempt_at, str(exc), holder=self.worker_id
+            ):
+                return self._lease_lost(run_id, source_id)
+            logger.warning(
+                "run.deferred",
+                extra={
+                    "component": "worker",
+                    "run_id": run_id,
+                    "reason": "github_rate_limit",
+                    "next_attempt_at": next_attempt_at,
+                },
             )
-            await clear_monitor_run_error_state(run_id)
+            return "deferred"
         except (UnsafeUrlError, ValueError, httpx.HTTPError) as exc:
+            self._latest_snapshots.pop(source_id)
             error_text = sanitize_error(exc, default_message="Monitor run failed.")
             if attempt_number < MAX_RUN_ATTEMPTS:
                 next_attempt_at = _retry_at_iso(attempt_number)
-                await mark_monitor_run_for_retry(run_id, attempt_number, next_attempt_at, error_text)
+                if not await mark_monitor_run_for_retry(
+                    run_id, attempt_number, next_attempt_at, error_text, holder=self.worker_id
+                ):
+                    return self._lease_lost(run_id, source_id)
                 logger.warning(
                     "run.retry_scheduled",
                     extra={
@@ -305,8 +435,11 @@ class MonitorRunProcessor:
                         "next_attempt_at": next_attempt_at,
                     },
                 )
-                return
-            await mark_monitor_run_dead_letter(run_id, attempt_number, error_text, _now_iso())
+                return "retry"
+            if not await mark_monitor_run_dead_letter(
+                run_id, attempt_number, error_text, _now_iso(), holder=self.worker_id
+            ):
+                return self._lease_lost(run_id, source_id)
             logger.error(
                 "run.dead_letter",
                 extra={
@@ -316,11 +449,16 @@ class MonitorRunProcessor:
                     "last_error": error_text,
                 },
             )
+            return "dead_letter"
         except Exception as exc:  # pragma: no cover - catch-all safety
+            self._latest_snapshots.pop(source_id)
             error_text = sanitize_error(exc, default_message="Monitor run failed.")
             if attempt_number < MAX_RUN_ATTEMPTS:
                 next_attempt_at = _retry_at_iso(attempt_number)
-                await mark_monitor_run_for_retry(run_id, attempt_number, next_attempt_at, error_text)
+                if not await mark_monitor_run_for_retry(
+                    run_id, attempt_number, next_attempt_at, error_text, holder=self.worker_id
+                ):
+                    return self._lease_lost(run_id, source_id)
                 logger.warning(
                     "run.retry_scheduled",
                     extra={
@@ -330,8 +468,11 @@ class MonitorRunProcessor:
                         "next_attempt_at": next_attempt_at,
                     },
                 )
-                return
-            await mark_monitor_run_dead_letter(run_id, attempt_number, error_text, _now_iso())
+                return "retry"
+            if not await mark_monitor_run_dead_letter(
+                run_id, attempt_number, error_text, _now_iso(), holder=self.worker_id
+            ):
+                return self._lease_lost(run_id, source_id)
             logger.error(
                 "run.dead_letter",
                 extra={
@@ -341,39 +482,7 @@ class MonitorRunProcessor:
                     "last_error": error_text,
                 },
             )
-
-    async def _enqueue_immediate_alert_if_needed(
-        self,
-        *,
-        org_id: str,
-        alert_id: str,
-        severity: str,
-    ) -> None:
-        await ensure_org_notification_rules(self.write_token, org_id)
-        rules = await get_org_notification_rules(self.write_token, org_id)
-        if not isinstance(rules, dict):
-            return
-        if not bool(rules.get("enabled", True)):
-            return
-
-        mode = str(rules.get("mode") or "digest").strip().lower()
-        if mode not in {"immediate", "both"}:
-            return
-
-        min_severity = str(rules.get("min_severity") or "medium")
-        if not _severity_meets_minimum(severity=severity, min_severity=min_severity):
-            return
-
-        await enqueue_notification_job(
-            org_id,
-            "immediate_alert",
-            {
-                "org_id": org_id,
-                "alert_id": alert_id,
-                "entity_type": "alert",
-                "entity_id": alert_id,
-            },
-        )
+            return "dead_letter"
 
 
 def _safe_int(value: object | None) -> int:
@@ -389,12 +498,6 @@ def _safe_int(value: object | None) -> int:
     return 0
 
 
-def _severity_meets_minimum(*, severity: str, min_severity: str) -> bool:
-    threshold = _SEVERITY_RANK.get(min_severity.strip().lower(), _SEVERITY_RANK["medium"])
-    score = _SEVERITY_RANK.get(severity.strip().lower(), _SEVERITY_RANK["medium"])
-    return score >= threshold
-
-
 def _now_iso() -> str:
     return datetime.now(UTC).isoformat().replace("+00:00", "Z")
 
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import Counter
+from urllib.parse import urlsplit, urlunsplit
+
+from app.core.ttl_cache import TTLCache
+from app.worker.adapters.base import Adapter, AdapterResult, Snapshot, Source
+
+SharedFetchKey = tuple[str, str, str, str | None]
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_fetch_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host if parts.port in {None, _DEFAULT_PORTS.get(scheme)} else f"{host}:{parts.port}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+def shared_fetch_key(source: Source, prev_snapshot: Snapshot | None) -> SharedFetchKey:
+    # RSS picks the newest entry after the previous one, so its result also
+    # depends on where the subscriber left off.
+    cursor = (prev_snapshot.item_id if prev_snapshot else None) if source.kind == "rss" else None
+    config = json.dumps(source.config, sort_keys=True, separators=(",", ":"), default=str)
+    return (source.kind, normalize_fetch_url(source.url), config, cursor)
+
+
+class SharedFetchCache:
+    """Fetches each distinct URL+kind+config once per window and hands the
+    same AdapterResult to every source subscribed to it, across orgs."""
+
+    def __init__(self, *, window_seconds: float, max_entries: int = 2048) -> None:
+        self.window_seconds = max(0.0, float(window_seconds))
+        self._fresh: TTLCache[SharedFetchKey, AdapterResult] = TTLCache(
+            max_entries=max_entries, ttl_seconds=self.window_seconds
+        )
+        # Last full result per key, kept longer so the next window can
+        # revalidate with its validators instead of downloading again.
+        self._validators: TTLCache[SharedFetchKey, AdapterResult] = TTLCache(
+            max_entries=max_entries, ttl_seconds=max(self.window_seconds * 24, 3600.0)
+        )
+        self._inflight: dict[SharedFetchKey, asyncio.Future[AdapterResult]] = {}
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self._fresh.enabled
+
+    async def fetch(
+        self, adapter: Adapter, source: Source, prev_snapshot: Snapshot | None
+    ) -> AdapterResult:
+        if not self.enabled:
+            return await adapter.fetch(source, prev_snapshot)
+
+        key = shared_fetch_key(source, prev_snapshot)
+        cached = self._fresh.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        self.stats["misses"] += 1
+        pending = asyncio.ensure_future(self._fetch_shared(key, adapter, source, prev_snapshot))
+        self._inflight[key] = pending
+        pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _fetch_shared(
+        self,
+        key: SharedFetchKey,
+        adapter: Adapter,
+        source: Source,
+        prev_snapshot: Snapshot | None,
+    ) -> AdapterResult:
+        # Subscribers hold different validators, so the shared request uses
+        # the ones from the last shared result and always yields full content.
+        previous = self._validators.get(key)
+        shared_source = source.model_copy(
+            update={
+                "etag": previous.etag if previous else None,
+                "last_modified": previous.last_modified if previous else None,
+            }
+        )
+        if source.kind == "rss":
+            shared_prev = (prev_snapshot or Snapshot()).model_copy(
+                update={"etag": shared_source.etag, "last_modified": shared_source.last_modified}
+            )
+        elif previous is not None:
+            shared_prev = Snapshot(
+                canonical_text=previous.canonical_text,
+                item_id=previous.item_id,
+                item_published_at=previous.item_published_at,
+                etag=previous.etag,
+                last_modified=previous.last_modified,
+            )
+        else:
+            shared_prev = None
+
+        result = await adapter.fetch(shared_source, shared_prev)
+        if result.http_status == 304:
+            if previous is None:
+                return result
+            self.stats["revalidated"] += 1
+            result = previous
+
+        self._fresh.set(key, result)
+        self._validators.set(key, result)
+        return result
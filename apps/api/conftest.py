@@ -13,3 +13,15 @@ os.environ.setdefault("INTEGRATIONS_ENCRYPTION_KEY", "VkObE4xoqlrYO7a5aH8VUZj1VO
 API_ROOT = Path(__file__).resolve().parent
 if str(API_ROOT) not in sys.path:
     sys.path.insert(0, str(API_ROOT))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches():
+    # Process-level caches would otherwise leak authorization state between tests.
+    from app.auth import roles
+
+    roles.get_org_role_cache().clear()
+    yield
+    roles.get_org_role_cache().clear()
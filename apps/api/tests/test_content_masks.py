@@ -0,0 +1,75 @@
+import asyncio
+import hashlib
+
+import pytest
+
+from app.core.content_masks import MaskRuleError, MaskRules, masked_text_fingerprint
+from app.worker.adapters import base
+
+
+def test_builtin_masks_replace_volatile_tokens() -> None:
+    rules = MaskRules.from_config({"mask_builtins": ["timestamps", "dates", "nonces", "counters"]})
+    assert rules is not None
+
+    masked = rules.apply(
+        "Generated 2026-10-17T08:15:02Z (10:15 AM CET) on 17 October 2026. "
+        "csrf=3f9a2c1d8e7b6a5f4c3d2e1f 1,204 views. Section 12.3 applies to 2025 filings."
+    )
+
+    assert masked == (
+        "Generated <time> (<time>) on <date>. csrf=<nonce> <count>. Section 12.3 applies to 2025 filings."
+    )
+
+
+def test_masked_fingerprint_ignores_masked_changes_only() -> None:
+    config = {"mask_builtins": "timestamps", "mask_patterns": [r"Visitor #\d+"]}
+    first = masked_text_fingerprint(config, "Rule 7\nUpdated 09:14:55 UTC\nVisitor #5512")
+    second = masked_text_fingerprint(config, "Rule 7\nUpdated 11:02:07 UTC\nVisitor #5519")
+    changed = masked_text_fingerprint(config, "Rule 8\nUpdated 11:02:07 UTC\nVisitor #5519")
+
+    assert first == second
+    assert changed != first
+    assert masked_text_fingerprint({}, " Rule 7 ") == hashlib.sha256(b"Rule 7").hexdigest()
+    assert masked_text_fingerprint(config, "   ") is None
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"mask_builtins": ["weather"]},
+        {"mask_patterns": ["(unclosed"]},
+        {"mask_patterns": {"pattern": "x"}},
+        {"mask_patterns": ["x"] * 21},
+        {"mask_patterns": [r"(a+)+$"]},
+        {"mask_patterns": [r"(?:\w+\s?)*!"]},
+    ],
+)
+def test_invalid_mask_config_is_rejected(config: dict[str, object]) -> None:
+    with pytest.raises(MaskRuleError):
+        MaskRules.from_config(config)
+
+
+def test_tenant_patterns_are_fingerprinted_in_the_compute_pool(monkeypatch) -> None:
+    offloaded: list[object] = []
+
+    async def fake_run_cpu_bound(func, *args):
+        offloaded.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(base, "run_cpu_bound", fake_run_cpu_bound)
+    plain = base.Source(id="s1", org_id="o1", url="https://example.com", config={"mask_builtins": "dates"})
+    custom = base.Source(
+        id="s2", org_id="o1", url="https://example.com", config={"mask_patterns": [r"(\d{2})+ views"]}
+    )
+
+    async def scenario() -> tuple[str | None, str | None]:
+        return (
+            await base.masked_fingerprint(plain, "Rule 7 on 2026-10-17"),
+            await base.masked_fingerprint(custom, "Rule 7 1234 views"),
+        )
+
+    plain_fingerprint, custom_fingerprint = asyncio.run(scenario())
+
+    assert offloaded == [masked_text_fingerprint]
+    assert plain_fingerprint == masked_text_fingerprint(plain.config, "Rule 7 on 2026-10-17")
+    assert custom_fingerprint == hashlib.sha256(b"Rule 7 <masked>").hexdigest()
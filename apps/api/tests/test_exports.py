@@ -5,7 +5,8 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.api.v1.endpoints import exports as exports_endpoint
-from app.billing import guard as billing_guard
+from app.auth import context as auth_context
+from app.auth import roles
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.main import app
 from app.worker import export_processor
@@ -14,15 +15,17 @@ ORG_ID = "11111111-1111-1111-1111-111111111111"
 EXPORT_ID = "22222222-2222-2222-2222-222222222222"
 
 
-async def _fake_paid_plan(access_token: str, org_id: str) -> dict[str, str]:
+async def _fake_paid_plan(
+    access_token: str, *, org_id: str | None = None, source_id: str | None = None
+) -> dict[str, str]:
     assert access_token == "token-123"
     assert org_id == ORG_ID
-    return {"id": org_id, "plan": "pro"}
+    return {"org_id": org_id, "user_id": "user-1", "role": "owner", "plan": "pro"}
 
 
 @pytest.fixture(autouse=True)
 def _default_paid_plan(monkeypatch) -> None:
-    monkeypatch.setattr(billing_guard, "select_org_billing", _fake_paid_plan)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", _fake_paid_plan)
 
     async def fake_enforce(*args, **kwargs) -> None:
         return None
@@ -151,10 +154,12 @@ def test_download_url_requires_succeeded(monkeypatch) -> None:
 
 
 def test_create_export_returns_402_when_monthly_limit_reached(monkeypatch) -> None:
-    async def fake_free_plan(access_token: str, org_id: str) -> dict[str, str]:
+    async def fake_free_plan(
+        access_token: str, *, org_id: str | None = None, source_id: str | None = None
+    ) -> dict[str, str]:
         assert access_token == "token-123"
         assert org_id == ORG_ID
-        return {"id": org_id, "plan": "free"}
+        return {"org_id": org_id, "user_id": "user-1", "role": "owner", "plan": "free"}
 
     async def fake_select_audit_exports(access_token: str, org_id: str) -> list[dict[str, object]]:
         assert access_token == "token-123"
@@ -178,8 +183,7 @@ def test_create_export_returns_402_when_monthly_limit_reached(monkeypatch) -> No
     async def fail_create_export(*args, **kwargs):  # pragma: no cover
         raise AssertionError("create export RPC should not run when monthly limit is reached")
 
-    monkeypatch.setattr(billing_guard, "select_org_billing", fake_free_plan)
-    monkeypatch.setattr(exports_endpoint, "select_org_billing", fake_free_plan)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_free_plan)
     monkeypatch.setattr(exports_endpoint, "select_audit_exports", fake_select_audit_exports)
     monkeypatch.setattr(exports_endpoint, "rpc_create_audit_export", fail_create_export)
     monkeypatch.setattr(
@@ -210,12 +214,54 @@ def test_create_export_returns_402_when_monthly_limit_reached(monkeypatch) -> No
     assert response.json() == {"detail": "Monthly export limit reached"}
 
 
+def test_create_export_resolves_role_and_plan_with_one_context_call(monkeypatch) -> None:
+    context_calls: list[dict[str, str | None]] = []
+
+    async def fake_org_auth_context(
+        access_token: str, *, org_id: str | None = None, source_id: str | None = None
+    ) -> dict[str, str]:
+        context_calls.append({"org_id": org_id, "source_id": source_id})
+        return {"org_id": ORG_ID, "user_id": "user-1", "role": "member", "plan": "pro"}
+
+    async def fake_create_export(access_token: str, payload: dict[str, object]) -> str:
+        assert payload["p_org_id"] == ORG_ID
+        return EXPORT_ID
+
+    async def fake_select_exports(access_token: str, org_id: str) -> list[dict[str, object]]:
+        return []
+
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
+    monkeypatch.setattr(exports_endpoint, "enforce_org_role", roles.enforce_org_role)
+    monkeypatch.setattr(exports_endpoint, "select_audit_exports", fake_select_exports)
+    monkeypatch.setattr(exports_endpoint, "rpc_create_audit_export", fake_create_export)
+    monkeypatch.setattr(
+        exports_endpoint,
+        "get_settings",
+        lambda: type("Settings", (), {"SUPABASE_SERVICE_ROLE_KEY": "service-role-123"})(),
+    )
+    app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
+        access_token="token-123",
+        claims={"sub": "user-1"},
+    )
+
+    try:
+        client = TestClient(app)
+        response = client.post("/api/v1/exports", json={"org_id": ORG_ID, "format": "pdf"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == {"id": EXPORT_ID, "status": "queued"}
+    assert context_calls == [{"org_id": ORG_ID, "source_id": None}]
+
+
 def test_export_processor_uploads_and_updates_status(monkeypatch) -> None:
     started_attempts: list[tuple[str, int]] = []
     status_updates: list[dict[str, object]] = []
     uploaded: list[tuple[str, str, bytes, str]] = []
 
-    async def fake_select_queued(limit: int = 3) -> list[dict[str, object]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
+        assert queue == "audit_exports"
         assert limit == 3
         return [
             {
@@ -260,7 +306,9 @@ def test_export_processor_uploads_and_updates_status(monkeypatch) -> None:
         file_sha256: str | None,
         error_text: str | None,
         completed_at: str | None,
-    ) -> None:
+        *,
+        holder: str,
+    ) -> bool:
         status_updates.append(
             {
                 "id": export_id,
@@ -271,9 +319,13 @@ def test_export_processor_uploads_and_updates_status(monkeypatch) -> None:
                 "completed_at": completed_at,
             }
         )
+        assert holder == "worker"
+        return True
 
-    async def fake_mark_started(export_id: str, attempts: int) -> None:
+    async def fake_mark_started(export_id: str, attempts: int, *, holder: str) -> bool:
         started_attempts.append((export_id, attempts))
+        assert holder == "worker"
+        return True
 
     def fake_build_export_bytes(export_format: str, packet: dict[str, object]) -> tuple[bytes, str]:
         assert export_format == "pdf"
@@ -283,7 +335,7 @@ def test_export_processor_uploads_and_updates_status(monkeypatch) -> None:
     async def fake_upload_bytes(bucket: str, path: str, data: bytes, content_type: str) -> None:
         uploaded.append((bucket, path, data, content_type))
 
-    monkeypatch.setattr(export_processor, "select_queued_audit_exports_service", fake_select_queued)
+    monkeypatch.setattr(export_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(export_processor, "select_audit_packet_data", fake_select_packet)
     monkeypatch.setattr(export_processor, "mark_audit_export_attempt_started", fake_mark_started)
     monkeypatch.setattr(export_processor, "update_audit_export_status", fake_update_status)
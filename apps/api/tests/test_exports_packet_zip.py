@@ -6,7 +6,7 @@ from io import BytesIO
 from fastapi.testclient import TestClient
 
 from app.api.v1.endpoints import exports as exports_endpoint
-from app.billing import guard as billing_guard
+from app.auth import context as auth_context
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.main import app
 from app.worker import export_processor
@@ -55,18 +55,19 @@ def test_create_zip_export_queues(monkeypatch) -> None:
         )(),
     )
 
-    async def fake_paid_plan(access_token: str, org_id: str) -> dict[str, str]:
+    async def fake_paid_plan(
+        access_token: str, *, org_id: str | None = None, source_id: str | None = None
+    ) -> dict[str, str]:
         assert access_token == "token-123"
         assert org_id == ORG_ID
-        return {"id": org_id, "plan": "pro"}
+        return {"org_id": org_id, "user_id": "user-1", "role": "owner", "plan": "pro"}
 
     async def fake_select_exports(access_token: str, org_id: str) -> list[dict[str, object]]:
         assert access_token == "token-123"
         assert org_id == ORG_ID
         return []
 
-    monkeypatch.setattr(billing_guard, "select_org_billing", fake_paid_plan)
-    monkeypatch.setattr(exports_endpoint, "select_org_billing", fake_paid_plan)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_paid_plan)
     monkeypatch.setattr(exports_endpoint, "select_audit_exports", fake_select_exports)
 
     app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
@@ -87,7 +88,8 @@ def test_create_zip_export_queues(monkeypatch) -> None:
 def test_zip_export_processor_writes_audit_packet(monkeypatch) -> None:
     uploaded: list[tuple[str, str, bytes, str]] = []
 
-    async def fake_select_queued(limit: int = 3) -> list[dict[str, object]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
+        assert queue == "audit_exports"
         assert limit == 3
         return [
             {
@@ -152,7 +154,9 @@ def test_zip_export_processor_writes_audit_packet(monkeypatch) -> None:
         file_sha256: str | None,
         error_text: str | None,
         completed_at: str | None,
-    ) -> None:
+        *,
+        holder: str,
+    ) -> bool:
         assert export_id == EXPORT_ID
         assert status_value in {"running", "succeeded"}
         if status_value == "succeeded":
@@ -160,10 +164,14 @@ def test_zip_export_processor_writes_audit_packet(monkeypatch) -> None:
             assert isinstance(file_sha256, str) and len(file_sha256) == 64
             assert error_text is None
             assert isinstance(completed_at, str)
+        assert holder == "worker"
+        return True
 
-    async def fake_mark_started(export_id: str, attempts: int) -> None:
+    async def fake_mark_started(export_id: str, attempts: int, *, holder: str) -> bool:
         assert export_id == EXPORT_ID
         assert attempts == 1
+        assert holder == "worker"
+        return True
 
     async def fake_download_bytes(bucket: str, path: str) -> bytes:
         assert bucket == "evidence"
@@ -173,7 +181,7 @@ def test_zip_export_processor_writes_audit_packet(monkeypatch) -> None:
     async def fake_upload_bytes(bucket: str, path: str, data: bytes, content_type: str) -> None:
         uploaded.append((bucket, path, data, content_type))
 
-    monkeypatch.setattr(export_processor, "select_queued_audit_exports_service", fake_select_queued)
+    monkeypatch.setattr(export_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(export_processor, "select_audit_packet_data", fake_select_packet)
     monkeypatch.setattr(export_processor, "mark_audit_export_attempt_started", fake_mark_started)
     monkeypatch.setattr(export_processor, "update_audit_export_status", fake_update_status)
@@ -228,7 +236,7 @@ def test_zip_export_processor_writes_audit_packet(monkeypatch) -> None:
 def test_zip_export_processor_skips_evidence_when_limits_exceeded(monkeypatch) -> None:
     uploaded: list[bytes] = []
 
-    async def fake_select_queued(limit: int = 3) -> list[dict[str, object]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
         return [
             {
                 "id": EXPORT_ID,
@@ -296,20 +304,25 @@ def test_zip_export_processor_skips_evidence_when_limits_exceeded(monkeypatch) -
         file_sha256: str | None,
         error_text: str | None,
         completed_at: str | None,
-    ) -> None:
-        return None
+        *,
+        holder: str,
+    ) -> bool:
+        assert holder == "worker"
+        return True
 
     async def fake_download_bytes(bucket: str, path: str) -> bytes:
         return b"12345678"
 
-    async def fake_mark_started(export_id: str, attempts: int) -> None:
+    async def fake_mark_started(export_id: str, attempts: int, *, holder: str) -> bool:
         assert export_id == EXPORT_ID
         assert attempts == 1
+        assert holder == "worker"
+        return True
 
     async def fake_upload_bytes(bucket: str, path: str, data: bytes, content_type: str) -> None:
         uploaded.append(data)
 
-    monkeypatch.setattr(export_processor, "select_queued_audit_exports_service", fake_select_queued)
+    monkeypatch.setattr(export_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(export_processor, "select_audit_packet_data", fake_select_packet)
     monkeypatch.setattr(export_processor, "mark_audit_export_attempt_started", fake_mark_started)
     monkeypatch.setattr(export_processor, "update_audit_export_status", fake_update_status)
@@ -0,0 +1,60 @@
+import pytest
+
+from app.core.html_selectors import RegionRules, SelectorError, parse_selector
+
+
+def _path(*elements: str) -> list[tuple[str, dict[str, str]]]:
+    path = []
+    for element in elements:
+        tag, _, classes = element.partition(".")
+        path.append((tag, {"class": classes.replace(".", " ")} if classes else {}))
+    return path
+
+
+def test_css_selectors_match_compound_and_combinators() -> None:
+    assert parse_selector("main .rule-body").matches(_path("html", "main", "div", "section.rule-body"))
+    assert not parse_selector("main > .rule-body").matches(_path("html", "main", "div", "section.rule-body"))
+    assert parse_selector("div > section.rule-body.current").matches(
+        _path("div", "section.rule-body.current")
+    )
+    assert parse_selector("#content").matches([("div", {"id": "content"})])
+    assert parse_selector("[data-region=body]").matches([("div", {"data-region": "body"})])
+    assert not parse_selector("nav").matches(_path("main"))
+
+
+def test_xpath_selectors_map_to_the_same_matcher() -> None:
+    assert parse_selector("//div[@id='content']").matches([("body", {}), ("div", {"id": "content"})])
+    assert parse_selector("//main/article[contains(@class, 'rule')]").matches(
+        _path("main", "article.rule.draft")
+    )
+    assert not parse_selector("//main/article").matches(_path("main", "div", "article"))
+
+
+@pytest.mark.parametrize("selector", ["", "main:nth-child(2)", "div >", "//div[1]", "a ~ b"])
+def test_unsupported_selectors_are_rejected(selector: str) -> None:
+    with pytest.raises(SelectorError):
+        parse_selector(selector)
+
+
+def test_region_rules_from_config() -> None:
+    assert RegionRules.from_config({}) is None
+    rules = RegionRules.from_config({"include_selectors": "main, article", "exclude_selectors": ["nav"]})
+    assert rules is not None
+    assert [selector.source for selector in rules.include] == ["main", "article"]
+    with pytest.raises(SelectorError):
+        RegionRules.from_config({"exclude_selectors": {"nav": True}})
+
+
+def test_descendant_selectors_match_deeply_nested_paths_quickly() -> None:
+    selector = parse_selector("section " + "div " * 14 + "p")
+    path = _path(*(["div"] * 300), "p")
+
+    # No "section" ancestor: every descendant combination fails.
+    assert not selector.matches(path)
+    assert selector.matches(_path("section", *(["div"] * 300), "p"))
+    assert not parse_selector("div > p").matches(_path("div", "span", "p"))
+
+
+def test_selectors_with_too_many_steps_are_rejected() -> None:
+    with pytest.raises(SelectorError):
+        parse_selector("div " * 17)
@@ -2,7 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.api.v1.endpoints import integrations as integrations_endpoint
-from app.billing import guard as billing_guard
+from app.auth import context as auth_context
 from app.core import crypto as crypto_core
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.integrations import jira as jira_integration
@@ -20,21 +20,25 @@ JIRA_TOKEN = "jira-token"
 JIRA_PROJECT = "VR"
 
 
-async def fake_paid_plan(access_token: str, org_id: str) -> dict[str, str]:
+async def fake_paid_plan(
+    access_token: str, *, org_id: str | None = None, source_id: str | None = None
+) -> dict[str, str]:
     assert access_token == "token-123"
     assert org_id == ORG_ID
-    return {"org_id": org_id, "plan": "pro"}
+    return {"org_id": org_id, "user_id": "user-1", "role": "owner", "plan": "pro"}
 
 
-async def fake_free_plan(access_token: str, org_id: str) -> dict[str, str]:
+async def fake_free_plan(
+    access_token: str, *, org_id: str | None = None, source_id: str | None = None
+) -> dict[str, str]:
     assert access_token == "token-123"
     assert org_id == ORG_ID
-    return {"org_id": org_id, "plan": "free"}
+    return {"org_id": org_id, "user_id": "user-1", "role": "owner", "plan": "free"}
 
 
 @pytest.fixture(autouse=True)
 def _default_paid_plan(monkeypatch) -> None:
-    monkeypatch.setattr(billing_guard, "select_org_billing", fake_paid_plan)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_paid_plan)
 
     async def fake_enforce(*args, **kwargs) -> None:
         return None
@@ -418,7 +422,7 @@ def test_jira_create_issue_returns_issue_data(monkeypatch) -> None:
 
 
 def test_connect_slack_returns_402_on_free_plan(monkeypatch) -> None:
-    monkeypatch.setattr(billing_guard, "select_org_billing", fake_free_plan)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_free_plan)
 
     app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
         access_token="token-123",
@@ -439,7 +443,7 @@ def test_connect_slack_returns_402_on_free_plan(monkeypatch) -> None:
 
 
 def test_slack_notify_returns_402_on_free_plan(monkeypatch) -> None:
-    monkeypatch.setattr(billing_guard, "select_org_billing", fake_free_plan)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_free_plan)
 
     app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
         access_token="token-123",
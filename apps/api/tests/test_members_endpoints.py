@@ -2,6 +2,8 @@ from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from app.api.v1.endpoints import members as members_endpoint
+from app.auth import context as auth_context
+from app.auth import roles
 from app.auth.roles import OrgRoleContext
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.main import app
@@ -82,10 +84,12 @@ def test_create_invite_returns_402_when_member_limit_reached(monkeypatch) -> Non
         assert min_role == "admin"
         return OrgRoleContext(org_id=org_id, user_id="11111111-1111-1111-1111-111111111112", role="admin")
 
-    async def fake_select_org_billing(access_token: str, org_id: str) -> dict[str, str]:
+    async def fake_org_auth_context(
+        access_token: str, *, org_id: str | None = None, source_id: str | None = None
+    ) -> dict[str, str]:
         assert access_token == "token-123"
         assert org_id == ORG_ID
-        return {"id": org_id, "plan": "free"}
+        return {"org_id": org_id, "role": "admin", "plan": "free"}
 
     async def fake_select_org_members_service(org_id: str) -> list[dict[str, str]]:
         assert org_id == ORG_ID
@@ -108,7 +112,7 @@ def test_create_invite_returns_402_when_member_limit_reached(monkeypatch) -> Non
         raise AssertionError("create_org_invite RPC should not run when member limit is reached")
 
     monkeypatch.setattr(members_endpoint, "enforce_org_role", fake_enforce)
-    monkeypatch.setattr(members_endpoint, "select_org_billing", fake_select_org_billing)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
     monkeypatch.setattr(members_endpoint, "select_org_members_service", fake_select_org_members_service)
     monkeypatch.setattr(members_endpoint, "select_org_invites", fake_select_org_invites)
     monkeypatch.setattr(members_endpoint, "rpc_create_org_invite", fail_create_invite)
@@ -129,3 +133,43 @@ def test_create_invite_returns_402_when_member_limit_reached(monkeypatch) -> Non
 
     assert response.status_code == 402
     assert response.json() == {"detail": "Member limit reached (5). Upgrade required."}
+
+
+def test_update_member_role_invalidates_cached_role(monkeypatch) -> None:
+    target_user_id = "11111111-1111-1111-1111-111111111114"
+    role_cache = roles.get_org_role_cache()
+    role_cache.set((ORG_ID, target_user_id), "admin")
+
+    async def fake_enforce(auth, org_id: str, min_role: str) -> OrgRoleContext:
+        return OrgRoleContext(org_id=org_id, user_id="11111111-1111-1111-1111-111111111112", role="owner")
+
+    async def fake_select_member(org_id: str, user_id: str) -> dict[str, str]:
+        return {"org_id": org_id, "user_id": user_id, "role": "admin"}
+
+    async def fake_update_role(org_id: str, user_id: str, role: str) -> dict[str, str]:
+        return {"org_id": org_id, "user_id": user_id, "role": role, "created_at": "2026-02-09T00:00:00Z"}
+
+    async def fake_audit(access_token: str, payload: dict[str, object]) -> None:
+        return None
+
+    monkeypatch.setattr(members_endpoint, "enforce_org_role", fake_enforce)
+    monkeypatch.setattr(members_endpoint, "select_org_member_service", fake_select_member)
+    monkeypatch.setattr(members_endpoint, "update_org_member_role_service", fake_update_role)
+    monkeypatch.setattr(members_endpoint, "rpc_record_audit_event", fake_audit)
+
+    app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
+        access_token="token-123",
+        claims={"sub": "11111111-1111-1111-1111-111111111112"},
+    )
+
+    try:
+        client = TestClient(app)
+        response = client.patch(
+            f"/api/v1/orgs/{ORG_ID}/members/{target_user_id}",
+            json={"role": "viewer"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert role_cache.get((ORG_ID, target_user_id)) is None
@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
@@ -51,7 +52,8 @@ def test_findings_returns_list_when_supabase_ok(monkeypatch) -> None:
                 assert params == {
                     "select": "id,org_id,source_id,run_id,title,summary,severity,detected_at,fingerprint,raw_url,raw_hash",
                     "org_id": f"eq.{ORG_ID}",
-                    "order": "detected_at.desc",
+                    "order": "detected_at.desc,id.desc",
+                    "limit": "101",
                 }
                 return FakeResponse(
                     [
@@ -75,32 +77,25 @@ def test_findings_returns_list_when_supabase_ok(monkeypatch) -> None:
                 assert params == {
                     "select": "finding_id",
                     "org_id": f"eq.{ORG_ID}",
+                    "finding_id": f"in.({FINDING_ID})",
                 }
                 return FakeResponse([{"finding_id": FINDING_ID}])
 
-            if url == "https://example.supabase.co/rest/v1/snapshots":
-                assert params == {
-                    "select": "id,run_id,canonical_title,item_published_at,created_at",
-                    "run_id": f"eq.{RUN_ID}",
-                    "order": "created_at.desc",
-                    "limit": "1",
-                }
-                return FakeResponse(
-                    [
-                        {
-                            "id": "88888888-8888-8888-8888-888888888888",
-                            "run_id": RUN_ID,
-                            "canonical_title": "Release 1.3.0",
-                            "item_published_at": "2026-02-09T00:00:00Z",
-                            "created_at": "2026-02-09T00:00:00Z",
-                        }
-                    ]
-                )
-
             raise AssertionError(f"unexpected URL: {url}")
 
-        async def post(self, *args, **kwargs):  # pragma: no cover
-            raise AssertionError("POST should not be called in findings GET test")
+        async def post(self, url: str, json: dict[str, object], headers: dict[str, str]) -> FakeResponse:
+            assert url == "https://example.supabase.co/rest/v1/rpc/latest_snapshots_for_runs"
+            assert json == {"p_run_ids": [RUN_ID]}
+            return FakeResponse(
+                [
+                    {
+                        "run_id": RUN_ID,
+                        "canonical_title": "Release 1.3.0",
+                        "item_published_at": "2026-02-09T00:00:00Z",
+                        "created_at": "2026-02-09T00:00:00Z",
+                    }
+                ]
+            )
 
     app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
         access_token="token-123", claims={"sub": USER_ID}
@@ -132,10 +127,115 @@ def test_findings_returns_list_when_supabase_ok(monkeypatch) -> None:
                 "item_published_at": "2026-02-09T00:00:00Z",
                 "has_explanation": True,
             }
-        ]
+        ],
+        "next_cursor": None,
     }
 
 
+def test_findings_enrich_snapshots_with_constant_upstream_calls(monkeypatch) -> None:
+    run_ids = [f"00000000-0000-0000-0000-{index:012d}" for index in range(250)]
+    finding_rows = [
+        {
+            "id": f"10000000-0000-0000-0000-{index:012d}",
+            "org_id": ORG_ID,
+            "source_id": SOURCE_ID,
+            "run_id": run_ids[index % len(run_ids)],
+            "title": f"Finding {index}",
+            "summary": "Changed.",
+            "severity": "low",
+            "detected_at": "2026-02-09T00:00:00Z",
+            "fingerprint": f"sha256:{index}",
+            "raw_url": None,
+            "raw_hash": None,
+        }
+        for index in range(500)
+    ]
+    calls: list[str] = []
+
+    async def fake_select_findings(access_token: str, org_id: str, **kwargs) -> list[dict[str, object]]:
+        calls.append("findings")
+        assert kwargs == {"limit": 500, "cursor": None}
+        return finding_rows
+
+    async def fake_select_explanations(
+        access_token: str, org_id: str, finding_ids: list[str]
+    ) -> list[dict[str, object]]:
+        calls.append("explanations")
+        assert finding_ids == [row["id"] for row in finding_rows]
+        return [{"finding_id": finding_rows[3]["id"]}]
+
+    async def fake_latest_snapshots(access_token: str, requested_run_ids: list[str]) -> dict[str, dict[str, object]]:
+        calls.append("snapshots")
+        assert sorted(set(requested_run_ids)) == run_ids
+        return {
+            run_id: {"run_id": run_id, "canonical_title": f"Item {run_id[-3:]}", "item_published_at": None}
+            for run_id in requested_run_ids
+        }
+
+    monkeypatch.setattr(monitoring_endpoint, "select_findings", fake_select_findings)
+    monkeypatch.setattr(monitoring_endpoint, "select_finding_explanations_for_findings", fake_select_explanations)
+    monkeypatch.setattr(monitoring_endpoint, "rpc_latest_snapshots_for_runs", fake_latest_snapshots)
+    app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
+        access_token="token-123", claims={"sub": USER_ID}
+    )
+
+    try:
+        client = TestClient(app)
+        response = client.get("/api/v1/findings", params={"org_id": ORG_ID, "limit": 500})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    findings = response.json()["findings"]
+    assert len(findings) == 500
+    assert findings[251]["canonical_title"] == "Item 001"
+    assert [finding["has_explanation"] for finding in findings[:4]] == [False, False, False, True]
+    assert calls == ["findings", "explanations", "snapshots"]
+
+
+def test_finding_explanations_are_filtered_to_requested_findings(monkeypatch) -> None:
+    finding_ids = [f"10000000-0000-0000-0000-{index:012d}" for index in range(250)]
+    requested: list[str] = []
+
+    class FakeResponse:
+        def __init__(self, payload):
+            self._payload = payload
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):
+            return self._payload
+
+    class FakeAsyncClient:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:
+            return None
+
+        async def get(self, url: str, params: dict[str, str], headers: dict[str, str]) -> FakeResponse:
+            assert url == "https://example.supabase.co/rest/v1/finding_explanations"
+            assert params["org_id"] == f"eq.{ORG_ID}"
+            assert params["finding_id"].startswith("in.(")
+            batch = params["finding_id"][len("in.(") : -1].split(",")
+            requested.extend(batch)
+            return FakeResponse([{"finding_id": batch[0]}])
+
+    monkeypatch.setattr(supabase_rest.httpx, "AsyncClient", FakeAsyncClient)
+
+    rows = asyncio.run(
+        supabase_rest.select_finding_explanations_for_findings("token-123", ORG_ID, finding_ids)
+    )
+
+    assert requested == finding_ids
+    assert rows == [{"finding_id": finding_ids[0]}, {"finding_id": finding_ids[100]}, {"finding_id": finding_ids[200]}]
+    assert asyncio.run(supabase_rest.select_finding_explanations_for_findings("token-123", ORG_ID, [])) == []
+
+
 def test_finding_explanation_returns_latest_record(monkeypatch) -> None:
     class FakeResponse:
         def __init__(self, payload):
@@ -235,7 +335,8 @@ def test_alerts_returns_list_when_supabase_ok(monkeypatch) -> None:
             assert params == {
                 "select": "id,org_id,finding_id,task_id,status,owner_user_id,created_at,resolved_at",
                 "org_id": f"eq.{ORG_ID}",
-                "order": "created_at.desc",
+                "order": "created_at.desc,id.desc",
+                "limit": "101",
             }
             assert headers["Authorization"] == "Bearer token-123"
             assert headers["apikey"] == "test-anon-key"
@@ -281,7 +382,8 @@ def test_alerts_returns_list_when_supabase_ok(monkeypatch) -> None:
                 "created_at": "2026-02-09T00:00:00Z",
                 "resolved_at": None,
             }
-        ]
+        ],
+        "next_cursor": None,
     }
 
 
@@ -406,7 +508,8 @@ def test_audit_returns_list_when_supabase_ok(monkeypatch) -> None:
             assert params == {
                 "select": "id,org_id,actor_user_id,actor_type,action,entity_type,entity_id,metadata,created_at",
                 "org_id": f"eq.{ORG_ID}",
-                "order": "created_at.desc",
+                "order": "created_at.desc,id.desc",
+                "limit": "101",
             }
             assert headers["Authorization"] == "Bearer token-123"
             assert headers["apikey"] == "test-anon-key"
@@ -454,7 +557,8 @@ def test_audit_returns_list_when_supabase_ok(monkeypatch) -> None:
                 "metadata": {"source_id": SOURCE_ID},
                 "created_at": "2026-02-09T00:00:00Z",
             }
-        ]
+        ],
+        "next_cursor": None,
     }
 
 
@@ -485,7 +589,8 @@ def test_monitor_runs_returns_list_when_supabase_ok(monkeypatch) -> None:
             assert params == {
                 "select": "id,org_id,source_id,status,started_at,finished_at,error,created_at,attempts,next_attempt_at,last_error",
                 "org_id": f"eq.{ORG_ID}",
-                "order": "created_at.desc",
+                "order": "created_at.desc,id.desc",
+                "limit": "101",
             }
             assert headers["Authorization"] == "Bearer token-123"
             assert headers["apikey"] == "test-anon-key"
@@ -531,7 +636,8 @@ def test_monitor_runs_returns_list_when_supabase_ok(monkeypatch) -> None:
                 "error": None,
                 "created_at": "2026-02-09T00:00:00Z",
             }
-        ]
+        ],
+        "next_cursor": None,
     }
 
 
@@ -3,6 +3,7 @@ import asyncio
 import pytest
 from fastapi import HTTPException
 
+from app.auth import context as auth_context
 from app.auth import roles
 from app.core.supabase_jwt import VerifiedSupabaseAuth
 
@@ -10,13 +11,12 @@ ORG_ID = "11111111-1111-1111-1111-111111111111"
 
 
 def test_enforce_org_role_denies_viewer(monkeypatch) -> None:
-    async def fake_select_org_member_role(access_token: str, org_id: str, user_id: str) -> str | None:
+    async def fake_org_auth_context(access_token: str, *, org_id=None, source_id=None) -> dict[str, object]:
         assert access_token == "token-123"
         assert org_id == ORG_ID
-        assert user_id == "11111111-1111-1111-1111-111111111112"
-        return "viewer"
+        return {"org_id": org_id, "user_id": "11111111-1111-1111-1111-111111111112", "role": "viewer"}
 
-    monkeypatch.setattr(roles, "select_org_member_role", fake_select_org_member_role)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
 
     auth = VerifiedSupabaseAuth(
         access_token="token-123",
@@ -28,3 +28,61 @@ def test_enforce_org_role_denies_viewer(monkeypatch) -> None:
 
     assert excinfo.value.status_code == 403
     assert excinfo.value.detail == "Forbidden"
+
+
+def test_enforce_org_role_caches_membership_lookups(monkeypatch) -> None:
+    lookups: list[str] = []
+
+    async def fake_org_auth_context(access_token: str, *, org_id=None, source_id=None) -> dict[str, object]:
+        lookups.append(org_id)
+        return {"org_id": org_id, "role": "admin"}
+
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
+    auth = VerifiedSupabaseAuth(access_token="token-123", claims={"sub": "user-1"})
+
+    async def scenario() -> None:
+        first = await roles.enforce_org_role(auth, ORG_ID, "member")
+        second = await roles.enforce_org_role(auth, ORG_ID, "admin")
+        assert first.role == second.role == "admin"
+
+    asyncio.run(scenario())
+
+    assert lookups == [ORG_ID]
+
+
+def test_invalidate_org_role_cache_forces_fresh_lookup(monkeypatch) -> None:
+    current_role = {"value": "admin"}
+
+    async def fake_org_auth_context(access_token: str, *, org_id=None, source_id=None) -> dict[str, object]:
+        return {"org_id": org_id, "role": current_role["value"]}
+
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
+
+    def new_request_auth() -> VerifiedSupabaseAuth:
+        return VerifiedSupabaseAuth(access_token="token-123", claims={"sub": "user-1"})
+
+    asyncio.run(roles.enforce_org_role(new_request_auth(), ORG_ID, "admin"))
+    current_role["value"] = "viewer"
+    roles.invalidate_org_role_cache(ORG_ID, "user-1")
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(roles.enforce_org_role(new_request_auth(), ORG_ID, "admin"))
+
+    assert excinfo.value.status_code == 403
+
+
+def test_missing_membership_is_not_cached(monkeypatch) -> None:
+    lookups: list[str] = []
+
+    async def fake_org_auth_context(access_token: str, *, org_id=None, source_id=None) -> dict[str, object]:
+        lookups.append(org_id)
+        return {"org_id": org_id, "role": None}
+
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
+
+    for _ in range(2):
+        auth = VerifiedSupabaseAuth(access_token="token-123", claims={"sub": "user-1"})
+        with pytest.raises(HTTPException):
+            asyncio.run(roles.enforce_org_role(auth, ORG_ID, "viewer"))
+
+    assert len(lookups) == 2
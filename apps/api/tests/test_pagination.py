@@ -0,0 +1,97 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import monitoring as monitoring_endpoint
+from app.core import pagination
+from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
+from app.main import app
+
+ORG_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _alert_row(index: int, created_at: str) -> dict[str, object]:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "org_id": ORG_ID,
+        "finding_id": "22222222-2222-2222-2222-222222222222",
+        "task_id": None,
+        "status": "open",
+        "owner_user_id": None,
+        "created_at": created_at,
+        "resolved_at": None,
+    }
+
+
+def test_page_cursor_round_trips_and_builds_keyset_filter() -> None:
+    token = pagination.encode_page_cursor(
+        "2026-02-09T10:00:00.123456+00:00", "33333333-3333-3333-3333-333333333333"
+    )
+    cursor = pagination.decode_page_cursor(token)
+
+    assert cursor == pagination.PageCursor(
+        sort_value="2026-02-09T10:00:00.123456+00:00", id="33333333-3333-3333-3333-333333333333"
+    )
+    assert pagination.keyset_page_params("created_at", limit=50, cursor=cursor) == {
+        "order": "created_at.desc,id.desc",
+        "limit": "51",
+        "or": (
+            '(created_at.lt."2026-02-09T10:00:00.123456+00:00",'
+            'and(created_at.eq."2026-02-09T10:00:00.123456+00:00",'
+            "id.lt.33333333-3333-3333-3333-333333333333))"
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-base64!",
+        pagination.encode_page_cursor("yesterday", "33333333-3333-3333-3333-333333333333"),
+        pagination.encode_page_cursor("2026-02-09T10:00:00Z", "1),or(id.neq.x"),
+    ],
+)
+def test_decode_page_cursor_rejects_tampered_tokens(token: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        pagination.decode_page_cursor(token)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_alerts_endpoint_returns_next_cursor_and_follows_it(monkeypatch) -> None:
+    calls: list[dict[str, object]] = []
+    rows = [_alert_row(index, f"2026-02-09T00:00:{59 - index:02d}Z") for index in range(3)]
+
+    async def fake_select_alerts(access_token: str, org_id: str, *, limit, cursor):
+        calls.append({"limit": limit, "cursor": cursor})
+        if cursor is None:
+            return rows[: limit + 1]
+        return rows[2:]
+
+    monkeypatch.setattr(monitoring_endpoint, "select_alerts", fake_select_alerts)
+    app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
+        access_token="token-123", claims={"sub": "user-1"}
+    )
+
+    try:
+        client = TestClient(app)
+        first = client.get("/api/v1/alerts", params={"org_id": ORG_ID, "limit": 2})
+        next_cursor = first.json()["next_cursor"]
+        second = client.get(
+            "/api/v1/alerts", params={"org_id": ORG_ID, "limit": 2, "cursor": next_cursor}
+        )
+        oversized = client.get(
+            "/api/v1/alerts", params={"org_id": ORG_ID, "limit": pagination.MAX_PAGE_SIZE + 1}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert [alert["id"] for alert in first.json()["alerts"]] == [rows[0]["id"], rows[1]["id"]]
+    assert second.status_code == 200
+    assert [alert["id"] for alert in second.json()["alerts"]] == [rows[2]["id"]]
+    assert second.json()["next_cursor"] is None
+    assert calls[1]["cursor"] == pagination.PageCursor(
+        sort_value="2026-02-09T00:00:58Z", id=str(rows[1]["id"])
+    )
+    assert oversized.status_code == 422
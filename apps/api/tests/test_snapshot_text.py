@@ -0,0 +1,18 @@
+import base64
+
+from app.core.snapshot_text import compress_snapshot_text, decode_snapshot_text, snapshot_text_hash
+
+
+def test_compressed_snapshot_text_round_trips_through_bytea() -> None:
+    text = "Article 5\n" * 500 + "Änderung"
+    stored = compress_snapshot_text(text)
+    body = base64.b64decode(stored["text_body"])
+
+    assert stored["text_encoding"] == "zlib"
+    assert len(body) < len(text.encode("utf-8")) // 10
+    assert decode_snapshot_text("zlib", "\\x" + body.hex()) == text
+    assert len(snapshot_text_hash(text)) == 64
+
+
+def test_plain_snapshot_text_decodes_backfilled_rows() -> None:
+    assert decode_snapshot_text("plain", "\\x" + b"legacy text".hex()) == "legacy text"
@@ -1,7 +1,7 @@
 from fastapi.testclient import TestClient
 
 from app.api.v1.endpoints import sources as sources_endpoint
-from app.billing import guard as billing_guard
+from app.auth import context as auth_context
 from app.core import supabase_rest
 from app.core.supabase_jwt import VerifiedSupabaseAuth, verify_supabase_auth
 from app.main import app
@@ -40,6 +40,8 @@ def test_sources_returns_list_when_supabase_ok(monkeypatch) -> None:
             assert params == {
                 "select": "id,org_id,name,type,kind,config,title,url,is_enabled,cadence,next_run_at,last_run_at,created_at",
                 "org_id": "eq.11111111-1111-1111-1111-111111111111",
+                "order": "created_at.desc,id.desc",
+                "limit": "101",
             }
             assert headers["Authorization"] == "Bearer token-123"
             assert headers["apikey"] == "test-anon-key"
@@ -96,15 +98,18 @@ def test_sources_returns_list_when_supabase_ok(monkeypatch) -> None:
                 "last_run_at": None,
                 "created_at": "2026-02-09T00:00:00Z",
             }
-        ]
+        ],
+        "next_cursor": None,
     }
 
 
 def test_create_source_returns_id_when_supabase_ok(monkeypatch) -> None:
-    async def fake_select_org_billing(access_token: str, org_id: str) -> dict[str, str]:
+    async def fake_org_auth_context(
+        access_token: str, *, org_id: str | None = None, source_id: str | None = None
+    ) -> dict[str, str]:
         assert access_token == "token-123"
         assert org_id == "11111111-1111-1111-1111-111111111111"
-        return {"id": org_id, "plan": "pro"}
+        return {"org_id": org_id, "role": "owner", "plan": "pro"}
 
     async def fake_select_sources(access_token: str, org_id: str) -> list[dict[str, object]]:
         assert access_token == "token-123"
@@ -155,7 +160,7 @@ def test_create_source_returns_id_when_supabase_ok(monkeypatch) -> None:
         claims={"sub": "user-1"},
     )
     monkeypatch.setattr(supabase_rest.httpx, "AsyncClient", FakeAsyncClient)
-    monkeypatch.setattr(sources_endpoint, "select_org_billing", fake_select_org_billing)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
     monkeypatch.setattr(sources_endpoint, "select_sources", fake_select_sources)
 
     try:
@@ -180,10 +185,12 @@ def test_create_source_returns_id_when_supabase_ok(monkeypatch) -> None:
 
 
 def test_create_source_returns_402_when_limit_reached(monkeypatch) -> None:
-    async def fake_select_org_billing(access_token: str, org_id: str) -> dict[str, str]:
+    async def fake_org_auth_context(
+        access_token: str, *, org_id: str | None = None, source_id: str | None = None
+    ) -> dict[str, str]:
         assert access_token == "token-123"
         assert org_id == "11111111-1111-1111-1111-111111111111"
-        return {"id": org_id, "plan": "free"}
+        return {"org_id": org_id, "role": "owner", "plan": "free"}
 
     async def fake_select_sources(access_token: str, org_id: str) -> list[dict[str, object]]:
         assert access_token == "token-123"
@@ -197,7 +204,7 @@ def test_create_source_returns_402_when_limit_reached(monkeypatch) -> None:
         access_token="token-123",
         claims={"sub": "user-1"},
     )
-    monkeypatch.setattr(sources_endpoint, "select_org_billing", fake_select_org_billing)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
     monkeypatch.setattr(sources_endpoint, "select_sources", fake_select_sources)
     monkeypatch.setattr(sources_endpoint, "rpc_create_source", fail_create_source)
 
@@ -406,23 +413,20 @@ def test_schedule_source_returns_ok_when_supabase_ok(monkeypatch) -> None:
         async def get(self, *args, **kwargs):  # pragma: no cover
             raise AssertionError("GET should not be called in schedule_source test")
 
-    async def fake_select_source_by_id(access_token: str, source_id: str) -> dict[str, str]:
+    async def fake_org_auth_context(
+        access_token: str, *, org_id: str | None = None, source_id: str | None = None
+    ) -> dict[str, str]:
         assert access_token == "token-123"
+        assert org_id is None
         assert source_id == "22222222-2222-2222-2222-222222222222"
-        return {"id": source_id, "org_id": "11111111-1111-1111-1111-111111111111"}
-
-    async def fake_select_org_billing(access_token: str, org_id: str) -> dict[str, str]:
-        assert access_token == "token-123"
-        assert org_id == "11111111-1111-1111-1111-111111111111"
-        return {"id": org_id, "plan": "pro"}
+        return {"org_id": "11111111-1111-1111-1111-111111111111", "role": "owner", "plan": "pro"}
 
     app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
         access_token="token-123",
         claims={"sub": "user-1"},
     )
     monkeypatch.setattr(supabase_rest.httpx, "AsyncClient", FakeAsyncClient)
-    monkeypatch.setattr(billing_guard, "select_source_by_id", fake_select_source_by_id)
-    monkeypatch.setattr(billing_guard, "select_org_billing", fake_select_org_billing)
+    monkeypatch.setattr(auth_context, "rpc_get_org_auth_context", fake_org_auth_context)
 
     try:
         client = TestClient(app)
@@ -458,3 +462,26 @@ def test_create_source_validates_github_repo_config() -> None:
         app.dependency_overrides.clear()
 
     assert response.status_code == 422
+
+
+def test_create_source_rejects_unsupported_html_selectors() -> None:
+    app.dependency_overrides[verify_supabase_auth] = lambda: VerifiedSupabaseAuth(
+        access_token="token-123",
+        claims={"sub": "user-1"},
+    )
+    try:
+        client = TestClient(app)
+        response = client.post(
+            "/api/v1/sources",
+            json={
+                "org_id": "11111111-1111-1111-1111-111111111111",
+                "name": "Regulator rules",
+                "kind": "html",
+                "url": "https://regulator.example.gov/rules",
+                "config": {"include_selectors": ["main:nth-child(2)"]},
+            },
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 422
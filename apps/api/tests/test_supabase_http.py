@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+
+from app.core import supabase_http, supabase_rest
+
+ORG_ID = "3e66f70d-1644-4b07-8d03-3dbfef9b3e01"
+
+
+def test_helpers_reuse_shared_client_when_open(monkeypatch) -> None:
+    seen_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(200, json=[{"id": ORG_ID, "name": "Acme", "created_at": "2026-02-09T00:00:00Z"}])
+
+    def fake_build_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    class UnexpectedAsyncClient:
+        def __init__(self, *args, **kwargs) -> None:
+            raise AssertionError("helpers must not open a new client while the pool is active")
+
+    async def scenario() -> httpx.AsyncClient:
+        async with supabase_http.supabase_http_lifespan() as client:
+            monkeypatch.setattr(supabase_rest.httpx, "AsyncClient", UnexpectedAsyncClient)
+            first = await supabase_rest.supabase_select_orgs("token-123")
+            second = await supabase_rest.supabase_select_orgs("token-123")
+            assert first == second
+            assert supabase_http.get_shared_supabase_http_client() is client
+        return client
+
+    monkeypatch.setattr(supabase_http, "build_supabase_http_client", fake_build_client)
+    client = asyncio.run(scenario())
+
+    assert len(seen_requests) == 2
+    assert all(request.headers["Authorization"] == "Bearer token-123" for request in seen_requests)
+    assert client.is_closed
+    assert supabase_http.get_shared_supabase_http_client() is None
+
+
+def test_pooled_client_applies_per_call_timeout(monkeypatch) -> None:
+    observed_timeouts: list[dict[str, float | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        observed_timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    def fake_build_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def scenario() -> None:
+        async with supabase_http.supabase_http_lifespan():
+            async with supabase_http.supabase_http_client(timeout=30.0) as client:
+                await client.get("https://example.supabase.co/storage/v1/object/exports/file.zip")
+
+    monkeypatch.setattr(supabase_http, "build_supabase_http_client", fake_build_client)
+    asyncio.run(scenario())
+
+    assert observed_timeouts == [{"connect": 30.0, "read": 30.0, "write": 30.0, "pool": 30.0}]
+
+
+def test_helpers_fall_back_to_short_lived_client_without_pool() -> None:
+    async def scenario() -> bool:
+        async with supabase_http.supabase_http_client() as client:
+            return isinstance(client, httpx.AsyncClient)
+
+    assert supabase_http.get_shared_supabase_http_client() is None
+    assert asyncio.run(scenario()) is True
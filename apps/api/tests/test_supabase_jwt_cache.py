@@ -0,0 +1,149 @@
+import asyncio
+import json
+import threading
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from jwt.algorithms import RSAAlgorithm
+
+from app.core import supabase_jwt
+from app.core.settings import get_settings
+
+
+def _rsa_key_pair(kid: str) -> tuple[rsa.RSAPrivateKey, dict[str, object]]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    public_jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_key, public_jwk
+
+
+def _token(private_key: rsa.RSAPrivateKey, kid: str, *, expires_in: int = 3600) -> str:
+    settings = get_settings()
+    return jwt.encode(
+        {"sub": "user-1", "iss": settings.SUPABASE_ISSUER, "exp": int(time.time()) + expires_in},
+        private_key,
+        algorithm="RS256",
+        headers={"kid": kid},
+    )
+
+
+@pytest.fixture
+def jwks_server(monkeypatch):
+    state: dict[str, object] = {"keys": [], "fetches": 0}
+
+    def fake_fetch_data(self) -> dict[str, object]:
+        state["fetches"] = int(state["fetches"]) + 1
+        state["fetch_thread"] = threading.current_thread()
+        return {"keys": list(state["keys"])}
+
+    monkeypatch.setattr(supabase_jwt.PyJWKClient, "fetch_data", fake_fetch_data)
+    monkeypatch.setattr(supabase_jwt, "_signing_key_cache", None)
+    monkeypatch.setattr(supabase_jwt, "_verified_token_cache", None)
+    return state
+
+
+def test_signing_keys_are_fetched_once_per_process(jwks_server) -> None:
+    private_key, public_jwk = _rsa_key_pair("key-1")
+    jwks_server["keys"] = [public_jwk]
+
+    first = supabase_jwt.verify_bearer_token(f"Bearer {_token(private_key, 'key-1')}")
+    second = supabase_jwt.verify_bearer_token(f"Bearer {_token(private_key, 'key-1', expires_in=1800)}")
+
+    assert first["sub"] == second["sub"] == "user-1"
+    assert jwks_server["fetches"] == 1
+
+
+def test_unknown_kid_triggers_refetch_for_rotated_keys(jwks_server) -> None:
+    old_private, old_public = _rsa_key_pair("key-old")
+    new_private, new_public = _rsa_key_pair("key-new")
+    jwks_server["keys"] = [old_public]
+    supabase_jwt.verify_bearer_token(f"Bearer {_token(old_private, 'key-old')}")
+
+    jwks_server["keys"] = [old_public, new_public]
+    supabase_jwt.get_signing_key_cache()._last_attempt_at = None
+    claims = supabase_jwt.verify_bearer_token(f"Bearer {_token(new_private, 'key-new')}")
+
+    assert claims["sub"] == "user-1"
+    assert jwks_server["fetches"] == 2
+
+
+def test_unknown_kid_refetch_is_rate_limited(jwks_server) -> None:
+    private_key, public_jwk = _rsa_key_pair("key-1")
+    stranger_key, _ = _rsa_key_pair("key-unknown")
+    jwks_server["keys"] = [public_jwk]
+    supabase_jwt.verify_bearer_token(f"Bearer {_token(private_key, 'key-1')}")
+
+    for _ in range(3):
+        with pytest.raises(HTTPException) as exc_info:
+            supabase_jwt.verify_bearer_token(f"Bearer {_token(stranger_key, 'key-unknown')}")
+        assert exc_info.value.status_code == 401
+
+    assert jwks_server["fetches"] == 1
+
+
+def test_verified_tokens_are_served_from_cache_until_exp(jwks_server, monkeypatch) -> None:
+    private_key, public_jwk = _rsa_key_pair("key-1")
+    jwks_server["keys"] = [public_jwk]
+    token = _token(private_key, "key-1")
+    supabase_jwt.verify_bearer_token(f"Bearer {token}")
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cached tokens must not be re-verified")
+
+    monkeypatch.setattr(supabase_jwt.jwt, "decode", fail_decode)
+    assert supabase_jwt.verify_bearer_token(f"Bearer {token}")["sub"] == "user-1"
+
+    real_time = time.time
+    monkeypatch.setattr(supabase_jwt.time, "time", lambda: real_time() + 7200)
+    with pytest.raises(AssertionError):
+        supabase_jwt.verify_bearer_token(f"Bearer {token}")
+
+
+def test_verified_token_cache_is_bounded() -> None:
+    cache = supabase_jwt.VerifiedTokenCache(max_entries=2)
+    exp = int(time.time()) + 60
+    cache.put("token-a", {"sub": "a", "exp": exp})
+    cache.put("token-b", {"sub": "b", "exp": exp})
+    assert cache.get("token-a") is not None
+    cache.put("token-c", {"sub": "c", "exp": exp})
+
+    assert len(cache) == 2
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") == {"sub": "a", "exp": exp}
+    cache.put("token-no-exp", {"sub": "d"})
+    assert cache.get("token-no-exp") is None
+
+
+def test_stale_key_set_is_refreshed_in_background(jwks_server) -> None:
+    private_key, public_jwk = _rsa_key_pair("key-1")
+    jwks_server["keys"] = [public_jwk]
+    cache = supabase_jwt.get_signing_key_cache()
+    cache.refresh(force=True)
+    cache._fetched_at = time.monotonic() - 3600
+
+    key = cache.get_signing_key("key-1")
+    assert key.key_id == "key-1"
+    assert cache._background_refresh is not None
+    cache._background_refresh.join(timeout=5)
+
+    assert jwks_server["fetches"] == 2
+    assert time.monotonic() - cache._fetched_at < 60
+
+
+def test_auth_dependency_fetches_keys_off_the_event_loop(jwks_server) -> None:
+    private_key, public_jwk = _rsa_key_pair("key-1")
+    jwks_server["keys"] = [public_jwk]
+
+    async def scenario():
+        loop_thread = threading.current_thread()
+        auth = await supabase_jwt.verify_supabase_auth(f"Bearer {_token(private_key, 'key-1')}")
+        return loop_thread, auth
+
+    loop_thread, auth = asyncio.run(scenario())
+
+    assert auth.claims["sub"] == "user-1"
+    assert jwks_server["fetches"] == 1
+    assert jwks_server["fetch_thread"] is not loop_thread
@@ -46,7 +46,8 @@ def test_tasks_list_returns_rows_when_supabase_ok(monkeypatch) -> None:
             assert params == {
                 "select": "id,org_id,title,description,status,assignee_user_id,alert_id,finding_id,due_at,severity,sla_state,created_at,updated_at",
                 "org_id": f"eq.{ORG_ID}",
-                "order": "created_at.desc",
+                "order": "created_at.desc,id.desc",
+                "limit": "101",
             }
             assert headers["Authorization"] == "Bearer token-123"
             assert headers["apikey"] == "test-anon-key"
@@ -103,7 +104,8 @@ def test_tasks_list_returns_rows_when_supabase_ok(monkeypatch) -> None:
                 "created_at": "2026-02-09T00:00:00Z",
                 "updated_at": "2026-02-09T00:00:00Z",
             }
-        ]
+        ],
+        "next_cursor": None,
     }
 
 
@@ -1,6 +1,12 @@
 import asyncio
+import ipaddress
 import json
+import re
+import time
 
+import httpx
+
+from app.worker import fetcher, github_api
 from app.worker.adapters.base import Source
 from app.worker.adapters.github_releases import GitHubReleasesAdapter
 
@@ -26,7 +32,7 @@ def test_github_releases_adapter_parses_latest_release(monkeypatch) -> None:
 
     async def fake_fetch(url: str, **kwargs):
         observed_kwargs.update(kwargs)
-        assert url == "https://api.github.com/repos/openai/openai-python/releases"
+        assert url == "https://api.github.com/repos/openai/openai-python/releases?per_page=5"
         return {
             "status": 200,
             "bytes": json.dumps(releases).encode("utf-8"),
@@ -70,3 +76,167 @@ def test_github_releases_adapter_requires_repo() -> None:
         raise AssertionError("expected ValueError")
     except ValueError as exc:
         assert "config.repo" in str(exc)
+
+
+class FakeGitHub:
+    """In-process stand-in for api.github.com with a per-token rate limit."""
+
+    def __init__(self, *, limit: int = 60) -> None:
+        self.limit = limit
+        self.used: dict[str, int] = {}
+        self.requests: list[httpx.Request] = []
+        self.reset_at = int(time.time()) + 3600
+
+    def release(self, repo: str) -> dict[str, object]:
+        return {
+            "id": abs(hash(repo)) % 10_000,
+            "tag_name": f"{repo}-v1",
+            "name": f"{repo} 1.0",
+            "body": f"Notes for {repo}",
+            "published_at": "2026-02-12T00:00:00Z",
+        }
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        credential = request.headers.get("authorization", "anonymous")
+        self.used[credential] = self.used.get(credential, 0) + 1
+        remaining = self.limit - self.used[credential]
+        headers = {
+            "content-type": "application/json",
+            "x-ratelimit-remaining": str(max(remaining, 0)),
+            "x-ratelimit-reset": str(self.reset_at),
+        }
+        if remaining < 0:
+            return httpx.Response(403, json={"message": "API rate limit exceeded"}, headers=headers)
+        if request.url.path == "/graphql":
+            query = json.loads(request.content)["query"]
+            data = {}
+            for alias, owner, name in re.findall(r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)', query):
+                release = self.release(f"{owner}/{name}")
+                data[alias] = {
+                    "releases": {
+                        "nodes": [
+                            {
+                                "databaseId": release["id"],
+                                "tagName": release["tag_name"],
+                                "name": release["name"],
+                                "description": release["body"],
+                                "publishedAt": release["published_at"],
+                            }
+                        ]
+                    }
+                }
+            return httpx.Response(200, json={"data": data}, headers=headers)
+        repo = request.url.path.removeprefix("/repos/").removesuffix("/releases")
+        return httpx.Response(200, json=[self.release(repo)], headers=headers)
+
+
+def _serve_github(monkeypatch, github: FakeGitHub) -> None:
+    real_async_client = httpx.AsyncClient
+
+    def fake_async_client(**kwargs):
+        return real_async_client(transport=httpx.MockTransport(github.handler), **kwargs)
+
+    async def fake_resolve_public_ips(host: str):
+        return [ipaddress.ip_address("140.82.112.6")]
+
+    monkeypatch.setattr(fetcher, "resolve_public_ips", fake_resolve_public_ips)
+    monkeypatch.setattr(fetcher.httpx, "AsyncClient", fake_async_client)
+
+
+def _github_source(repo: str) -> Source:
+    return Source(
+        id=f"source-{repo}",
+        org_id="org-1",
+        url=f"https://github.com/{repo}",
+        kind="github_releases",
+        config={"repo": repo},
+    )
+
+
+def test_github_adapter_requests_one_small_page_and_defers_when_budget_runs_out(monkeypatch) -> None:
+    github = FakeGitHub(limit=7)
+    _serve_github(monkeypatch, github)
+    github_api.configure_github()
+    adapter = GitHubReleasesAdapter()
+
+    async def scenario() -> list[str]:
+        outcomes = []
+        for index in range(5):
+            try:
+                result = await adapter.fetch(_github_source(f"acme/repo-{index}"), None)
+                outcomes.append(result.canonical_title or "")
+            except github_api.GitHubRateLimited as exc:
+                assert exc.retry_at == github.reset_at
+                outcomes.append("deferred")
+        return outcomes
+
+    outcomes = asyncio.run(scenario())
+
+    # Five requests are kept in reserve, so only two go out.
+    assert outcomes == ["acme/repo-0 1.0", "acme/repo-1 1.0", "deferred", "deferred", "deferred"]
+    assert len(github.requests) == 2
+    assert github.requests[0].url.params["per_page"] == "5"
+    assert "authorization" not in github.requests[0].headers
+
+
+def test_github_adapter_batches_concurrent_lookups_into_one_graphql_query(monkeypatch) -> None:
+    github = FakeGitHub(limit=5000)
+    _serve_github(monkeypatch, github)
+    github_api.configure_github(["token-a", "token-b"])
+    adapter = GitHubReleasesAdapter()
+    repos = [f"acme/repo-{index}" for index in range(4)]
+
+    async def scenario():
+        return await asyncio.gather(*(adapter.fetch(_github_source(repo), None) for repo in repos))
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        github_api.configure_github()
+
+    assert len(github.requests) == 1
+    assert github.requests[0].method == "POST"
+    assert github.requests[0].headers["authorization"] == "Bearer token-a"
+    assert [result.canonical_title for result in results] == [f"{repo} 1.0" for repo in repos]
+    assert results[2].item_id == str(github.release("acme/repo-2")["id"])
+
+
+def test_github_batch_uses_the_widest_limits_of_its_callers() -> None:
+    batcher = github_api.GitHubReleaseBatcher(github_api.GitHubBudget(["token-a"]))
+    posts: list[tuple[float, int]] = []
+
+    async def post(body: bytes, headers: dict[str, str], timeout_seconds: float, max_bytes: int):
+        posts.append((timeout_seconds, max_bytes))
+        data = {f"r{index}": {"releases": {"nodes": []}} for index in range(3)}
+        return {"status": 200, "bytes": json.dumps({"data": data}).encode(), "headers": {}}
+
+    async def scenario() -> None:
+        # The last caller has the tightest limits and must not shrink the
+        # request the other two are waiting on.
+        await asyncio.gather(
+            batcher.latest_release("acme/slow", post, timeout_seconds=30.0, max_bytes=100_000),
+            batcher.latest_release("acme/large", post, timeout_seconds=5.0, max_bytes=5_000_000),
+            batcher.latest_release("acme/small", post, timeout_seconds=2.0, max_bytes=10_000),
+        )
+        await batcher.latest_release("acme/small", post, timeout_seconds=2.0, max_bytes=10_000)
+
+    asyncio.run(scenario())
+
+    # Limits do not carry over into the next batch.
+    assert posts == [(30.0, 5_000_000), (2.0, 10_000)]
+
+
+def test_github_budget_rotates_to_the_token_with_most_requests_left() -> None:
+    budget = github_api.GitHubBudget(["token-a", "token-b"], reserve=0)
+    reset = str(int(time.time()) + 60)
+
+    budget.record("token-a", "core", 200, {"x-ratelimit-remaining": "1", "x-ratelimit-reset": reset})
+    budget.record("token-b", "core", 200, {"x-ratelimit-remaining": "3", "x-ratelimit-reset": reset})
+
+    assert [budget.acquire() for _ in range(4)] == ["token-b", "token-b", "token-a", "token-b"]
+    try:
+        budget.acquire()
+        raise AssertionError("expected GitHubRateLimited")
+    except github_api.GitHubRateLimited as exc:
+        assert exc.retry_at == float(reset)
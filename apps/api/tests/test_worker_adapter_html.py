@@ -0,0 +1,84 @@
+import asyncio
+import hashlib
+
+from app.worker.adapters.base import Source
+from app.worker.adapters.html import HtmlAdapter
+from app.worker.normalize import normalize
+
+HTML = (
+    "<html><head><title>Rule &amp; Guidance\n update</title>"
+    "<style>body { color: red; }</style></head>"
+    "<body><h1>Résumé of changes</h1><script>ignore()</script><p>Line one</p></body></html>"
+).encode()
+
+
+def _source() -> Source:
+    return Source(id="source-1", org_id="org-1", url="https://example.com/rules", kind="html")
+
+
+def _fake_fetch(content_type: str, body: bytes, chunk_size: int):
+    async def fake_fetch(*args, sink=None, **kwargs):
+        sink.begin(content_type)
+        for offset in range(0, len(body), chunk_size):
+            sink.write(body[offset : offset + chunk_size])
+        return {
+            "status": 200,
+            "bytes": b"",
+            "content_type": content_type,
+            "etag": '"v1"',
+            "last_modified": None,
+            "fetched_url": "https://example.com/rules",
+            "content_len": len(body),
+        }
+
+    return fake_fetch
+
+
+def test_html_adapter_extracts_title_text_and_hash_while_streaming(monkeypatch) -> None:
+    # Seven-byte chunks split tags, entities and the two-byte "é".
+    monkeypatch.setattr(
+        "app.worker.adapters.html.fetch_url", _fake_fetch("text/html; charset=utf-8", HTML, 7)
+    )
+
+    result = asyncio.run(HtmlAdapter().fetch(_source(), None))
+
+    assert result.canonical_title == "Rule & Guidance update"
+    assert result.canonical_text == normalize("text/html", HTML)["normalized_text"]
+    assert result.canonical_text == "Rule & Guidance update\nRésumé of changes\nLine one"
+    assert result.raw_bytes_hash == hashlib.sha256(HTML).hexdigest()
+    assert result.content_len == len(HTML)
+    assert result.etag == '"v1"'
+
+
+def test_html_adapter_buffers_non_html_bodies(monkeypatch) -> None:
+    body = b'{"b": 1, "a": 2}'
+    monkeypatch.setattr(
+        "app.worker.adapters.html.fetch_url", _fake_fetch("application/json", body, 4)
+    )
+
+    result = asyncio.run(HtmlAdapter().fetch(_source(), None))
+
+    assert result.canonical_title is None
+    assert result.canonical_text == '{\n  "a": 2,\n  "b": 1\n}'
+    assert result.raw_bytes_hash == hashlib.sha256(body).hexdigest()
+    assert result.content_len == len(body)
+
+
+def test_html_adapter_keeps_only_configured_regions(monkeypatch) -> None:
+    page = (
+        b"<html><head><title>Rules</title></head><body>"
+        b"<nav><a href='/'>Home</a><a href='/news'>News</a></nav>"
+        b"<main><article class='rule'><h1>Rule 7</h1><p>Keep records for <b>5</b> years.</p>"
+        b"<aside class='share'>Share this page</aside><img src='x.png'><p>Effective 2026</article></main>"
+        b"<footer>Updated today</footer></body></html>"
+    )
+    monkeypatch.setattr("app.worker.adapters.html.fetch_url", _fake_fetch("text/html", page, 11))
+    source = _source().model_copy(
+        update={"config": {"include_selectors": ["main article"], "exclude_selectors": "//aside"}}
+    )
+
+    result = asyncio.run(HtmlAdapter().fetch(source, None))
+
+    assert result.canonical_title == "Rules"
+    assert result.canonical_text == "Rule 7\nKeep records for\n5\nyears.\nEffective 2026"
+    assert result.raw_bytes_hash == hashlib.sha256(page).hexdigest()
@@ -2,10 +2,17 @@ import asyncio
 import hashlib
 from io import BytesIO
 
-from pypdf import PdfWriter
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+)
 
 from app.worker.adapters.base import Source
-from app.worker.adapters.pdf import PdfAdapter
+from app.worker.adapters.pdf import PdfAdapter, _page_fingerprint
 
 
 def _build_pdf_bytes() -> bytes:
@@ -17,6 +24,163 @@ def _build_pdf_bytes() -> bytes:
     return buffer.getvalue()
 
 
+def _build_text_pdf(page_texts: list[str]) -> bytes:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in page_texts:
+        page = writer.add_blank_page(width=300, height=100)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 10 50 Td ({text}) Tj ET".encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _first_page_fingerprint(*, differences: str = "/A", nested_text: str = "Inner") -> str:
+    writer = PdfWriter()
+    encoding = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Encoding"),
+                NameObject("/Differences"): ArrayObject([NumberObject(65), NameObject(differences)]),
+            }
+        )
+    )
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+                NameObject("/Encoding"): encoding,
+            }
+        )
+    )
+    font_resources = DictionaryObject({NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})})
+
+    inner = DecodedStreamObject()
+    inner.set_data(f"BT /F1 12 Tf ({nested_text}) Tj ET".encode("latin-1"))
+    inner.update({NameObject("/Subtype"): NameObject("/Form"), NameObject("/Resources"): font_resources})
+    outer = DecodedStreamObject()
+    outer.set_data(b"/Fm2 Do")
+    outer.update(
+        {
+            NameObject("/Subtype"): NameObject("/Form"),
+            NameObject("/Resources"): DictionaryObject(
+                {NameObject("/XObject"): DictionaryObject({NameObject("/Fm2"): writer._add_object(inner)})}
+            ),
+        }
+    )
+
+    page = writer.add_blank_page(width=300, height=100)
+    contents = DecodedStreamObject()
+    contents.set_data(b"BT /F1 12 Tf (A) Tj ET /Fm1 Do")
+    page[NameObject("/Contents")] = writer._add_object(contents)
+    page[NameObject("/Resources")] = DictionaryObject(
+        {
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+            NameObject("/XObject"): DictionaryObject({NameObject("/Fm1"): writer._add_object(outer)}),
+        }
+    )
+    buffer = BytesIO()
+    writer.write(buffer)
+    return _page_fingerprint(PdfReader(BytesIO(buffer.getvalue())).pages[0])
+
+
+def _serve(monkeypatch, bodies: list[bytes]) -> None:
+    async def fake_fetch(*args, **kwargs):
+        return {
+            "status": 200,
+            "bytes": bodies.pop(0),
+            "content_type": "application/pdf",
+            "fetched_url": "https://example.com/policy.pdf",
+        }
+
+    monkeypatch.setattr("app.worker.adapters.pdf.fetch_url", fake_fetch)
+
+
+def _count_extractions(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    original = PageObject.extract_text
+
+    def counting_extract_text(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(PageObject, "extract_text", counting_extract_text)
+    return calls
+
+
+def test_pdf_adapter_reextracts_only_changed_pages(monkeypatch) -> None:
+    before = [f"Clause {idx}" for idx in range(5)]
+    after = list(before)
+    after[2] = "Clause 2 amended"
+    _serve(monkeypatch, [_build_text_pdf(before), _build_text_pdf(after)])
+    calls = _count_extractions(monkeypatch)
+    adapter = PdfAdapter()
+    source = Source(id="source-1", org_id="org-1", url="https://example.com/policy.pdf", kind="pdf")
+
+    first = asyncio.run(adapter.fetch(source, None))
+    assert len(calls) == 5
+    second = asyncio.run(adapter.fetch(source, None))
+
+    assert len(calls) == 6
+    assert first.canonical_text.splitlines() == before
+    assert second.canonical_text.splitlines() == after
+
+
+def test_pdf_adapter_reads_past_page_limit_for_full_document_sources(monkeypatch) -> None:
+    texts = [f"Page {idx}" for idx in range(25)]
+    _serve(monkeypatch, [_build_text_pdf(texts), _build_text_pdf(texts)])
+    adapter = PdfAdapter()
+
+    limited = asyncio.run(
+        adapter.fetch(Source(id="s-1", org_id="org-1", url="https://example.com/a.pdf", kind="pdf"), None)
+    )
+    full = asyncio.run(
+        adapter.fetch(
+            Source(
+                id="s-2",
+                org_id="org-1",
+                url="https://example.com/a.pdf",
+                kind="pdf",
+                config={"full_document": True},
+            ),
+            None,
+        )
+    )
+
+    assert limited.canonical_text.splitlines() == texts[:20]
+    assert full.canonical_text.splitlines() == texts
+
+
+def test_pdf_adapter_parses_bodies_spooled_to_disk(monkeypatch) -> None:
+    pdf_bytes = _build_text_pdf(["Spooled clause"])
+    _serve(monkeypatch, [pdf_bytes])
+
+    result = asyncio.run(
+        PdfAdapter(spool_memory_bytes=64).fetch(
+            Source(id="s-1", org_id="org-1", url="https://example.com/a.pdf", kind="pdf"), None
+        )
+    )
+
+    assert result.canonical_text == "Spooled clause"
+    assert result.content_len == len(pdf_bytes)
+    assert result.raw_bytes_hash == hashlib.sha256(pdf_bytes).hexdigest()
+
+
 def test_pdf_adapter_hashes_bytes_when_text_empty(monkeypatch) -> None:
     pdf_bytes = _build_pdf_bytes()
 
@@ -45,3 +209,26 @@ def test_pdf_adapter_hashes_bytes_when_text_empty(monkeypatch) -> None:
     assert result.canonical_text == ""
     assert result.canonical_title == "Example PDF"
     assert result.raw_bytes_hash == hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def test_page_fingerprint_covers_encoding_contents_and_nested_forms() -> None:
+    baseline = _first_page_fingerprint()
+
+    assert _first_page_fingerprint() == baseline
+    assert _first_page_fingerprint(differences="/B") != baseline
+    assert _first_page_fingerprint(nested_text="Inner amended") != baseline
+
+
+def test_pdf_adapter_bounds_cached_page_text_by_characters(monkeypatch) -> None:
+    first_texts = ["A" * 40, "B" * 40]
+    second_texts = ["C" * 40]
+    _serve(monkeypatch, [_build_text_pdf(first_texts), _build_text_pdf(second_texts)])
+    adapter = PdfAdapter(page_cache_chars=100)
+
+    asyncio.run(adapter.fetch(Source(id="s-1", org_id="org-1", url="https://example.com/a.pdf", kind="pdf"), None))
+    asyncio.run(adapter.fetch(Source(id="s-2", org_id="org-1", url="https://example.com/b.pdf", kind="pdf"), None))
+
+    # 80 + 40 characters do not fit in 100, so the older source is dropped.
+    assert adapter._page_texts.get("s-1") is None
+    assert adapter._page_texts.get("s-2") is not None
+    assert adapter._page_texts.weight == 40
@@ -89,3 +89,68 @@ def test_rss_adapter_dedupes_when_no_new_item(monkeypatch) -> None:
 
     assert result.item_id == "same-1"
     assert result.canonical_text == ""
+
+
+def _fetch_feed(monkeypatch, feed_xml: bytes, previous_item_id: str | None):
+    async def fake_fetch(*args, **kwargs):
+        return {
+            "status": 200,
+            "bytes": feed_xml,
+            "content_type": "application/rss+xml",
+            "fetched_url": "https://example.com/feed.xml",
+        }
+
+    monkeypatch.setattr("app.worker.adapters.rss.fetch_url", fake_fetch)
+    source = Source(id="source-1", org_id="org-1", url="https://example.com/feed.xml", kind="rss")
+    previous = Snapshot(item_id=previous_item_id) if previous_item_id else None
+    return asyncio.run(RssAdapter().fetch(source, previous))
+
+
+def test_rss_adapter_reports_every_new_item_and_stops_at_the_previous_one(monkeypatch) -> None:
+    # Everything after the previously seen item is left unparsed, so the
+    # broken markup at the end of the document does not matter.
+    feed_xml = b"""<rss version="2.0"><channel>
+      <item><guid>n-3</guid><title>Third</title>
+        <pubDate>Sat, 14 Feb 2026 00:00:00 GMT</pubDate><description>Body 3</description></item>
+      <item><guid>n-2</guid><title>Second</title>
+        <pubDate>Fri, 13 Feb 2026 00:00:00 GMT</pubDate><description>Body 2</description></item>
+      <item><guid>n-1</guid><title>First</title>
+        <pubDate>Thu, 12 Feb 2026 00:00:00 GMT</pubDate><description>Body 1</description></item>
+      <item><guid>n-0</guid><title>Broken & unescaped
+    """
+
+    result = _fetch_feed(monkeypatch, feed_xml, "n-1")
+
+    assert result.item_id == "n-3"
+    assert result.canonical_title == "Third"
+    assert result.canonical_text == "Third\nBody 3\n\nSecond\nBody 2"
+
+
+def test_rss_adapter_reads_atom_feeds_in_stream(monkeypatch) -> None:
+    feed_xml = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+      <entry><id>urn:entry:2</id><title>Rule update</title>
+        <link href="https://example.com/2"/><updated>2026-02-13T00:00:00Z</updated>
+        <summary type="html">&lt;p&gt;Amended &lt;b&gt;rule&lt;/b&gt;&lt;/p&gt;</summary></entry>
+      <entry><id>urn:entry:1</id><title>Older</title><updated>2026-02-12T00:00:00Z</updated></entry>
+    </feed>"""
+
+    result = _fetch_feed(monkeypatch, feed_xml, None)
+
+    assert result.item_id == "urn:entry:2"
+    assert result.canonical_text == "Amended\nrule"
+    assert result.item_published_at is not None and result.item_published_at.day == 13
+
+
+def test_rss_adapter_falls_back_to_feedparser_for_malformed_feeds(monkeypatch) -> None:
+    feed_xml = b"""<rss version="2.0"><channel>
+      <item><guid>b-2</guid><title>Terms & conditions</title>
+        <pubDate>Fri, 13 Feb 2026 00:00:00 GMT</pubDate><description>Updated terms</description></item>
+      <item><guid>b-1</guid><title>Old</title>
+        <pubDate>Thu, 12 Feb 2026 00:00:00 GMT</pubDate><description>Old terms</description></item>
+    </channel></rss>"""
+
+    result = _fetch_feed(monkeypatch, feed_xml, "b-1")
+
+    assert result.item_id == "b-2"
+    assert result.canonical_title == "Terms & conditions"
+    assert result.canonical_text == "Updated terms"
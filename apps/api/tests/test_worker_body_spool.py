@@ -0,0 +1,33 @@
+import hashlib
+import os
+
+from app.worker.body_spool import SpooledBody, SpooledFile, open_payload
+
+
+def test_spooled_body_stays_in_memory_below_threshold() -> None:
+    with SpooledBody(max_memory_bytes=16) as body:
+        body.write(b"small")
+        body.write(b" body")
+
+        assert not body.spooled
+        assert body.payload() == b"small body"
+        assert body.sha256 == hashlib.sha256(b"small body").hexdigest()
+
+
+def test_spooled_body_spills_to_a_mapped_file_and_cleans_up() -> None:
+    chunks = [bytes([idx]) * 1000 for idx in range(10)]
+    with SpooledBody(max_memory_bytes=2500) as body:
+        for chunk in chunks:
+            body.write(chunk)
+        payload = body.payload()
+
+        assert body.spooled
+        assert isinstance(payload, SpooledFile)
+        assert payload.size == 10_000
+        with open_payload(payload) as stream:
+            assert stream.read() == b"".join(chunks)
+            stream.seek(4000)
+            assert stream.read(3) == b"\x04\x04\x04"
+        assert body.sha256 == hashlib.sha256(b"".join(chunks)).hexdigest()
+
+    assert not os.path.exists(payload.path)
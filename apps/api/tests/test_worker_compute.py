@@ -0,0 +1,92 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.worker import compute
+from app.worker.explain import build_explanation
+
+
+def _crash() -> None:
+    os._exit(1)
+
+
+def _sleep(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+def _pid() -> int:
+    return os.getpid()
+
+
+def test_compute_pool_runs_tasks_in_other_processes_and_isolates_failures() -> None:
+    async def scenario() -> dict[str, object]:
+        async with compute.compute_pool_lifespan(
+            max_workers=1, task_timeout_seconds=2.0, max_input_bytes=64
+        ) as pool:
+            assert pool is not None
+            outcome: dict[str, object] = {}
+            outcome["explanation"] = await compute.run_cpu_bound(build_explanation, "a\nb", "a\nc")
+            outcome["pid"] = await compute.run_cpu_bound(_pid)
+
+            with pytest.raises(compute.ComputeTaskError, match="crashed"):
+                await compute.run_cpu_bound(_crash)
+            with pytest.raises(compute.ComputeTaskError, match="size limit"):
+                await compute.run_cpu_bound(build_explanation, "x" * 40, "y" * 40)
+
+            pool.task_timeout_seconds = 0.5
+            with pytest.raises(compute.ComputeTaskError, match="timed out"):
+                await compute.run_cpu_bound(_sleep, 5.0)
+
+            pool.task_timeout_seconds = 10.0
+            outcome["after_failures"] = await compute.run_cpu_bound(_sleep, 0.0)
+            return outcome
+
+    outcome = asyncio.run(scenario())
+
+    assert outcome["explanation"]["citations"] == [
+        {"quote": "b", "context": "@@ -1,2 +1,2 @@"},
+        {"quote": "c", "context": "@@ -1,2 +1,2 @@"},
+    ]
+    assert outcome["pid"] != os.getpid()
+    assert outcome["after_failures"] == "done"
+    assert compute._shared_pool is None
+
+
+def test_run_cpu_bound_without_pool_uses_a_thread() -> None:
+    async def scenario() -> int:
+        return await compute.run_cpu_bound(_pid)
+
+    assert compute._shared_pool is None
+    assert asyncio.run(scenario()) == os.getpid()
+
+
+def test_compute_pool_times_tasks_from_start_and_resubmits_collateral_tasks() -> None:
+    async def scenario() -> dict[str, object]:
+        async with compute.compute_pool_lifespan(max_workers=1, task_timeout_seconds=1.5) as pool:
+            assert pool is not None
+            outcome: dict[str, object] = {}
+            # Queued behind each other for longer than the timeout, but each
+            # task runs well within it.
+            outcome["queued"] = await asyncio.gather(*(compute.run_cpu_bound(_sleep, 0.6) for _ in range(3)))
+
+        async with compute.compute_pool_lifespan(max_workers=2, task_timeout_seconds=2.0):
+
+            async def bystander() -> str:
+                await asyncio.sleep(1.5)
+                return await compute.run_cpu_bound(_sleep, 1.0)
+
+            stuck, survivor = await asyncio.gather(
+                compute.run_cpu_bound(_sleep, 10.0), bystander(), return_exceptions=True
+            )
+            outcome["stuck"] = stuck
+            outcome["survivor"] = survivor
+            return outcome
+
+    outcome = asyncio.run(scenario())
+
+    assert outcome["queued"] == ["done", "done", "done"]
+    assert isinstance(outcome["stuck"], compute.ComputeTaskError)
+    assert outcome["survivor"] == "done"
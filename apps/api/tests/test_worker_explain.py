@@ -1,3 +1,6 @@
+import random
+
+from app.worker import explain, line_diff
 from app.worker.explain import build_explanation
 
 
@@ -13,3 +16,94 @@ def test_build_explanation_limits_diff_preview_size() -> None:
     assert isinstance(result["citations"], list)
     assert len(result["citations"]) <= 3
     assert len(preview.splitlines()) <= 201
+
+
+def test_build_explanation_reports_hunks_in_unified_diff_format() -> None:
+    previous = "\n".join(f"clause {idx}" for idx in range(20))
+    current_lines = [f"clause {idx}" for idx in range(20)]
+    current_lines[3] = "clause 3 amended"
+    current_lines.insert(15, "clause 14b")
+
+    result = build_explanation(previous, "\n".join(current_lines))
+
+    assert result["diff_preview"].splitlines() == [
+        "--- previous",
+        "+++ current",
+        "@@ -2,5 +2,5 @@",
+        " clause 1",
+        " clause 2",
+        "-clause 3",
+        "+clause 3 amended",
+        " clause 4",
+        " clause 5",
+        "@@ -14,4 +14,5 @@",
+        " clause 13",
+        " clause 14",
+        "+clause 14b",
+        " clause 15",
+        " clause 16",
+    ]
+    assert [citation["context"] for citation in result["citations"]] == [
+        "@@ -2,5 +2,5 @@",
+        "@@ -2,5 +2,5 @@",
+        "@@ -14,4 +14,5 @@",
+    ]
+    assert result["summary"].startswith("The source updated 2 section(s)")
+
+
+def test_build_explanation_stops_diffing_once_the_preview_is_full(monkeypatch) -> None:
+    # difflib needs tens of seconds on this input: every line repeats many
+    # times, which defeats its junk heuristics.
+    previous_lines = [f"Section {idx % 50}: requirement text {idx % 7}" for idx in range(20_000)]
+    current_lines = list(previous_lines)
+    for idx in range(0, len(current_lines), 97):
+        current_lines[idx] += " amended"
+
+    consumed: list[list[str]] = []
+
+    def counting_hunks(*args, **kwargs):
+        for hunk in line_diff.iter_unified_hunks(*args, **kwargs):
+            consumed.append(hunk)
+            yield hunk
+
+    # No deadline, so the result does not depend on how fast the host is.
+    monkeypatch.setattr(explain, "DIFF_TIME_BUDGET_SECONDS", None)
+    monkeypatch.setattr(explain, "iter_unified_hunks", counting_hunks)
+    result = explain.build_explanation("\n".join(previous_lines), "\n".join(current_lines))
+
+    preview = result["diff_preview"].splitlines()
+    assert len(preview) == 201
+    assert preview[-1] == "... diff truncated ..."
+    assert len(result["citations"]) == 3
+    # One hunk past the full preview is read to know more changes exist;
+    # the remaining ~200 hunks are never diffed.
+    assert len(consumed) < 40
+    assert f"{len(consumed) - 1}+ section(s)" in result["summary"]
+
+
+def test_build_explanation_bounds_unanchored_rewrites(monkeypatch) -> None:
+    rng = random.Random(3)
+    previous = "\n".join(rng.choice("xyz") for _ in range(20_000))
+    current = "\n".join(rng.choice("xyz") for _ in range(20_000))
+
+    outcomes: list[bool] = []
+    myers = line_diff._myers
+
+    def recording_myers(*args, **kwargs):
+        opcodes = myers(*args, **kwargs)
+        outcomes.append(opcodes is None)
+        return opcodes
+
+    monkeypatch.setattr(explain, "DIFF_TIME_BUDGET_SECONDS", None)
+    monkeypatch.setattr(line_diff, "_myers", recording_myers)
+    result = explain.build_explanation(previous, current)
+
+    # With no unique lines to anchor on, the edit-cost cap alone makes
+    # Myers give up and the rewrite is reported as one replaced block.
+    preview = result["diff_preview"].splitlines()
+    assert outcomes == [True]
+    assert preview[2] == "@@ -1,20000 +1,20000 @@"
+    assert len(preview) == 201
+    assert preview[-1] == "... diff truncated ..."
+    assert len(result["citations"]) == 3
+    assert result["summary"].startswith("The source updated 1 section(s)")
@@ -1,35 +1,88 @@
 import asyncio
 import ipaddress
+import socket
+import threading
+import time
 
+import httpx
 import pytest
 
-from app.worker import fetcher
+from app.worker import fetch_engine, fetcher
+
+
+def _fake_resolver(address: str):
+    async def fake_resolve_public_ips(host: str) -> list[ipaddress._BaseAddress]:
+        return [ipaddress.ip_address(address)]
+
+    return fake_resolve_public_ips
 
 
 def test_validate_fetch_url_rejects_private_ip_ranges() -> None:
     with pytest.raises(fetcher.UnsafeUrlError):
-        fetcher.validate_fetch_url("http://127.0.0.1/internal")
+        asyncio.run(fetcher.validate_fetch_url("http://127.0.0.1/internal"))
 
     with pytest.raises(fetcher.UnsafeUrlError):
-        fetcher.validate_fetch_url("http://169.254.169.254/latest/meta-data")
+        asyncio.run(fetcher.validate_fetch_url("http://169.254.169.254/latest/meta-data"))
 
 
 def test_validate_fetch_url_respects_allowed_hosts(monkeypatch) -> None:
-    monkeypatch.setattr(fetcher, "resolve_public_ips", lambda host: [ipaddress.ip_address("140.82.114.5")])
+    monkeypatch.setattr(fetcher, "resolve_public_ips", _fake_resolver("140.82.114.5"))
 
-    assert (
+    assert asyncio.run(
         fetcher.validate_fetch_url(
             "https://api.github.com/repos/openai/openai-python/releases",
             allowed_hosts={"api.github.com"},
         )
-        == "https://api.github.com/repos/openai/openai-python/releases"
+    ) == fetcher.FetchTarget(
+        url="https://api.github.com/repos/openai/openai-python/releases",
+        host="api.github.com",
+        ip="140.82.114.5",
     )
 
     with pytest.raises(fetcher.UnsafeUrlError):
-        fetcher.validate_fetch_url(
-            "https://example.com/feed.xml",
-            allowed_hosts={"api.github.com"},
+        asyncio.run(
+            fetcher.validate_fetch_url(
+                "https://example.com/feed.xml",
+                allowed_hosts={"api.github.com"},
+            )
+        )
+
+
+def test_resolver_caches_answers_and_failures_off_the_event_loop(monkeypatch) -> None:
+    lookups: list[str] = []
+    loop_threads: list[bool] = []
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        lookups.append(host)
+        loop_threads.append(threading.current_thread() is threading.main_thread())
+        if host == "missing.example.com":
+            raise socket.gaierror("no such host")
+        if host == "internal.example.com":
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.7", 0))]
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+
+    fetcher.clear_dns_cache()
+    monkeypatch.setattr(fetcher.socket, "getaddrinfo", fake_getaddrinfo)
+
+    async def scenario() -> list[fetcher.FetchTarget]:
+        targets = await asyncio.gather(
+            *(fetcher.validate_fetch_url(f"https://example.com/page-{index}") for index in range(5))
         )
+        for _ in range(2):
+            with pytest.raises(fetcher.UnsafeUrlError):
+                await fetcher.validate_fetch_url("https://missing.example.com/")
+            with pytest.raises(fetcher.UnsafeUrlError, match="blocked IP address"):
+                await fetcher.validate_fetch_url("https://internal.example.com/")
+        return targets
+
+    try:
+        targets = asyncio.run(scenario())
+    finally:
+        fetcher.clear_dns_cache()
+
+    assert {target.ip for target in targets} == {"93.184.216.34"}
+    assert lookups == ["example.com", "missing.example.com", "internal.example.com"]
+    assert not any(loop_threads)
 
 
 def test_fetch_url_handles_304_not_modified(monkeypatch) -> None:
@@ -64,14 +117,18 @@ def test_fetch_url_handles_304_not_modified(monkeypatch) -> None:
         async def __aexit__(self, exc_type, exc, tb) -> None:
             return None
 
-        def stream(self, method: str, url: str, headers: dict[str, str]) -> FakeResponse:
+        def stream(
+            self, method: str, url: str, headers: dict[str, str], extensions: dict[str, str]
+        ) -> FakeResponse:
             assert method == "GET"
-            assert url == "https://example.com/policy"
+            assert url == "https://93.184.216.34/policy"
+            assert headers["Host"] == "example.com"
+            assert extensions == {"sni_hostname": "example.com"}
             assert headers["If-None-Match"] == '"etag-v1"'
             assert headers["If-Modified-Since"] == "Wed, 10 Feb 2026 00:00:00 GMT"
             return FakeResponse()
 
-    monkeypatch.setattr(fetcher, "resolve_public_ips", lambda host: [ipaddress.ip_address("93.184.216.34")])
+    monkeypatch.setattr(fetcher, "resolve_public_ips", _fake_resolver("93.184.216.34"))
     monkeypatch.setattr(fetcher.httpx, "AsyncClient", FakeAsyncClient)
 
     result = asyncio.run(
@@ -85,3 +142,110 @@ def test_fetch_url_handles_304_not_modified(monkeypatch) -> None:
     assert result["status"] == 304
     assert result["bytes"] == b""
     assert result["etag"] == '"etag-v2"'
+    assert result["fetched_url"] == "https://example.com/policy"
+
+
+def test_fetch_url_reuses_per_host_pools_and_paces_requests(monkeypatch) -> None:
+    created_clients: list[dict[str, object]] = []
+    request_starts: dict[str, list[float]] = {}
+    real_async_client = httpx.AsyncClient
+
+    def fake_async_client(**kwargs):
+        created_clients.append(kwargs)
+        return real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        request_starts.setdefault(request.headers["host"], []).append(time.monotonic())
+        return httpx.Response(200, content=b"ok", headers={"content-type": "text/plain"})
+
+    monkeypatch.setattr(fetcher, "resolve_public_ips", _fake_resolver("93.184.216.34"))
+    monkeypatch.setattr(fetch_engine.httpx, "AsyncClient", fake_async_client)
+
+    async def scenario() -> list[dict[str, object]]:
+        async with fetch_engine.fetch_engine_lifespan(
+            per_host_concurrency=2, per_host_rate_per_second=20.0
+        ) as engine:
+            results = await asyncio.gather(
+                *(fetcher.fetch_url(f"https://example.com/page-{index}") for index in range(3)),
+                fetcher.fetch_url("https://other.example.org/feed"),
+            )
+            assert len(engine) == 2
+        assert fetch_engine.get_fetch_engine() is None
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert [result["bytes"] for result in results] == [b"ok"] * 4
+    assert len(created_clients) == 2
+    assert all(client["follow_redirects"] is False for client in created_clients)
+    example_starts = request_starts["example.com"]
+    assert len(example_starts) == 3
+    assert all(later - earlier >= 0.04 for earlier, later in zip(example_starts, example_starts[1:], strict=False))
+    assert len(request_starts["other.example.org"]) == 1
+
+
+def test_fetch_engine_closes_least_recently_used_and_idle_pools(monkeypatch) -> None:
+    created_clients: list[httpx.AsyncClient] = []
+    real_async_client = httpx.AsyncClient
+
+    def fake_async_client(**kwargs):
+        client = real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+        created_clients.append(client)
+        return client
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"ok", headers={"content-type": "text/plain"})
+
+    monkeypatch.setattr(fetcher, "resolve_public_ips", _fake_resolver("93.184.216.34"))
+    monkeypatch.setattr(fetch_engine.httpx, "AsyncClient", fake_async_client)
+
+    async def scenario() -> None:
+        async with fetch_engine.fetch_engine_lifespan(max_clients=2, per_host_rate_per_second=0) as engine:
+            for host in ("a.example.com", "b.example.com", "a.example.com", "c.example.com"):
+                await fetcher.fetch_url(f"https://{host}/page")
+            assert len(engine) == 2
+            # b was used least recently, so it is the pool that was closed.
+            assert [client.is_closed for client in created_clients] == [False, True, False]
+
+            engine.client_idle_seconds = 0
+            await fetcher.fetch_url("https://a.example.com/page")
+            assert len(engine) == 0
+            assert all(client.is_closed for client in created_clients)
+
+    asyncio.run(scenario())
+
+
+def test_fetch_url_streams_body_into_sink_without_buffering(monkeypatch) -> None:
+    real_async_client = httpx.AsyncClient
+
+    def fake_async_client(**kwargs):
+        return real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"<p>streamed</p>", headers={"content-type": "text/html"})
+
+    class RecordingSink:
+        def __init__(self) -> None:
+            self.content_type: str | None = None
+            self.chunks: list[bytes] = []
+
+        def begin(self, content_type: str | None) -> None:
+            self.content_type = content_type
+
+        def write(self, chunk: bytes) -> None:
+            self.chunks.append(chunk)
+
+    monkeypatch.setattr(fetcher, "resolve_public_ips", _fake_resolver("93.184.216.34"))
+    monkeypatch.setattr(fetch_engine.httpx, "AsyncClient", fake_async_client)
+    sink = RecordingSink()
+
+    async def scenario() -> dict[str, object]:
+        async with fetch_engine.fetch_engine_lifespan():
+            return await fetcher.fetch_url("https://example.com/page", sink=sink)
+
+    result = asyncio.run(scenario())
+
+    assert sink.content_type == "text/html"
+    assert b"".join(sink.chunks) == b"<p>streamed</p>"
+    assert result["bytes"] == b""
+    assert result["content_len"] == len(b"<p>streamed</p>")
@@ -0,0 +1,107 @@
+import asyncio
+
+import httpx
+
+from app.core import supabase_http, supabase_rest
+from app.worker import leases
+
+RUN_ID = "22222222-2222-2222-2222-222222222222"
+
+
+def test_lease_heartbeat_renews_until_the_block_exits(monkeypatch) -> None:
+    renewals: list[tuple[str, str, str, int]] = []
+
+    async def fake_renew(queue: str, job_id: str, holder: str, lease_seconds: int) -> bool:
+        renewals.append((queue, job_id, holder, lease_seconds))
+        return True
+
+    monkeypatch.setattr(leases, "rpc_renew_job_lease", fake_renew)
+
+    async def scenario() -> None:
+        async with leases.lease_heartbeat("monitor_runs", RUN_ID, "worker-a", 1):
+            await asyncio.sleep(0.8)
+        count = len(renewals)
+        await asyncio.sleep(0.5)
+        assert len(renewals) == count
+
+    asyncio.run(scenario())
+
+    assert len(renewals) == 2
+    assert set(renewals) == {("monitor_runs", RUN_ID, "worker-a", 1)}
+
+
+def test_lease_heartbeat_stops_once_the_lease_is_lost(monkeypatch) -> None:
+    renewals: list[str] = []
+
+    async def fake_renew(queue: str, job_id: str, holder: str, lease_seconds: int) -> bool:
+        renewals.append(job_id)
+        return False
+
+    monkeypatch.setattr(leases, "rpc_renew_job_lease", fake_renew)
+
+    async def scenario() -> None:
+        async with leases.lease_heartbeat("audit_exports", RUN_ID, "worker-a", 1):
+            await asyncio.sleep(0.8)
+
+    asyncio.run(scenario())
+
+    assert renewals == [RUN_ID]
+
+
+def test_claimed_writes_are_fenced_on_the_lease_holder(monkeypatch) -> None:
+    seen: list[httpx.Request] = []
+    matched_rows: list[list[dict[str, str]]] = [[{"id": RUN_ID}], []]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=matched_rows[len(seen) - 1])
+
+    def fake_build_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(supabase_http, "build_supabase_http_client", fake_build_client)
+    monkeypatch.setattr(
+        supabase_rest, "supabase_service_role_headers", lambda: {"Authorization": "Bearer service-role-123"}
+    )
+
+    async def scenario() -> tuple[bool, bool]:
+        async with supabase_http.supabase_http_lifespan():
+            kept = await supabase_rest.mark_monitor_run_for_retry(
+                RUN_ID, 1, "2026-02-09T00:00:00Z", "boom", holder="worker-a"
+            )
+            lost = await supabase_rest.mark_monitor_run_dead_letter(
+                RUN_ID, 5, "boom", "2026-02-09T00:00:00Z", holder="worker-a"
+            )
+            return kept, lost
+
+    kept, lost = asyncio.run(scenario())
+
+    assert (kept, lost) == (True, False)
+    for request in seen:
+        assert request.method == "PATCH"
+        assert request.url.params["id"] == f"eq.{RUN_ID}"
+        assert request.url.params["claimed_by"] == "eq.worker-a"
+        assert request.url.params["status"] == "eq.running"
+
+
+def test_batch_lease_heartbeat_renews_only_jobs_still_waiting(monkeypatch) -> None:
+    renewals: list[str] = []
+
+    async def fake_renew(queue: str, job_id: str, holder: str, lease_seconds: int) -> bool:
+        renewals.append(job_id)
+        return job_id != "job-lost"
+
+    monkeypatch.setattr(leases, "rpc_renew_job_lease", fake_renew)
+    pending = {"job-done", "job-waiting", "job-lost"}
+
+    async def scenario() -> None:
+        async with leases.batch_lease_heartbeat("notification_jobs", pending, "worker-a", 1):
+            pending.discard("job-done")
+            await asyncio.sleep(0.8)
+
+    asyncio.run(scenario())
+
+    assert renewals.count("job-waiting") == 2
+    assert renewals.count("job-lost") == 1
+    assert "job-done" not in renewals
+    assert pending == {"job-waiting"}
@@ -1,7 +1,8 @@
 import asyncio
+import time
 
 from app.notifications.emailer import EmailSendError
-from app.worker import notification_sender
+from app.worker import leases, notification_sender
 
 ORG_ID = "11111111-1111-1111-1111-111111111111"
 
@@ -14,7 +15,8 @@ def test_notification_sender_sends_digest_job(monkeypatch) -> None:
     sent_messages: list[dict[str, str]] = []
     audit_events: list[dict[str, object]] = []
 
-    async def fake_fetch_due(limit: int = 50):
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int):
+        assert queue == "notification_jobs"
         assert limit == 50
         return [
             {
@@ -36,20 +38,26 @@ def test_notification_sender_sends_digest_job(monkeypatch) -> None:
             }
         ]
 
-    async def fake_mark_running(job_id: str, attempts: int) -> None:
+    async def fake_mark_running(job_id: str, attempts: int, *, holder: str) -> bool:
+        assert holder == "worker"
         running_calls.append((job_id, attempts))
+        return True
 
-    async def fake_mark_sent(job_id: str, attempts: int) -> None:
+    async def fake_mark_sent(job_id: str, attempts: int, *, holder: str) -> bool:
+        assert holder == "worker"
         sent_calls.append((job_id, attempts))
+        return True
 
     async def fake_mark_failed(
         job_id: str,
         attempts: int,
         last_error: str | None,
         *,
+        holder: str,
         run_after: str | None = None,
         terminal: bool = False,
-    ) -> None:
+    ) -> bool:
+        assert holder == "worker"
         failed_calls.append(
             {
                 "job_id": job_id,
@@ -59,6 +67,7 @@ def test_notification_sender_sends_digest_job(monkeypatch) -> None:
                 "terminal": terminal,
             }
         )
+        return True
 
     def fake_send_email(*, to: str, subject: str, html: str, text: str, request_id: str | None = None) -> None:
         sent_messages.append(
@@ -82,7 +91,7 @@ def test_notification_sender_sends_digest_job(monkeypatch) -> None:
         event_rows.append(kwargs)
         return {"id": "event-1"}
 
-    monkeypatch.setattr(notification_sender, "fetch_due_notification_jobs", fake_fetch_due)
+    monkeypatch.setattr(notification_sender, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(notification_sender, "mark_notification_job_running", fake_mark_running)
     monkeypatch.setattr(notification_sender, "mark_notification_job_sent", fake_mark_sent)
     monkeypatch.setattr(notification_sender, "mark_notification_job_failed", fake_mark_failed)
@@ -115,7 +124,7 @@ def test_notification_sender_retries_on_email_failure(monkeypatch) -> None:
     failed_calls: list[dict[str, object]] = []
     event_rows: list[dict[str, object]] = []
 
-    async def fake_fetch_due(limit: int = 50):
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int):
         return [
             {
                 "id": "job-2",
@@ -136,20 +145,26 @@ def test_notification_sender_retries_on_email_failure(monkeypatch) -> None:
             }
         ]
 
-    async def fake_mark_running(job_id: str, attempts: int) -> None:
+    async def fake_mark_running(job_id: str, attempts: int, *, holder: str) -> bool:
+        assert holder == "worker"
         running_calls.append((job_id, attempts))
+        return True
 
-    async def fake_mark_sent(job_id: str, attempts: int) -> None:
+    async def fake_mark_sent(job_id: str, attempts: int, *, holder: str) -> bool:
+        assert holder == "worker"
         sent_calls.append((job_id, attempts))
+        return True
 
     async def fake_mark_failed(
         job_id: str,
         attempts: int,
         last_error: str | None,
         *,
+        holder: str,
         run_after: str | None = None,
         terminal: bool = False,
-    ) -> None:
+    ) -> bool:
+        assert holder == "worker"
         failed_calls.append(
             {
                 "job_id": job_id,
@@ -159,6 +174,7 @@ def test_notification_sender_retries_on_email_failure(monkeypatch) -> None:
                 "terminal": terminal,
             }
         )
+        return True
 
     def fake_send_email(*, to: str, subject: str, html: str, text: str, request_id: str | None = None) -> None:
         raise EmailSendError("smtp failure")
@@ -170,7 +186,7 @@ def test_notification_sender_retries_on_email_failure(monkeypatch) -> None:
         event_rows.append(kwargs)
         return {"id": "event-2"}
 
-    monkeypatch.setattr(notification_sender, "fetch_due_notification_jobs", fake_fetch_due)
+    monkeypatch.setattr(notification_sender, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(notification_sender, "mark_notification_job_running", fake_mark_running)
     monkeypatch.setattr(notification_sender, "mark_notification_job_sent", fake_mark_sent)
     monkeypatch.setattr(notification_sender, "mark_notification_job_failed", fake_mark_failed)
@@ -202,7 +218,7 @@ def test_notification_sender_handles_sla_job(monkeypatch) -> None:
     sent_messages: list[dict[str, str]] = []
     event_rows: list[dict[str, object]] = []
 
-    async def fake_fetch_due(limit: int = 50):
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int):
         return [
             {
                 "id": "job-3",
@@ -221,13 +237,17 @@ def test_notification_sender_handles_sla_job(monkeypatch) -> None:
             }
         ]
 
-    async def fake_mark_running(job_id: str, attempts: int) -> None:
+    async def fake_mark_running(job_id: str, attempts: int, *, holder: str) -> bool:
+        assert holder == "worker"
         running_calls.append((job_id, attempts))
+        return True
 
-    async def fake_mark_sent(job_id: str, attempts: int) -> None:
+    async def fake_mark_sent(job_id: str, attempts: int, *, holder: str) -> bool:
+        assert holder == "worker"
         sent_calls.append((job_id, attempts))
+        return True
 
-    async def fake_mark_failed(*args, **kwargs) -> None:
+    async def fake_mark_failed(*args, **kwargs) -> bool:
         raise AssertionError("SLA job should not fail in this test")
 
     async def fake_member_emails(org_id: str):
@@ -254,7 +274,7 @@ def test_notification_sender_handles_sla_job(monkeypatch) -> None:
         event_rows.append(kwargs)
         return {"id": "event-3"}
 
-    monkeypatch.setattr(notification_sender, "fetch_due_notification_jobs", fake_fetch_due)
+    monkeypatch.setattr(notification_sender, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(notification_sender, "mark_notification_job_running", fake_mark_running)
     monkeypatch.setattr(notification_sender, "mark_notification_job_sent", fake_mark_sent)
     monkeypatch.setattr(notification_sender, "mark_notification_job_failed", fake_mark_failed)
@@ -280,3 +300,87 @@ def test_notification_sender_handles_sla_job(monkeypatch) -> None:
     assert sent_messages[0]["to"] == "owner@example.com"
     assert sent_messages[0]["subject"].startswith("Overdue: Remediation task past due - ")
     assert [row["event_type"] for row in event_rows] == ["sla", "sla"]
+
+
+def test_notification_sender_keeps_the_batch_leased_and_skips_lost_jobs(monkeypatch) -> None:
+    lease_seconds = 1
+    owners = {"job-1": "worker", "job-2": "worker", "job-3": "worker"}
+    expires_at: dict[str, float] = {}
+    renewed: list[str] = []
+    sent_to: list[str] = []
+    sent_calls: list[str] = []
+
+    def _digest(job_id: str, email: str) -> dict[str, object]:
+        return {
+            "id": job_id,
+            "org_id": ORG_ID,
+            "type": "digest",
+            "attempts": 0,
+            "payload": {
+                "org_name": "Acme",
+                "recipient_targets": [{"user_id": "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa", "email": email}],
+                "dashboard_url": "https://app.verirule.com/dashboard",
+            },
+        }
+
+    def _holds(job_id: str, holder: str) -> bool:
+        return owners[job_id] == holder and expires_at[job_id] > time.monotonic()
+
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int):
+        for job_id in owners:
+            expires_at[job_id] = time.monotonic() + lease_seconds
+        return [_digest("job-1", "one@example.com"), _digest("job-2", "two@example.com"), _digest("job-3", "three@example.com")]
+
+    async def fake_renew(queue: str, job_id: str, holder: str, lease_seconds: int) -> bool:
+        if not _holds(job_id, holder):
+            return False
+        expires_at[job_id] = time.monotonic() + lease_seconds
+        renewed.append(job_id)
+        return True
+
+    async def fake_mark_running(job_id: str, attempts: int, *, holder: str) -> bool:
+        return _holds(job_id, holder)
+
+    async def fake_mark_sent(job_id: str, attempts: int, *, holder: str) -> bool:
+        sent_calls.append(job_id)
+        return _holds(job_id, holder)
+
+    async def fake_mark_failed(*args, **kwargs) -> bool:
+        raise AssertionError("no job should fail in this test")
+
+    def fake_send_email(*, to: str, subject: str, html: str, text: str, request_id: str | None = None) -> None:
+        sent_to.append(to)
+
+    async def fake_run_in_threadpool(func, *args, **kwargs):
+        if kwargs.get("to") == "one@example.com":
+            # A slow SMTP send that outlives the claim lease; meanwhile the
+            # lease on job-2 expires and another worker takes it.
+            owners["job-2"] = "worker-b"
+            await asyncio.sleep(lease_seconds * 1.5)
+        return func(*args, **kwargs)
+
+    async def fake_noop(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(notification_sender, "rpc_claim_jobs", fake_claim_jobs)
+    monkeypatch.setattr(leases, "rpc_renew_job_lease", fake_renew)
+    monkeypatch.setattr(notification_sender, "mark_notification_job_running", fake_mark_running)
+    monkeypatch.setattr(notification_sender, "mark_notification_job_sent", fake_mark_sent)
+    monkeypatch.setattr(notification_sender, "mark_notification_job_failed", fake_mark_failed)
+    monkeypatch.setattr(notification_sender, "send_email", fake_send_email)
+    monkeypatch.setattr(notification_sender, "run_in_threadpool", fake_run_in_threadpool)
+    monkeypatch.setattr(notification_sender, "rpc_record_audit_event", fake_noop)
+    monkeypatch.setattr(notification_sender, "upsert_notification_event_service", fake_noop)
+
+    sender = notification_sender.NotificationSender(
+        access_token="service-role-token", lease_seconds=lease_seconds
+    )
+    processed = asyncio.run(sender.process_queued_jobs_once())
+
+    # job-3 waited longer than its lease but was renewed; job-2 belongs to
+    # worker-b now, so it is neither sent nor marked by this worker.
+    assert processed == 2
+    assert sent_to == ["one@example.com", "three@example.com"]
+    assert sent_calls == ["job-1", "job-3"]
+    assert "job-3" in renewed
+    assert "job-2" not in renewed
@@ -12,7 +12,7 @@ EXPORT_ID = "44444444-4444-4444-4444-444444444444"
 def test_run_retry_schedules_next_attempt(monkeypatch) -> None:
     retries: list[dict[str, object]] = []
 
-    async def fake_select_queued(access_token: str, limit: int) -> list[dict[str, object]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
         return [
             {
                 "id": RUN_ID,
@@ -23,19 +23,18 @@ def test_run_retry_schedules_next_attempt(monkeypatch) -> None:
             }
         ]
 
-    async def fake_mark_started(run_id: str, attempts: int) -> None:
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
         assert run_id == RUN_ID
         assert attempts == 1
-
-    async def fake_set_state(access_token: str, payload: dict[str, str | None]) -> None:
-        assert payload["p_status"] == "running"
+        assert holder == "worker"
+        return True
 
     async def fake_select_source(access_token: str, source_id: str) -> dict[str, object] | None:
         return None
 
     async def fake_mark_retry(
-        run_id: str, attempts: int, next_attempt_at: str, last_error: str
-    ) -> None:
+        run_id: str, attempts: int, next_attempt_at: str, last_error: str, *, holder: str
+    ) -> bool:
         retries.append(
             {
                 "run_id": run_id,
@@ -44,13 +43,14 @@ def test_run_retry_schedules_next_attempt(monkeypatch) -> None:
                 "last_error": last_error,
             }
         )
+        assert holder == "worker"
+        return True
 
-    async def fake_dead_letter(run_id: str, attempts: int, last_error: str, failed_at: str) -> None:
+    async def fake_dead_letter(run_id: str, attempts: int, last_error: str, failed_at: str, *, holder: str) -> bool:
         raise AssertionError("dead-letter should not be called for attempt 1")
 
-    monkeypatch.setattr(run_processor, "select_queued_monitor_runs", fake_select_queued)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
-    monkeypatch.setattr(run_processor, "rpc_set_monitor_run_state", fake_set_state)
     monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
     monkeypatch.setattr(run_processor, "mark_monitor_run_for_retry", fake_mark_retry)
     monkeypatch.setattr(run_processor, "mark_monitor_run_dead_letter", fake_dead_letter)
@@ -68,7 +68,7 @@ def test_run_retry_schedules_next_attempt(monkeypatch) -> None:
 def test_run_dead_letter_after_five_attempts(monkeypatch) -> None:
     dead_letters: list[dict[str, object]] = []
 
-    async def fake_select_queued(access_token: str, limit: int) -> list[dict[str, object]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
         return [
             {
                 "id": RUN_ID,
@@ -79,21 +79,20 @@ def test_run_dead_letter_after_five_attempts(monkeypatch) -> None:
             }
         ]
 
-    async def fake_mark_started(run_id: str, attempts: int) -> None:
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
         assert attempts == 5
-
-    async def fake_set_state(access_token: str, payload: dict[str, str | None]) -> None:
-        assert payload["p_status"] == "running"
+        assert holder == "worker"
+        return True
 
     async def fake_select_source(access_token: str, source_id: str) -> dict[str, object] | None:
         return None
 
     async def fake_mark_retry(
-        run_id: str, attempts: int, next_attempt_at: str, last_error: str
-    ) -> None:
+        run_id: str, attempts: int, next_attempt_at: str, last_error: str, *, holder: str
+    ) -> bool:
         raise AssertionError("retry should not be scheduled after 5th attempt")
 
-    async def fake_dead_letter(run_id: str, attempts: int, last_error: str, failed_at: str) -> None:
+    async def fake_dead_letter(run_id: str, attempts: int, last_error: str, failed_at: str, *, holder: str) -> bool:
         dead_letters.append(
             {
                 "run_id": run_id,
@@ -102,10 +101,11 @@ def test_run_dead_letter_after_five_attempts(monkeypatch) -> None:
                 "failed_at": failed_at,
             }
         )
+        assert holder == "worker"
+        return True
 
-    monkeypatch.setattr(run_processor, "select_queued_monitor_runs", fake_select_queued)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
-    monkeypatch.setattr(run_processor, "rpc_set_monitor_run_state", fake_set_state)
     monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
     monkeypatch.setattr(run_processor, "mark_monitor_run_for_retry", fake_mark_retry)
     monkeypatch.setattr(run_processor, "mark_monitor_run_dead_letter", fake_dead_letter)
@@ -122,7 +122,7 @@ def test_run_dead_letter_after_five_attempts(monkeypatch) -> None:
 def test_export_dead_letter_after_five_attempts(monkeypatch) -> None:
     dead_letters: list[dict[str, object]] = []
 
-    async def fake_select_queued(limit: int = 3) -> list[dict[str, object]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
         return [
             {
                 "id": EXPORT_ID,
@@ -134,9 +134,11 @@ def test_export_dead_letter_after_five_attempts(monkeypatch) -> None:
             }
         ]
 
-    async def fake_mark_started(export_id: str, attempts: int) -> None:
+    async def fake_mark_started(export_id: str, attempts: int, *, holder: str) -> bool:
         assert export_id == EXPORT_ID
         assert attempts == 5
+        assert holder == "worker"
+        return True
 
     async def fake_select_packet(
         access_token: str, org_id: str, from_ts: str | None, to_ts: str | None
@@ -144,13 +146,13 @@ def test_export_dead_letter_after_five_attempts(monkeypatch) -> None:
         raise ValueError("packet failed")
 
     async def fake_retry(
-        export_id: str, attempts: int, next_attempt_at: str, last_error: str
-    ) -> None:
+        export_id: str, attempts: int, next_attempt_at: str, last_error: str, *, holder: str
+    ) -> bool:
         raise AssertionError("retry should not be scheduled after 5th attempt")
 
     async def fake_dead_letter(
-        export_id: str, attempts: int, last_error: str, completed_at: str
-    ) -> None:
+        export_id: str, attempts: int, last_error: str, completed_at: str, *, holder: str
+    ) -> bool:
         dead_letters.append(
             {
                 "export_id": export_id,
@@ -159,8 +161,10 @@ def test_export_dead_letter_after_five_attempts(monkeypatch) -> None:
                 "completed_at": completed_at,
             }
         )
+        assert holder == "worker"
+        return True
 
-    monkeypatch.setattr(export_processor, "select_queued_audit_exports_service", fake_select_queued)
+    monkeypatch.setattr(export_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(export_processor, "mark_audit_export_attempt_started", fake_mark_started)
     monkeypatch.setattr(export_processor, "select_audit_packet_data", fake_select_packet)
     monkeypatch.setattr(export_processor, "mark_audit_export_for_retry", fake_retry)
@@ -181,7 +185,7 @@ def test_export_dead_letter_after_five_attempts(monkeypatch) -> None:
 def test_export_retry_schedules_next_attempt(monkeypatch) -> None:
     retries: list[dict[str, object]] = []
 
-    async def fake_select_queued(limit: int = 3) -> list[dict[str, object]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
         return [
             {
                 "id": EXPORT_ID,
@@ -193,9 +197,11 @@ def test_export_retry_schedules_next_attempt(monkeypatch) -> None:
             }
         ]
 
-    async def fake_mark_started(export_id: str, attempts: int) -> None:
+    async def fake_mark_started(export_id: str, attempts: int, *, holder: str) -> bool:
         assert export_id == EXPORT_ID
         assert attempts == 1
+        assert holder == "worker"
+        return True
 
     async def fake_select_packet(
         access_token: str, org_id: str, from_ts: str | None, to_ts: str | None
@@ -203,8 +209,8 @@ def test_export_retry_schedules_next_attempt(monkeypatch) -> None:
         raise ValueError("packet failed")
 
     async def fake_retry(
-        export_id: str, attempts: int, next_attempt_at: str, last_error: str
-    ) -> None:
+        export_id: str, attempts: int, next_attempt_at: str, last_error: str, *, holder: str
+    ) -> bool:
         retries.append(
             {
                 "export_id": export_id,
@@ -213,13 +219,15 @@ def test_export_retry_schedules_next_attempt(monkeypatch) -> None:
                 "last_error": last_error,
             }
         )
+        assert holder == "worker"
+        return True
 
     async def fake_dead_letter(
-        export_id: str, attempts: int, last_error: str, completed_at: str
-    ) -> None:
+        export_id: str, attempts: int, last_error: str, completed_at: str, *, holder: str
+    ) -> bool:
         raise AssertionError("dead-letter should not be called for attempt 1")
 
-    monkeypatch.setattr(export_processor, "select_queued_audit_exports_service", fake_select_queued)
+    monkeypatch.setattr(export_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(export_processor, "mark_audit_export_attempt_started", fake_mark_started)
     monkeypatch.setattr(export_processor, "select_audit_packet_data", fake_select_packet)
     monkeypatch.setattr(export_processor, "mark_audit_export_for_retry", fake_retry)
@@ -321,14 +329,14 @@ def test_worker_heartbeat_upsert_called(monkeypatch) -> None:
     assert upserts[0][0] == "worker"
 
 
-def test_worker_tick_skips_processors_when_lock_not_acquired(monkeypatch) -> None:
-    class FailIfCalledMonitor:
+def test_worker_tick_skips_locked_processors_but_drains_claimed_queues(monkeypatch) -> None:
+    class FakeMonitorProcessor:
         async def run_once(self, *, queue_limit: int = 10, process_limit: int = 5) -> dict[str, int]:
-            raise AssertionError("monitor processor should be skipped")
+            return {"due_sources": 1, "runs_queued": 1, "runs_processed": 3}
 
-    class FailIfCalledExport:
+    class FakeExportProcessor:
         async def run_once(self, *, limit: int = 3) -> int:
-            raise AssertionError("export processor should be skipped")
+            return 2
 
     class FailIfCalledAlertTask:
         async def run_once(self, *, limit: int = 25) -> int:
@@ -346,9 +354,9 @@ def test_worker_tick_skips_processors_when_lock_not_acquired(monkeypatch) -> Non
         async def run_once(self) -> int:
             raise AssertionError("sla processor should be skipped")
 
-    class FailIfCalledNotificationSender:
+    class FakeNotificationSender:
         async def run_once(self) -> int:
-            raise AssertionError("notification sender should be skipped")
+            return 4
 
     async def fake_rpc_acquire_worker_lock(key: str, holder: str, ttl_seconds: int) -> bool:
         assert key.startswith("worker:")
@@ -360,13 +368,13 @@ def test_worker_tick_skips_processors_when_lock_not_acquired(monkeypatch) -> Non
 
     payload = asyncio.run(
         app_main.run_worker_tick(
-            FailIfCalledMonitor(),  # type: ignore[arg-type]
-            FailIfCalledExport(),  # type: ignore[arg-type]
+            FakeMonitorProcessor(),  # type: ignore[arg-type]
+            FakeExportProcessor(),  # type: ignore[arg-type]
             FailIfCalledAlertTask(),  # type: ignore[arg-type]
             FailIfCalledReadiness(),  # type: ignore[arg-type]
             FailIfCalledDigest(),  # type: ignore[arg-type]
             FailIfCalledSla(),  # type: ignore[arg-type]
-            FailIfCalledNotificationSender(),  # type: ignore[arg-type]
+            FakeNotificationSender(),  # type: ignore[arg-type]
             run_batch_limit=5,
             heartbeat_enabled=False,
             lock_holder="alloc-2:999",
@@ -374,13 +382,13 @@ def test_worker_tick_skips_processors_when_lock_not_acquired(monkeypatch) -> Non
         )
     )
 
-    assert payload["runs_processed"] == 0
-    assert payload["exports_processed"] == 0
+    assert payload["runs_processed"] == 3
+    assert payload["exports_processed"] == 2
     assert payload["alert_tasks_processed"] == 0
-    assert payload["runs_queued"] == 0
-    assert payload["due_sources"] == 0
+    assert payload["runs_queued"] == 1
+    assert payload["due_sources"] == 1
     assert payload["readiness_computed"] == 0
     assert payload["digests_sent"] == 0
     assert payload["sla_escalations_queued"] == 0
-    assert payload["notification_emails_sent"] == 0
+    assert payload["notification_emails_sent"] == 4
     assert payload["errors"] == 0
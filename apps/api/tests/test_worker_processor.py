@@ -1,9 +1,15 @@
 import asyncio
+import base64
 import hashlib
+import json
+import zlib
 from datetime import UTC, datetime
 
-from app.worker import run_processor
+from app.core.content_masks import masked_text_fingerprint
+from app.worker import fetch_engine, github_api, run_processor
+from app.worker.adapters import github_releases
 from app.worker.adapters.base import AdapterResult
+from app.worker.github_api import GitHubRateLimited
 
 ORG_ID = "11111111-1111-1111-1111-111111111111"
 SOURCE_ID = "22222222-2222-2222-2222-222222222222"
@@ -13,21 +19,15 @@ ALERT_ID = "55555555-5555-5555-5555-555555555555"
 
 
 def test_process_run_creates_explanation_when_content_changes(monkeypatch) -> None:
-    run_state_updates: list[dict[str, str | None]] = []
-    inserted_explanations: list[dict[str, object]] = []
-    immediate_calls: list[dict[str, str]] = []
+    completions: list[dict[str, object]] = []
 
-    async def fake_select_queued(access_token: str, limit: int) -> list[dict[str, str]]:
-        assert access_token == "worker-token"
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, str]]:
+        assert queue == "monitor_runs"
         assert limit == 5
         return [
             {"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}
         ]
 
-    async def fake_set_state(access_token: str, payload: dict[str, str | None]) -> None:
-        assert access_token == "worker-token"
-        run_state_updates.append(payload)
-
     async def fake_select_source(access_token: str, source_id: str) -> dict[str, object] | None:
         assert access_token == "worker-token"
         assert source_id == SOURCE_ID
@@ -57,7 +57,7 @@ def test_process_run_creates_explanation_when_content_changes(monkeypatch) -> No
     class FakeAdapter:
         async def fetch(self, source, prev_snapshot):
             assert source.url == "https://example.com/policy"
-            assert prev_snapshot is not None
+            assert source.etag is None
             return AdapterResult(
                 canonical_title="Policy",
                 canonical_text="new text preview",
@@ -82,92 +82,63 @@ def test_process_run_creates_explanation_when_content_changes(monkeypatch) -> No
             "citations": [{"quote": "new text", "context": "@@ -1 +1 @@"}],
         }
 
-    async def fake_set_source_metadata(access_token: str, payload: dict[str, object]) -> None:
-        assert access_token == "worker-token"
-        assert payload["p_source_id"] == SOURCE_ID
-        assert payload["p_etag"] == '"new-etag"'
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append({"run_id": run_id, "fetch": fetch, "snapshot": snapshot, "finding": finding})
+        return {"run_id": run_id, "finding_id": FINDING_ID, "alert_id": ALERT_ID}
 
-    async def fake_insert_snapshot(access_token: str, payload: dict[str, object]) -> str:
-        assert access_token == "worker-token"
-        assert payload["p_run_id"] == RUN_ID
-        assert payload["p_http_status"] == 200
-        assert payload["p_canonical_text"] == "new text preview"
-        assert payload["p_canonical_title"] == "Policy"
-        return "snapshot-id"
-
-    async def fake_upsert_finding(access_token: str, payload: dict[str, object]) -> str:
-        assert access_token == "worker-token"
-        assert payload["p_raw_hash"]
-        return FINDING_ID
-
-    async def fake_insert_explanation(access_token: str, payload: dict[str, object]) -> str:
-        assert access_token == "worker-token"
-        inserted_explanations.append(payload)
-        return "explanation-id"
-
-    async def fake_upsert_alert(access_token: str, payload: dict[str, str]) -> dict[str, object]:
-        assert access_token == "worker-token"
-        assert payload == {"p_org_id": ORG_ID, "p_finding_id": FINDING_ID}
-        return {"id": ALERT_ID, "created": True}
-
-    async def fake_append_audit(access_token: str, payload: dict[str, object]) -> None:
-        assert access_token == "worker-token"
-        assert payload["p_org_id"] == ORG_ID
-
-    async def fake_mark_started(run_id: str, attempts: int) -> None:
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
         assert run_id == RUN_ID
         assert attempts == 1
+        assert holder == "worker"
+        return True
 
-    async def fake_clear_retry_state(run_id: str) -> None:
-        assert run_id == RUN_ID
-
-    async def fake_enqueue_immediate(self, *, org_id: str, alert_id: str, severity: str) -> None:
-        immediate_calls.append({"org_id": org_id, "alert_id": alert_id, "severity": severity})
-
-    monkeypatch.setattr(run_processor, "select_queued_monitor_runs", fake_select_queued)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
-    monkeypatch.setattr(run_processor, "clear_monitor_run_error_state", fake_clear_retry_state)
-    monkeypatch.setattr(run_processor, "rpc_set_monitor_run_state", fake_set_state)
     monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
     monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
     monkeypatch.setattr(run_processor, "get_adapter", fake_get_adapter)
     monkeypatch.setattr(run_processor, "build_explanation", fake_build_explanation)
-    monkeypatch.setattr(run_processor, "rpc_set_source_fetch_metadata", fake_set_source_metadata)
-    monkeypatch.setattr(run_processor, "rpc_insert_snapshot_v3", fake_insert_snapshot)
-    monkeypatch.setattr(run_processor, "rpc_upsert_finding", fake_upsert_finding)
-    monkeypatch.setattr(run_processor, "rpc_insert_finding_explanation", fake_insert_explanation)
-    monkeypatch.setattr(run_processor, "rpc_upsert_alert_for_finding", fake_upsert_alert)
-    monkeypatch.setattr(run_processor, "rpc_append_audit", fake_append_audit)
-    monkeypatch.setattr(
-        run_processor.MonitorRunProcessor,
-        "_enqueue_immediate_alert_if_needed",
-        fake_enqueue_immediate,
-    )
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
 
     processor = run_processor.MonitorRunProcessor(access_token="worker-token")
     processed_count = asyncio.run(processor.process_queued_runs_once(limit=5))
 
     assert processed_count == 1
-    assert run_state_updates[0]["p_status"] == "running"
-    assert run_state_updates[-1]["p_status"] == "succeeded"
-    assert len(inserted_explanations) == 1
-    assert inserted_explanations[0]["p_finding_id"] == FINDING_ID
-    assert immediate_calls == [{"org_id": ORG_ID, "alert_id": ALERT_ID, "severity": "medium"}]
+    assert len(completions) == 1
+    completion = completions[0]
+    assert completion["run_id"] == RUN_ID
+    assert completion["fetch"] == {
+        "etag": '"new-etag"',
+        "last_modified": "Thu, 11 Feb 2026 00:00:00 GMT",
+        "content_type": "text/html",
+    }
+    assert completion["snapshot"]["http_status"] == 200
+    assert "canonical_text" not in completion["snapshot"]
+    assert completion["snapshot"]["text_hash"] == hashlib.sha256(b"new text preview").hexdigest()
+    assert completion["snapshot"]["text_encoding"] == "zlib"
+    assert zlib.decompress(base64.b64decode(completion["snapshot"]["text_body"])) == b"new text preview"
+    assert completion["snapshot"]["canonical_title"] == "Policy"
+    new_fingerprint = hashlib.sha256(b"new text preview").hexdigest()
+    assert completion["finding"] == {
+        "title": "Source content changed",
+        "summary": "The source updated one section with a policy change.",
+        "severity": "medium",
+        "fingerprint": hashlib.sha256(f"{SOURCE_ID}:{new_fingerprint}".encode()).hexdigest(),
+        "raw_url": "https://example.com/policy",
+        "raw_hash": new_fingerprint,
+        "diff_preview": "@@ -1 +1 @@",
+        "citations": [{"quote": "new text", "context": "@@ -1 +1 @@"}],
+    }
 
 
 def test_process_run_handles_304_without_finding(monkeypatch) -> None:
-    run_state_updates: list[dict[str, str | None]] = []
-    insert_snapshot_calls = 0
-    upsert_finding_calls = 0
+    completions: list[dict[str, object]] = []
 
-    async def fake_select_queued(access_token: str, limit: int) -> list[dict[str, str]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, str]]:
         return [
             {"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}
         ]
 
-    async def fake_set_state(access_token: str, payload: dict[str, str | None]) -> None:
-        run_state_updates.append(payload)
-
     async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
         return {
             "id": SOURCE_ID,
@@ -181,7 +152,7 @@ def test_process_run_handles_304_without_finding(monkeypatch) -> None:
         }
 
     async def fake_select_latest_snapshot(access_token: str, source_id: str) -> dict[str, str]:
-        return {"etag": '"old-etag"', "last_modified": "Wed, 10 Feb 2026 00:00:00 GMT"}
+        return {"id": "snapshot-1", "etag": '"old-etag"', "last_modified": "Wed, 10 Feb 2026 00:00:00 GMT"}
 
     class FakeAdapter:
         async def fetch(self, source, prev_snapshot):
@@ -198,62 +169,55 @@ def test_process_run_handles_304_without_finding(monkeypatch) -> None:
     def fake_get_adapter(kind: str):
         return FakeAdapter()
 
-    async def fake_set_source_metadata(access_token: str, payload: dict[str, object]) -> None:
-        return None
-
-    async def fake_insert_snapshot(access_token: str, payload: dict[str, object]) -> str:
-        nonlocal insert_snapshot_calls
-        insert_snapshot_calls += 1
-        return "snapshot-id"
-
-    async def fake_upsert_finding(access_token: str, payload: dict[str, object]) -> str:
-        nonlocal upsert_finding_calls
-        upsert_finding_calls += 1
-        return FINDING_ID
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append(
+            {"run_id": run_id, "fetch": fetch, "snapshot": snapshot, "finding": finding, "touch": touch}
+        )
+        return {"run_id": run_id}
 
-    async def fake_mark_started(run_id: str, attempts: int) -> None:
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
         assert run_id == RUN_ID
         assert attempts == 1
+        assert holder == "worker"
+        return True
 
-    async def fake_clear_retry_state(run_id: str) -> None:
-        assert run_id == RUN_ID
-
-    monkeypatch.setattr(run_processor, "select_queued_monitor_runs", fake_select_queued)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
-    monkeypatch.setattr(run_processor, "clear_monitor_run_error_state", fake_clear_retry_state)
-    monkeypatch.setattr(run_processor, "rpc_set_monitor_run_state", fake_set_state)
     monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
     monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
     monkeypatch.setattr(run_processor, "get_adapter", fake_get_adapter)
-    monkeypatch.setattr(run_processor, "rpc_set_source_fetch_metadata", fake_set_source_metadata)
-    monkeypatch.setattr(run_processor, "rpc_insert_snapshot_v3", fake_insert_snapshot)
-    monkeypatch.setattr(run_processor, "rpc_upsert_finding", fake_upsert_finding)
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
 
     processor = run_processor.MonitorRunProcessor(access_token="worker-token")
     processed_count = asyncio.run(processor.process_queued_runs_once(limit=5))
 
     assert processed_count == 1
-    assert run_state_updates[0]["p_status"] == "running"
-    assert run_state_updates[-1]["p_status"] == "succeeded"
-    assert insert_snapshot_calls == 0
-    assert upsert_finding_calls == 0
+    assert completions == [
+        {
+            "run_id": RUN_ID,
+            "fetch": {
+                "etag": '"old-etag"',
+                "last_modified": "Wed, 10 Feb 2026 00:00:00 GMT",
+                "content_type": "text/html",
+            },
+            "snapshot": None,
+            "finding": None,
+            "touch": {"snapshot_id": "snapshot-1", "http_status": 304},
+        }
+    ]
 
 
 def test_process_run_uses_service_role_for_writes(monkeypatch) -> None:
     read_token = "worker-read-token"
     write_token = "service-role-token"
     called_read_tokens: list[str] = []
-    called_write_tokens: list[str] = []
+    completions: list[dict[str, object]] = []
 
-    async def fake_select_queued(access_token: str, limit: int) -> list[dict[str, str]]:
-        called_read_tokens.append(access_token)
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, str]]:
         return [
             {"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}
         ]
 
-    async def fake_set_state(access_token: str, payload: dict[str, str | None]) -> None:
-        called_write_tokens.append(access_token)
-
     async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
         called_read_tokens.append(access_token)
         return {
@@ -289,29 +253,22 @@ def test_process_run_uses_service_role_for_writes(monkeypatch) -> None:
     def fake_get_adapter(kind: str):
         return FakeAdapter()
 
-    async def fake_set_source_metadata(access_token: str, payload: dict[str, object]) -> None:
-        called_write_tokens.append(access_token)
-
-    async def fake_insert_snapshot(access_token: str, payload: dict[str, object]) -> str:
-        called_write_tokens.append(access_token)
-        return "snapshot-id"
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append({"holder": holder, "snapshot": snapshot, "finding": finding})
+        return {"run_id": run_id}
 
-    async def fake_mark_started(run_id: str, attempts: int) -> None:
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
         assert run_id == RUN_ID
         assert attempts == 1
+        assert holder == "worker"
+        return True
 
-    async def fake_clear_retry_state(run_id: str) -> None:
-        assert run_id == RUN_ID
-
-    monkeypatch.setattr(run_processor, "select_queued_monitor_runs", fake_select_queued)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
-    monkeypatch.setattr(run_processor, "clear_monitor_run_error_state", fake_clear_retry_state)
-    monkeypatch.setattr(run_processor, "rpc_set_monitor_run_state", fake_set_state)
     monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
     monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
     monkeypatch.setattr(run_processor, "get_adapter", fake_get_adapter)
-    monkeypatch.setattr(run_processor, "rpc_set_source_fetch_metadata", fake_set_source_metadata)
-    monkeypatch.setattr(run_processor, "rpc_insert_snapshot_v3", fake_insert_snapshot)
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
 
     processor = run_processor.MonitorRunProcessor(
         access_token=read_token,
@@ -321,22 +278,21 @@ def test_process_run_uses_service_role_for_writes(monkeypatch) -> None:
 
     assert processed_count == 1
     assert called_read_tokens
-    assert called_write_tokens
     assert all(token == read_token for token in called_read_tokens)
-    assert all(token == write_token for token in called_write_tokens)
+    assert len(completions) == 1
+    assert completions[0]["holder"] == "worker"
+    assert completions[0]["snapshot"] is not None
+    assert completions[0]["finding"] is None
 
 
 def test_process_run_rss_item_id_dedupes(monkeypatch) -> None:
-    snapshot_insert_calls = 0
+    completions: list[dict[str, object]] = []
 
-    async def fake_select_queued(access_token: str, limit: int) -> list[dict[str, str]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, str]]:
         return [
             {"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}
         ]
 
-    async def fake_set_state(access_token: str, payload: dict[str, str | None]) -> None:
-        return None
-
     async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
         return {
             "id": SOURCE_ID,
@@ -351,6 +307,7 @@ def test_process_run_rss_item_id_dedupes(monkeypatch) -> None:
 
     async def fake_select_latest_snapshot(access_token: str, source_id: str) -> dict[str, object]:
         return {
+            "id": "snapshot-1",
             "item_id": "same-item",
             "text_fingerprint": "old-fingerprint",
             "canonical_text": "old",
@@ -373,48 +330,39 @@ def test_process_run_rss_item_id_dedupes(monkeypatch) -> None:
         assert kind == "rss"
         return FakeAdapter()
 
-    async def fake_set_source_metadata(access_token: str, payload: dict[str, object]) -> None:
-        return None
-
-    async def fake_insert_snapshot(access_token: str, payload: dict[str, object]) -> str:
-        nonlocal snapshot_insert_calls
-        snapshot_insert_calls += 1
-        return "snapshot-id"
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append({"snapshot": snapshot, "finding": finding, "touch": touch})
+        return {"run_id": run_id}
 
-    async def fake_mark_started(run_id: str, attempts: int) -> None:
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
         assert attempts == 1
+        assert holder == "worker"
+        return True
 
-    async def fake_clear_retry_state(run_id: str) -> None:
-        return None
-
-    monkeypatch.setattr(run_processor, "select_queued_monitor_runs", fake_select_queued)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
-    monkeypatch.setattr(run_processor, "clear_monitor_run_error_state", fake_clear_retry_state)
-    monkeypatch.setattr(run_processor, "rpc_set_monitor_run_state", fake_set_state)
     monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
     monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
     monkeypatch.setattr(run_processor, "get_adapter", fake_get_adapter)
-    monkeypatch.setattr(run_processor, "rpc_set_source_fetch_metadata", fake_set_source_metadata)
-    monkeypatch.setattr(run_processor, "rpc_insert_snapshot_v3", fake_insert_snapshot)
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
 
     processor = run_processor.MonitorRunProcessor(access_token="worker-token")
     processed_count = asyncio.run(processor.process_queued_runs_once(limit=5))
 
     assert processed_count == 1
-    assert snapshot_insert_calls == 0
+    assert completions == [
+        {"snapshot": None, "finding": None, "touch": {"snapshot_id": "snapshot-1", "http_status": 200}}
+    ]
 
 
 def test_process_run_rss_stores_item_id(monkeypatch) -> None:
-    inserted_snapshot_payloads: list[dict[str, object]] = []
+    completions: list[dict[str, object]] = []
 
-    async def fake_select_queued(access_token: str, limit: int) -> list[dict[str, str]]:
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, str]]:
         return [
             {"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}
         ]
 
-    async def fake_set_state(access_token: str, payload: dict[str, str | None]) -> None:
-        return None
-
     async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
         return {
             "id": SOURCE_ID,
@@ -446,154 +394,594 @@ def test_process_run_rss_stores_item_id(monkeypatch) -> None:
     def fake_get_adapter(kind: str):
         return FakeAdapter()
 
-    async def fake_set_source_metadata(access_token: str, payload: dict[str, object]) -> None:
-        return None
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append({"snapshot": snapshot, "finding": finding})
+        return {"run_id": run_id, "finding_id": FINDING_ID, "alert_id": ALERT_ID}
 
-    async def fake_insert_snapshot(access_token: str, payload: dict[str, object]) -> str:
-        inserted_snapshot_payloads.append(payload)
-        return "snapshot-id"
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
+        assert attempts == 1
+        assert holder == "worker"
+        return True
 
-    async def fake_upsert_finding(access_token: str, payload: dict[str, object]) -> str:
-        return FINDING_ID
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
+    monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
+    monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
+    monkeypatch.setattr(run_processor, "get_adapter", fake_get_adapter)
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
 
-    async def fake_insert_explanation(access_token: str, payload: dict[str, object]) -> str:
-        return "exp-id"
+    processor = run_processor.MonitorRunProcessor(access_token="worker-token")
+    processed_count = asyncio.run(processor.process_queued_runs_once(limit=5))
 
-    async def fake_alert(access_token: str, payload: dict[str, str]) -> dict[str, object]:
-        return {"id": ALERT_ID}
+    assert processed_count == 1
+    assert len(completions) == 1
+    assert completions[0]["snapshot"]["item_id"] == "entry-123"
+    assert completions[0]["snapshot"]["canonical_title"] == "Post"
+    assert completions[0]["snapshot"]["item_published_at"] == "2026-02-12T00:00:00+00:00"
+    assert completions[0]["finding"] is not None
 
-    async def fake_audit(access_token: str, payload: dict[str, object]) -> None:
-        return None
 
-    async def fake_mark_started(run_id: str, attempts: int) -> None:
-        assert attempts == 1
+def test_run_once_schedules_due_sources_with_single_enqueue_call(monkeypatch) -> None:
+    enqueue_limits: list[int] = []
 
-    async def fake_clear_retry_state(run_id: str) -> None:
-        return None
+    async def fake_enqueue_due_runs(*, limit: int) -> dict[str, int]:
+        enqueue_limits.append(limit)
+        return {"due_sources": 40, "runs_queued": 25}
+
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int):
+        assert queue == "monitor_runs"
+        return []
+
+    monkeypatch.setattr(run_processor, "rpc_enqueue_due_runs", fake_enqueue_due_runs)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+
+    processor = run_processor.MonitorRunProcessor(access_token="worker-token")
+    metrics = asyncio.run(processor.run_once(queue_limit=25, process_limit=5))
+
+    assert enqueue_limits == [25]
+    assert metrics == {"due_sources": 40, "runs_queued": 25, "runs_processed": 0}
+
+
+def test_process_queued_runs_overlaps_fetches_within_global_and_host_caps(monkeypatch) -> None:
+    runs = [
+        {
+            "id": f"run-{index}",
+            "org_id": ORG_ID,
+            "source_id": f"source-{index}",
+            "status": "queued",
+            "attempts": 0,
+        }
+        for index in range(8)
+    ]
+    hosts = {
+        f"source-{index}": "slow.example.com" if index < 5 else f"host-{index}.example.com"
+        for index in range(8)
+    }
+    in_flight: dict[str, int] = {"total": 0}
+    peaks: dict[str, int] = {"total": 0}
+    completed: list[str] = []
+
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
+        return runs
+
+    async def mark_started(*args, **kwargs) -> bool:
+        return True
+
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completed.append(run_id)
+        return {"run_id": run_id}
+
+    async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
+        return {
+            "id": source_id,
+            "org_id": ORG_ID,
+            "kind": "html",
+            "config": {},
+            "url": f"https://{hosts[source_id]}/{source_id}",
+            "is_enabled": True,
+        }
 
-    async def fake_enqueue_immediate(self, *, org_id: str, alert_id: str, severity: str) -> None:
+    async def fake_select_latest_snapshot(access_token: str, source_id: str) -> None:
         return None
 
-    monkeypatch.setattr(run_processor, "select_queued_monitor_runs", fake_select_queued)
+    class SlowAdapter:
+        async def fetch(self, source, prev_snapshot):
+            host = source.url.split("/")[2]
+            in_flight["total"] += 1
+            engine = fetch_engine.get_fetch_engine()
+            assert engine is not None
+            async with engine.request_slot(source.url):
+                in_flight[host] = in_flight.get(host, 0) + 1
+                peaks["total"] = max(peaks["total"], in_flight["total"])
+                peaks[host] = max(peaks.get(host, 0), in_flight[host])
+                await asyncio.sleep(0.01)
+                in_flight[host] -= 1
+            in_flight["total"] -= 1
+            return AdapterResult(http_status=304, fetched_url=source.url)
+
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", mark_started)
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
+    monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
+    monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
+    monkeypatch.setattr(run_processor, "get_adapter", lambda kind: SlowAdapter())
+
+    processor = run_processor.MonitorRunProcessor(access_token="worker-token", max_concurrent_runs=4)
+
+    async def scenario() -> int:
+        async with fetch_engine.fetch_engine_lifespan(per_host_concurrency=2, per_host_rate_per_second=0):
+            return await processor.process_queued_runs_once(limit=8)
+
+    processed_count = asyncio.run(scenario())
+
+    assert processed_count == 8
+    assert 1 < peaks["total"] <= 4
+    assert peaks["slow.example.com"] == 2
+    assert sorted(completed) == sorted(str(run["id"]) for run in runs)
+
+
+def test_process_run_skips_finding_when_only_masked_content_changed(monkeypatch) -> None:
+    completions: list[dict[str, object]] = []
+    config = {"mask_builtins": ["timestamps"]}
+    previous_text = "Rule 7 applies.\nLast generated 09:14:55 UTC"
+
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, str]]:
+        return [{"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}]
+
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
+        assert holder == "worker"
+        return True
+
+    async def fake_select_source(access_token: str, source_id: str) -> dict[str, object] | None:
+        return {
+            "id": SOURCE_ID,
+            "org_id": ORG_ID,
+            "kind": "html",
+            "config": config,
+            "url": "https://example.com/policy",
+            "is_enabled": True,
+        }
+
+    async def fake_select_latest_snapshot(access_token: str, source_id: str) -> dict[str, str] | None:
+        fingerprint = masked_text_fingerprint(config, previous_text)
+        return {
+            "id": "snapshot-1",
+            "content_hash": fingerprint,
+            "text_fingerprint": fingerprint,
+            "canonical_text": previous_text,
+        }
+
+    async def fake_fetch_url(*args, sink=None, **kwargs) -> dict[str, object]:
+        sink.begin("text/html")
+        sink.write(b"<p>Rule 7 applies.</p><footer>Last generated 11:02:07 UTC</footer>")
+        return {"status": 200, "content_type": "text/html", "fetched_url": "https://example.com/policy"}
+
+    def fail_build_explanation(prev_text: str, new_text: str) -> dict[str, object]:
+        raise AssertionError("explanation must not be built for masked-only changes")
+
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append({"snapshot": snapshot, "finding": finding, "touch": touch})
+        return {"run_id": run_id}
+
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
     monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
-    monkeypatch.setattr(run_processor, "clear_monitor_run_error_state", fake_clear_retry_state)
-    monkeypatch.setattr(run_processor, "rpc_set_monitor_run_state", fake_set_state)
     monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
     monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
-    monkeypatch.setattr(run_processor, "get_adapter", fake_get_adapter)
-    monkeypatch.setattr(run_processor, "rpc_set_source_fetch_metadata", fake_set_source_metadata)
-    monkeypatch.setattr(run_processor, "rpc_insert_snapshot_v3", fake_insert_snapshot)
-    monkeypatch.setattr(run_processor, "rpc_upsert_finding", fake_upsert_finding)
-    monkeypatch.setattr(run_processor, "rpc_insert_finding_explanation", fake_insert_explanation)
-    monkeypatch.setattr(run_processor, "rpc_upsert_alert_for_finding", fake_alert)
-    monkeypatch.setattr(run_processor, "rpc_append_audit", fake_audit)
-    monkeypatch.setattr(
-        run_processor.MonitorRunProcessor,
-        "_enqueue_immediate_alert_if_needed",
-        fake_enqueue_immediate,
-    )
+    monkeypatch.setattr("app.worker.adapters.html.fetch_url", fake_fetch_url)
+    monkeypatch.setattr(run_processor, "build_explanation", fail_build_explanation)
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
 
     processor = run_processor.MonitorRunProcessor(access_token="worker-token")
-    processed_count = asyncio.run(processor.process_queued_runs_once(limit=5))
+    asyncio.run(processor.process_queued_runs_once(limit=5))
 
-    assert processed_count == 1
-    assert len(inserted_snapshot_payloads) == 1
-    assert inserted_snapshot_payloads[0]["p_item_id"] == "entry-123"
-    assert inserted_snapshot_payloads[0]["p_canonical_title"] == "Post"
+    # Unchanged in substance: no finding and no new snapshot row, only a
+    # check recorded on the latest snapshot.
+    assert completions == [
+        {"snapshot": None, "finding": None, "touch": {"snapshot_id": "snapshot-1", "http_status": 200}}
+    ]
 
 
-def test_queue_due_sources_once_queues_single_run_with_safety_window(monkeypatch) -> None:
-    due_sources = [
-        {"id": SOURCE_ID, "org_id": ORG_ID, "next_run_at": "2026-02-11T00:00:00Z"},
-        {"id": "77777777-7777-7777-7777-777777777777", "org_id": ORG_ID, "next_run_at": "2026-02-11T00:00:00Z"},
-    ]
-    queued_payloads: list[dict[str, str]] = []
-    scheduled_payloads: list[dict[str, str]] = []
+def test_process_run_caches_latest_snapshot_and_loads_text_only_on_change(monkeypatch) -> None:
+    snapshot_selects: list[str] = []
+    text_selects: list[str] = []
+    completions: list[dict[str, object]] = []
+    bodies = iter(["Rule v2", "Rule v2", "Rule v2"])
+    completion_results = iter(
+        [
+            {"snapshot_id": "snapshot-2"},
+            {"snapshot_id": "snapshot-2"},
+            {"snapshot_id": None, "stale_snapshot": True},
+            {"snapshot_id": "snapshot-4"},
+        ]
+    )
 
-    async def fake_select_due(access_token: str, org_id: str | None = None) -> list[dict[str, str]]:
-        assert access_token == "worker-token"
-        assert org_id is None
-        return due_sources
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, str]]:
+        return [{"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}]
 
-    async def fake_select_recent_active(
-        access_token: str, source_id: str, created_after_iso: str
-    ) -> list[dict[str, str]]:
-        assert access_token == "worker-token"
-        assert created_after_iso.endswith("Z")
-        if source_id == SOURCE_ID:
-            return [{"id": RUN_ID, "source_id": SOURCE_ID, "status": "queued"}]
-        return []
+    async def fake_mark_started(*args, **kwargs) -> bool:
+        return True
 
-    async def fake_create_run(access_token: str, payload: dict[str, str]) -> str:
-        assert access_token == "worker-token"
-        queued_payloads.append(payload)
-        return "run-created"
+    async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
+        return {"id": SOURCE_ID, "org_id": ORG_ID, "kind": "html", "url": "https://example.com/policy"}
 
-    async def fake_schedule_next(access_token: str, payload: dict[str, str]) -> None:
-        assert access_token == "worker-token"
-        scheduled_payloads.append(payload)
+    async def fake_select_latest_snapshot(access_token: str, source_id: str) -> dict[str, str]:
+        snapshot_selects.append(source_id)
+        if len(snapshot_selects) == 1:
+            return {"id": "snapshot-1", "text_fingerprint": hashlib.sha256(b"Rule v1").hexdigest()}
+        return {"id": "snapshot-3", "text_fingerprint": hashlib.sha256(b"Rule v3").hexdigest()}
+
+    async def fake_select_snapshot_text(access_token: str, snapshot_id: str) -> str:
+        text_selects.append(snapshot_id)
+        return "Rule v1" if snapshot_id == "snapshot-1" else "Rule v3"
+
+    class FakeAdapter:
+        async def fetch(self, source, prev_snapshot):
+            return AdapterResult(canonical_text=next(bodies), http_status=200, fetched_url=source.url)
+
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append({"snapshot": snapshot is not None, "finding": finding is not None, "touch": touch})
+        return {"run_id": run_id, **next(completion_results)}
 
-    monkeypatch.setattr(run_processor, "select_due_sources", fake_select_due)
-    monkeypatch.setattr(
-        run_processor,
-        "select_recent_active_monitor_runs_for_source",
-        fake_select_recent_active,
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
+    monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
+    monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
+    monkeypatch.setattr(run_processor, "select_snapshot_text", fake_select_snapshot_text)
+    monkeypatch.setattr(run_processor, "get_adapter", lambda kind: FakeAdapter())
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
+
+    processor = run_processor.MonitorRunProcessor(
+        access_token="worker-token", shared_fetch_window_seconds=0
     )
-    monkeypatch.setattr(run_processor, "rpc_create_monitor_run", fake_create_run)
-    monkeypatch.setattr(run_processor, "rpc_schedule_next_run", fake_schedule_next)
 
-    processor = run_processor.MonitorRunProcessor(access_token="worker-token")
-    queued_count = asyncio.run(processor.queue_due_sources_once(limit=10))
+    async def scenario() -> None:
+        for _ in range(3):
+            await processor.process_queued_runs_once(limit=1)
+
+    asyncio.run(scenario())
+
+    # Run 1 loads the light row and, on change, the previous text. Run 2 hits
+    # the cache. Run 3's touch is rejected as stale, so it reloads, sees a
+    # newer snapshot from another worker and records its change against it.
+    assert snapshot_selects == [SOURCE_ID, SOURCE_ID]
+    assert text_selects == ["snapshot-1", "snapshot-3"]
+    assert completions == [
+        {"snapshot": True, "finding": True, "touch": None},
+        {"snapshot": False, "finding": False, "touch": {"snapshot_id": "snapshot-2", "http_status": 200}},
+        {"snapshot": False, "finding": False, "touch": {"snapshot_id": "snapshot-2", "http_status": 200}},
+        {"snapshot": True, "finding": True, "touch": None},
+    ]
 
-    assert queued_count == 1
-    assert queued_payloads == [
-        {
-            "p_org_id": ORG_ID,
-            "p_source_id": "77777777-7777-7777-7777-777777777777",
+
+def test_process_run_defers_github_runs_when_rate_limited(monkeypatch) -> None:
+    retries: list[tuple[str, int, str, str]] = []
+    reset_at = datetime(2026, 2, 12, 13, 0, tzinfo=UTC).timestamp()
+
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
+        return [
+            {"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 2}
+        ]
+
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
+        assert attempts == 3
+        assert holder == "worker"
+        return True
+
+    async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
+        return {
+            "id": SOURCE_ID,
+            "org_id": ORG_ID,
+            "kind": "github_releases",
+            "config": {"repo": "acme/rules"},
+            "url": "https://github.com/acme/rules",
+            "is_enabled": True,
         }
-    ]
-    assert scheduled_payloads == [{"p_source_id": "77777777-7777-7777-7777-777777777777"}]
 
+    async def fake_select_latest_snapshot(access_token: str, source_id: str) -> None:
+        return None
+
+    class RateLimitedAdapter:
+        async def fetch(self, source, prev_snapshot):
+            raise GitHubRateLimited(reset_at)
+
+    async def fake_mark_for_retry(run_id: str, attempts: int, next_attempt_at: str, last_error: str, *, holder: str) -> bool:
+        retries.append((run_id, attempts, next_attempt_at, last_error))
+        assert holder == "worker"
+        return True
 
-def test_enqueue_immediate_alert_if_needed_enqueues_when_rules_match(monkeypatch) -> None:
-    ensured: list[tuple[str, str]] = []
-    enqueued: list[dict[str, object]] = []
+    async def fail_dead_letter(*args, **kwargs) -> None:
+        raise AssertionError("rate-limited runs must not be dead-lettered")
 
-    async def fake_ensure(access_token: str, org_id: str) -> None:
-        ensured.append((access_token, org_id))
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
+    monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
+    monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
+    monkeypatch.setattr(run_processor, "get_adapter", lambda kind: RateLimitedAdapter())
+    monkeypatch.setattr(run_processor, "mark_monitor_run_for_retry", fake_mark_for_retry)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_dead_letter", fail_dead_letter)
 
-    async def fake_get_rules(access_token: str, org_id: str) -> dict[str, object]:
-        assert access_token == "write-token"
-        assert org_id == ORG_ID
-        return {"enabled": True, "mode": "both", "min_severity": "high"}
+    processor = run_processor.MonitorRunProcessor(access_token="worker-token")
+    assert asyncio.run(processor.process_queued_runs_once(limit=5)) == 1
 
-    async def fake_enqueue(org_id: str, job_type: str, payload: dict[str, object], *, run_after=None):
-        enqueued.append({"org_id": org_id, "job_type": job_type, "payload": payload, "run_after": run_after})
-        return {"id": "job-1"}
+    assert retries == [(RUN_ID, 2, "2026-02-12T13:00:00Z", "GitHub API rate limit reached")]
 
-    monkeypatch.setattr(run_processor, "ensure_org_notification_rules", fake_ensure)
-    monkeypatch.setattr(run_processor, "get_org_notification_rules", fake_get_rules)
-    monkeypatch.setattr(run_processor, "enqueue_notification_job", fake_enqueue)
 
-    processor = run_processor.MonitorRunProcessor(
-        access_token="read-token",
-        write_access_token="write-token",
+def test_process_run_stops_writing_once_its_lease_is_lost(monkeypatch) -> None:
+    completions: list[str] = []
+    retries: list[str] = []
+
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
+        return [{"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}]
+
+    async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
+        return True
+
+    async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
+        return {"id": SOURCE_ID, "org_id": ORG_ID, "kind": "html", "url": "https://example.com/policy"}
+
+    async def fake_select_latest_snapshot(access_token: str, source_id: str) -> dict[str, str]:
+        return {"id": "snapshot-1", "text_fingerprint": hashlib.sha256(b"Rule v1").hexdigest(), "canonical_text": "Rule v1"}
+
+    class FakeAdapter:
+        async def fetch(self, source, prev_snapshot):
+            return AdapterResult(canonical_text="Rule v2", http_status=200, fetched_url=source.url)
+
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        completions.append(holder)
+        return {"run_id": run_id, "lease_lost": True}
+
+    async def fake_mark_for_retry(*args, **kwargs) -> bool:
+        retries.append(args[0])
+        return True
+
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
+    monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
+    monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
+    monkeypatch.setattr(run_processor, "get_adapter", lambda kind: FakeAdapter())
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_for_retry", fake_mark_for_retry)
+
+    processor = run_processor.MonitorRunProcessor(access_token="worker-token", worker_id="worker-a")
+    asyncio.run(processor.process_queued_runs_once(limit=1))
+
+    # The run was reclaimed by another worker: nothing is retried and the
+    # cached snapshot is dropped instead of being advanced.
+    assert completions == ["worker-a"]
+    assert retries == []
+    assert processor._latest_snapshots.get(SOURCE_ID) is None
+
+
+class _SnapshotStore:
+    """In-memory stand-in for the snapshots of one source that mirrors
+    complete_monitor_run's checks on the snapshot a worker compared against."""
+
+    def __init__(self, *texts: str) -> None:
+        self.snapshots: list[tuple[str, str]] = []
+        self.texts: dict[str, str] = {}
+        self.findings: list[str] = []
+        self.touches: list[str] = []
+        self.text_selects: list[str] = []
+        self.latest_selects = 0
+        self.etag: str | None = None
+        for text in texts:
+            self.insert(text)
+
+    def insert(self, text: str) -> str:
+        snapshot_id = f"snapshot-{len(self.snapshots) + 1}"
+        self.snapshots.append((snapshot_id, hashlib.sha256(text.encode()).hexdigest()))
+        self.texts[snapshot_id] = text
+        return snapshot_id
+
+    def stored_texts(self) -> list[str]:
+        return [self.texts[snapshot_id] for snapshot_id, _ in self.snapshots]
+
+    def install(self, monkeypatch, bodies: list[str]) -> None:
+        async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
+            return [{"id": RUN_ID, "org_id": ORG_ID, "source_id": SOURCE_ID, "status": "queued", "attempts": 0}]
+
+        async def fake_mark_started(run_id: str, attempts: int, *, holder: str) -> bool:
+            return True
+
+        async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
+            return {"id": SOURCE_ID, "org_id": ORG_ID, "kind": "html", "url": "https://example.com/policy"}
+
+        async def fake_select_latest_snapshot(access_token: str, source_id: str) -> dict[str, str]:
+            self.latest_selects += 1
+            snapshot_id, fingerprint = self.snapshots[-1]
+            return {"id": snapshot_id, "text_fingerprint": fingerprint}
+
+        async def fake_select_snapshot_text(access_token: str, snapshot_id: str) -> str:
+            self.text_selects.append(snapshot_id)
+            return self.texts[snapshot_id]
+
+        def fake_get_adapter(kind: str):
+            class FakeAdapter:
+                async def fetch(self, source, prev_snapshot):
+                    text = bodies.pop(0)
+                    return AdapterResult(
+                        canonical_text=text, etag=f'"{text}"', http_status=200, fetched_url=source.url
+                    )
+
+            return FakeAdapter()
+
+        async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+            latest_id, latest_fingerprint = self.snapshots[-1]
+            touch_id = None
+            stale = False
+            if snapshot is not None:
+                same_content = snapshot["content_hash"] == latest_fingerprint
+                stale = snapshot["previous_snapshot_id"] != latest_id or same_content
+                touch_id = latest_id if stale and same_content else None
+            elif touch is not None:
+                stale = touch["snapshot_id"] != latest_id
+                touch_id = None if stale else latest_id
+            if stale and touch_id is None:
+                # Nothing is written, not even the response validators.
+                return {"run_id": run_id, "stale_snapshot": True, "lease_lost": False}
+            self.etag = fetch["etag"]
+            if touch_id is not None:
+                self.touches.append(touch_id)
+                snapshot_id = touch_id
+            else:
+                snapshot_id = self.insert(str(snapshot["text_preview"]))
+                if finding is not None:
+                    self.findings.append(holder)
+            return {"run_id": run_id, "snapshot_id": snapshot_id, "stale_snapshot": stale, "lease_lost": False}
+
+        monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+        monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", fake_mark_started)
+        monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
+        monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
+        monkeypatch.setattr(run_processor, "select_snapshot_text", fake_select_snapshot_text)
+        monkeypatch.setattr(run_processor, "get_adapter", fake_get_adapter)
+        monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
+
+
+def _store_worker(worker_id: str) -> run_processor.MonitorRunProcessor:
+    return run_processor.MonitorRunProcessor(
+        access_token="worker-token", worker_id=worker_id, shared_fetch_window_seconds=0
     )
-    asyncio.run(
-        processor._enqueue_immediate_alert_if_needed(
-            org_id=ORG_ID,
-            alert_id=ALERT_ID,
-            severity="high",
-        )
+
+
+def test_processors_sharing_a_source_record_a_change_once(monkeypatch) -> None:
+    store = _SnapshotStore("Rule v1")
+    store.install(monkeypatch, ["Rule v1", "Rule v1", "Rule v2", "Rule v2", "Rule v2"])
+    worker_a = _store_worker("worker-a")
+    worker_b = _store_worker("worker-b")
+
+    async def scenario() -> None:
+        # Both workers cache snapshot-1, then A stores the change first.
+        await worker_a.process_queued_runs_once(limit=1)
+        await worker_b.process_queued_runs_once(limit=1)
+        await worker_a.process_queued_runs_once(limit=1)
+        # B still compares against snapshot-1 and sees the same change.
+        await worker_b.process_queued_runs_once(limit=1)
+        assert worker_b._latest_snapshots.get(SOURCE_ID) is None
+        await worker_b.process_queued_runs_once(limit=1)
+
+    asyncio.run(scenario())
+
+    assert store.stored_texts() == ["Rule v1", "Rule v2"]
+    assert store.findings == ["worker-a"]
+    # B's stale insert became a touch of A's snapshot, and its next run
+    # reloaded the latest snapshot and touched it as unchanged.
+    assert store.touches == ["snapshot-1", "snapshot-1", "snapshot-2", "snapshot-2"]
+
+
+def test_process_run_records_a_revert_seen_through_a_stale_cache(monkeypatch) -> None:
+    store = _SnapshotStore("Rule A")
+    store.install(monkeypatch, ["Rule A", "Rule A"])
+    worker = _store_worker("worker-a")
+
+    async def scenario() -> None:
+        await worker.process_queued_runs_once(limit=1)
+        # Another worker records A -> B; the page is then reverted to A.
+        store.insert("Rule B")
+        await worker.process_queued_runs_once(limit=1)
+
+    asyncio.run(scenario())
+
+    # The touch of the cached snapshot-1 is rejected, so the same run
+    # compares against B and records the revert.
+    assert store.stored_texts() == ["Rule A", "Rule B", "Rule A"]
+    assert store.findings == ["worker-a"]
+    assert store.text_selects == ["snapshot-2"]
+    assert store.etag == '"Rule A"'
+    assert worker._latest_snapshots.get(SOURCE_ID).id == "snapshot-3"
+
+
+def test_process_run_records_a_new_change_over_a_stale_cache(monkeypatch) -> None:
+    store = _SnapshotStore("Rule A")
+    store.install(monkeypatch, ["Rule A", "Rule C"])
+    worker = _store_worker("worker-a")
+
+    async def scenario() -> None:
+        await worker.process_queued_runs_once(limit=1)
+        store.insert("Rule B")
+        await worker.process_queued_runs_once(limit=1)
+
+    asyncio.run(scenario())
+
+    # The insert against snapshot-1 is dropped; the run reloads B, diffs C
+    # against it and stores C in the same run.
+    assert store.stored_texts() == ["Rule A", "Rule B", "Rule C"]
+    assert store.findings == ["worker-a"]
+    assert store.text_selects == ["snapshot-1", "snapshot-2"]
+    assert store.latest_selects == 2
+    assert store.etag == '"Rule C"'
+
+
+def test_process_queued_runs_batches_github_sources_past_the_host_cap(monkeypatch) -> None:
+    repos = [f"acme/rules-{index}" for index in range(6)]
+    runs = [
+        {"id": f"run-{index}", "org_id": ORG_ID, "source_id": f"source-{index}", "status": "queued", "attempts": 0}
+        for index in range(len(repos))
+    ]
+    posts: list[str] = []
+    stored: dict[str, str] = {}
+
+    async def fake_claim_jobs(queue: str, holder: str, *, limit: int, lease_seconds: int) -> list[dict[str, object]]:
+        return runs
+
+    async def mark_started(*args, **kwargs) -> bool:
+        return True
+
+    async def fake_select_source(access_token: str, source_id: str) -> dict[str, object]:
+        index = int(source_id.rsplit("-", 1)[1])
+        return {
+            "id": source_id,
+            "org_id": ORG_ID,
+            "kind": "github_releases",
+            "config": {"repo": repos[index]},
+            "url": f"https://github.com/{repos[index]}",
+            "is_enabled": True,
+        }
+
+    async def fake_select_latest_snapshot(access_token: str, source_id: str) -> None:
+        return None
+
+    async def fake_fetch_url(url: str, **kwargs) -> dict[str, object]:
+        # Holds the api.github.com slot like the real fetcher does.
+        engine = fetch_engine.get_fetch_engine()
+        assert engine is not None
+        async with engine.request_slot(url):
+            posts.append(url)
+            data = {
+                f"r{index}": {"releases": {"nodes": [{"databaseId": index, "tagName": f"v{index}", "description": f"Notes {index}"}]}}
+                for index in range(len(repos))
+            }
+            return {"status": 200, "bytes": json.dumps({"data": data}).encode(), "headers": {}}
+
+    async def fake_complete_run(run_id: str, *, holder, fetch, snapshot=None, finding=None, touch=None) -> dict[str, object]:
+        assert snapshot is not None
+        stored[run_id] = str(snapshot["item_id"])
+        return {"run_id": run_id}
+
+    monkeypatch.setattr(github_api, "_shared_budget", None)
+    monkeypatch.setattr(github_api, "_shared_batcher", None)
+    github_api.configure_github(["token-a"])
+    batcher = github_api.get_github_batcher()
+    assert batcher is not None
+    monkeypatch.setattr(github_releases, "fetch_url", fake_fetch_url)
+    monkeypatch.setattr(run_processor, "rpc_claim_jobs", fake_claim_jobs)
+    monkeypatch.setattr(run_processor, "mark_monitor_run_attempt_started", mark_started)
+    monkeypatch.setattr(run_processor, "select_source_by_id", fake_select_source)
+    monkeypatch.setattr(run_processor, "select_latest_snapshot", fake_select_latest_snapshot)
+    monkeypatch.setattr(run_processor, "rpc_complete_monitor_run", fake_complete_run)
+
+    processor = run_processor.MonitorRunProcessor(
+        access_token="worker-token", max_concurrent_runs=len(repos), shared_fetch_window_seconds=0
     )
 
-    assert ensured == [("write-token", ORG_ID)]
-    assert len(enqueued) == 1
-    assert enqueued[0]["org_id"] == ORG_ID
-    assert enqueued[0]["job_type"] == "immediate_alert"
-    assert enqueued[0]["payload"] == {
-        "org_id": ORG_ID,
-        "alert_id": ALERT_ID,
-        "entity_type": "alert",
-        "entity_id": ALERT_ID,
-    }
+    async def scenario() -> int:
+        async with fetch_engine.fetch_engine_lifespan(per_host_concurrency=2, per_host_rate_per_second=0):
+            return await processor.process_queued_runs_once(limit=len(repos))
+
+    assert asyncio.run(scenario()) == len(repos)
+
+    # One GraphQL request answers every run; the per-host cap only applies
+    # to that request, not to the runs waiting on the batch.
+    assert posts == ["https://api.github.com/graphql"]
+    assert batcher.batches_sent == 1
+    assert len(stored) == len(repos)
@@ -0,0 +1,97 @@
+import asyncio
+import time
+
+from app.worker.adapters.base import AdapterResult, Snapshot, Source
+from app.worker.shared_fetch import SharedFetchCache, normalize_fetch_url, shared_fetch_key
+
+
+def _source(index: int, url: str, *, kind: str = "html", etag: str | None = None) -> Source:
+    return Source(
+        id=f"source-{index}",
+        org_id=f"org-{index}",
+        url=url,
+        kind=kind,
+        config={"b": 1, "a": 2},
+        etag=etag,
+    )
+
+
+class RecordingAdapter:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str | None, Snapshot | None]] = []
+
+    async def fetch(self, source: Source, prev_snapshot: Snapshot | None) -> AdapterResult:
+        self.calls.append((source.etag, prev_snapshot))
+        await asyncio.sleep(0.01)
+        if source.etag == '"v1"':
+            return AdapterResult(http_status=304, etag='"v1"', fetched_url=source.url)
+        return AdapterResult(
+            canonical_text="Rule text",
+            etag='"v1"',
+            http_status=200,
+            fetched_url=source.url,
+            content_len=9,
+        )
+
+
+def test_normalize_fetch_url_ignores_case_default_port_and_fragment() -> None:
+    assert normalize_fetch_url("HTTPS://Regulator.EXAMPLE.gov:443/rules?id=7#top") == (
+        "https://regulator.example.gov/rules?id=7"
+    )
+    assert normalize_fetch_url("http://example.com:8080") == "http://example.com:8080/"
+
+
+def test_shared_fetch_fans_one_fetch_out_to_every_subscriber() -> None:
+    adapter = RecordingAdapter()
+    cache = SharedFetchCache(window_seconds=60)
+    sources = [
+        _source(0, "https://regulator.example.gov/rules", etag='"org-0-etag"'),
+        _source(1, "https://REGULATOR.example.gov:443/rules"),
+        _source(2, "https://regulator.example.gov/rules#section"),
+    ]
+
+    async def scenario() -> list[AdapterResult]:
+        first = await asyncio.gather(*(cache.fetch(adapter, source, None) for source in sources[:2]))
+        later = await cache.fetch(adapter, sources[2], None)
+        return [*first, later]
+
+    results = asyncio.run(scenario())
+
+    assert len(adapter.calls) == 1
+    assert adapter.calls[0] == (None, None)
+    assert all(result.canonical_text == "Rule text" for result in results)
+    assert dict(cache.stats) == {"misses": 1, "coalesced": 1, "hits": 1}
+
+
+def test_shared_fetch_revalidates_after_window_and_reuses_full_result() -> None:
+    adapter = RecordingAdapter()
+    cache = SharedFetchCache(window_seconds=0.05)
+    source = _source(0, "https://regulator.example.gov/rules")
+
+    first = asyncio.run(cache.fetch(adapter, source, None))
+    time.sleep(0.06)
+    second = asyncio.run(cache.fetch(adapter, _source(1, source.url), None))
+
+    assert [etag for etag, _ in adapter.calls] == [None, '"v1"']
+    assert adapter.calls[1][1] is not None
+    assert adapter.calls[1][1].canonical_text == "Rule text"
+    assert second.http_status == 200
+    assert second.canonical_text == first.canonical_text
+    assert cache.stats["revalidated"] == 1
+
+
+def test_shared_fetch_key_tracks_rss_cursor_and_disabled_cache_passes_through() -> None:
+    feed = _source(0, "https://example.com/feed.xml", kind="rss")
+    assert shared_fetch_key(feed, Snapshot(item_id="a")) != shared_fetch_key(feed, Snapshot(item_id="b"))
+    assert shared_fetch_key(_source(0, "https://example.com/"), Snapshot(item_id="a")) == shared_fetch_key(
+        _source(1, "https://example.com/"), Snapshot(item_id="b")
+    )
+
+    adapter = RecordingAdapter()
+    cache = SharedFetchCache(window_seconds=0)
+    source = _source(0, "https://example.com/", etag='"v1"')
+    result = asyncio.run(cache.fetch(adapter, source, None))
+
+    assert result.http_status == 304
+    assert adapter.calls == [('"v1"', None)]
+    assert not cache.stats
@@ -1,5 +1,6 @@
 import { createClient } from "@/lib/supabase/server";
 import { NextRequest, NextResponse } from "next/server";
+import { pageQuerySuffix } from "@/src/lib/pagination";
 
 function getApiBaseUrl(): string | null {
   const apiBaseUrl = process.env.VERIRULE_API_URL?.replace(/\/$/, "");
@@ -47,7 +48,7 @@ export async function GET(request: NextRequest) {
 
   try {
     const upstreamResponse = await fetch(
-      `${apiBaseUrl}/api/v1/monitor/runs?org_id=${encodeURIComponent(orgId)}`,
+      `${apiBaseUrl}/api/v1/monitor/runs?org_id=${encodeURIComponent(orgId)}${pageQuerySuffix(request.nextUrl.searchParams)}`,
       {
         method: "GET",
         headers: upstreamHeaders(accessToken),
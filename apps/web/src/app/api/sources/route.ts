@@ -1,5 +1,6 @@
 import { createClient } from "@/lib/supabase/server";
 import { NextRequest, NextResponse } from "next/server";
+import { pageQuerySuffix } from "@/src/lib/pagination";
 
 type SourceKind = "html" | "rss" | "pdf" | "github_releases";
 
@@ -86,7 +87,7 @@ export async function GET(request: NextRequest) {
 
   try {
     const upstreamResponse = await fetch(
-      `${apiBaseUrl}/api/v1/sources?org_id=${encodeURIComponent(orgId)}`,
+      `${apiBaseUrl}/api/v1/sources?org_id=${encodeURIComponent(orgId)}${pageQuerySuffix(request.nextUrl.searchParams)}`,
       {
         method: "GET",
         headers: upstreamHeaders(accessToken),
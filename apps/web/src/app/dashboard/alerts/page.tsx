@@ -6,6 +6,7 @@ import { Label } from "@/components/ui/label";
 import { usePlan } from "@/src/components/billing/usePlan";
 import Link from "next/link";
 import { useCallback, useEffect, useMemo, useState } from "react";
+import { readNextCursor, withCursor } from "@/src/lib/pagination";
 
 type OrgRecord = {
   id: string;
@@ -44,8 +45,8 @@ type FindingRecord = {
 };
 
 type OrgsResponse = { orgs: OrgRecord[] };
-type AlertsResponse = { alerts: AlertRecord[] };
-type FindingsResponse = { findings: FindingRecord[] };
+type AlertsResponse = { alerts: AlertRecord[]; next_cursor?: string | null };
+type FindingsResponse = { findings: FindingRecord[]; next_cursor?: string | null };
 type IntegrationRecord = {
   id: string;
   org_id: string;
@@ -84,6 +85,9 @@ export default function DashboardAlertsPage() {
   const [activeTab, setActiveTab] = useState<AlertTab>("open");
   const [isLoadingOrgs, setIsLoadingOrgs] = useState(true);
   const [isLoadingAlerts, setIsLoadingAlerts] = useState(false);
+  const [alertsCursor, setAlertsCursor] = useState<string | null>(null);
+  const [findingsCursor, setFindingsCursor] = useState<string | null>(null);
+  const [isLoadingMoreAlerts, setIsLoadingMoreAlerts] = useState(false);
   const [updatingAlertId, setUpdatingAlertId] = useState<string | null>(null);
   const [creatingTaskAlertId, setCreatingTaskAlertId] = useState<string | null>(null);
   const [actingAlertId, setActingAlertId] = useState<string | null>(null);
@@ -206,7 +210,9 @@ export default function DashboardAlertsPage() {
       }
 
       setAlerts(alertsBody.alerts);
+      setAlertsCursor(readNextCursor(alertsBody));
       setFindings(findingsBody.findings);
+      setFindingsCursor(readNextCursor(findingsBody));
       setIntegrations(Array.isArray(integrationsBody.integrations) ? integrationsBody.integrations : []);
     } catch {
       setError("Unable to load alerts right now.");
@@ -218,6 +224,53 @@ export default function DashboardAlertsPage() {
     }
   }, [planFeatures.canUseIntegrations]);
 
+  // Alert titles come from their findings, so the next findings page is
+  // loaded alongside the next alerts page.
+  const loadMoreAlerts = async () => {
+    if (!selectedOrgId || !alertsCursor) {
+      return;
+    }
+
+    setIsLoadingMoreAlerts(true);
+    setError(null);
+    try {
+      const orgQuery = `org_id=${encodeURIComponent(selectedOrgId)}`;
+      const [alertsResponse, findingsResponse] = await Promise.all([
+        fetch(withCursor(`/api/alerts?${orgQuery}`, alertsCursor), { method: "GET", cache: "no-store" }),
+        findingsCursor
+          ? fetch(withCursor(`/api/findings?${orgQuery}`, findingsCursor), { method: "GET", cache: "no-store" })
+          : Promise.resolve(null),
+      ]);
+
+      if (alertsResponse.status === 401 || findingsResponse?.status === 401) {
+        window.location.href = "/auth/login";
+        return;
+      }
+
+      const alertsBody = (await alertsResponse.json().catch(() => ({}))) as Partial<AlertsResponse>;
+      if (!alertsResponse.ok || !Array.isArray(alertsBody.alerts)) {
+        setError("Unable to load alerts right now.");
+        return;
+      }
+      const nextAlerts = alertsBody.alerts;
+      setAlerts((current) => [...current, ...nextAlerts]);
+      setAlertsCursor(readNextCursor(alertsBody));
+
+      if (findingsResponse) {
+        const findingsBody = (await findingsResponse.json().catch(() => ({}))) as Partial<FindingsResponse>;
+        if (findingsResponse.ok && Array.isArray(findingsBody.findings)) {
+          const nextFindings = findingsBody.findings;
+          setFindings((current) => [...current, ...nextFindings]);
+          setFindingsCursor(readNextCursor(findingsBody));
+        }
+      }
+    } catch {
+      setError("Unable to load alerts right now.");
+    } finally {
+      setIsLoadingMoreAlerts(false);
+    }
+  };
+
   useEffect(() => {
     void loadOrgs();
   }, []);
@@ -225,7 +278,9 @@ export default function DashboardAlertsPage() {
   useEffect(() => {
     if (!selectedOrgId) {
       setAlerts([]);
+      setAlertsCursor(null);
       setFindings([]);
+      setFindingsCursor(null);
       setIntegrations([]);
       return;
     }
@@ -544,6 +599,17 @@ export default function DashboardAlertsPage() {
               })}
             </ul>
           ) : null}
+          {!isLoadingAlerts && alertsCursor ? (
+            <Button
+              type="button"
+              variant="outline"
+              size="sm"
+              disabled={isLoadingMoreAlerts}
+              onClick={() => void loadMoreAlerts()}
+            >
+              {isLoadingMoreAlerts ? "Loading..." : "Load more alerts"}
+            </Button>
+          ) : null}
           {error ? <p className="text-sm text-destructive">{error}</p> : null}
           {actionMessage ? <p className="text-sm text-emerald-700">{actionMessage}</p> : null}
         </CardContent>
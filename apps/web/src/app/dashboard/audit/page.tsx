@@ -1,8 +1,10 @@
 "use client";
 
+import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Label } from "@/components/ui/label";
 import { useEffect, useState } from "react";
+import { readNextCursor, withCursor } from "@/src/lib/pagination";
 
 type OrgRecord = {
   id: string;
@@ -22,7 +24,7 @@ type AuditRecord = {
 };
 
 type OrgsResponse = { orgs: OrgRecord[] };
-type AuditResponse = { audit: AuditRecord[] };
+type AuditResponse = { audit: AuditRecord[]; next_cursor?: string | null };
 
 function formatTime(value: string): string {
   const parsed = new Date(value);
@@ -46,6 +48,8 @@ export default function DashboardAuditPage() {
   const [auditRows, setAuditRows] = useState<AuditRecord[]>([]);
   const [isLoadingOrgs, setIsLoadingOrgs] = useState(true);
   const [isLoadingAudit, setIsLoadingAudit] = useState(false);
+  const [auditCursor, setAuditCursor] = useState<string | null>(null);
+  const [isLoadingMoreAudit, setIsLoadingMoreAudit] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   const loadOrgs = async () => {
@@ -84,16 +88,18 @@ export default function DashboardAuditPage() {
     }
   };
 
-  const loadAudit = async (orgId: string) => {
+  const loadAudit = async (orgId: string, cursor: string | null = null) => {
     if (!orgId) {
       setAuditRows([]);
+      setAuditCursor(null);
       return;
     }
 
-    setIsLoadingAudit(true);
+    const setLoading = cursor ? setIsLoadingMoreAudit : setIsLoadingAudit;
+    setLoading(true);
     setError(null);
     try {
-      const response = await fetch(`/api/audit?org_id=${encodeURIComponent(orgId)}`, {
+      const response = await fetch(withCursor(`/api/audit?org_id=${encodeURIComponent(orgId)}`, cursor), {
         method: "GET",
         cache: "no-store",
       });
@@ -106,16 +112,22 @@ export default function DashboardAuditPage() {
 
       if (!response.ok || !Array.isArray(body.audit)) {
         setError("Unable to load audit events right now.");
-        setAuditRows([]);
+        if (!cursor) {
+          setAuditRows([]);
+        }
         return;
       }
 
-      setAuditRows(body.audit);
+      const page = body.audit;
+      setAuditRows((current) => (cursor ? [...current, ...page] : page));
+      setAuditCursor(readNextCursor(body));
     } catch {
       setError("Unable to load audit events right now.");
-      setAuditRows([]);
+      if (!cursor) {
+        setAuditRows([]);
+      }
     } finally {
-      setIsLoadingAudit(false);
+      setLoading(false);
     }
   };
 
@@ -126,6 +138,7 @@ export default function DashboardAuditPage() {
   useEffect(() => {
     if (!selectedOrgId) {
       setAuditRows([]);
+      setAuditCursor(null);
       return;
     }
     void loadAudit(selectedOrgId);
@@ -205,6 +218,17 @@ export default function DashboardAuditPage() {
               ))}
             </ul>
           ) : null}
+          {!isLoadingAudit && auditCursor ? (
+            <Button
+              type="button"
+              variant="outline"
+              size="sm"
+              disabled={isLoadingMoreAudit}
+              onClick={() => void loadAudit(selectedOrgId, auditCursor)}
+            >
+              {isLoadingMoreAudit ? "Loading..." : "Load more events"}
+            </Button>
+          ) : null}
           {error ? <p className="text-sm text-destructive">{error}</p> : null}
         </CardContent>
       </Card>
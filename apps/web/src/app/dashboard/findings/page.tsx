@@ -5,6 +5,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
 import { useEffect, useMemo, useState } from "react";
+import { readNextCursor, withCursor } from "@/src/lib/pagination";
 
 type OrgRecord = {
   id: string;
@@ -66,7 +67,7 @@ type ControlSuggestionRecord = {
 };
 
 type OrgsResponse = { orgs: OrgRecord[] };
-type FindingsResponse = { findings: FindingRecord[] };
+type FindingsResponse = { findings: FindingRecord[]; next_cursor?: string | null };
 type OrgControlsResponse = { controls: OrgControlCatalogRecord[] };
 type FindingControlsResponse = { controls: FindingControlRecord[] };
 type ControlSuggestResponse = { suggestions: ControlSuggestionRecord[] };
@@ -108,6 +109,8 @@ export default function DashboardFindingsPage() {
 
   const [isLoadingOrgs, setIsLoadingOrgs] = useState(true);
   const [isLoadingFindings, setIsLoadingFindings] = useState(false);
+  const [findingsCursor, setFindingsCursor] = useState<string | null>(null);
+  const [isLoadingMoreFindings, setIsLoadingMoreFindings] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   const [severityFilter, setSeverityFilter] = useState<SeverityFilter>("all");
@@ -181,16 +184,18 @@ export default function DashboardFindingsPage() {
     }
   };
 
-  const loadFindings = async (orgId: string) => {
+  const loadFindings = async (orgId: string, cursor: string | null = null) => {
     if (!orgId) {
       setFindings([]);
+      setFindingsCursor(null);
       return;
     }
 
-    setIsLoadingFindings(true);
+    const setLoading = cursor ? setIsLoadingMoreFindings : setIsLoadingFindings;
+    setLoading(true);
     setError(null);
     try {
-      const response = await fetch(`/api/findings?org_id=${encodeURIComponent(orgId)}`, {
+      const response = await fetch(withCursor(`/api/findings?org_id=${encodeURIComponent(orgId)}`, cursor), {
         method: "GET",
         cache: "no-store",
       });
@@ -203,16 +208,22 @@ export default function DashboardFindingsPage() {
 
       if (!response.ok || !Array.isArray(body.findings)) {
         setError("Unable to load findings right now.");
-        setFindings([]);
+        if (!cursor) {
+          setFindings([]);
+        }
         return;
       }
 
-      setFindings(body.findings);
+      const page = body.findings;
+      setFindings((current) => (cursor ? [...current, ...page] : page));
+      setFindingsCursor(readNextCursor(body));
     } catch {
       setError("Unable to load findings right now.");
-      setFindings([]);
+      if (!cursor) {
+        setFindings([]);
+      }
     } finally {
-      setIsLoadingFindings(false);
+      setLoading(false);
     }
   };
 
@@ -293,6 +304,7 @@ export default function DashboardFindingsPage() {
   useEffect(() => {
     if (!selectedOrgId) {
       setFindings([]);
+      setFindingsCursor(null);
       setOrgControlsCatalog([]);
       return;
     }
@@ -585,6 +597,17 @@ export default function DashboardFindingsPage() {
               ))}
             </ul>
           ) : null}
+          {!isLoadingFindings && findingsCursor ? (
+            <Button
+              type="button"
+              variant="outline"
+              size="sm"
+              disabled={isLoadingMoreFindings}
+              onClick={() => void loadFindings(selectedOrgId, findingsCursor)}
+            >
+              {isLoadingMoreFindings ? "Loading..." : "Load more findings"}
+            </Button>
+          ) : null}
           {error ? <p className="text-sm text-destructive">{error}</p> : null}
         </CardContent>
       </Card>
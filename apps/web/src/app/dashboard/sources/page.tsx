@@ -7,6 +7,7 @@ import { Label } from "@/components/ui/label";
 import { usePlan } from "@/src/components/billing/usePlan";
 import Link from "next/link";
 import { useEffect, useMemo, useState, type FormEvent } from "react";
+import { readNextCursor, withCursor } from "@/src/lib/pagination";
 
 type SourceKind = "html" | "rss" | "pdf" | "github_releases";
 type LegacySourceType = "rss" | "url";
@@ -48,7 +49,7 @@ type MonitorRunRecord = {
 };
 
 type OrgsResponse = { orgs: OrgRecord[] };
-type SourcesResponse = { sources: SourceRecord[] };
+type SourcesResponse = { sources: SourceRecord[]; next_cursor?: string | null };
 type RunsResponse = { runs: MonitorRunRecord[] };
 
 function formatCreatedAt(value: string): string {
@@ -109,6 +110,8 @@ export default function DashboardSourcesPage() {
 
   const [isLoadingOrgs, setIsLoadingOrgs] = useState(true);
   const [isLoadingSources, setIsLoadingSources] = useState(false);
+  const [sourcesCursor, setSourcesCursor] = useState<string | null>(null);
+  const [isLoadingMoreSources, setIsLoadingMoreSources] = useState(false);
   const [isCreating, setIsCreating] = useState(false);
   const [togglingId, setTogglingId] = useState<string | null>(null);
   const [schedulingSourceId, setSchedulingSourceId] = useState<string | null>(null);
@@ -213,11 +216,13 @@ export default function DashboardSourcesPage() {
         setError("Unable to load monitor runs right now.");
         setRuns([]);
         setSources(sourcesBody.sources);
+        setSourcesCursor(readNextCursor(sourcesBody));
         return;
       }
 
       const sourceRows = sourcesBody.sources;
       setSources(sourceRows);
+      setSourcesCursor(readNextCursor(sourcesBody));
       setRuns(runsBody.runs);
     } catch {
       setError("Unable to load sources right now.");
@@ -228,6 +233,40 @@ export default function DashboardSourcesPage() {
     }
   };
 
+  const loadMoreSources = async () => {
+    if (!selectedOrgId || !sourcesCursor) {
+      return;
+    }
+
+    setIsLoadingMoreSources(true);
+    setError(null);
+    try {
+      const response = await fetch(
+        withCursor(`/api/sources?org_id=${encodeURIComponent(selectedOrgId)}`, sourcesCursor),
+        { method: "GET", cache: "no-store" },
+      );
+      const body = (await response.json().catch(() => ({}))) as Partial<SourcesResponse>;
+
+      if (response.status === 401) {
+        window.location.href = "/auth/login";
+        return;
+      }
+
+      if (!response.ok || !Array.isArray(body.sources)) {
+        setError("Unable to load sources right now.");
+        return;
+      }
+
+      const sourceRows = body.sources;
+      setSources((current) => [...current, ...sourceRows]);
+      setSourcesCursor(readNextCursor(body));
+    } catch {
+      setError("Unable to load sources right now.");
+    } finally {
+      setIsLoadingMoreSources(false);
+    }
+  };
+
   useEffect(() => {
     void loadOrgs();
   }, []);
@@ -235,6 +274,7 @@ export default function DashboardSourcesPage() {
   useEffect(() => {
     if (!selectedOrgId) {
       setSources([]);
+      setSourcesCursor(null);
       setRuns([]);
       return;
     }
@@ -562,6 +602,17 @@ export default function DashboardSourcesPage() {
               })}
             </ul>
           ) : null}
+          {!isLoadingSources && sourcesCursor ? (
+            <Button
+              type="button"
+              variant="outline"
+              size="sm"
+              disabled={isLoadingMoreSources}
+              onClick={() => void loadMoreSources()}
+            >
+              {isLoadingMoreSources ? "Loading..." : "Load more sources"}
+            </Button>
+          ) : null}
         </CardContent>
       </Card>
 
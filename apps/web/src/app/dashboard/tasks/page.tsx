@@ -6,6 +6,7 @@ import { Input } from "@/components/ui/input";
 import { Label } from "@/components/ui/label";
 import { useSearchParams } from "next/navigation";
 import { useCallback, useEffect, useMemo, useRef, useState, type ChangeEvent, type FormEvent } from "react";
+import { readNextCursor, withCursor } from "@/src/lib/pagination";
 
 type TaskStatus = "open" | "in_progress" | "blocked" | "done";
 type TaskSlaState = "none" | "on_track" | "due_soon" | "overdue";
@@ -57,7 +58,7 @@ type EvidenceFileRecord = {
 };
 
 type OrgsResponse = { orgs: OrgRecord[] };
-type TasksResponse = { tasks: TaskRecord[] };
+type TasksResponse = { tasks: TaskRecord[]; next_cursor?: string | null };
 type CommentsResponse = { comments: TaskCommentRecord[] };
 type EvidenceFilesResponse = { evidence_files: EvidenceFileRecord[] };
 type EvidenceFileUploadUrlResponse = {
@@ -196,6 +197,8 @@ export default function DashboardTasksPage() {
 
   const [isLoadingOrgs, setIsLoadingOrgs] = useState(true);
   const [isLoadingTasks, setIsLoadingTasks] = useState(false);
+  const [tasksCursor, setTasksCursor] = useState<string | null>(null);
+  const [isLoadingMoreTasks, setIsLoadingMoreTasks] = useState(false);
   const [isLoadingDetails, setIsLoadingDetails] = useState(false);
   const [isSavingTask, setIsSavingTask] = useState(false);
   const [isUploadingFile, setIsUploadingFile] = useState(false);
@@ -264,16 +267,18 @@ export default function DashboardTasksPage() {
     }
   }, [requestedOrgId]);
 
-  const loadTasks = async (orgId: string) => {
+  const loadTasks = async (orgId: string, cursor: string | null = null) => {
     if (!orgId) {
       setTasks([]);
+      setTasksCursor(null);
       return;
     }
 
-    setIsLoadingTasks(true);
+    const setLoading = cursor ? setIsLoadingMoreTasks : setIsLoadingTasks;
+    setLoading(true);
     setError(null);
     try {
-      const response = await fetch(`/api/tasks?org_id=${encodeURIComponent(orgId)}`, {
+      const response = await fetch(withCursor(`/api/tasks?org_id=${encodeURIComponent(orgId)}`, cursor), {
         method: "GET",
         cache: "no-store",
       });
@@ -286,16 +291,22 @@ export default function DashboardTasksPage() {
 
       if (!response.ok || !Array.isArray(body.tasks)) {
         setError("Unable to load tasks right now.");
-        setTasks([]);
+        if (!cursor) {
+          setTasks([]);
+        }
         return;
       }
 
-      setTasks(body.tasks);
+      const page = body.tasks;
+      setTasks((current) => (cursor ? [...current, ...page] : page));
+      setTasksCursor(readNextCursor(body));
     } catch {
       setError("Unable to load tasks right now.");
-      setTasks([]);
+      if (!cursor) {
+        setTasks([]);
+      }
     } finally {
-      setIsLoadingTasks(false);
+      setLoading(false);
     }
   };
 
@@ -349,6 +360,7 @@ export default function DashboardTasksPage() {
   useEffect(() => {
     if (!selectedOrgId) {
       setTasks([]);
+      setTasksCursor(null);
       return;
     }
     void loadTasks(selectedOrgId);
@@ -709,6 +721,17 @@ export default function DashboardTasksPage() {
               ))}
             </ul>
           ) : null}
+          {!isLoadingTasks && tasksCursor ? (
+            <Button
+              type="button"
+              variant="outline"
+              size="sm"
+              disabled={isLoadingMoreTasks}
+              onClick={() => void loadTasks(selectedOrgId, tasksCursor)}
+            >
+              {isLoadingMoreTasks ? "Loading..." : "Load more tasks"}
+            </Button>
+          ) : null}
 
           {error ? <p className="text-sm text-destructive">{error}</p> : null}
         </CardContent>
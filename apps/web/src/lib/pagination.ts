@@ -0,0 +1,29 @@
+const PAGE_PARAMS = ["limit", "cursor"] as const;
+
+export function pageQuerySuffix(searchParams: URLSearchParams): string {
+  const params = new URLSearchParams();
+  for (const key of PAGE_PARAMS) {
+    const value = searchParams.get(key)?.trim();
+    if (value) {
+      params.set(key, value);
+    }
+  }
+  const query = params.toString();
+  return query ? `&${query}` : "";
+}
+
+export function withCursor(path: string, cursor: string | null): string {
+  if (!cursor) {
+    return path;
+  }
+  const separator = path.includes("?") ? "&" : "?";
+  return `${path}${separator}cursor=${encodeURIComponent(cursor)}`;
+}
+
+export function readNextCursor(body: unknown): string | null {
+  if (typeof body !== "object" || body === null) {
+    return null;
+  }
+  const value = (body as { next_cursor?: unknown }).next_cursor;
+  return typeof value === "string" && value ? value : null;
+}
@@ -0,0 +1,66 @@
+-- Single round-trip authorization context for API guards: caller membership
+-- role plus org billing plan, optionally resolving the org from a source id.
+create or replace function public.get_org_auth_context(
+  p_org_id uuid default null,
+  p_source_id uuid default null
+)
+returns jsonb
+language plpgsql
+stable
+security definer
+set search_path = public
+as $$
+declare
+  v_user_id uuid;
+  v_org_id uuid;
+  v_role text;
+  v_plan text;
+  v_plan_status text;
+begin
+  v_user_id := auth.uid();
+  if v_user_id is null then
+    raise exception 'not authenticated';
+  end if;
+
+  v_org_id := p_org_id;
+  if v_org_id is null and p_source_id is not null then
+    select s.org_id
+      into v_org_id
+    from public.sources s
+    where s.id = p_source_id
+    limit 1;
+  end if;
+
+  if v_org_id is null then
+    return jsonb_build_object('org_id', null, 'user_id', v_user_id, 'role', null, 'plan', null, 'plan_status', null);
+  end if;
+
+  select m.role
+    into v_role
+  from public.org_members m
+  where m.org_id = v_org_id
+    and m.user_id = v_user_id
+  limit 1;
+
+  -- Billing state is only disclosed to members, mirroring the orgs RLS policy.
+  if v_role is not null then
+    select o.plan, o.plan_status
+      into v_plan, v_plan_status
+    from public.orgs o
+    where o.id = v_org_id
+    limit 1;
+  end if;
+
+  return jsonb_build_object(
+    'org_id', case when v_role is null and p_org_id is null then null else v_org_id end,
+    'user_id', v_user_id,
+    'role', v_role,
+    'plan', v_plan,
+    'plan_status', v_plan_status
+  );
+end;
+$$;
+
+revoke all on function public.get_org_auth_context(uuid, uuid) from public;
+grant execute on function public.get_org_auth_context(uuid, uuid) to authenticated;
+grant execute on function public.get_org_auth_context(uuid, uuid) to service_role;
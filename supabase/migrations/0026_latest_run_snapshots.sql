@@ -0,0 +1,30 @@
+-- Bulk lookup of the newest snapshot per monitor run so finding lists can be
+-- enriched in one round-trip. Runs as the caller so snapshots RLS still applies.
+create index if not exists snapshots_run_created_at_idx
+  on public.snapshots(run_id, created_at desc);
+
+create or replace function public.latest_snapshots_for_runs(p_run_ids uuid[])
+returns table (
+  run_id uuid,
+  canonical_title text,
+  item_published_at timestamptz,
+  created_at timestamptz
+)
+language sql
+stable
+security invoker
+set search_path = public
+as $$
+  select distinct on (s.run_id)
+    s.run_id,
+    s.canonical_title,
+    s.item_published_at,
+    s.created_at
+  from public.snapshots s
+  where s.run_id = any(coalesce(p_run_ids, '{}'::uuid[]))
+  order by s.run_id, s.created_at desc, s.id desc;
+$$;
+
+revoke all on function public.latest_snapshots_for_runs(uuid[]) from public;
+grant execute on function public.latest_snapshots_for_runs(uuid[]) to authenticated;
+grant execute on function public.latest_snapshots_for_runs(uuid[]) to service_role;
@@ -0,0 +1,19 @@
+-- Composite indexes backing keyset pagination on the org list endpoints
+-- (order by <sort column> desc, id desc within one org).
+create index if not exists findings_org_detected_at_id_idx
+  on public.findings(org_id, detected_at desc, id desc);
+
+create index if not exists alerts_org_created_at_id_idx
+  on public.alerts(org_id, created_at desc, id desc);
+
+create index if not exists audit_events_org_created_at_id_idx
+  on public.audit_events(org_id, created_at desc, id desc);
+
+create index if not exists monitor_runs_org_created_at_id_idx
+  on public.monitor_runs(org_id, created_at desc, id desc);
+
+create index if not exists tasks_org_created_at_id_idx
+  on public.tasks(org_id, created_at desc, id desc);
+
+create index if not exists sources_org_created_at_id_idx
+  on public.sources(org_id, created_at desc, id desc);
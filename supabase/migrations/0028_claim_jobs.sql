@@ -0,0 +1,118 @@
+-- Lease-based work claiming so several workers can drain the same queue
+-- without a fleet-wide lock. Rows are claimed with FOR UPDATE SKIP LOCKED;
+-- a claim that is not finished before lease_expires_at becomes claimable again.
+alter table public.monitor_runs
+  add column if not exists claimed_by text,
+  add column if not exists lease_expires_at timestamptz;
+
+alter table public.audit_exports
+  add column if not exists claimed_by text,
+  add column if not exists lease_expires_at timestamptz;
+
+alter table public.notification_jobs
+  add column if not exists claimed_by text,
+  add column if not exists lease_expires_at timestamptz;
+
+create index if not exists monitor_runs_claimable_idx
+  on public.monitor_runs(created_at)
+  where status in ('queued', 'running');
+
+create index if not exists audit_exports_claimable_idx
+  on public.audit_exports(created_at)
+  where status in ('queued', 'running');
+
+create index if not exists notification_jobs_running_lease_idx
+  on public.notification_jobs(lease_expires_at)
+  where status = 'running';
+
+create or replace function public.claim_jobs(
+  p_queue text,
+  p_holder text,
+  p_limit int default 10,
+  p_lease_seconds int default 300
+)
+returns setof jsonb
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_holder text;
+  v_limit int;
+  v_lease interval;
+begin
+  if auth.role() <> 'service_role' then
+    raise exception 'forbidden';
+  end if;
+
+  v_holder := trim(coalesce(p_holder, ''));
+  if v_holder = '' then
+    raise exception 'holder is required';
+  end if;
+
+  v_limit := least(greatest(coalesce(p_limit, 10), 1), 500);
+  v_lease := make_interval(secs => greatest(coalesce(p_lease_seconds, 300), 5));
+
+  if p_queue = 'monitor_runs' then
+    return query
+    with candidates as (
+      select r.id
+      from public.monitor_runs r
+      where (r.status = 'queued' and (r.next_attempt_at is null or r.next_attempt_at <= now()))
+         or (r.status = 'running' and r.lease_expires_at < now())
+      order by r.created_at asc
+      limit v_limit
+      for update skip locked
+    )
+    update public.monitor_runs r
+       set status = 'running',
+           claimed_by = v_holder,
+           lease_expires_at = now() + v_lease
+      from candidates c
+     where r.id = c.id
+    returning to_jsonb(r.*);
+  elsif p_queue = 'audit_exports' then
+    return query
+    with candidates as (
+      select e.id
+      from public.audit_exports e
+      where (e.status = 'queued' and (e.next_attempt_at is null or e.next_attempt_at <= now()))
+         or (e.status = 'running' and e.lease_expires_at < now())
+      order by e.created_at asc
+      limit v_limit
+      for update skip locked
+    )
+    update public.audit_exports e
+       set status = 'running',
+           claimed_by = v_holder,
+           lease_expires_at = now() + v_lease
+      from candidates c
+     where e.id = c.id
+    returning to_jsonb(e.*);
+  elsif p_queue = 'notification_jobs' then
+    return query
+    with candidates as (
+      select j.id
+      from public.notification_jobs j
+      where (j.status = 'queued' and j.run_after <= now())
+         or (j.status = 'running' and j.lease_expires_at < now())
+      order by j.run_after asc
+      limit v_limit
+      for update skip locked
+    )
+    update public.notification_jobs j
+       set status = 'running',
+           claimed_by = v_holder,
+           lease_expires_at = now() + v_lease,
+           updated_at = now()
+      from candidates c
+     where j.id = c.id
+    returning to_jsonb(j.*);
+  else
+    raise exception 'unknown queue: %', p_queue;
+  end if;
+end;
+$$;
+
+revoke all on function public.claim_jobs(text, text, int, int) from public;
+grant execute on function public.claim_jobs(text, text, int, int) to service_role;
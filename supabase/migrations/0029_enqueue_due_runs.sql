@@ -0,0 +1,78 @@
+-- Set-based scheduler pass: queue a run for every due source that has no
+-- recent active run and advance next_run_at, in a single statement.
+create index if not exists monitor_runs_source_active_idx
+  on public.monitor_runs(source_id, created_at desc)
+  where status in ('queued', 'running');
+
+create or replace function public.enqueue_due_runs(p_limit int default 10)
+returns jsonb
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_limit int;
+  v_now timestamptz := now();
+  v_due int;
+  v_queued int;
+begin
+  if auth.role() <> 'service_role' then
+    raise exception 'forbidden';
+  end if;
+
+  v_limit := least(greatest(coalesce(p_limit, 10), 1), 1000);
+
+  select count(*)
+    into v_due
+  from public.sources s
+  where s.cadence <> 'manual'
+    and s.is_enabled = true
+    and s.next_run_at <= v_now;
+
+  -- SKIP LOCKED lets concurrent workers schedule disjoint sources.
+  with picked as (
+    select s.id, s.org_id, s.cadence
+    from public.sources s
+    where s.cadence <> 'manual'
+      and s.is_enabled = true
+      and s.next_run_at <= v_now
+      and not exists (
+        select 1
+        from public.monitor_runs r
+        where r.source_id = s.id
+          and r.status in ('queued', 'running')
+          and r.created_at >= v_now - interval '10 minutes'
+      )
+    order by s.next_run_at asc
+    limit v_limit
+    for update of s skip locked
+  ),
+  inserted as (
+    insert into public.monitor_runs (org_id, source_id, status)
+    select p.org_id, p.id, 'queued'
+    from picked p
+    returning source_id
+  ),
+  advanced as (
+    update public.sources s
+       set next_run_at = case p.cadence
+             when 'hourly' then v_now + interval '1 hour'
+             when 'daily' then v_now + interval '1 day'
+             when 'weekly' then v_now + interval '1 week'
+             else null
+           end,
+           last_run_at = v_now
+      from picked p
+     where s.id = p.id
+    returning s.id
+  )
+  select count(*)
+    into v_queued
+  from inserted;
+
+  return jsonb_build_object('due_sources', v_due, 'runs_queued', v_queued);
+end;
+$$;
+
+revoke all on function public.enqueue_due_runs(int) from public;
+grant execute on function public.enqueue_due_runs(int) to service_role;
@@ -0,0 +1,232 @@
+-- Workers cache the latest snapshot fingerprint per source and only load
+-- snapshot text when a change is detected. A cached entry can be stale when
+-- another worker stored a newer snapshot, so a touch now only applies to the
+-- newest snapshot of the source; snapshot_id comes back null otherwise and
+-- the worker drops its cached entry.
+create or replace function public.complete_monitor_run(
+  p_run_id uuid,
+  p_fetch jsonb,
+  p_snapshot jsonb default null,
+  p_finding jsonb default null,
+  p_touch jsonb default null
+)
+returns jsonb
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_org_id uuid;
+  v_source_id uuid;
+  v_snapshot_id uuid;
+  v_finding_id uuid;
+  v_alert_id uuid;
+  v_alert_created boolean := false;
+  v_notification_job_id uuid;
+  v_severity text;
+  v_rules public.org_notification_rules%rowtype;
+begin
+  if auth.role() <> 'service_role' then
+    raise exception 'forbidden';
+  end if;
+
+  select r.org_id, r.source_id
+    into v_org_id, v_source_id
+  from public.monitor_runs r
+  where r.id = p_run_id
+  for update;
+
+  if v_org_id is null then
+    raise exception 'monitor run not found';
+  end if;
+
+  update public.sources
+  set
+    etag = nullif(p_fetch->>'etag', ''),
+    last_modified = nullif(p_fetch->>'last_modified', ''),
+    content_type = nullif(p_fetch->>'content_type', '')
+  where id = v_source_id;
+
+  if p_snapshot is not null then
+    insert into public.snapshots (
+      org_id,
+      source_id,
+      run_id,
+      fetched_url,
+      content_hash,
+      content_type,
+      content_len,
+      http_status,
+      etag,
+      last_modified,
+      text_preview,
+      text_fingerprint,
+      canonical_title,
+      canonical_text,
+      item_id,
+      item_published_at
+    )
+    values (
+      v_org_id,
+      v_source_id,
+      p_run_id,
+      p_snapshot->>'fetched_url',
+      p_snapshot->>'content_hash',
+      p_snapshot->>'content_type',
+      (p_snapshot->>'content_len')::bigint,
+      (p_snapshot->>'http_status')::int,
+      p_snapshot->>'etag',
+      p_snapshot->>'last_modified',
+      p_snapshot->>'text_preview',
+      p_snapshot->>'text_fingerprint',
+      nullif(trim(coalesce(p_snapshot->>'canonical_title', '')), ''),
+      coalesce(p_snapshot->>'canonical_text', ''),
+      nullif(trim(coalesce(p_snapshot->>'item_id', '')), ''),
+      (p_snapshot->>'item_published_at')::timestamptz
+    )
+    returning id into v_snapshot_id;
+  elsif p_touch is not null then
+    update public.snapshots s
+    set
+      last_checked_at = now(),
+      last_checked_run_id = p_run_id,
+      last_http_status = (p_touch->>'http_status')::int,
+      check_count = s.check_count + 1
+    where s.id = (p_touch->>'snapshot_id')::uuid
+      and s.source_id = v_source_id
+      and not exists (
+        select 1
+        from public.snapshots newer
+        where newer.org_id = v_org_id
+          and newer.source_id = v_source_id
+          and (newer.created_at, newer.id) > (s.created_at, s.id)
+      )
+    returning s.id into v_snapshot_id;
+  end if;
+
+  if p_finding is not null then
+    v_severity := coalesce(p_finding->>'severity', 'medium');
+
+    insert into public.findings (
+      org_id,
+      source_id,
+      run_id,
+      title,
+      summary,
+      severity,
+      fingerprint,
+      raw_url,
+      raw_hash
+    )
+    values (
+      v_org_id,
+      v_source_id,
+      p_run_id,
+      p_finding->>'title',
+      p_finding->>'summary',
+      v_severity,
+      p_finding->>'fingerprint',
+      p_finding->>'raw_url',
+      p_finding->>'raw_hash'
+    )
+    on conflict (org_id, fingerprint)
+    do update set
+      source_id = excluded.source_id,
+      run_id = excluded.run_id,
+      title = excluded.title,
+      summary = excluded.summary,
+      severity = excluded.severity,
+      detected_at = now(),
+      raw_url = excluded.raw_url,
+      raw_hash = excluded.raw_hash
+    returning id into v_finding_id;
+
+    insert into public.finding_explanations (org_id, finding_id, summary, diff_preview, citations)
+    values (
+      v_org_id,
+      v_finding_id,
+      p_finding->>'summary',
+      p_finding->>'diff_preview',
+      coalesce(p_finding->'citations', '[]'::jsonb)
+    );
+
+    select a.id
+      into v_alert_id
+    from public.alerts a
+    where a.org_id = v_org_id
+      and a.finding_id = v_finding_id
+    order by a.created_at desc
+    limit 1;
+
+    if v_alert_id is null then
+      insert into public.alerts (org_id, finding_id, status)
+      values (v_org_id, v_finding_id, 'open')
+      returning id into v_alert_id;
+      v_alert_created := true;
+    end if;
+
+    insert into public.org_notification_rules(org_id)
+    values (v_org_id)
+    on conflict (org_id) do nothing;
+
+    select *
+      into v_rules
+    from public.org_notification_rules nr
+    where nr.org_id = v_org_id;
+
+    if v_rules.enabled
+      and v_rules.mode in ('immediate', 'both')
+      and (case v_severity when 'low' then 1 when 'high' then 3 else 2 end)
+        >= (case v_rules.min_severity when 'low' then 1 when 'high' then 3 else 2 end)
+    then
+      insert into public.notification_jobs (org_id, type, payload)
+      values (
+        v_org_id,
+        'immediate_alert',
+        jsonb_build_object(
+          'org_id', v_org_id,
+          'alert_id', v_alert_id,
+          'entity_type', 'alert',
+          'entity_id', v_alert_id
+        )
+      )
+      returning id into v_notification_job_id;
+    end if;
+
+    perform public.record_audit_event(
+      v_org_id,
+      'worker_finding_detected',
+      'monitor_run',
+      p_run_id,
+      jsonb_build_object(
+        'source_id', v_source_id,
+        'finding_id', v_finding_id,
+        'alert_id', v_alert_id
+      )
+    );
+  end if;
+
+  update public.monitor_runs
+  set
+    status = 'succeeded',
+    finished_at = now(),
+    error = null,
+    last_error = null,
+    next_attempt_at = null,
+    claimed_by = null,
+    lease_expires_at = null
+  where id = p_run_id;
+
+  return jsonb_build_object(
+    'run_id', p_run_id,
+    'snapshot_id', v_snapshot_id,
+    'finding_id', v_finding_id,
+    'alert_id', v_alert_id,
+    'alert_created', v_alert_created,
+    'notification_job_id', v_notification_job_id
+  );
+end;
+$$;
+
+revoke all on function public.complete_monitor_run(uuid, jsonb, jsonb, jsonb, jsonb) from public;
+grant execute on function public.complete_monitor_run(uuid, jsonb, jsonb, jsonb, jsonb) to service_role;
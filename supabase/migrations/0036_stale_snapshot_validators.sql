@@ -0,0 +1,311 @@
+-- A stale cached snapshot on the worker used to leave two gaps. A dropped
+-- insert or a rejected touch still stored the response's etag and
+-- last_modified on the source, so the next conditional request got a 304
+-- and the change was never recorded; and the run was completed anyway, so
+-- it was not compared again. complete_monitor_run now checks the snapshot
+-- the worker compared against before writing anything. When it is no longer
+-- the newest (and the content is not already the newest snapshot's), it
+-- returns 'stale_snapshot' without touching the source or the run, and the
+-- worker reloads the newest snapshot and completes the run again.
+
+create or replace function public.complete_monitor_run(
+  p_run_id uuid,
+  p_holder text,
+  p_fetch jsonb,
+  p_snapshot jsonb default null,
+  p_finding jsonb default null,
+  p_touch jsonb default null
+)
+returns jsonb
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  v_org_id uuid;
+  v_source_id uuid;
+  v_status text;
+  v_claimed_by text;
+  v_snapshot_id uuid;
+  v_text_hash text;
+  v_latest_id uuid;
+  v_latest_fingerprint text;
+  v_stale boolean := false;
+  v_touch_id uuid;
+  v_touch_status int;
+  v_finding_id uuid;
+  v_alert_id uuid;
+  v_alert_created boolean := false;
+  v_notification_job_id uuid;
+  v_severity text;
+  v_rules public.org_notification_rules%rowtype;
+begin
+  if auth.role() <> 'service_role' then
+    raise exception 'forbidden';
+  end if;
+
+  select r.org_id, r.source_id, r.status, r.claimed_by
+    into v_org_id, v_source_id, v_status, v_claimed_by
+  from public.monitor_runs r
+  where r.id = p_run_id
+  for update;
+
+  if v_org_id is null then
+    raise exception 'monitor run not found';
+  end if;
+
+  -- The lease expired and the run was reclaimed (or already finished):
+  -- write nothing so the current holder's result is the only one stored.
+  if v_status <> 'running' or v_claimed_by is distinct from p_holder then
+    return jsonb_build_object('run_id', p_run_id, 'lease_lost', true);
+  end if;
+
+  -- Completions for the same source run one at a time, so the newest
+  -- snapshot read here stays the newest until this transaction commits.
+  perform 1 from public.sources where id = v_source_id for update;
+
+  select s.id, coalesce(nullif(s.text_fingerprint, ''), s.content_hash)
+    into v_latest_id, v_latest_fingerprint
+  from public.snapshots s
+  where s.org_id = v_org_id
+    and s.source_id = v_source_id
+  order by s.created_at desc, s.id desc
+  limit 1;
+
+  if p_snapshot is not null and p_snapshot ? 'previous_snapshot_id' then
+    v_stale := v_latest_id is distinct from nullif(p_snapshot->>'previous_snapshot_id', '')::uuid
+      or v_latest_fingerprint = p_snapshot->>'content_hash';
+    if v_stale and v_latest_fingerprint = p_snapshot->>'content_hash' then
+      -- The newest snapshot already has this content: record the check on it.
+      v_touch_id := v_latest_id;
+      v_touch_status := (p_snapshot->>'http_status')::int;
+    end if;
+  elsif p_snapshot is null and p_touch is not null then
+    if (p_touch->>'snapshot_id')::uuid is distinct from v_latest_id then
+      v_stale := true;
+    else
+      v_touch_id := v_latest_id;
+      v_touch_status := (p_touch->>'http_status')::int;
+    end if;
+  end if;
+
+  -- Compared against a snapshot that is no longer the newest: store nothing,
+  -- not even the response validators, since a later conditional request
+  -- would then get a 304 for content that was never recorded. The run stays
+  -- claimed so the worker can compare against the newest snapshot and
+  -- complete it again.
+  if v_stale and v_touch_id is null then
+    return jsonb_build_object('run_id', p_run_id, 'stale_snapshot', true, 'lease_lost', false);
+  end if;
+
+  update public.sources
+  set
+    etag = nullif(p_fetch->>'etag', ''),
+    last_modified = nullif(p_fetch->>'last_modified', ''),
+    content_type = nullif(p_fetch->>'content_type', '')
+  where id = v_source_id;
+
+  if v_touch_id is not null then
+    update public.snapshots s
+    set
+      last_checked_at = now(),
+      last_checked_run_id = p_run_id,
+      last_http_status = v_touch_status,
+      check_count = s.check_count + 1
+    where s.id = v_touch_id
+    returning s.id into v_snapshot_id;
+  elsif p_snapshot is not null then
+    v_text_hash := nullif(p_snapshot->>'text_hash', '');
+    if v_text_hash is not null then
+      if p_snapshot->>'text_body' is not null then
+        insert into public.snapshot_texts (text_hash, encoding, body, text_len)
+        values (
+          v_text_hash,
+          coalesce(p_snapshot->>'text_encoding', 'zlib'),
+          decode(p_snapshot->>'text_body', 'base64'),
+          coalesce((p_snapshot->>'text_len')::int, 0)
+        )
+        on conflict (text_hash) do nothing;
+      elsif not exists (select 1 from public.snapshot_texts t where t.text_hash = v_text_hash) then
+        raise exception 'snapshot text is not stored';
+      end if;
+    end if;
+
+    insert into public.snapshots (
+      org_id,
+      source_id,
+      run_id,
+      fetched_url,
+      content_hash,
+      content_type,
+      content_len,
+      http_status,
+      etag,
+      last_modified,
+      text_preview,
+      text_fingerprint,
+      canonical_title,
+      canonical_text,
+      text_hash,
+      item_id,
+      item_published_at
+    )
+    values (
+      v_org_id,
+      v_source_id,
+      p_run_id,
+      p_snapshot->>'fetched_url',
+      p_snapshot->>'content_hash',
+      p_snapshot->>'content_type',
+      (p_snapshot->>'content_len')::bigint,
+      (p_snapshot->>'http_status')::int,
+      p_snapshot->>'etag',
+      p_snapshot->>'last_modified',
+      p_snapshot->>'text_preview',
+      p_snapshot->>'text_fingerprint',
+      nullif(trim(coalesce(p_snapshot->>'canonical_title', '')), ''),
+      case when v_text_hash is null then coalesce(p_snapshot->>'canonical_text', '') end,
+      v_text_hash,
+      nullif(trim(coalesce(p_snapshot->>'item_id', '')), ''),
+      (p_snapshot->>'item_published_at')::timestamptz
+    )
+    returning id into v_snapshot_id;
+  end if;
+
+  if p_finding is not null and not v_stale then
+    v_severity := coalesce(p_finding->>'severity', 'medium');
+
+    insert into public.findings (
+      org_id,
+      source_id,
+      run_id,
+      title,
+      summary,
+      severity,
+      fingerprint,
+      raw_url,
+      raw_hash
+    )
+    values (
+      v_org_id,
+      v_source_id,
+      p_run_id,
+      p_finding->>'title',
+      p_finding->>'summary',
+      v_severity,
+      p_finding->>'fingerprint',
+      p_finding->>'raw_url',
+      p_finding->>'raw_hash'
+    )
+    on conflict (org_id, fingerprint)
+    do update set
+      source_id = excluded.source_id,
+      run_id = excluded.run_id,
+      title = excluded.title,
+      summary = excluded.summary,
+      severity = excluded.severity,
+      detected_at = now(),
+      raw_url = excluded.raw_url,
+      raw_hash = excluded.raw_hash
+    returning id into v_finding_id;
+
+    insert into public.finding_explanations (org_id, finding_id, summary, diff_preview, citations)
+    values (
+      v_org_id,
+      v_finding_id,
+      p_finding->>'summary',
+      p_finding->>'diff_preview',
+      coalesce(p_finding->'citations', '[]'::jsonb)
+    );
+
+    select a.id
+      into v_alert_id
+    from public.alerts a
+    where a.org_id = v_org_id
+      and a.finding_id = v_finding_id
+    order by a.created_at desc
+    limit 1;
+
+    if v_alert_id is null then
+      insert into public.alerts (org_id, finding_id, status)
+      values (v_org_id, v_finding_id, 'open')
+      returning id into v_alert_id;
+      v_alert_created := true;
+    end if;
+
+    insert into public.org_notification_rules(org_id)
+    values (v_org_id)
+    on conflict (org_id) do nothing;
+
+    select *
+      into v_rules
+    from public.org_notification_rules nr
+    where nr.org_id = v_org_id;
+
+    -- One pending immediate notification per alert is enough.
+    if v_rules.enabled
+      and v_rules.mode in ('immediate', 'both')
+      and not exists (
+        select 1
+        from public.notification_jobs j
+        where j.org_id = v_org_id
+          and j.type = 'immediate_alert'
+          and j.status in ('queued', 'running')
+          and j.payload->>'alert_id' = v_alert_id::text
+      )
+      and (case v_severity when 'low' then 1 when 'high' then 3 else 2 end)
+        >= (case v_rules.min_severity when 'low' then 1 when 'high' then 3 else 2 end)
+    then
+      insert into public.notification_jobs (org_id, type, payload)
+      values (
+        v_org_id,
+        'immediate_alert',
+        jsonb_build_object(
+          'org_id', v_org_id,
+          'alert_id', v_alert_id,
+          'entity_type', 'alert',
+          'entity_id', v_alert_id
+        )
+      )
+      returning id into v_notification_job_id;
+    end if;
+
+    perform public.record_audit_event(
+      v_org_id,
+      'worker_finding_detected',
+      'monitor_run',
+      p_run_id,
+      jsonb_build_object(
+        'source_id', v_source_id,
+        'finding_id', v_finding_id,
+        'alert_id', v_alert_id
+      )
+    );
+  end if;
+
+  update public.monitor_runs
+  set
+    status = 'succeeded',
+    finished_at = now(),
+    error = null,
+    last_error = null,
+    next_attempt_at = null,
+    claimed_by = null,
+    lease_expires_at = null
+  where id = p_run_id;
+
+  return jsonb_build_object(
+    'run_id', p_run_id,
+    'snapshot_id', v_snapshot_id,
+    'finding_id', v_finding_id,
+    'alert_id', v_alert_id,
+    'alert_created', v_alert_created,
+    'notification_job_id', v_notification_job_id,
+    'stale_snapshot', v_stale,
+    'lease_lost', false
+  );
+end;
+$$;
+
+revoke all on function public.complete_monitor_run(uuid, text, jsonb, jsonb, jsonb, jsonb) from public;
+grant execute on function public.complete_monitor_run(uuid, text, jsonb, jsonb, jsonb, jsonb) to service_role;